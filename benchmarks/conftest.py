@@ -0,0 +1,42 @@
+"""Fixtures for the SQL parser benchmarks (see benchmarks/README.md)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ddl_generator import WORKLOADS, nested_table  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--ddl-scale",
+        type=float,
+        default=1.0,
+        help="Scale factor for synthetic DDL workload sizes (default: 1.0)",
+    )
+
+
+@pytest.fixture(scope="session")
+def ddl_workloads(request, tmp_path_factory):
+    """Write every workload once; maps name -> (path, dialect, expected)."""
+    scale = request.config.getoption("--ddl-scale")
+    root = tmp_path_factory.mktemp("ddl")
+    out = {}
+    for name, (dialect, generate, sizes) in WORKLOADS.items():
+        kwargs = {k: max(1, int(v * scale)) for k, v in sizes.items()}
+        if generate is not nested_table:
+            kwargs["dialect"] = dialect
+        sql, expected = generate(**kwargs)
+        path = root / f"{name}.sql"
+        path.write_text(sql, encoding="utf-8")
+        out[name] = (str(path), dialect, expected)
+    return out
+
+
+@pytest.fixture(scope="session")
+def parse_results():
+    """Per-session cache of (parser, workload) -> parsed tables."""
+    return {}
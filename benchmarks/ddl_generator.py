@@ -0,0 +1,178 @@
+"""Deterministic synthetic SQL DDL for the parser benchmarks.
+
+Every generator returns the DDL text together with the schema it describes,
+``{full_table_name: (tree, required_paths)}`` in schema-diff's internal
+notation, so parsers can be scored against ground truth as well as against
+each other.
+
+Workloads:
+- wide_table   – one table with thousands of scalar columns
+- nested_table – BigQuery STRUCT/ARRAY nesting, one field per line
+- ddl_dump     – many CREATE TABLE statements mixed with other DDL, as in a
+                 ``pg_dump`` / ``bq show --schema`` export
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+Expected = dict[str, tuple[dict[str, Any], set[str]]]
+
+# (DDL type, internal type) ground truth per dialect
+SCALAR_TYPES = {
+    "bigquery": [
+        ("INT64", "int"),
+        ("FLOAT64", "float"),
+        ("NUMERIC", "float"),
+        ("BOOL", "bool"),
+        ("STRING", "str"),
+        ("BYTES", "str"),
+        ("DATE", "date"),
+        ("TIMESTAMP", "timestamp"),
+    ],
+    "postgres": [
+        ("BIGINT", "int"),
+        ("INTEGER", "int"),
+        ("DOUBLE PRECISION", "float"),
+        ("NUMERIC(12,2)", "float"),
+        ("BOOLEAN", "bool"),
+        ("TEXT", "str"),
+        ("VARCHAR(255)", "str"),
+        ("DATE", "date"),
+        ("TIMESTAMP", "timestamp"),
+    ],
+}
+
+_OTHER_STATEMENTS = {
+    "bigquery": [
+        "DROP TABLE IF EXISTS `{name}_old`;",
+        "ALTER TABLE `{name}` SET OPTIONS (description = 'nightly; load');",
+        'INSERT INTO `{name}` (c0) VALUES ("it\'s; fine");',
+    ],
+    "postgres": [
+        "DROP TABLE IF EXISTS {name}_old;",
+        "COMMENT ON TABLE {name} IS 'synthetic; table';",
+        "CREATE INDEX {short}_idx ON {name} (c0);",
+        "INSERT INTO {name} (c0) VALUES ('it''s; fine');",
+    ],
+}
+
+
+def _column(rnd: random.Random, dialect: str, name: str) -> tuple[str, Any, bool]:
+    ddl_type, internal = rnd.choice(SCALAR_TYPES[dialect])
+    if dialect == "postgres" and rnd.random() < 0.1:
+        ddl_type, internal = f"{ddl_type}[]", [internal]
+    elif dialect == "bigquery" and rnd.random() < 0.1:
+        ddl_type, internal = f"ARRAY<{ddl_type}>", [internal]
+    required = rnd.random() < 0.3
+    return f"{name} {ddl_type}{' NOT NULL' if required else ''}", internal, required
+
+
+def _create_table(
+    rnd: random.Random, dialect: str, name: str, n_columns: int
+) -> tuple[str, dict[str, Any], set[str]]:
+    lines, tree, required = [], {}, set()
+    for i in range(n_columns):
+        col = f"c{i}"
+        ddl, internal, is_required = _column(rnd, dialect, col)
+        lines.append(ddl)
+        tree[col] = internal
+        if is_required:
+            required.add(col)
+    quoted = f"`{name}`" if dialect == "bigquery" else name
+    body = ",\n  ".join(lines)
+    return f"CREATE TABLE {quoted} (\n  {body}\n);\n", tree, required
+
+
+def wide_table(
+    n_columns: int = 2000, dialect: str = "postgres", seed: int = 1
+) -> tuple[str, Expected]:
+    """One CREATE TABLE with `n_columns` scalar columns."""
+    rnd = random.Random(seed)
+    name = "public.wide" if dialect == "postgres" else "proj.ds.wide"
+    sql, tree, required = _create_table(rnd, dialect, name, n_columns)
+    return sql, {name: (tree, required)}
+
+
+def _struct(
+    rnd: random.Random, depth: int, breadth: int, indent: str
+) -> tuple[list[str], dict[str, Any]]:
+    """Lines of a multi-line STRUCT body and the tree it maps to."""
+    lines, tree = [], {}
+    for i in range(breadth):
+        name = f"f{depth}_{i}"
+        sep = "," if i < breadth - 1 else ""
+        if depth > 0 and i == 0:
+            inner, sub = _struct(rnd, depth - 1, breadth, indent + "  ")
+            lines += [f"{indent}{name} STRUCT<", *inner, f"{indent}>{sep}"]
+            tree[name] = sub
+        elif depth > 0 and i == 1:
+            inner, sub = _struct(rnd, depth - 1, breadth, indent + "  ")
+            lines += [f"{indent}{name} ARRAY<STRUCT<", *inner, f"{indent}>>{sep}"]
+            tree[name] = [sub]
+        else:
+            ddl_type, internal = rnd.choice(SCALAR_TYPES["bigquery"])
+            lines.append(f"{indent}{name} {ddl_type}{sep}")
+            tree[name] = internal
+    return lines, tree
+
+
+def nested_table(
+    depth: int = 5, breadth: int = 4, n_columns: int = 20, seed: int = 2
+) -> tuple[str, Expected]:
+    """A BigQuery table whose columns nest STRUCT/ARRAY<STRUCT> `depth` levels."""
+    rnd = random.Random(seed)
+    name = "proj.ds.nested"
+    lines, tree, required = [], {}, set()
+    for i in range(n_columns):
+        col = f"c{i}"
+        sep = "," if i < n_columns - 1 else ""
+        if i % 2:
+            ddl, internal, is_required = _column(rnd, "bigquery", col)
+            lines.append(f"  {ddl}{sep}")
+            tree[col] = internal
+            if is_required:
+                required.add(col)
+            continue
+        inner, sub = _struct(rnd, depth - 1, breadth, "    ")
+        if i % 4 == 0:
+            lines += [f"  {col} STRUCT<", *inner, f"  >{sep}"]
+            tree[col] = sub
+        else:
+            lines += [f"  {col} ARRAY<STRUCT<", *inner, f"  >>{sep}"]
+            tree[col] = [sub]
+    sql = f"CREATE TABLE `{name}` (\n" + "\n".join(lines) + "\n);\n"
+    return sql, {name: (tree, required)}
+
+
+def ddl_dump(
+    n_tables: int = 2000,
+    dialect: str = "postgres",
+    columns: tuple[int, int] = (5, 40),
+    seed: int = 3,
+) -> tuple[str, Expected]:
+    """`n_tables` CREATE TABLE statements interleaved with other DDL/DML."""
+    rnd = random.Random(seed)
+    prefix = "public" if dialect == "postgres" else "proj.ds"
+    parts = [f"-- synthetic {dialect} dump: {n_tables} tables\n"]
+    expected: Expected = {}
+    for t in range(n_tables):
+        name = f"{prefix}.t{t:05d}"
+        sql, tree, required = _create_table(rnd, dialect, name, rnd.randint(*columns))
+        parts.append(sql)
+        expected[name] = (tree, required)
+        if rnd.random() < 0.3:
+            stmt = rnd.choice(_OTHER_STATEMENTS[dialect])
+            parts.append(stmt.format(name=name, short=f"t{t:05d}") + "\n")
+    return "".join(parts), expected
+
+
+# name -> (dialect, generator, sizing kwargs at scale 1.0)
+WORKLOADS = {
+    "wide_postgres": ("postgres", wide_table, {"n_columns": 2000}),
+    "wide_bigquery": ("bigquery", wide_table, {"n_columns": 2000}),
+    "nested_bigquery": ("bigquery", nested_table, {"n_columns": 20}),
+    "dump_postgres": ("postgres", ddl_dump, {"n_tables": 3000}),
+    "dump_bigquery": ("bigquery", ddl_dump, {"n_tables": 3000}),
+}
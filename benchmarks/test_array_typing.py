@@ -0,0 +1,99 @@
+"""Throughput vs. accuracy of array element typing per sampling budget.
+
+`to_schema` types each array from a bounded sample of its elements
+(`Config.array_sample_size`). The records generated here hide minority
+element types in their arrays (late nulls, mixed scalars, optional object
+keys). Every budget is timed with pytest-benchmark; its accuracy is stored
+in the benchmark's ``extra_info``:
+
+- ``record_accuracy`` – fraction of single-record array fields typed exactly
+  as a full scan types them
+- ``merged_exact``    – whether the schema merged over all records is exact
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from schema_diff.config import Config  # noqa: E402
+from schema_diff.json_data_file_parser import merged_schema_from_samples  # noqa: E402
+
+RECORDS = 2000
+ARRAY_LEN = 200
+# Records scored one by one for record_accuracy
+ACCURACY_RECORDS = 200
+BUDGETS = [1, 4, 16, 64, ARRAY_LEN]
+
+
+def make_records(n_records, array_len, seed=7):
+    """Records with arrays whose minority element types appear at random offsets."""
+    rnd = random.Random(seed)
+    records = []
+    for _ in range(n_records):
+        ints = [rnd.randint(0, 1000) for _ in range(array_len)]
+        ints[rnd.randrange(array_len)] = None  # one late null
+
+        mixed = [f"s{i}" for i in range(array_len)]
+        for _ in range(max(1, array_len // 50)):
+            mixed[rnd.randrange(array_len)] = rnd.random()  # ~2% floats
+
+        items = [{"sku": f"A{i}", "qty": i} for i in range(array_len)]
+        items[rnd.randrange(array_len)]["discount"] = 0.1  # rare optional key
+
+        records.append(
+            {"id": rnd.randint(1, 10**6), "scores": ints, "tags": mixed, "items": items}
+        )
+    return records
+
+
+def array_fields(schema):
+    return {k: v for k, v in schema.items() if isinstance(v, list)}
+
+
+def infer(records, budget):
+    cfg = Config(color_enabled=False, array_sample_size=budget)
+    return merged_schema_from_samples(records, cfg)
+
+
+@pytest.fixture(scope="module")
+def records():
+    return make_records(RECORDS, ARRAY_LEN)
+
+
+@pytest.fixture(scope="module")
+def reference(records):
+    """Array field types of a full scan: merged, and per scored record."""
+    merged = array_fields(infer(records, ARRAY_LEN))
+    per_record = [
+        array_fields(infer([rec], ARRAY_LEN)) for rec in records[:ACCURACY_RECORDS]
+    ]
+    return merged, per_record
+
+
+@pytest.mark.parametrize("budget", BUDGETS)
+def test_array_typing_throughput(benchmark, records, reference, budget):
+    expected, per_record = reference
+    hits = total = 0
+    for rec, full in zip(records, per_record):
+        got = array_fields(infer([rec], budget))
+        hits += sum(got.get(k) == v for k, v in full.items())
+        total += len(full)
+
+    benchmark.group = "array_typing"
+    schema = benchmark.pedantic(infer, args=(records, budget), rounds=3)
+    merged = array_fields(schema)
+    mistyped = sorted(k for k, v in expected.items() if merged.get(k) != v)
+    benchmark.extra_info.update(
+        {
+            "records": len(records),
+            "array_len": ARRAY_LEN,
+            "budget": budget,
+            "record_accuracy": round(hits / total, 4),
+            "merged_exact": not mistyped,
+            "mistyped": mistyped,
+        }
+    )
+    if budget == ARRAY_LEN:
+        assert not mistyped and hits == total
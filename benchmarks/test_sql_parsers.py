@@ -0,0 +1,102 @@
+"""Throughput, memory and accuracy of `sql_schema_parser` vs `sqlglot_parser`.
+
+Every (parser, workload) pair is timed with pytest-benchmark; its peak traced
+allocation and accuracy against the generator's ground truth are stored in the
+benchmark's ``extra_info`` so saved runs can be compared for regressions.
+"""
+
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from ddl_generator import WORKLOADS
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("sqlglot")
+
+from schema_diff.sql_schema_parser import schema_from_sql_schema_file_all  # noqa: E402
+from schema_diff.sqlglot_parser import schemas_from_sql_ddl_sqlglot  # noqa: E402
+
+
+def parse_regex(path, dialect):
+    return schema_from_sql_schema_file_all(path, workers=1)
+
+
+def parse_sqlglot(path, dialect):
+    return schemas_from_sql_ddl_sqlglot(path, dialect, workers=1, use_cache=False)
+
+
+def parse_sqlglot_parallel(path, dialect):
+    return schemas_from_sql_ddl_sqlglot(path, dialect, use_cache=False)
+
+
+PARSERS = {
+    "regex": parse_regex,
+    "sqlglot": parse_sqlglot,
+    "sqlglot_parallel": parse_sqlglot_parallel,
+}
+
+
+def accuracy(parsed, expected):
+    """Fractions of tables and of columns (type + nullability) parsed exactly."""
+    tables = columns = total_columns = 0
+    for name, (tree, required) in expected.items():
+        got_tree, got_required = parsed.get(name, ({}, set()))
+        tables += (got_tree, got_required) == (tree, required)
+        total_columns += len(tree)
+        columns += sum(
+            got_tree.get(col) == typ and (col in got_required) == (col in required)
+            for col, typ in tree.items()
+        )
+    return tables / len(expected), columns / total_columns
+
+
+def _parse_once(parse_results, parser, workload, path, dialect):
+    """Parse under tracemalloc once per session; returns (tables, peak KiB)."""
+    key = (parser, workload)
+    if key not in parse_results:
+        tracemalloc.start()
+        try:
+            tables = PARSERS[parser](path, dialect)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        parse_results[key] = (tables, peak // 1024)
+    return parse_results[key]
+
+
+@pytest.mark.parametrize("workload", list(WORKLOADS))
+@pytest.mark.parametrize("parser", list(PARSERS))
+def test_sql_parser_throughput(
+    benchmark, ddl_workloads, parse_results, parser, workload
+):
+    path, dialect, expected = ddl_workloads[workload]
+    tables, peak_kib = _parse_once(parse_results, parser, workload, path, dialect)
+    table_acc, column_acc = accuracy(tables, expected)
+
+    benchmark.group = workload
+    benchmark.extra_info.update(
+        {
+            "bytes": Path(path).stat().st_size,
+            "tables": len(expected),
+            "peak_kib": peak_kib,
+            "table_accuracy": round(table_acc, 4),
+            "column_accuracy": round(column_acc, 4),
+        }
+    )
+    result = benchmark.pedantic(
+        PARSERS[parser], args=(path, dialect), rounds=3, warmup_rounds=1
+    )
+    assert set(result) == set(expected)
+
+
+@pytest.mark.parametrize("workload", list(WORKLOADS))
+def test_sql_parser_parity(ddl_workloads, parse_results, workload):
+    path, dialect, expected = ddl_workloads[workload]
+    regex, _ = _parse_once(parse_results, "regex", workload, path, dialect)
+    glot, _ = _parse_once(parse_results, "sqlglot", workload, path, dialect)
+
+    # Both parsers must find every table; type-level disagreements are what
+    # the accuracy figures in the throughput results track
+    assert set(regex) == set(glot) == set(expected)
+    assert accuracy(glot, expected) == (1.0, 1.0)
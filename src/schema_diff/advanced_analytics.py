@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
 from .models import FieldConstraint, Schema
 
@@ -293,8 +293,8 @@ def analyze_policy_tags(schema: Schema) -> Dict[str, Any]:  # type: ignore[misc]
     from schema_diff.bigquery_ddl import (
         _classify_pii_by_name,
         _policy_tag_names_on_field,
-        _tokenize_name,
     )
+    from schema_diff.name_matcher import suffix_matcher, tokenize_name
 
     raw_schema = schema.metadata["raw_bq_schema"]
 
@@ -354,16 +354,15 @@ def analyze_policy_tags(schema: Schema) -> Dict[str, Any]:  # type: ignore[misc]
             # Check for sensitive indicators (credentials/secrets) using canonical catalog
             name_lower = field.name.lower()
             if not name_lower.endswith(("_id", "_key", "_ref", "id", "key")):
-                name_tokens = set(_tokenize_name(field.name))
+                name_tokens = set(tokenize_name(field.name))
                 # Exact match check
                 if any(
                     tok in analyze_config.SENSITIVE_SECRETS_EXACT for tok in name_tokens
                 ):
                     analysis["sensitive_fields_untagged"].append(field_path)
                 # Suffix check for variants
-                elif any(
-                    name_lower.endswith(sfx)
-                    for sfx in analyze_config.SENSITIVE_SECRET_SUFFIXES
+                elif suffix_matcher(analyze_config.SENSITIVE_SECRET_SUFFIXES).match(
+                    name_lower
                 ):
                     analysis["sensitive_fields_untagged"].append(field_path)
 
@@ -386,9 +385,16 @@ def analyze_policy_tags(schema: Schema) -> Dict[str, Any]:  # type: ignore[misc]
     return final_result
 
 
-def suggest_schema_improvements(schema: Schema) -> List[Dict[str, str]]:
+def suggest_schema_improvements(
+    schema: Schema,
+    rules: Optional[Iterable[str]] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, str]]:
     """Suggest improvements for schema design.
 
+    `rules` and `timings` are passed to `detect_bigquery_antipatterns` for
+    BigQuery schemas (anti-pattern rules to run, seconds spent per rule).
+
     Returns a list of suggestions with type, description, and affected fields.
     """
     if not isinstance(schema, Schema):
@@ -533,7 +539,9 @@ def suggest_schema_improvements(schema: Schema) -> List[Dict[str, str]]:
             from .bigquery_ddl import detect_bigquery_antipatterns
 
             raw_schema = schema.metadata["raw_bq_schema"]
-            antipatterns = detect_bigquery_antipatterns(raw_schema)
+            antipatterns = detect_bigquery_antipatterns(
+                raw_schema, rules=rules, timings=timings
+            )
 
             if antipatterns:
                 # Group by category and pattern
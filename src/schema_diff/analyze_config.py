@@ -884,6 +884,32 @@ RETRY_BACKOFF_MULTIPLIER = 2.0
 PARALLEL_WORKERS = 15  # Number of threads for parallel table processing
 PARALLEL_ENABLED_DEFAULT = True  # Enable parallel processing by default
 
+# Fetch dataset metadata with INFORMATION_SCHEMA queries (instead of one
+# get_table call per table) when at least this many tables are needed
+BULK_METADATA_MIN_TABLES = 10
+
+# Shared BigQuery API limiter (see rate_limit.py): request rate cap, and AIMD
+# concurrency between ADAPTIVE_MIN_WORKERS and PARALLEL_WORKERS that is cut by
+# ADAPTIVE_DECREASE_FACTOR on 429/503 and grows back on success
+BIGQUERY_API_QPS = 50.0
+BIGQUERY_API_BURST = 20
+ADAPTIVE_MIN_WORKERS = 1
+ADAPTIVE_DECREASE_FACTOR = 0.5
+
+# Persistent table-metadata cache (see bigquery_cache.py): a dataset's cached
+# tables are revalidated with one last-modified query unless the previous check
+# is younger than this many seconds (0 = revalidate on every run, so changes
+# such as an ALTER TABLE are always seen)
+BQ_METADATA_MAX_AGE_SECONDS = 0
+
+# Anti-pattern rules (names from bigquery_rules.list_rules()) skipped by
+# detect_bigquery_antipatterns unless requested explicitly
+ANTIPATTERN_DISABLED_RULES: frozenset[str] = frozenset()
+
+# Dataset/project anti-pattern scans (see bigquery_scan.py): table metadata is
+# fetched and handed to the analysis processes in batches of this many tables
+SCAN_BATCH_TABLES = 500
+
 
 # =============================================================================
 # ANTI-PATTERN DETECTION: TEMPORAL & TIME-BASED PATTERNS
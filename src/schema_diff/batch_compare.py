@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""Batch schema comparison: one-vs-many and N×N drift matrices.
+
+Comparing one contract schema against hundreds of tables with `compare_trees`
+means reloading and renormalizing the baseline for every pair. This module
+loads and normalizes every input exactly once, short-circuits pairs whose
+structural fingerprints match, and diffs the remaining pairs in a process pool.
+Each worker receives the normalized trees once (via the pool initializer), so
+tasks only carry a pair of indexes.
+
+Public helpers
+--------------
+- BatchInput              – a loaded, normalized input with its fingerprint
+- load_batch_input        – load + normalize one path (data or schema)
+- load_sql_table_inputs   – one input per CREATE TABLE of a SQL DDL file
+- diff_pairs              – diff arbitrary input pairs (fingerprint + pool)
+- compare_batch           – run one-vs-many or matrix comparisons
+- render_batch_markdown   – consolidated markdown summary / drift matrix
+"""
+from __future__ import annotations
+
+import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .compare import diff_normalized_trees, normalize_for_diff
+from .config import Config
+from .utils import structural_hash
+
+
+@dataclass
+class BatchInput:
+    """One normalized input participating in a batch comparison."""
+
+    label: str
+    tree: Any
+    source_type: str = "data"
+    fingerprint: str = field(default="")
+
+    def __post_init__(self) -> None:
+        """Fingerprint the tree unless a fingerprint was given."""
+        if not self.fingerprint:
+            self.fingerprint = structural_hash(self.tree)
+
+
+def load_batch_input(
+    path: str,
+    kind: Optional[str] = None,
+    *,
+    cfg: Optional[Config] = None,
+    table: Optional[str] = None,
+    model: Optional[str] = None,
+    first_record: bool = False,
+    all_records: bool = False,
+    sample_size: int = 1000,
+) -> BatchInput:
+    """Load `path` (data file or any supported schema) and normalize it once.
+
+    Args:
+        path: File path, GCS path or BigQuery table reference
+        kind: Resolved format (e.g. "data:json", "sql:ddl"); auto-detected if None
+        cfg: Inference configuration for data files
+        table: Table name for SQL schemas
+        model: Model name for dbt schemas
+        first_record: Use only the first record of data files
+        all_records: Use every record of data files
+        sample_size: Records to sample from data files otherwise
+
+    Returns:
+        BatchInput holding the normalized tree and its fingerprint
+    """
+    from .format_resolver import get_family
+    from .loader import _guess_kind
+
+    cfg = cfg or Config(color_enabled=False)
+    kind = kind or _guess_kind(path)
+
+    if get_family(kind) == "data":
+        from .io_utils import load_records_with_sampling
+        from .json_data_file_parser import merged_schema_from_samples
+
+        records = load_records_with_sampling(
+            path,
+            first_record=first_record,
+            all_records_flag=all_records,
+            sample_size=sample_size,
+        )
+        tree = merged_schema_from_samples(records, cfg)
+        return BatchInput(path, normalize_for_diff(tree, set(), "data"), "data")
+
+    from .models import to_legacy_tree
+    from .unified_loader import load_schema_unified
+
+    schema = load_schema_unified(path, kind, table=table, model=model)
+    tree, required = to_legacy_tree(schema)
+    source_type = schema.source_type or "data"
+    return BatchInput(
+        path, normalize_for_diff(tree, required, source_type), source_type
+    )
+
+
+def load_sql_table_inputs(path: str, workers: Optional[int] = None) -> list[BatchInput]:
+    """Load every CREATE TABLE in a SQL DDL file as a separate input.
+
+    Statements are parsed in parallel through the file's table index (see
+    `schema_from_sql_schema_file_all`). Inputs are labelled ``path:table``.
+    """
+    from .sql_schema_parser import schema_from_sql_schema_file_all
+
+    return [
+        BatchInput(f"{path}:{name}", normalize_for_diff(tree, required, "sql"), "sql")
+        for name, (tree, required) in schema_from_sql_schema_file_all(
+            path, workers=workers
+        ).items()
+    ]
+
+
+# Normalized trees shared with pool workers (set once per worker process)
+_WORKER_TREES: list[Any] = []
+
+
+def _init_worker(trees: list[Any]) -> None:
+    global _WORKER_TREES
+    _WORKER_TREES = trees
+
+
+def _diff_pair(
+    i: int, j: int, labels: tuple[str, str], include_presence: bool
+) -> tuple[int, int, dict[str, Any]]:
+    report = diff_normalized_trees(
+        labels[0],
+        labels[1],
+        _WORKER_TREES[i],
+        _WORKER_TREES[j],
+        include_presence=include_presence,
+    )
+    return i, j, report
+
+
+def _summarize(report: dict[str, Any]) -> dict[str, int]:
+    """Reduce a pair report to the counts shown in summaries and matrices."""
+    counts = {
+        "only_in_left": len(report.get("only_in_file1", [])),
+        "only_in_right": len(report.get("only_in_file2", [])),
+        "type_mismatches": len(report.get("schema_mismatches", [])),
+        "presence_issues": len(report.get("presence_issues", [])),
+        "path_changes": len(report.get("path_changes", [])),
+    }
+    counts["total"] = (
+        counts["only_in_left"]
+        + counts["only_in_right"]
+        + counts["type_mismatches"]
+        + counts["presence_issues"]
+    )
+    return counts
+
+
+def diff_pairs(
+    inputs: list[BatchInput],
+    pairs: list[tuple[int, int]],
+    *,
+    workers: Optional[int] = None,
+    include_presence: bool = True,
+) -> dict[tuple[int, int], dict[str, Any]]:
+    """Diff the given ``(left, right)`` index pairs of `inputs`.
+
+    Pairs with equal fingerprints get a "No differences" report without
+    diffing; the rest run in a process pool (``workers=1`` runs in-process).
+
+    Returns:
+        Pair report keyed by ``(left, right)``
+    """
+    reports: dict[tuple[int, int], dict[str, Any]] = {}
+    pending: list[tuple[int, int]] = []
+    for i, j in pairs:
+        if inputs[i].fingerprint == inputs[j].fingerprint:
+            direction = f"{inputs[i].label} -> {inputs[j].label}"
+            reports[(i, j)] = {
+                "meta": {"direction": direction},
+                "note": "No differences",
+            }
+        else:
+            pending.append((i, j))
+
+    max_workers = workers or os.cpu_count() or 1
+    max_workers = min(max_workers, len(pending)) if pending else 1
+    if max_workers > 1:
+        trees = [inp.tree for inp in inputs]
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(trees,)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _diff_pair,
+                    i,
+                    j,
+                    (inputs[i].label, inputs[j].label),
+                    include_presence,
+                )
+                for i, j in pending
+            ]
+            for future in futures:
+                i, j, report = future.result()
+                reports[(i, j)] = report
+    else:
+        for i, j in pending:
+            reports[(i, j)] = diff_normalized_trees(
+                inputs[i].label,
+                inputs[j].label,
+                inputs[i].tree,
+                inputs[j].tree,
+                include_presence=include_presence,
+            )
+    return reports
+
+
+def compare_batch(
+    inputs: list[BatchInput],
+    *,
+    matrix: bool = False,
+    workers: Optional[int] = None,
+    include_presence: bool = True,
+    include_reports: bool = True,
+) -> dict[str, Any]:
+    """Compare normalized inputs in one-vs-many or N×N matrix mode.
+
+    Args:
+        inputs: Normalized inputs; in one-vs-many mode the first is the baseline
+        matrix: Compare every ordered pair instead of baseline vs the rest
+        workers: Process pool size (None = CPU count, 1 = run in-process)
+        include_presence: Include presence issues in pair reports
+        include_reports: Keep the full per-pair report in the results
+
+    Returns:
+        Consolidated result with ``meta``, ``inputs``, ``results`` and, in
+        matrix mode, ``matrix`` (total difference counts, row = left input)
+    """
+    if len(inputs) < 2:
+        raise ValueError("Batch comparison needs at least two inputs")
+
+    n = len(inputs)
+    if matrix:
+        pairs = [(i, j) for i in range(n) for j in range(n) if i != j]
+    else:
+        pairs = [(0, j) for j in range(1, n)]
+
+    reports = diff_pairs(
+        inputs, pairs, workers=workers, include_presence=include_presence
+    )
+    diffed = sum(
+        1 for i, j in pairs if inputs[i].fingerprint != inputs[j].fingerprint
+    )
+
+    results: list[dict[str, Any]] = []
+    totals: dict[tuple[int, int], int] = {}
+    for i, j in pairs:
+        report = reports[(i, j)]
+        entry: dict[str, Any] = {
+            "left": inputs[i].label,
+            "right": inputs[j].label,
+            "identical": report.get("note") == "No differences",
+            **_summarize(report),
+        }
+        if include_reports:
+            entry["report"] = report
+        totals[(i, j)] = entry["total"]
+        results.append(entry)
+
+    out: dict[str, Any] = {
+        "meta": {
+            "mode": "matrix" if matrix else "one-vs-many",
+            "generated": datetime.datetime.now().isoformat(timespec="seconds"),
+            "pairs": len(pairs),
+            "diffed": diffed,
+        },
+        "inputs": [
+            {
+                "label": inp.label,
+                "source_type": inp.source_type,
+                "fingerprint": inp.fingerprint,
+            }
+            for inp in inputs
+        ],
+        "results": results,
+    }
+    if matrix:
+        out["matrix"] = [
+            [0 if i == j else totals[(i, j)] for j in range(n)] for i in range(n)
+        ]
+    return out
+
+
+def render_batch_markdown(result: dict[str, Any]) -> str:
+    """Render a `compare_batch` result as a markdown summary or drift matrix."""
+    labels = [inp["label"] for inp in result["inputs"]]
+    meta = result["meta"]
+    lines = [
+        "# 📊 Batch Schema Comparison",
+        "",
+        f"- **Generated**: {meta['generated']}",
+        f"- **Mode**: {meta['mode']}",
+        f"- **Inputs**: {len(labels)}",
+        f"- **Pairs**: {meta['pairs']} ({meta['diffed']} diffed, "
+        f"{meta['pairs'] - meta['diffed']} identical by fingerprint)",
+        "",
+    ]
+
+    if meta["mode"] == "matrix":
+        lines.extend(["## Drift Matrix", "", "Total differences (row → column)", ""])
+        lines.append("| | " + " | ".join(f"`{lbl}`" for lbl in labels) + " |")
+        lines.append("|---" * (len(labels) + 1) + "|")
+        for lbl, row in zip(labels, result["matrix"]):
+            cells = ["—" if v == 0 else str(v) for v in row]
+            lines.append(f"| `{lbl}` | " + " | ".join(cells) + " |")
+        lines.append("")
+    else:
+        lines.extend([f"## Baseline: `{labels[0]}`", ""])
+
+    lines.extend(
+        [
+            "## Pair Summary",
+            "",
+            "| Left | Right | Only left | Only right | Type | Presence | Paths |",
+            "|---|---|---|---|---|---|---|",
+        ]
+    )
+    for r in result["results"]:
+        if r["identical"]:
+            lines.append(f"| `{r['left']}` | `{r['right']}` | ✅ identical | | | | |")
+            continue
+        lines.append(
+            f"| `{r['left']}` | `{r['right']}` | {r['only_in_left']} | "
+            f"{r['only_in_right']} | {r['type_mismatches']} | "
+            f"{r['presence_issues']} | {r['path_changes']} |"
+        )
+    lines.append("")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "BatchInput",
+    "load_batch_input",
+    "load_sql_table_inputs",
+    "diff_pairs",
+    "compare_batch",
+    "render_batch_markdown",
+]
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Persistent BigQuery table-metadata cache, revalidated per dataset.
+
+Every ``compare``/``analyze`` run against a live table used to fetch its full
+metadata again. This module keeps each table's ``tables.get`` resource
+(schema, options, partitioning, clustering, table constraints) on disk, one
+JSON file per dataset, together with the table's ``lastModifiedTime``.
+Cached entries are revalidated for a whole dataset at once with a single
+``__TABLES__`` query (table id -> last modified time), by default on every
+call; a validation younger than `max_age` seconds may be trusted without any
+call. Only tables that changed or were never seen are fetched again (in bulk
+for large sets, see `bigquery_metadata.prefetch_dataset_tables`).
+
+Tables rebuilt by the bulk INFORMATION_SCHEMA path lack some ``tables.get``
+fields (e.g. table constraints). They are cached as partial entries, served
+only to callers passing ``allow_partial=True``; everyone else gets a full
+``get_table`` resource.
+
+Public helpers
+--------------
+- get_cached_tables – tables of one dataset, served from the cache when fresh
+- get_cached_table  – a single table (raises like ``client.get_table``)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from google.cloud import bigquery
+
+from . import analyze_config
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache file layout changes
+_CACHE_VERSION = 2
+
+MODIFIED_SQL = """
+SELECT table_id, last_modified_time
+FROM `{project}.{dataset}.__TABLES__`
+"""
+
+_LOCK = threading.Lock()
+
+
+def _cache_path(cache_dir: Optional[Path], project_id: str, dataset_id: str) -> Path:
+    if cache_dir is None:
+        from .decorators import _cache_manager
+
+        cache_dir = _cache_manager.cache_dir / "bq_metadata"
+    key = f"{project_id}.{dataset_id}"
+    digest = hashlib.sha1(key.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return Path(cache_dir) / f"{digest}.json"
+
+
+def _load(path: Path, project_id: str, dataset_id: str) -> dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            state: dict[str, Any] = json.load(fh)
+        if state.get("version") == _CACHE_VERSION and state.get("dataset") == (
+            f"{project_id}.{dataset_id}"
+        ):
+            return state
+    except (OSError, ValueError):
+        pass
+    return {
+        "version": _CACHE_VERSION,
+        "dataset": f"{project_id}.{dataset_id}",
+        "checked_at": None,
+        "modified": {},
+        "tables": {},
+    }
+
+
+def _save(path: Path, state: dict[str, Any]) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(state, fh)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        logger.debug("Could not write BigQuery metadata cache %s", path)
+        tmp.unlink(missing_ok=True)
+
+
+def _query_modified(
+    client: bigquery.Client, project_id: str, dataset_id: str
+) -> dict[str, int]:
+    """Table id -> last modified time (ms) for every table of the dataset."""
+    from .rate_limit import get_bigquery_limiter
+
+    sql = MODIFIED_SQL.format(project=project_id, dataset=dataset_id)
+    rows = get_bigquery_limiter(project_id).call(
+        lambda: list(client.query(sql).result()),
+        operation_name=f"Modified-time query for {project_id}.{dataset_id}",
+    )
+    return {row["table_id"]: int(row["last_modified_time"]) for row in rows}
+
+
+def get_cached_tables(
+    client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    table_ids: list[str],
+    *,
+    cache_dir: Optional[Path] = None,
+    max_age: Optional[float] = None,
+    allow_partial: bool = False,
+) -> tuple[dict[str, bigquery.Table], dict[str, Exception]]:
+    """Return tables of one dataset, fetching only what changed since cached.
+
+    Args:
+        client: BigQuery client instance
+        project_id: GCP project ID
+        dataset_id: Dataset ID
+        table_ids: Tables to return
+        cache_dir: Cache directory (default ``~/.cache/schema-diff/bq_metadata``)
+        max_age: Seconds a dataset validation is trusted without a query
+            (default: analyze_config.BQ_METADATA_MAX_AGE_SECONDS; 0 = always
+            revalidate)
+        allow_partial: Accept tables rebuilt from INFORMATION_SCHEMA, which
+            lack fields such as table constraints (bulk fetches are only
+            used when True)
+
+    Returns:
+        ``(tables, errors)``: table_id -> Table, and table_id -> exception for
+        tables that could not be fetched (e.g. NotFound)
+    """
+    if max_age is None:
+        max_age = analyze_config.BQ_METADATA_MAX_AGE_SECONDS
+    path = _cache_path(cache_dir, project_id, dataset_id)
+    with _LOCK:
+        state = _load(path, project_id, dataset_id)
+
+    now = time.time()
+    checked_at = state["checked_at"]
+    known = state["modified"]
+    validated = checked_at is not None and now - checked_at <= max_age
+    if not validated or any(t not in known for t in table_ids):
+        try:
+            known = _query_modified(client, project_id, dataset_id)
+            state["modified"], state["checked_at"] = known, now
+            validated = True
+        except Exception as e:
+            logger.debug(
+                "Cannot revalidate %s.%s metadata cache: %s", project_id, dataset_id, e
+            )
+            validated = False
+
+    tables: dict[str, bigquery.Table] = {}
+    errors: dict[str, Exception] = {}
+    stale: list[str] = []
+    for table_id in dict.fromkeys(table_ids):
+        entry = state["tables"].get(table_id)
+        if (
+            validated
+            and entry
+            and entry["last_modified"] == known.get(table_id)
+            and (allow_partial or not entry["partial"])
+        ):
+            tables[table_id] = bigquery.Table.from_api_repr(entry["resource"])
+        else:
+            stale.append(table_id)
+
+    if stale:
+        fetched, errors, partial = _fetch_tables(
+            client, project_id, dataset_id, stale, bulk=allow_partial
+        )
+        for table_id, tbl in fetched.items():
+            resource = tbl.to_api_repr()
+            if not isinstance(resource, dict):
+                tables[table_id] = tbl
+                continue
+            last_modified = resource.get("lastModifiedTime") or known.get(table_id)
+            if last_modified is not None:
+                state["tables"][table_id] = {
+                    "last_modified": int(last_modified),
+                    "resource": resource,
+                    "partial": table_id in partial,
+                }
+            tables[table_id] = tbl
+    logger.debug(
+        "BigQuery metadata cache %s.%s: %d hit(s), %d fetched",
+        project_id,
+        dataset_id,
+        len(table_ids) - len(stale),
+        len(stale),
+    )
+
+    if validated:
+        # Forget tables that no longer exist
+        for table_id in set(state["tables"]) - set(known):
+            del state["tables"][table_id]
+    with _LOCK:
+        _save(path, state)
+    return tables, errors
+
+
+def _fetch_tables(
+    client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    table_ids: list[str],
+    bulk: bool = False,
+) -> tuple[dict[str, bigquery.Table], dict[str, Exception], set[str]]:
+    """Fetch tables (in bulk when `bulk` and worthwhile) with ``get_table``.
+
+    Returns ``(tables, errors, partial)``; `partial` holds the ids rebuilt by
+    the bulk path rather than fetched with ``get_table``.
+    """
+    from .bigquery_metadata import prefetch_dataset_tables
+    from .rate_limit import get_bigquery_limiter
+
+    tables: dict[str, bigquery.Table] = {}
+    if bulk:
+        tables = prefetch_dataset_tables(client, project_id, dataset_id, table_ids)
+    partial = set(tables)
+    remaining = [t for t in table_ids if t not in tables]
+    errors: dict[str, Exception] = {}
+    if not remaining:
+        return tables, errors, partial
+
+    limiter = get_bigquery_limiter(project_id)
+
+    def _get(table_id: str) -> bigquery.Table:
+        ref = f"{project_id}.{dataset_id}.{table_id}"
+        return limiter.call(
+            lambda: client.get_table(ref), operation_name=f"get_table {ref}"
+        )
+
+    max_workers = min(analyze_config.PARALLEL_WORKERS, len(remaining))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {t: executor.submit(_get, t) for t in remaining}
+        for table_id, future in futures.items():
+            try:
+                tables[table_id] = future.result()
+            except Exception as e:
+                errors[table_id] = e
+    return tables, errors, partial
+
+
+def get_cached_table(
+    client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    **kwargs: Any,
+) -> bigquery.Table:
+    """Return one table through the cache; raises the fetch error if any."""
+    tables, errors = get_cached_tables(
+        client, project_id, dataset_id, [table_id], **kwargs
+    )
+    if table_id in errors:
+        raise errors[table_id]
+    return tables[table_id]
+
+
+__all__ = ["get_cached_tables", "get_cached_table"]
@@ -19,7 +19,7 @@ import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Iterable, TypeVar
 
 from google.api_core import exceptions as gcp_exceptions
 from google.cloud import bigquery
@@ -28,6 +28,13 @@ from google.cloud.bigquery.schema import SchemaField
 # Import all configuration from centralized module
 from schema_diff import analyze_config
 
+from .name_matcher import (
+    keyword_matcher,
+    prefix_matcher,
+    suffix_matcher,
+    token_matcher,
+)
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -99,46 +106,12 @@ def _retry_on_transient(
 
 
 # --- Tokenization & matching helpers -----------------------------------------
-# (Using PII_INDICATORS from bq_config)
-
-_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
-
-
-def _tokenize_name(name: str) -> list[str]:
-    """Split field name into lowercase tokens (handles snake & camelCase)."""
-    n = name or ""
-    # replace non-alnum with underscores, then split
-    base = re.sub(r"[^0-9A-Za-z]+", "_", n)
-    parts = []
-    for p in base.split("_"):
-        if not p:
-            continue
-        # split camelCase chunks too
-        parts.extend(_CAMEL_SPLIT_RE.sub("_", p).lower().split("_"))
-    # drop purely numeric tokens
-    return [t for t in parts if t and not t.isdigit()]
-
-
-def _indicator_tokens(indicator: str) -> list[str]:
-    """Turn an indicator like 'credit_card' into tokens ['credit','card']."""
-    return _tokenize_name(indicator)
-
-
-def _matches_indicator(tokens: set[str], indicator: str) -> bool:
-    """True if all tokens of the indicator are present in name tokens."""
-    itoks = _indicator_tokens(indicator)
-    return all(t in tokens for t in itoks)
+# (Using PII_INDICATORS from bq_config, compiled once by name_matcher)
 
 
 def _classify_pii_by_name(field_name: str) -> dict[str, list[str]]:
     """Return {category: [matched_indicator,...]} for the field name."""
-    tokens = set(_tokenize_name(field_name))
-    hits: dict[str, list[str]] = {}
-    for cat, indicators in analyze_config.PII_INDICATORS.items():
-        matched = [i for i in indicators if _matches_indicator(tokens, i)]
-        if matched:
-            hits[cat] = matched
-    return hits
+    return token_matcher(analyze_config.PII_INDICATORS).classify(field_name)
 
 
 def _policy_tag_names_on_field(f: SchemaField) -> list[str]:
@@ -571,7 +544,9 @@ def get_batch_constraints(
         )
         job_config.location = location
 
-        rows = _retry_on_transient(
+        from .rate_limit import get_bigquery_limiter
+
+        rows = get_bigquery_limiter(project_id).call(
             lambda: list(
                 client.query(
                     BATCH_CONSTRAINTS_SQL.format(
@@ -1012,11 +987,25 @@ def generate_dataset_ddl(
             client, project_id, dataset_id, table_ids
         )
 
+    # Bulk metadata for large datasets (two queries instead of a get_table per table)
+    from .bigquery_metadata import prefetch_dataset_tables
+    from .rate_limit import get_bigquery_limiter
+
+    prefetched = prefetch_dataset_tables(client, project_id, dataset_id, table_ids)
+    # Shared limiter: under throttling fewer get_table calls run at once
+    limiter = get_bigquery_limiter(project_id)
+    throttles_before = limiter.metrics.throttles
+
     def _one_table_ddl(table_id: str) -> tuple[str, str]:
         """Generate DDL for a single table (safe for parallel execution)."""
         try:
             table_ref = f"{project_id}.{dataset_id}.{table_id}"
-            tbl: bigquery.Table = client.get_table(table_ref)
+            tbl = prefetched.get(table_id)
+            if tbl is None:
+                tbl = limiter.call(
+                    lambda: client.get_table(table_ref),
+                    operation_name=f"get_table {table_ref}",
+                )
 
             create_header = f"CREATE OR REPLACE TABLE `{table_ref}` ("
             columns_block = _render_columns(tbl.schema)
@@ -1107,2355 +1096,221 @@ def generate_dataset_ddl(
             tid, ddl = _one_table_ddl(table_id)
             ddls[tid] = ddl
 
-    return ddls
-
-
-# =========================
-# Schema extraction for schema-diff integration
-# =========================
-
-
-def bigquery_schema_to_internal(
-    schema: list[SchemaField],
-) -> tuple[dict[str, Any], set[str]]:
-    """Convert BigQuery schema to internal schema-diff format.
-
-    Returns:
-        (schema_tree, required_paths)
-    """
-
-    def convert_field(field: SchemaField, path_prefix: str = "") -> Any:
-        field_path = f"{path_prefix}.{field.name}" if path_prefix else field.name
-
-        if field.field_type == "RECORD":
-            # STRUCT type
-            struct_dict = {}
-            for sub_field in field.fields:
-                struct_dict[sub_field.name] = convert_field(sub_field, field_path)
-
-            if field.mode == "REPEATED":
-                return [struct_dict]  # Array of structs
-            else:
-                return struct_dict
-        else:
-            # Scalar type
-            base_type = _map_bq_type_to_internal(field.field_type)
-            if field.mode == "REPEATED":
-                return [base_type]  # Array of scalars
-            else:
-                return base_type
-
-    def collect_required_paths(
-        schema: list[SchemaField], path_prefix: str = ""
-    ) -> set[str]:
-        required = set()
-        for field in schema:
-            field_path = f"{path_prefix}.{field.name}" if path_prefix else field.name
-
-            if field.mode == "REQUIRED":
-                required.add(field_path)
-
-            # Recurse into RECORD fields
-            if field.field_type == "RECORD":
-                if field.mode == "REPEATED":
-                    # For repeated records, collect paths with array notation
-                    nested_required = collect_required_paths(
-                        field.fields, f"{field_path}[]"
-                    )
-                else:
-                    nested_required = collect_required_paths(field.fields, field_path)
-                required.update(nested_required)
-
-        return required
-
-    # Convert schema
-    tree = {}
-    for field in schema:
-        tree[field.name] = convert_field(field)
-
-    # Collect required paths
-    required_paths = collect_required_paths(schema)
-
-    # Normalize BigQuery array wrapper patterns
-    tree = _normalize_bigquery_arrays(tree)
-
-    return tree, required_paths
-
-
-def _normalize_bigquery_arrays(tree: Any) -> Any:
-    """Normalize BigQuery array wrapper patterns like {'list': [{'element': ...}]} to
-    [...].
-
-    This removes the BigQuery-specific array wrapper structure to match the cleaner
-    array notation used elsewhere in schema-diff.
-    """
-    if isinstance(tree, dict):
-        normalized = {}
-        for key, value in tree.items():
-            # Check for BigQuery array wrapper pattern
-            if (
-                isinstance(value, dict)
-                and len(value) == 1
-                and "list" in value
-                and isinstance(value["list"], list)
-                and len(value["list"]) == 1
-                and isinstance(value["list"][0], dict)
-                and len(value["list"][0]) == 1
-                and "element" in value["list"][0]
-            ):
-                # Extract the element structure and normalize recursively
-                element_structure = value["list"][0]["element"]
-                normalized[key] = [_normalize_bigquery_arrays(element_structure)]
-            else:
-                # Recursively normalize nested structures
-                normalized[key] = _normalize_bigquery_arrays(value)
-        return normalized
-    elif isinstance(tree, list):
-        # Normalize list elements
-        return [_normalize_bigquery_arrays(item) for item in tree]
-    else:
-        # Return primitive values as-is
-        return tree
-
-
-def _map_bq_type_to_internal(bq_type: str) -> str:
-    """Map BigQuery types to internal schema-diff types."""
-    type_map = {
-        "STRING": "str",
-        "INT64": "int",
-        "INTEGER": "int",
-        "FLOAT64": "float",
-        "FLOAT": "float",
-        "NUMERIC": "number",
-        "BIGNUMERIC": "number",
-        "BOOL": "bool",
-        "BOOLEAN": "bool",
-        "DATE": "date",
-        "DATETIME": "datetime",
-        "TIME": "time",
-        "TIMESTAMP": "timestamp",
-        "BYTES": "bytes",
-        "GEOGRAPHY": "geography",
-        "JSON": "json",
-        "INTERVAL": "interval",
-    }
-    return type_map.get(bq_type, bq_type.lower())
-
-
-def get_live_table_schema(
-    project_id: str, dataset_id: str, table_id: str
-) -> tuple[dict[str, Any], set[str]]:
-    """Get live BigQuery table schema in schema-diff internal format.
-
-    Returns:
-        (schema_tree, required_paths)
-    """
-    client = bigquery.Client(project=project_id)
-    table_ref = f"{project_id}.{dataset_id}.{table_id}"
-    table = client.get_table(table_ref)
-
-    return bigquery_schema_to_internal(table.schema)
-
-
-# =========================
-# Schema Anti-Pattern Detection
-# =========================
-
-
-def _canon_type(field_type: str) -> str:
-    """Normalize BigQuery type aliases to canonical forms for analysis.
-
-    Maps FROM type aliases TO canonical analysis forms (INT64, FLOAT64, BOOLEAN).
-    This is the inverse direction of analyze_config.SCALAR_TYPE_MAP (used for DDL rendering).
-
-    Why the difference?
-    - DDL rendering: BOOLEAN → BOOL (BigQuery DDL prefers short form)
-    - Analysis: BOOL → BOOLEAN (longer form is more explicit for comparisons)
-
-    Args:
-        field_type: BigQuery field type (e.g., "INTEGER", "INT64", "FLOAT")
-
-    Returns:
-        Canonical type name (e.g., "INT64", "FLOAT64", "BOOLEAN")
-    """
-    t = (field_type or "").upper()
-    return {
-        "INTEGER": "INT64",
-        "FLOAT": "FLOAT64",
-        "BOOL": "BOOLEAN",
-        "BIGNUMERIC": "BIGNUMERIC",
-    }.get(t, t)
-
-
-def detect_bigquery_antipatterns(
-    schema: list[SchemaField],
-) -> list[dict[str, Any]]:
-    """Detect BigQuery schema anti-patterns in raw schema.
-
-    Detects multiple anti-patterns:
-    1. Unnecessary STRUCT wrappers
-    2. Inconsistent naming conventions
-    3. Boolean stored as INTEGER
-    4. Deep nesting (>10 levels)
-    5. REPEATED fields without ordering
-    6. Low-cardinality strings (enum candidates)
-    7. Generic field names
-    8. Missing descriptions on complex types
-
-    Returns list of issues with severity, description, and suggestions.
-    """
-    issues = []
-    all_field_names = []
-    nesting_depths = {}
-
-    def get_nesting_depth(field: SchemaField, current_depth: int = 0) -> int:
-        """Calculate max nesting depth for a field."""
-        if field.field_type != "RECORD":
-            return current_depth
-        max_depth = current_depth
-        for sub_field in field.fields:
-            depth = get_nesting_depth(sub_field, current_depth + 1)
-            max_depth = max(max_depth, depth)
-        return max_depth
-
-    def check_field(field: SchemaField, path: str = "", depth: int = 0) -> None:
-        """Recursively check fields for anti-patterns."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        all_field_names.append(field.name)
-
-        # Track nesting depth
-        if field.field_type == "RECORD":
-            max_depth = get_nesting_depth(field, depth)
-            nesting_depths[field_path] = max_depth
-
-        # Anti-pattern 1: STRUCT with single "list" field that's REPEATED
-        if field.field_type == "RECORD" and field.mode != "REPEATED":
-            if len(field.fields) == 1:
-                list_field = field.fields[0]
-                if list_field.name == "list" and list_field.mode == "REPEATED":
-                    if (
-                        list_field.field_type == "RECORD"
-                        and len(list_field.fields) == 1
-                    ):
-                        element_field = list_field.fields[0]
-                        if element_field.name == "element":
-                            issues.append(
-                                {
-                                    "field_name": field_path,
-                                    "pattern": "unnecessary_struct_wrapper",
-                                    "severity": "warning",
-                                    "category": "schema_design",
-                                }
-                            )
-
-        # Anti-pattern 2: STRUCT with single "element" inside REPEATED
-        if field.field_type == "RECORD" and field.mode == "REPEATED":
-            if len(field.fields) == 1:
-                element_field = field.fields[0]
-                if (
-                    element_field.name == "element"
-                    and element_field.field_type == "RECORD"
-                ):
-                    issues.append(
-                        {
-                            "field_name": field_path,
-                            "pattern": "unnecessary_element_wrapper",
-                            "severity": "warning",
-                            "category": "schema_design",
-                        }
-                    )
-
-        # Anti-pattern 3: Boolean stored as INTEGER
-        ft = _canon_type(field.field_type)
-        if ft == "INT64":
-            name_lower = field.name.lower()
-            if any(
-                name_lower.startswith(prefix)
-                for prefix in ["is_", "has_", "can_", "should_", "will_", "deleted"]
-            ):
-                issues.append(
-                    {
-                        "field_name": field_path,
-                        "pattern": "boolean_as_integer",
-                        "severity": "info",
-                        "category": "type_optimization",
-                        "suggestion": f"Use BOOLEAN instead of INTEGER for '{field_path}'",
-                    }
-                )
-
-        # Anti-pattern 4: Deep nesting (>10 levels)
-        if field.field_type == "RECORD" and depth > 10:
-            issues.append(
-                {
-                    "field_name": field_path,
-                    "pattern": "deep_nesting",
-                    "severity": "warning",
-                    "category": "complexity",
-                    "depth": depth,
-                    "suggestion": f"Consider flattening '{field_path}' (depth: {depth})",
-                }
-            )
-
-        # Anti-pattern 5: REPEATED RECORD without ordering field
-        if field.field_type == "RECORD" and field.mode == "REPEATED":
-            has_order_field = any(
-                sf.name
-                in [
-                    "order",
-                    "order_in_profile",
-                    "sequence",
-                    "position",
-                    "index",
-                    "sort_order",
-                ]
-                for sf in field.fields
-            )
-            if not has_order_field and len(field.fields) > 1:
-                issues.append(
-                    {
-                        "field_name": field_path,
-                        "pattern": "missing_array_ordering",
-                        "severity": "info",
-                        "category": "data_quality",
-                        "suggestion": f"Add ordering field to '{field_path}' array",
-                    }
-                )
-
-        # Anti-pattern 6: Generic field names
-        if field.name.lower() in analyze_config.GENERIC_FIELD_NAMES:
-            issues.append(
-                {
-                    "field_name": field_path,
-                    "pattern": "generic_field_name",
-                    "severity": "info",
-                    "category": "naming",
-                    "suggestion": f"Use more descriptive name instead of '{field.name}'",
-                }
-            )
-
-        # Anti-pattern 7: Missing description on complex types
-        if field.field_type == "RECORD" and not field.description:
-            if len(field.fields) > 5:  # Only flag complex structures
-                issues.append(
-                    {
-                        "field_name": field_path,
-                        "pattern": "missing_description",
-                        "severity": "info",
-                        "category": "documentation",
-                        "suggestion": f"Add description to complex field '{field_path}'",
-                    }
-                )
-
-        # Recurse into nested fields
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_field(sub_field, field_path, depth + 1)
-
-    # Check all top-level fields
-    for field in schema:
-        check_field(field)
-
-    # Anti-pattern 8: Inconsistent naming conventions (check after collecting all names)
-    snake_case_count = sum(1 for name in all_field_names if "_" in name)
-    camel_case_count = sum(
-        1
-        for name in all_field_names
-        if name != name.lower() and name != name.upper() and "_" not in name
-    )
-
-    total_names = len(all_field_names)
-    if total_names > 5:  # Only check if we have enough fields
-        if snake_case_count > 0 and camel_case_count > 0:
-            ratio = min(snake_case_count, camel_case_count) / total_names
-            if ratio > 0.2:  # More than 20% inconsistency
-                issues.append(
-                    {
-                        "field_name": "schema",
-                        "pattern": "inconsistent_naming",
-                        "severity": "info",
-                        "category": "naming",
-                        "suggestion": f"Inconsistent naming: {snake_case_count} snake_case vs {camel_case_count} camelCase fields. Standardize on snake_case (BigQuery convention)",
-                    }
-                )
-
-    # Anti-pattern 9: Deep nesting summary
-    deeply_nested = [path for path, depth in nesting_depths.items() if depth > 5]
-    if deeply_nested:
-        max_depth = max(nesting_depths.values())
-        if max_depth > 8:
-            issues.append(
-                {
-                    "field_name": "schema",
-                    "pattern": "overall_deep_nesting",
-                    "severity": "warning",
-                    "category": "complexity",
-                    "suggestion": f"Schema has max nesting depth of {max_depth} levels. Consider flattening deeply nested structures.",
-                    "affected_count": len(deeply_nested),
-                }
-            )
-
-    # Anti-pattern 10: Wide tables (too many columns)
-    total_top_level_fields = len(schema)
-    if total_top_level_fields > 100:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "wide_table",
-                "severity": "warning",
-                "category": "complexity",
-                "suggestion": f"Table has {total_top_level_fields} columns. Consider splitting into multiple tables or using nested structures for better organization.",
-                "field_count": total_top_level_fields,
-            }
-        )
-    elif total_top_level_fields > 50:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "wide_table",
-                "severity": "info",
-                "category": "complexity",
-                "suggestion": f"Table has {total_top_level_fields} columns. This is getting wide - consider if splitting would improve maintainability.",
-                "field_count": total_top_level_fields,
-            }
-        )
-
-    # Anti-pattern 11: Inconsistent timestamp formats
-    string_date_fields = []
-    timestamp_fields = []
-
-    def check_date_fields(field: SchemaField, path: str = "") -> None:
-        """Check for date/time fields."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Check for STRING fields with date-like names
-        if field.field_type == "STRING":
-            if any(
-                keyword in name_lower
-                for keyword in [
-                    "date",
-                    "time",
-                    "timestamp",
-                    "created",
-                    "updated",
-                    "modified",
-                    "deleted",
-                    "_at",
-                    "_on",
-                ]
-            ):
-                string_date_fields.append(field_path)
-
-        # Track TIMESTAMP/DATE/DATETIME fields
-        if field.field_type in ["TIMESTAMP", "DATE", "DATETIME"]:
-            timestamp_fields.append(field_path)
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_date_fields(sub_field, field_path)
-
-    for field in schema:
-        check_date_fields(field)
-
-    if string_date_fields and timestamp_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "inconsistent_timestamps",
-                "severity": "warning",
-                "category": "type_consistency",
-                "suggestion": f"Mix of STRING date fields ({len(string_date_fields)}) and TIMESTAMP types ({len(timestamp_fields)}). Standardize on TIMESTAMP/DATE types for better performance and type safety.",
-                "string_dates": string_date_fields[:5],
-                "typed_dates": timestamp_fields[:5],
-            }
-        )
-
-    # Collect nullable ID fields first (to exclude from FK check)
-    primary_id_fields_set = set()
-
-    def collect_primary_ids(field: SchemaField, path: str = "") -> None:
-        """Collect primary ID field names."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        if field.mode == "NULLABLE":
-            # Top-level id
-            if name_lower == "id" and not path:
-                primary_id_fields_set.add(field_path)
-            # Entity-specific IDs at top level (member_id, user_id, etc.)
-            elif (
-                name_lower.endswith("_id")
-                and not name_lower.endswith("_ref_id")
-                and not path
-            ):
-                if name_lower not in [
-                    "parent_id",
-                    "related_id",
-                    "ref_id",
-                    "reference_id",
-                ]:
-                    primary_id_fields_set.add(field_path)
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                collect_primary_ids(sub_field, field_path)
-
-    for field in schema:
-        collect_primary_ids(field)
-
-    # Anti-pattern 12: Nullable foreign keys (excluding primary IDs)
-    nullable_foreign_keys = []
-
-    def check_foreign_keys(field: SchemaField, path: str = "") -> None:
-        """Check for nullable foreign key fields."""
-        field_path = f"{path}.{field.name}" if path else field.name
-
-        # Check if field looks like a foreign key and is nullable
-        if field.name.endswith("_id") and field.mode == "NULLABLE":
-            # Exclude fields already flagged as primary IDs
-            if field_path not in primary_id_fields_set:
-                # Exclude common non-FK ids
-                if field.name not in ["id", "uuid", "guid"]:
-                    nullable_foreign_keys.append(field_path)
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_foreign_keys(sub_field, field_path)
-
-    for field in schema:
-        check_foreign_keys(field)
-
-    if nullable_foreign_keys:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "nullable_foreign_keys",
-                "severity": "info",
-                "category": "data_integrity",
-                "suggestion": f"Foreign key fields are nullable ({len(nullable_foreign_keys)} fields). Consider making REQUIRED or adding explicit null handling to prevent orphaned references.",
-                "affected_fields": nullable_foreign_keys,
-            }
-        )
-
-    # Anti-pattern 13: Redundant/duplicate structures
-    # Find RECORD fields with IDENTICAL structures at the TOP level only
-    # This is conservative - only flags true duplicates that likely represent the same entity
-    top_level_struct_signatures: dict[tuple, list[str]] = {}
-
-    def collect_top_level_struct_signatures(field: SchemaField) -> None:
-        """Collect signatures of top-level RECORD fields only."""
-        # Only check direct children of root or arrays
-        # Skip deeply nested structures as similarity there is often coincidental
-        if field.field_type == "RECORD":
-            # For arrays, check the element structure
-            if (
-                field.mode == "REPEATED"
-                and len(field.fields) == 1
-                and field.fields[0].name == "element"
-            ):
-                element_field = field.fields[0]
-                if element_field.field_type == "RECORD":
-                    # This is an array of structs - check its structure
-                    signature = tuple(
-                        sorted(
-                            (sf.name, sf.field_type, sf.mode)
-                            for sf in element_field.fields
-                        )
-                    )
-                    # Only flag if substantial (>=6 fields) and at root level
-                    if len(signature) >= 6:
-                        if signature not in top_level_struct_signatures:
-                            top_level_struct_signatures[signature] = []
-                        top_level_struct_signatures[signature].append(
-                            f"{field.name}.list.element"
-                        )
-
-    for field in schema:
-        collect_top_level_struct_signatures(field)
-
-    # Find duplicates - only report if 3+ instances (more likely to be a real issue)
-    redundant_structs = {
-        sig: paths
-        for sig, paths in top_level_struct_signatures.items()
-        if len(paths) >= 3
-    }
-
-    if redundant_structs:
-        # Report the most duplicated one
-        most_duplicated = max(
-            redundant_structs.items(), key=lambda x: (len(x[1]), len(x[0]))
-        )
-        signature, paths = most_duplicated
-
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "redundant_structures",
-                "severity": "info",
-                "category": "normalization",
-                "suggestion": f"Identical structure ({len(signature)} fields) appears in {len(paths)} top-level arrays. If these represent the same entity type, consider consolidating or creating a shared reference table.",
-                "affected_fields": paths,
-                "field_count": len(signature),
-            }
-        )
-
-    # Anti-pattern 14: Cryptic/abbreviated column names
-    cryptic_fields = []
-
-    def check_cryptic_names(field: SchemaField, path: str = "") -> None:
-        """Check for cryptic or overly abbreviated names."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name = field.name
-
-        # Skip ISO standard codes (iso_2, iso_3, iso_*, etc.)
-        name_lower = name.lower()
-        if "iso" in name_lower or name_lower.startswith("iso_"):
-            return
-
-        # Check for cryptic patterns
-        is_cryptic = False
-
-        # Pattern 1: Very short names (1-2 chars) that aren't common
-        if len(name) <= 2 and name_lower not in analyze_config.ACCEPTABLE_ABBREVIATIONS:
-            is_cryptic = True
-
-        # Pattern 2: Excessive abbreviation (lots of consonants, no vowels, >3 chars)
-        if len(name) > 3 and len(name) <= 6:
-            vowels = set("aeiouAEIOU")
-            has_vowel = any(c in vowels for c in name)
-            if (
-                not has_vowel
-                and name_lower not in analyze_config.ACCEPTABLE_ABBREVIATIONS
-            ):
-                is_cryptic = True
-
-        # Pattern 3: Numbers in names (except common patterns like v1, v2, iso_2, iso_3)
-        if re.search(r"\d", name) and not re.match(
-            r".*(_v\d+|_\d{4}|_at|_on|iso_\d+)$", name_lower
-        ):
-            # Allow version numbers, years, and ISO codes
-            if not re.match(
-                r"^(v\d+|version_?\d+|.*iso.*\d+)$", name_lower, re.IGNORECASE
-            ):
-                is_cryptic = True
-
-        # Pattern 4: Single letter prefixes (e.g., bActive, sName, iCount)
-        if re.match(r"^[a-z][A-Z]", name):  # Hungarian notation
-            is_cryptic = True
-
-        if is_cryptic:
-            cryptic_fields.append(field_path)
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_cryptic_names(sub_field, field_path)
-
-    for field in schema:
-        check_cryptic_names(field)
-
-    if cryptic_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "cryptic_names",
-                "severity": "info",
-                "category": "naming",
-                "suggestion": f"Cryptic or overly abbreviated field names detected ({len(cryptic_fields)} fields). Use descriptive names for better readability (e.g., 'usr' → 'user', 'cnt' → 'count').",
-                "affected_fields": cryptic_fields,
-            }
-        )
-
-    # Anti-pattern 15: Missing audit columns
-    top_level_names = {f.name.lower() for f in schema}
-
-    # Check for presence of audit field categories
-    has_timestamp = bool(top_level_names & analyze_config.AUDIT_TIMESTAMP_FIELDS)
-    has_actor = bool(top_level_names & analyze_config.AUDIT_ACTOR_FIELDS)
-    has_version = bool(top_level_names & analyze_config.AUDIT_VERSION_FIELDS)
-    has_soft_delete = bool(top_level_names & analyze_config.AUDIT_SOFT_DELETE_FIELDS)
-    has_source = bool(top_level_names & analyze_config.AUDIT_SOURCE_FIELDS)
-
-    # Find which specific recommended fields are present
-    present_audit = top_level_names & analyze_config.ALL_AUDIT_FIELDS
-    missing_recommended = analyze_config.RECOMMENDED_AUDIT_FIELDS - top_level_names
-
-    # Check for incomplete audit pairs
-    incomplete_pairs = []
-    for ts_field, actor_field in analyze_config.AUDIT_FIELD_PAIRS:
-        if ts_field in top_level_names and actor_field not in top_level_names:
-            incomplete_pairs.append(f"{ts_field} (missing {actor_field})")
-
-    # Build comprehensive feedback
-    audit_summary = {
-        "has_timestamp": has_timestamp,
-        "has_actor": has_actor,
-        "has_version": has_version,
-        "has_soft_delete": has_soft_delete,
-        "has_source": has_source,
-        "present_fields": sorted(present_audit),
-        "missing_recommended": sorted(missing_recommended),
-        "incomplete_pairs": incomplete_pairs,
-    }
-
-    # Issue if missing recommended fields or has incomplete pairs
-    if missing_recommended or incomplete_pairs:
-        severity = "warning" if missing_recommended else "info"
-
-        suggestion_parts = []
-        if missing_recommended:
-            suggestion_parts.append(
-                f"Missing recommended audit fields: {', '.join(sorted(missing_recommended))}"
-            )
-        if incomplete_pairs:
-            suggestion_parts.append(
-                f"Incomplete audit pairs: {', '.join(incomplete_pairs)}"
-            )
-
-        # Add category-specific recommendations
-        recommendations = []
-        if not has_timestamp:
-            recommendations.append(
-                "Add timestamp fields (created_at, updated_at) for change tracking"
-            )
-        if not has_actor and has_timestamp:
-            recommendations.append(
-                "Consider adding actor fields (created_by, updated_by) to track who made changes"
-            )
-        if not has_version and (has_timestamp or has_actor):
-            recommendations.append(
-                "Consider adding version/etag for optimistic locking"
-            )
-
-        full_suggestion = ". ".join(suggestion_parts)
-        if recommendations:
-            full_suggestion += ". " + ". ".join(recommendations)
-
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "missing_audit_columns",
-                "severity": severity,
-                "category": "data_quality",
-                "suggestion": full_suggestion,
-                "audit_summary": audit_summary,
-            }
-        )
-
-    # Anti-pattern 16: Inconsistent field casing within schema
-    # Collect all field name casing patterns
-    all_fields_for_casing = []
-
-    def collect_all_names(field: SchemaField, path: str = "") -> None:
-        """Collect all field names for casing analysis."""
-        all_fields_for_casing.append(field.name)
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                collect_all_names(
-                    sub_field, f"{path}.{field.name}" if path else field.name
-                )
-
-    for field in schema:
-        collect_all_names(field)
-
-    # Analyze casing patterns
-    snake_case = []  # lowercase_with_underscores
-    camel_case = []  # camelCase
-    pascal_case = []  # PascalCase
-    upper_case = []  # ALLCAPS or UPPER_SNAKE
-    mixed_case = []  # Anything else weird
-
-    for name in all_fields_for_casing:
-        if name.isupper():
-            upper_case.append(name)
-        elif "_" in name and name.islower():
-            snake_case.append(name)
-        elif "_" in name and name.isupper():
-            upper_case.append(name)
-        elif name[0].isupper() and "_" not in name:
-            pascal_case.append(name)
-        elif name[0].islower() and name != name.lower() and "_" not in name:
-            camel_case.append(name)
-        elif name.islower():
-            snake_case.append(name)  # Lowercase, no underscores
-        else:
-            mixed_case.append(name)
-
-    # Check for inconsistency
-    casing_counts = {
-        "snake_case": len(snake_case),
-        "camelCase": len(camel_case),
-        "PascalCase": len(pascal_case),
-        "UPPER_CASE": len(upper_case),
-        "mixed": len(mixed_case),
-    }
-
-    # Remove zero counts
-    casing_counts = {k: v for k, v in casing_counts.items() if v > 0}
-
-    # If we have more than one casing style with significant usage
-    if len(casing_counts) > 1:
-        # Check if minority style is > 20% of fields
-        total = sum(casing_counts.values())
-        sorted_styles = sorted(casing_counts.items(), key=lambda x: x[1], reverse=True)
-        dominant_style, dominant_count = sorted_styles[0]
-
-        minority_count = sum(count for _, count in sorted_styles[1:])
-        if minority_count / total > 0.15:  # More than 15% inconsistency
-            style_summary = ", ".join(
-                f"{count} {style}" for style, count in sorted_styles
-            )
-            issues.append(
-                {
-                    "field_name": "schema",
-                    "pattern": "inconsistent_casing",
-                    "severity": "info",
-                    "category": "naming",
-                    "suggestion": f"Inconsistent field name casing: {style_summary}. BigQuery convention is snake_case. Standardize all fields to {dominant_style} or preferably snake_case.",
-                    "casing_distribution": dict(casing_counts),
-                }
-            )
-
-    # Anti-pattern 17: JSON/STRING blob fields
-    json_blob_fields = []
-
-    def check_json_blobs(field: SchemaField, path: str = "") -> None:
-        """Check for STRING fields that should be structured."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Check if STRING field with blob-like name
-        if field.field_type == "STRING":
-            blob_indicators = [
-                "json",
-                "metadata",
-                "properties",
-                "config",
-                "data",
-                "payload",
-                "content",
-                "details",
-                "attributes",
-                "extra",
-                "raw",
-                "blob",
-                "params",
-                "options",
-                "settings",
-            ]
-            if name_lower in blob_indicators or any(
-                name_lower.endswith(f"_{indicator}")
-                or name_lower.startswith(f"{indicator}_")
-                for indicator in blob_indicators
-            ):
-                json_blob_fields.append(field_path)
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_json_blobs(sub_field, field_path)
-
-    for field in schema:
-        check_json_blobs(field)
-
-    if json_blob_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "json_string_blobs",
-                "severity": "warning",
-                "category": "schema_design",
-                "suggestion": f"STRING fields likely containing JSON/structured data ({len(json_blob_fields)} fields). Use RECORD/STRUCT for type safety, better compression, and column-level access.",
-                "affected_fields": json_blob_fields,
-            }
-        )
-
-    # Anti-pattern 18: Nullable ID fields
-    nullable_id_fields = []
-
-    def check_nullable_ids(field: SchemaField, path: str = "") -> None:
-        """Check for ID fields that should be REQUIRED."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Check if this is a primary/important ID that's nullable
-        if field.mode == "NULLABLE":
-            # Primary key patterns
-            if name_lower == "id" and not path:  # Top-level id
-                nullable_id_fields.append(field_path)
-            # Entity-specific IDs (user_id, customer_id, etc.)
-            elif name_lower.endswith("_id") and not name_lower.endswith("_ref_id"):
-                # Exclude obvious foreign keys like parent_id, related_id
-                if name_lower not in [
-                    "parent_id",
-                    "related_id",
-                    "ref_id",
-                    "reference_id",
-                ]:
-                    # If it's at top level or in a non-repeated structure, flag it
-                    if not path or "_id" in name_lower.split("_")[0]:
-                        nullable_id_fields.append(field_path)
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_nullable_ids(sub_field, field_path)
-
-    for field in schema:
-        check_nullable_ids(field)
-
-    if nullable_id_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "nullable_id_fields",
-                "severity": "warning",
-                "category": "data_integrity",
-                "suggestion": f"Primary/identifier fields are nullable ({len(nullable_id_fields)} fields). IDs should typically be REQUIRED to ensure data integrity.",
-                "affected_fields": nullable_id_fields,
-            }
-        )
-
-    # Anti-pattern 19: Reserved keyword field names
-    keyword_fields = []
-
-    def check_reserved_keywords(field: SchemaField, path: str = "") -> None:
-        """Check for reserved keyword field names."""
-        field_path = f"{path}.{field.name}" if path else field.name
-
-        if field.name.lower() in analyze_config.RESERVED_KEYWORDS:
-            keyword_fields.append(field_path)
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_reserved_keywords(sub_field, field_path)
-
-    for field in schema:
-        check_reserved_keywords(field)
-
-    if keyword_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "reserved_keywords",
-                "severity": "warning",
-                "category": "naming",
-                "suggestion": f"Field names use SQL reserved keywords ({len(keyword_fields)} fields). Requires backticks in queries. Rename to avoid: `select` → `selection`, `order` → `sort_order`, `group` → `group_name`.",
-                "affected_fields": keyword_fields,
-            }
-        )
-
-    # Anti-pattern 20: Overly granular timestamps (TIMESTAMP for date-only fields)
-    granular_timestamp_fields = []
-
-    def check_timestamp_granularity(field: SchemaField, path: str = "") -> None:
-        """Check for TIMESTAMP fields that should be DATE."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Check if TIMESTAMP with date-only semantics
-        if field.field_type == "TIMESTAMP":
-            # Also check for _date suffix (but not _datetime)
-            if name_lower in analyze_config.DATE_ONLY_FIELD_PATTERNS or (
-                name_lower.endswith("_date") and not name_lower.endswith("_datetime")
-            ):
-                granular_timestamp_fields.append(field_path)
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_timestamp_granularity(sub_field, field_path)
-
-    for field in schema:
-        check_timestamp_granularity(field)
-
-    if granular_timestamp_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "overly_granular_timestamps",
-                "severity": "info",
-                "category": "type_optimization",
-                "suggestion": f"TIMESTAMP fields with date-only semantics ({len(granular_timestamp_fields)} fields). Use DATE type for fields like birth_date, hire_date. Saves 8 bytes per row and improves query semantics.",
-                "affected_fields": granular_timestamp_fields,
-            }
-        )
-
-    # Anti-pattern 21: Expensive unnest candidates (complex ARRAY<STRUCT>)
-    expensive_unnest_fields = []
-
-    def check_expensive_unnests(field: SchemaField, path: str = "") -> None:
-        """Check for ARRAY<STRUCT> with many fields (expensive to unnest)."""
-        field_path = f"{path}.{field.name}" if path else field.name
-
-        # Check for REPEATED RECORD with many fields
-        if field.field_type == "RECORD" and field.mode == "REPEATED":
-            field_count = len(field.fields)
-            if field_count > 10:
-                expensive_unnest_fields.append((field_path, field_count))
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_expensive_unnests(sub_field, field_path)
-
-    for field in schema:
-        check_expensive_unnests(field)
-
-    if expensive_unnest_fields:
-        # Sort by field count descending
-        expensive_unnest_fields.sort(key=lambda x: x[1], reverse=True)
-        field_paths = [path for path, _ in expensive_unnest_fields]
-        max_field_count = expensive_unnest_fields[0][1]
-
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "expensive_unnest",
-                "severity": "info",
-                "category": "performance",
-                "suggestion": f"Complex ARRAY<STRUCT> fields ({len(expensive_unnest_fields)} arrays, max {max_field_count} fields). UNNEST operations on wide structs are expensive. Consider denormalizing into separate table or reducing struct width.",
-                "affected_fields": field_paths,
-            }
-        )
-
-    # Anti-pattern 22: Negative boolean field names
-    negative_boolean_fields = []
-
-    def check_negative_booleans(field: SchemaField, path: str = "") -> None:
-        """Check for negative boolean naming (double negative logic)."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Check for negative boolean patterns
-        if field.field_type in ["BOOLEAN", "INTEGER"]:
-            # Check for explicit negative patterns (first 5 in the set)
-            explicit_negatives = ["is_not_", "has_no_", "cannot_", "isnt_", "hasnt_"]
-            for pattern in explicit_negatives:
-                if name_lower.startswith(pattern):
-                    negative_boolean_fields.append(field_path)
-                    break
-            # Check for implicit negatives (but be careful with common names)
-            else:
-                if any(
-                    name_lower.startswith(p)
-                    for p in ["no_", "not_", "non_", "without_"]
-                ):
-                    # Exclude common acceptable names
-                    if name_lower not in [
-                        "no_reply",
-                        "notes",
-                        "notice",
-                        "notification",
-                    ]:
-                        negative_boolean_fields.append(field_path)
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_negative_booleans(sub_field, field_path)
-
-    for field in schema:
-        check_negative_booleans(field)
-
-    if negative_boolean_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "negative_booleans",
-                "severity": "info",
-                "category": "naming",
-                "suggestion": f"Negative boolean field names ({len(negative_boolean_fields)} fields). Creates double negatives in queries. Use positive names: `is_not_active` → `is_active`, `has_no_access` → `has_access`.",
-                "affected_fields": negative_boolean_fields,
-            }
-        )
-
-    # Anti-pattern 23: Overly long field names
-    long_field_names = []
-
-    def check_long_names(field: SchemaField, path: str = "") -> None:
-        """Check for excessively long field names."""
-        field_path = f"{path}.{field.name}" if path else field.name
-
-        if len(field.name) > 50:
-            long_field_names.append((field_path, len(field.name)))
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_long_names(sub_field, field_path)
-
-    for field in schema:
-        check_long_names(field)
-
-    if long_field_names:
-        # Sort by length descending
-        long_field_names.sort(key=lambda x: x[1], reverse=True)
-        field_paths = [path for path, _ in long_field_names]
-        max_length = long_field_names[0][1]
-
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "overly_long_names",
-                "severity": "info",
-                "category": "naming",
-                "suggestion": f"Overly long field names ({len(long_field_names)} fields, max {max_length} chars). Keep names concise (<50 chars). Use descriptions for details.",
-                "affected_fields": field_paths,
-            }
-        )
-
-    # Anti-pattern 24: Field ordering
-    # REMOVED: Field ordering is subjective and doesn't affect BigQuery performance.
-    # Column order has no impact on query execution, storage, or indexing in BigQuery.
-
-    # ============================================================================
-    # PHASE 1: High-Impact Anti-Patterns (10 patterns)
-    # ============================================================================
-
-    # Anti-pattern 25: String abuse (numbers/booleans as STRING)
-    string_abuse_fields = []
-
-    def check_string_abuse(field: SchemaField, path: str = "") -> None:
-        """Check for STRING fields that should be numeric or boolean."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        if field.field_type == "STRING":
-            # Skip ISO codes, country codes, and code fields (correctly STRING)
-            if any(
-                pattern in name_lower
-                for pattern in analyze_config.STRING_FIELD_EXCLUSIONS
-            ):
-                return
-
-            # Numeric indicators
-            # Be more conservative: require exact match or _keyword pattern
-            # Exclude "number" and "position" as they're often identifiers/codes
-            if any(
-                name_lower == kw or f"_{kw}" in name_lower or f"{kw}_" in name_lower
-                for kw in analyze_config.NUMERIC_FIELD_INDICATORS
-            ):
-                string_abuse_fields.append((field_path, "numeric"))
-
-            # Boolean indicators (not caught by boolean_as_integer check)
-            if any(
-                name_lower.startswith(kw)
-                for kw in analyze_config.BOOLEAN_FIELD_PREFIXES
-            ) or any(kw in name_lower for kw in analyze_config.BOOLEAN_FIELD_KEYWORDS):
-                string_abuse_fields.append((field_path, "boolean"))
-
-        # Recurse
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_string_abuse(sub_field, field_path)
-
-    for field in schema:
-        check_string_abuse(field)
-
-    if string_abuse_fields:
-        by_type: dict[str, list[str]] = {}
-        for field_path, suggested_type in string_abuse_fields:
-            by_type.setdefault(suggested_type, []).append(field_path)
-
-        for suggested_type, fields in by_type.items():
-            type_name = "INTEGER/NUMERIC" if suggested_type == "numeric" else "BOOLEAN"
-            issues.append(
-                {
-                    "field_name": "schema",
-                    "pattern": "string_type_abuse",
-                    "severity": "warning",
-                    "category": "type_optimization",
-                    "suggestion": f"STRING fields that should be {type_name} ({len(fields)} fields). Use proper types for better performance, validation, and query optimization.",
-                    "affected_fields": fields,
-                }
-            )
-
-    # Anti-pattern 26: Type inconsistency (mixed types for similar fields)
-    def check_type_consistency() -> None:
-        """Check for inconsistent types across similar fields."""
-        id_fields_by_type: dict[str, list[str]] = {}
-
-        def collect_id_types(field: SchemaField, path: str = "") -> None:
-            field_path = f"{path}.{field.name}" if path else field.name
-            field_name_lower = field.name.lower()
-
-            # Only check top-level IDs (internal entity IDs)
-            # Exclude:
-            # - Nested IDs (external references like credential_id, certificate_id)
-            # - Common external IDs (transaction_id, order_id, etc. in nested contexts)
-            if field_name_lower.endswith("_id") and not path:
-                id_fields_by_type.setdefault(field.field_type, []).append(field_path)
-
-            if field.field_type == "RECORD":
-                for sub_field in field.fields:
-                    collect_id_types(sub_field, field_path)
-
-        for field in schema:
-            collect_id_types(field)
-
-        if len(id_fields_by_type) > 1:
-            type_summary = ", ".join(
-                f"{len(fields)} {ftype}" for ftype, fields in id_fields_by_type.items()
-            )
-            all_id_fields = [f for fields in id_fields_by_type.values() for f in fields]
-            issues.append(
-                {
-                    "field_name": "schema",
-                    "pattern": "inconsistent_id_types",
-                    "severity": "warning",
-                    "category": "type_consistency",
-                    "suggestion": f"Internal ID fields have inconsistent types ({type_summary}). Standardize on one type (typically STRING or INTEGER) for primary entity IDs.",
-                    "affected_fields": all_id_fields,
-                }
-            )
-
-    check_type_consistency()
-
-    # Anti-pattern 27: FLOAT64 for monetary values
-    float_money_fields = []
-
-    def check_float_money(field: SchemaField, path: str = "") -> None:
-        """Check for FLOAT64 fields used for money."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-        ft = _canon_type(field.field_type)
-
-        if ft == "FLOAT64":
-            if any(
-                keyword in name_lower for keyword in analyze_config.FLOAT_MONEY_KEYWORDS
-            ):
-                float_money_fields.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_float_money(sub_field, field_path)
-
-    for field in schema:
-        check_float_money(field)
-
-    if float_money_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "float_for_money",
-                "severity": "warning",
-                "category": "type_optimization",
-                "suggestion": f"FLOAT64 used for monetary values ({len(float_money_fields)} fields). Use NUMERIC/DECIMAL for exact decimal arithmetic to avoid rounding errors.",
-                "affected_fields": float_money_fields,
-            }
-        )
-
-    # Anti-pattern 28: God table (too many unrelated fields)
-    total_fields = len(schema)
-    if total_fields > 80:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "god_table",
-                "severity": "warning",
-                "category": "schema_design",
-                "suggestion": f"Table has {total_fields} top-level fields, suggesting multiple concerns. Consider splitting into focused tables (users + preferences, orders + line_items, etc.) for better maintainability.",
-                "affected_fields": [],
-            }
-        )
-
-    # Anti-pattern 29: Missing unique identifiers in arrays
-    arrays_without_id = []
-
-    def check_array_ids(field: SchemaField, path: str = "") -> None:
-        """Check for ARRAY<STRUCT> without id field."""
-        field_path = f"{path}.{field.name}" if path else field.name
-
-        if field.field_type == "RECORD" and field.mode == "REPEATED":
-            # Check if struct has an id field
-            has_id = any(
-                sf.name.lower() in ["id", "uuid", "guid", "key", "index"]
-                for sf in field.fields
-            )
-            # Only flag if struct has multiple fields
-            if not has_id and len(field.fields) > 2:
-                arrays_without_id.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_array_ids(sub_field, field_path)
-
-    for field in schema:
-        check_array_ids(field)
-
-    if arrays_without_id:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "array_without_id",
-                "severity": "warning",
-                "category": "data_quality",
-                "suggestion": f"ARRAY<STRUCT> fields without unique identifiers ({len(arrays_without_id)} arrays). Add id/uuid field to enable updates, deletes, and unambiguous references.",
-                "affected_fields": arrays_without_id,
-            }
-        )
-
-    # Anti-pattern 30: PII without clear marking
-    pii_missing_both = []  # no policy tags AND no doc
-    pii_missing_tags = []  # documented but missing policy tags
-
-    def check_pii(field: SchemaField, path: str = "") -> None:
-        """Check for PII fields and whether they are tagged/documented."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Cut obvious false positives
-        if (name_lower in analyze_config.PII_EXCLUDE_EXACT) or any(
-            name_lower.endswith(suf) for suf in analyze_config.PII_EXCLUDE_SUFFIXES
-        ):
-            pass
-        else:
-            # Flatten all PII indicators into single list for substring check
-            all_pii_indicators: list[str] = []
-            for indicators in analyze_config.PII_INDICATORS.values():
-                all_pii_indicators.extend(indicators)
-
-            name_signals = any(ind in name_lower for ind in all_pii_indicators)
-
-            # Weak signals (only count if STRING/BYTES)
-            if not name_signals and any(
-                t in name_lower for t in {"image", "photo", "picture"}
-            ):
-                name_signals = field.field_type in ("STRING", "BYTES")
-
-            if name_signals:
-                desc = (field.description or "").lower()
-                documented = any(
-                    w in desc
-                    for w in [
-                        "pii",
-                        "sensitive",
-                        "confidential",
-                        "private",
-                        "personal",
-                    ]
-                )
-                tagged = bool(_policy_tag_names(field))
-
-                if not documented and not tagged:
-                    pii_missing_both.append(field_path)
-                elif documented and not tagged:
-                    pii_missing_tags.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub in field.fields:
-                check_pii(sub, field_path)
-
-    for field in schema:
-        check_pii(field)
-
-    if pii_missing_both:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "pii_unmarked_undocumented",
-                "severity": "warning",
-                "category": "security",
-                "suggestion": "Fields likely containing PII are neither policy-tagged nor documented. Add data catalog policy tags and docs.",
-                "affected_fields": pii_missing_both,
-            }
-        )
-    if pii_missing_tags:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "pii_missing_policy_tags",
-                "severity": "info",
-                "category": "security",
-                "suggestion": "Fields likely containing PII are documented as sensitive but missing policy tags. Attach taxonomy policy tags.",
-                "affected_fields": pii_missing_tags,
-            }
-        )
-
-    # Anti-pattern 31: Password/secret fields
-    secret_fields_untagged = []
-    secret_fields_tagged_or_doc = []
-
-    def check_secrets(field: SchemaField, path: str = "") -> None:
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Ignore obvious non-secrets (_id/_key references)
-        if name_lower.endswith(("_id", "_key", "_ref")):
-            pass
-        else:
-            is_secretish = name_lower in analyze_config.SENSITIVE_SECRETS_EXACT
-            # tolerant extras: *_secret, *_token, *_private_key (but avoid false positives)
-            if not is_secretish and any(
-                name_lower.endswith(sfx)
-                for sfx in analyze_config.SENSITIVE_SECRET_SUFFIXES
-            ):
-                is_secretish = True
-
-            if is_secretish:
-                desc = (field.description or "").lower()
-                documented = any(
-                    w in desc for w in ["secret", "credential", "sensitive"]
-                )
-                tagged = bool(_policy_tag_names(field))
-                # Prefer BYTES or hashed STRING; flag plain STRING strongly
-                if field.field_type == "STRING" and not (tagged or documented):
-                    secret_fields_untagged.append(field_path)
-                elif tagged or documented:
-                    secret_fields_tagged_or_doc.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub in field.fields:
-                check_secrets(sub, field_path)
-
-    for field in schema:
-        check_secrets(field)
-
-    if secret_fields_untagged:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "plaintext_secrets",
-                "severity": "error",
-                "category": "security",
-                "suggestion": "Likely secrets stored without policy tags/docs. Never store plaintext passwords or long-lived tokens; prefer hashed values or external secret managers and add policy tags.",
-                "affected_fields": secret_fields_untagged,
-            }
-        )
-    if secret_fields_tagged_or_doc:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "secrets_needing_review",
-                "severity": "info",
-                "category": "security",
-                "suggestion": "Secret-like fields are present but already tagged/documented. Re-check storage strategy (hashing/rotation) and access policies.",
-                "affected_fields": secret_fields_tagged_or_doc,
-            }
-        )
-
-    # Anti-pattern 32: Unstructured address
-    unstructured_address = []
-
-    def check_address_structure(field: SchemaField, path: str = "") -> None:
-        """Check for address fields that should be structured."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        if field.field_type == "STRING" and "address" in name_lower:
-            # Single string address field - should be structured
-            unstructured_address.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_address_structure(sub_field, field_path)
-
-    for field in schema:
-        check_address_structure(field)
-
-    if unstructured_address:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "unstructured_address",
-                "severity": "info",
-                "category": "data_quality",
-                "suggestion": f"Address fields stored as STRING ({len(unstructured_address)} fields). Use STRUCT with street, city, state, zip, country for better querying and validation.",
-                "affected_fields": unstructured_address,
-            }
-        )
-
-    # Anti-pattern 33: Enum fields without constraints
-    enum_without_constraints = []
-
-    def check_enum_fields(field: SchemaField, path: str = "") -> None:
-        """Check for enum-like fields without documentation."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        if field.field_type == "STRING" and any(
-            indicator in name_lower
-            for indicator in analyze_config.ENUM_FIELD_INDICATORS
-        ):
-            # Check if description mentions valid values
-            desc = (field.description or "").lower()
-            if not any(
-                word in desc
-                for word in ["valid", "values", "enum", "one of", "options", ":"]
-            ):
-                enum_without_constraints.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_enum_fields(sub_field, field_path)
-
-    for field in schema:
-        check_enum_fields(field)
-
-    if enum_without_constraints:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "undocumented_enum",
-                "severity": "info",
-                "category": "documentation",
-                "suggestion": f"Enum-like fields without documented valid values ({len(enum_without_constraints)} fields). Document constraints in description (e.g., 'Valid values: active, inactive, pending').",
-                "affected_fields": enum_without_constraints,
-            }
-        )
-
-    # ============================================================================
-    # PHASE 2: Medium Priority Anti-Patterns (12 patterns)
-    # ============================================================================
-
-    # Anti-pattern 34: Plural/singular confusion
-    plural_singular_issues = []
-
-    def check_pluralization(field: SchemaField, path: str = "") -> None:
-        """Check for pluralization consistency."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name = field.name.lower()
-
-        # Skip wrapper artifacts (.list, .element) - these are internal schema patterns
-        if name in ["list", "element"]:
-            return
-
-        # Common plural endings
-        is_plural = name.endswith(("s", "es", "ies")) and not name.endswith(
-            ("ss", "us", "is")
-        )
-
-        # Check if this is a STRUCT wrapper for an array (e.g., awards.list pattern)
-        is_array_wrapper = False
-        if field.field_type == "RECORD" and field.mode != "REPEATED":
-            # Check if it has a single "list" field that's REPEATED
-            if (
-                len(field.fields) == 1
-                and field.fields[0].name == "list"
-                and field.fields[0].mode == "REPEATED"
-            ):
-                is_array_wrapper = True
-
-        if field.mode == "REPEATED":
-            # Array should have plural name
-            if not is_plural and len(name) > 3:
-                plural_singular_issues.append((field_path, "should_be_plural"))
-        elif is_plural and field.mode != "REPEATED" and not is_array_wrapper:
-            # Non-array with plural name (but skip array wrappers)
-            plural_singular_issues.append((field_path, "should_be_singular"))
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_pluralization(sub_field, field_path)
-
-    for field in schema:
-        check_pluralization(field)
-
-    if plural_singular_issues:
-        by_type = {}
-        for field_path, issue_type in plural_singular_issues:
-            by_type.setdefault(issue_type, []).append(field_path)
-
-        for issue_type, fields in by_type.items():
-            if issue_type == "should_be_plural":
-                msg = f"ARRAY fields with singular names ({len(fields)} fields). Use plural names for arrays (user → users, item → items)."
-            else:
-                msg = f"Non-array fields with plural names ({len(fields)} fields). Use singular names for scalar/object fields."
-
-            issues.append(
-                {
-                    "field_name": "schema",
-                    "pattern": "plural_singular_confusion",
-                    "severity": "info",
-                    "category": "naming",
-                    "suggestion": msg,
-                    "affected_fields": fields,
-                }
-            )
-
-    # Anti-pattern 35: Type suffixes in names
-    type_suffix_fields = []
-
-    def check_type_suffixes(field: SchemaField, path: str = "") -> None:
-        """Check for type information in field names."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        if any(
-            name_lower.endswith(suffix)
-            for suffix in analyze_config.TYPE_SUFFIX_PATTERNS
-        ):
-            type_suffix_fields.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_type_suffixes(sub_field, field_path)
-
-    for field in schema:
-        check_type_suffixes(field)
-
-    if type_suffix_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "type_in_name",
-                "severity": "info",
-                "category": "naming",
-                "suggestion": f"Field names include type information ({len(type_suffix_fields)} fields). Remove type suffixes - schema already defines types (user_id_string → user_id).",
-                "affected_fields": type_suffix_fields,
-            }
-        )
-
-    # Anti-pattern 36: Redundant prefixes
-    def check_redundant_prefixes() -> None:
-        """Check for redundant field prefixes."""
-        if len(schema) < 5:
-            return
-
-        # Find most common prefix
-        prefixes: dict[str, int] = {}
-        for field in schema:
-            parts = field.name.lower().split("_")
-            if len(parts) > 1:
-                prefix = parts[0]
-                prefixes[prefix] = prefixes.get(prefix, 0) + 1
-
-        if prefixes:
-            most_common_prefix, count = max(prefixes.items(), key=lambda x: x[1])
-            if count / len(schema) > 0.5:  # >50% of fields share prefix
-                affected = [
-                    f.name
-                    for f in schema
-                    if f.name.lower().startswith(most_common_prefix + "_")
-                ]
-                issues.append(
-                    {
-                        "field_name": "schema",
-                        "pattern": "redundant_prefix",
-                        "severity": "info",
-                        "category": "naming",
-                        "suggestion": f"Redundant prefix '{most_common_prefix}_' in {count} fields. If table is named '{most_common_prefix}', remove prefix (user_name → name).",
-                        "affected_fields": affected[:20],
-                    }
-                )
-
-    check_redundant_prefixes()
-
-    # Anti-pattern 37: Denormalization abuse
-    def check_denormalization() -> None:
-        """Check for excessive denormalization."""
-        field_prefixes: dict[str, int] = {}
-
-        for field in schema:
-            parts = field.name.lower().split("_")
-            if len(parts) >= 2:
-                # Look for patterns like company_name, company_address, company_city
-                prefix = "_".join(parts[:2]) if len(parts) > 2 else parts[0]
-                field_prefixes[prefix] = field_prefixes.get(prefix, 0) + 1
-
-        # Find prefixes with many related fields
-        denorm_groups = {
-            prefix: count for prefix, count in field_prefixes.items() if count >= 4
-        }
-
-        if denorm_groups:
-            top_group = max(denorm_groups.items(), key=lambda x: x[1])
-            prefix, count = top_group
-            affected = [f.name for f in schema if f.name.lower().startswith(prefix)]
-
-            issues.append(
-                {
-                    "field_name": "schema",
-                    "pattern": "denormalization_abuse",
-                    "severity": "info",
-                    "category": "normalization",
-                    "suggestion": f"Multiple related fields with '{prefix}_' prefix ({count} fields). Consider creating a separate table or nested STRUCT for better organization.",
-                    "affected_fields": affected[:20],
-                }
-            )
-
-    check_denormalization()
-
-    # Anti-pattern 38: EAV (Entity-Attribute-Value) pattern
-    eav_fields = []
-
-    def check_eav(field: SchemaField, path: str = "") -> None:
-        """Check for EAV anti-pattern."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Check for generic key-value structures
-        if field.field_type == "RECORD" and field.mode == "REPEATED":
-            if name_lower in [
-                "attributes",
-                "properties",
-                "metadata",
-                "tags",
-                "custom_fields",
-            ]:
-                # Check if it has key/value structure
-                field_names = {sf.name.lower() for sf in field.fields}
-                if "key" in field_names or "name" in field_names:
-                    if "value" in field_names:
-                        eav_fields.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_eav(sub_field, field_path)
-
-    for field in schema:
-        check_eav(field)
-
-    if eav_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "eav_antipattern",
-                "severity": "warning",
-                "category": "schema_design",
-                "suggestion": f"EAV (key-value) pattern detected ({len(eav_fields)} fields). Loses type safety and makes queries complex. Define explicit fields or use JSON type with schema validation.",
-                "affected_fields": eav_fields,
-            }
-        )
-
-    # Anti-pattern 39: STRING for binary data
-    binary_as_string = []
-
-    def check_binary_strings(field: SchemaField, path: str = "") -> None:
-        """Check for STRING fields that should be BYTES."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        if field.field_type == "STRING":
-            # Exclude URL, URI, path fields (these are text, not binary)
-            if any(
-                suffix in name_lower
-                for suffix in ["_url", "_uri", "_path", "url", "uri", "link", "href"]
-            ):
-                return
-
-            if any(
-                keyword in name_lower for keyword in analyze_config.BINARY_DATA_KEYWORDS
-            ):
-                binary_as_string.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_binary_strings(sub_field, field_path)
-
-    for field in schema:
-        check_binary_strings(field)
-
-    if binary_as_string:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "string_for_binary",
-                "severity": "info",
-                "category": "type_optimization",
-                "suggestion": f"STRING fields likely containing binary data ({len(binary_as_string)} fields). Use BYTES type for better storage efficiency and semantic clarity.",
-                "affected_fields": binary_as_string,
-            }
-        )
-
-    # Anti-pattern 40: Missing soft delete flag
-    has_soft_delete = any(
-        f.name.lower() in ["is_deleted", "deleted", "deleted_at", "soft_deleted"]
-        for f in schema
-    )
-    has_crud_timestamps = any(
-        f.name.lower() in ["created_at", "updated_at"] for f in schema
-    )
-
-    if has_crud_timestamps and not has_soft_delete:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "missing_soft_delete",
-                "severity": "info",
-                "category": "data_quality",
-                "suggestion": "Table has audit timestamps but no soft delete mechanism. Add is_deleted or deleted_at field to preserve data history and enable recovery.",
-                "affected_fields": [],
-            }
-        )
-
-    # Anti-pattern 41: Inconsistent date granularity
-    date_fields_by_type: dict[str, list[str]] = {}
-
-    def collect_date_types(field: SchemaField, path: str = "") -> None:
-        """Collect date fields by type."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        if field.field_type in ["DATE", "TIMESTAMP", "DATETIME"]:
-            if "_date" in name_lower or name_lower.endswith("date"):
-                date_fields_by_type.setdefault(field.field_type, []).append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                collect_date_types(sub_field, field_path)
-
-    for field in schema:
-        collect_date_types(field)
-
-    if len(date_fields_by_type) > 1:
-        type_summary = ", ".join(
-            f"{len(fields)} {ftype}" for ftype, fields in date_fields_by_type.items()
-        )
-        all_date_fields = [f for fields in date_fields_by_type.values() for f in fields]
-
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "inconsistent_date_granularity",
-                "severity": "info",
-                "category": "type_consistency",
-                "suggestion": f"Date fields have inconsistent types ({type_summary}). Standardize on appropriate granularity: DATE for dates, TIMESTAMP for events.",
-                "affected_fields": all_date_fields,
-            }
-        )
-
-    # Anti-pattern 42: Mixed NULL representations
-    def check_null_representation() -> None:
-        """Check for fields suggesting multiple null representations."""
-        suspect_fields = []
-
-        for field in schema:
-            desc = (field.description or "").lower()
-            # Check for descriptions mentioning alternative null representations
-            null_mentions = [
-                "empty string",
-                "0 means",
-                "blank means",
-                "null string",
-                '""',
-                "n/a",
-            ]
-            if any(mention in desc for mention in null_mentions):
-                suspect_fields.append(field.name)
-
-        if suspect_fields:
-            issues.append(
-                {
-                    "field_name": "schema",
-                    "pattern": "mixed_null_representation",
-                    "severity": "info",
-                    "category": "data_quality",
-                    "suggestion": f"Fields with alternative NULL representations ({len(suspect_fields)} fields). Use proper NULL values, not empty strings or magic numbers.",
-                    "affected_fields": suspect_fields,
-                }
-            )
-
-    check_null_representation()
-
-    # Anti-pattern 43: Inconsistent boolean representation
-    boolean_fields_by_type: dict[str, list[str]] = {}
-
-    def collect_boolean_types(field: SchemaField, path: str = "") -> None:
-        """Collect boolean-semantic fields by type."""
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Boolean semantic names
-        if any(
-            name_lower.startswith(p)
-            for p in ["is_", "has_", "can_", "should_", "will_"]
-        ) or any(
-            name_lower.endswith(p)
-            for p in ["_enabled", "_active", "_visible", "_published"]
-        ):
-            boolean_fields_by_type.setdefault(field.field_type, []).append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                collect_boolean_types(sub_field, field_path)
-
-    for field in schema:
-        collect_boolean_types(field)
-
-    if len(boolean_fields_by_type) > 1:
-        type_summary = ", ".join(
-            f"{len(fields)} {ftype}" for ftype, fields in boolean_fields_by_type.items()
-        )
-        all_bool_fields = [
-            f for fields in boolean_fields_by_type.values() for f in fields
-        ]
-
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "inconsistent_boolean_type",
-                "severity": "warning",
-                "category": "type_consistency",
-                "suggestion": f"Boolean-semantic fields use inconsistent types ({type_summary}). Standardize on BOOLEAN type for all true/false fields.",
-                "affected_fields": all_bool_fields,
-            }
-        )
-
-    # Anti-pattern 44: Nullable partition key (BigQuery)
-    # This would require table metadata - checking field names that suggest partitioning
-    for field in schema:
-        if (
-            field.name.lower() in analyze_config.PARTITION_FIELD_NAMES
-            and field.mode == "NULLABLE"
-        ):
-            issues.append(
-                {
-                    "field_name": "schema",
-                    "pattern": "nullable_partition_field",
-                    "severity": "warning",
-                    "category": "performance",
-                    "suggestion": f"Field '{field.name}' appears to be a partition key but is NULLABLE. Partition fields should be REQUIRED for optimal query performance.",
-                    "affected_fields": [field.name],
-                }
-            )
-
-    # Anti-pattern 45: Over-structuring (small structs that should be flat)
-    small_structs = []
-
-    def check_small_structs(field: SchemaField, path: str = "") -> None:
-        """Check for over-structuring."""
-        field_path = f"{path}.{field.name}" if path else field.name
-
-        if field.field_type == "RECORD" and field.mode != "REPEATED":
-            # Check for small structs (<=2 simple fields) at top level
-            if not path and len(field.fields) <= 2:
-                # Check if all sub-fields are simple types
-                all_simple = all(
-                    sf.field_type
-                    in ["STRING", "INTEGER", "FLOAT", "BOOLEAN", "TIMESTAMP", "DATE"]
-                    for sf in field.fields
-                )
-                if all_simple:
-                    small_structs.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub_field in field.fields:
-                check_small_structs(sub_field, field_path)
-
-    for field in schema:
-        check_small_structs(field)
-
-    if small_structs:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "over_structuring",
-                "severity": "info",
-                "category": "schema_design",
-                "suggestion": f"Small STRUCT fields that should be flattened ({len(small_structs)} structs). Flatten commonly-used fields to top level for simpler queries.",
-                "affected_fields": small_structs,
-            }
-        )
-
-    # =============================================================================
-    # PARTITIONING & CLUSTERING ANTI-PATTERNS (requires table metadata)
-    # =============================================================================
-    # Note: These checks require BigQuery Table metadata (not just schema).
-    # They are implemented in a separate function: detect_table_antipatterns()
-    # which should be called with the full Table object.
-
-    # =============================================================================
-    # TYPES & SEMANTICS ANTI-PATTERNS
-    # =============================================================================
-
-    # Anti-pattern 32: Epoch/Unix time stored as INT64
-    epoch_fields = []
-
-    def check_epoch_fields(field: SchemaField, path: str = "") -> None:
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        if field.field_type == "INT64":
-            # Check for epoch/unix time indicators
-            if any(
-                indicator in name_lower
-                for indicator in analyze_config.EPOCH_TIME_INDICATORS
-            ):
-                epoch_fields.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub in field.fields:
-                check_epoch_fields(sub, field_path)
-
-    for field in schema:
-        check_epoch_fields(field)
-
-    if epoch_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "epoch_as_int64",
-                "severity": "warning",
-                "category": "types",
-                "suggestion": "Epoch/Unix timestamps stored as INT64 are harder to query. Use TIMESTAMP instead and convert with TIMESTAMP_MILLIS(col) or TIMESTAMP_SECONDS(col).",
-                "affected_fields": epoch_fields,
-            }
-        )
-
-    # Anti-pattern 33: Duration fields using INT64/STRING instead of INTERVAL
-    duration_fields = []
-
-    def check_duration_fields(field: SchemaField, path: str = "") -> None:
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        if field.field_type in ("INT64", "STRING"):
-            # Check for duration indicators
-            if any(
-                name_lower.endswith(suf)
-                for suf in analyze_config.DURATION_FIELD_SUFFIXES
-            ):
-                duration_fields.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub in field.fields:
-                check_duration_fields(sub, field_path)
-
-    for field in schema:
-        check_duration_fields(field)
-
-    if duration_fields:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "duration_without_interval",
-                "severity": "info",
-                "category": "types",
-                "suggestion": "Duration fields stored as INT64/STRING lose semantics. Consider using INTERVAL type with MAKE_INTERVAL() for clarity.",
-                "affected_fields": duration_fields,
-            }
-        )
-
-    # Anti-pattern 34: Monetary amounts without currency
-    money_without_currency = []
-
-    def check_money_fields(field: SchemaField, path: str = "") -> None:
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
-
-        # Only check at top level or within RECORD parents
-        if field.field_type in ("NUMERIC", "BIGNUMERIC", "FLOAT64", "INT64"):
-            if any(ind in name_lower for ind in analyze_config.MONEY_FIELD_INDICATORS):
-                # Check if there's a sibling currency field
-                parent_fields = []
-                if not path:  # Top level
-                    parent_fields = [f.name.lower() for f in schema]
-                else:
-                    # Find parent struct
-                    for f in schema:
-                        parent = _find_parent_struct(f, path)
-                        if parent:
-                            parent_fields = [sf.name.lower() for sf in parent.fields]
-                            break
-
-                has_currency = any("currency" in fname for fname in parent_fields)
-                if not has_currency:
-                    money_without_currency.append(field_path)
-
-        if field.field_type == "RECORD":
-            for sub in field.fields:
-                check_money_fields(sub, field_path)
-
-    def _find_parent_struct(field: SchemaField, target_path: str) -> SchemaField | None:
-        """Find parent STRUCT containing target_path."""
-        # Simple implementation for nested paths
-        parts = target_path.split(".")
-        if not parts:
-            return None
-
-        current = None
-        for f in schema:
-            if f.name == parts[0]:
-                current = f
-                break
-
-        if not current:
-            return None
-
-        for part in parts[1:]:
-            if current.field_type != "RECORD":
-                return None
-            found = False
-            for sub in current.fields:
-                if sub.name == part:
-                    current = sub
-                    found = True
-                    break
-            if not found:
-                return None
-
-        return current
-
-    for field in schema:
-        check_money_fields(field)
-
-    if money_without_currency:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "money_without_currency",
-                "severity": "warning",
-                "category": "types",
-                "suggestion": "Monetary amounts without currency_code are ambiguous. Add a sibling currency_code STRING field (ISO-4217) or use a normalized currency table.",
-                "affected_fields": money_without_currency,
-            }
-        )
-
-    # Anti-pattern 35: Lat/Lon pairs not modeled as GEOGRAPHY
-    latlon_without_geography = []
-    top_level_names_lower = {f.name.lower() for f in schema}
-
-    for field in schema:
-        name_lower = field.name.lower()
-        # Check for latitude field
-        if name_lower in analyze_config.LATITUDE_FIELD_NAMES and field.field_type in (
-            "FLOAT64",
-            "STRING",
-        ):
-            # Check if there's a corresponding lon field but no geography field
-            has_lon = bool(top_level_names_lower & analyze_config.LONGITUDE_FIELD_NAMES)
-            has_geography = any("geo" in n for n in top_level_names_lower)
-            if has_lon and not has_geography:
-                latlon_without_geography.append(f"{field.name} & lon")
-
-    if latlon_without_geography:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "latlon_not_geography",
-                "severity": "info",
-                "category": "types",
-                "suggestion": "Lat/lon pairs as separate STRING/FLOAT fields are clumsy for spatial queries. Use GEOGRAPHY with ST_GEOGPOINT(lon, lat) and consider clustering by geography.",
-                "affected_fields": latlon_without_geography,
-            }
+    throttled = limiter.metrics.throttles - throttles_before
+    if throttled:
+        logger.warning(
+            "BigQuery throttled %d call(s) for %s.%s; concurrency limit now %d",
+            throttled,
+            project_id,
+            dataset_id,
+            limiter.limit,
         )
 
-    # Anti-pattern 36: DATETIME for instant events (should be TIMESTAMP)
-    datetime_for_instants = []
+    return ddls
 
-    def check_datetime_fields(field: SchemaField, path: str = "") -> None:
-        field_path = f"{path}.{field.name}" if path else field.name
-        name_lower = field.name.lower()
 
-        if field.field_type == "DATETIME":
-            # Check for instant event indicators
-            if any(
-                ind in name_lower for ind in analyze_config.INSTANT_EVENT_INDICATORS
-            ):
-                datetime_for_instants.append(field_path)
+# =========================
+# Schema extraction for schema-diff integration
+# =========================
 
-        if field.field_type == "RECORD":
-            for sub in field.fields:
-                check_datetime_fields(sub, field_path)
 
-    for field in schema:
-        check_datetime_fields(field)
+def bigquery_schema_to_internal(
+    schema: list[SchemaField],
+) -> tuple[dict[str, Any], set[str]]:
+    """Convert BigQuery schema to internal schema-diff format.
 
-    if datetime_for_instants:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "datetime_for_instants",
-                "severity": "warning",
-                "category": "types",
-                "suggestion": "DATETIME fields for instant events lack timezone info and can cause issues during DST transitions. Use TIMESTAMP unless truly timezone-agnostic.",
-                "affected_fields": datetime_for_instants,
-            }
-        )
+    Returns:
+        (schema_tree, required_paths)
+    """
 
-    # =============================================================================
-    # NAMING & DOCUMENTATION ANTI-PATTERNS
-    # =============================================================================
-
-    # Anti-pattern 37: Non-ASCII / whitespace / problematic underscores
-    problematic_names = []
-
-    def check_name_quality(field: SchemaField, path: str = "") -> None:
-        field_path = f"{path}.{field.name}" if path else field.name
-        name = field.name
-
-        # Check for various naming issues
-        issues_found = []
-        if any(ord(c) > 127 for c in name):  # Non-ASCII
-            issues_found.append("non-ASCII")
-        if " " in name:  # Whitespace
-            issues_found.append("whitespace")
-        if name.startswith("_"):  # Leading underscore
-            issues_found.append("leading underscore")
-        if name.endswith("_"):  # Trailing underscore
-            issues_found.append("trailing underscore")
-        if "__" in name:  # Consecutive underscores
-            issues_found.append("consecutive underscores")
-        if len(name.split("_")) > 5:  # Too many segments
-            issues_found.append("too many segments")
-
-        if issues_found:
-            problematic_names.append(f"{field_path} ({', '.join(issues_found)})")
+    def convert_field(field: SchemaField, path_prefix: str = "") -> Any:
+        field_path = f"{path_prefix}.{field.name}" if path_prefix else field.name
 
         if field.field_type == "RECORD":
-            for sub in field.fields:
-                check_name_quality(sub, field_path)
+            # STRUCT type
+            struct_dict = {}
+            for sub_field in field.fields:
+                struct_dict[sub_field.name] = convert_field(sub_field, field_path)
 
-    for field in schema:
-        check_name_quality(field)
+            if field.mode == "REPEATED":
+                return [struct_dict]  # Array of structs
+            else:
+                return struct_dict
+        else:
+            # Scalar type
+            base_type = _map_bq_type_to_internal(field.field_type)
+            if field.mode == "REPEATED":
+                return [base_type]  # Array of scalars
+            else:
+                return base_type
 
-    if problematic_names:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "problematic_field_names",
-                "severity": "warning",
-                "category": "naming",
-                "suggestion": "Field names with non-ASCII characters, whitespace, problematic underscores, or too many segments cause tooling friction. Use clean snake_case names.",
-                "affected_fields": problematic_names[:20],  # Limit display
-            }
-        )
+    def collect_required_paths(
+        schema: list[SchemaField], path_prefix: str = ""
+    ) -> set[str]:
+        required = set()
+        for field in schema:
+            field_path = f"{path_prefix}.{field.name}" if path_prefix else field.name
 
-    # Anti-pattern 38: Documentation coverage
-    total_fields = 0
-    documented_fields = 0
+            if field.mode == "REQUIRED":
+                required.add(field_path)
 
-    def count_documentation(field: SchemaField) -> None:
-        nonlocal total_fields, documented_fields
-        total_fields += 1
-        if field.description and field.description.strip():
-            documented_fields += 1
+            # Recurse into RECORD fields
+            if field.field_type == "RECORD":
+                if field.mode == "REPEATED":
+                    # For repeated records, collect paths with array notation
+                    nested_required = collect_required_paths(
+                        field.fields, f"{field_path}[]"
+                    )
+                else:
+                    nested_required = collect_required_paths(field.fields, field_path)
+                required.update(nested_required)
 
-        if field.field_type == "RECORD":
-            for sub in field.fields:
-                count_documentation(sub)
+        return required
 
+    # Convert schema
+    tree = {}
     for field in schema:
-        count_documentation(field)
+        tree[field.name] = convert_field(field)
 
-    if total_fields > 0:
-        coverage_pct = (documented_fields / total_fields) * 100
+    # Collect required paths
+    required_paths = collect_required_paths(schema)
 
-        # Find undocumented top-level fields
-        undocumented_top = [
-            f.name for f in schema if not f.description or not f.description.strip()
-        ]
+    # Normalize BigQuery array wrapper patterns
+    tree = _normalize_bigquery_arrays(tree)
 
-        if coverage_pct < 60:  # Warn if < 60%
-            severity = "error" if coverage_pct < 30 else "warning"
-            issues.append(
-                {
-                    "field_name": "schema",
-                    "pattern": "low_documentation_coverage",
-                    "severity": severity,
-                    "category": "documentation",
-                    "suggestion": f"Only {coverage_pct:.1f}% of fields have descriptions. Document all fields for better maintainability. Top-level fields missing descriptions: {', '.join(undocumented_top[:10])}",
-                    "coverage_percent": coverage_pct,
-                    "documented": documented_fields,
-                    "total": total_fields,
-                }
-            )
+    return tree, required_paths
 
-    # =============================================================================
-    # ARRAYS & NESTED DATA ANTI-PATTERNS
-    # =============================================================================
 
-    # Anti-pattern 39: Repeated scalar that should be structured
-    repeated_scalars_near_structs = []
+def _normalize_bigquery_arrays(tree: Any) -> Any:
+    """Normalize BigQuery array wrapper patterns like {'list': [{'element': ...}]} to
+    [...].
 
-    for field in schema:
-        if field.mode == "REPEATED" and field.field_type not in (
-            "RECORD",
-            "STRUCT",
-        ):
-            # Check if there are sibling STRUCT fields
-            has_struct_sibling = any(
-                f.field_type == "RECORD" and f.name.startswith(field.name.rstrip("s"))
-                for f in schema
-            )
-            if has_struct_sibling:
-                repeated_scalars_near_structs.append(field.name)
+    This removes the BigQuery-specific array wrapper structure to match the cleaner
+    array notation used elsewhere in schema-diff.
+    """
+    if isinstance(tree, dict):
+        normalized = {}
+        for key, value in tree.items():
+            # Check for BigQuery array wrapper pattern
+            if (
+                isinstance(value, dict)
+                and len(value) == 1
+                and "list" in value
+                and isinstance(value["list"], list)
+                and len(value["list"]) == 1
+                and isinstance(value["list"][0], dict)
+                and len(value["list"][0]) == 1
+                and "element" in value["list"][0]
+            ):
+                # Extract the element structure and normalize recursively
+                element_structure = value["list"][0]["element"]
+                normalized[key] = [_normalize_bigquery_arrays(element_structure)]
+            else:
+                # Recursively normalize nested structures
+                normalized[key] = _normalize_bigquery_arrays(value)
+        return normalized
+    elif isinstance(tree, list):
+        # Normalize list elements
+        return [_normalize_bigquery_arrays(item) for item in tree]
+    else:
+        # Return primitive values as-is
+        return tree
 
-    if repeated_scalars_near_structs:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "repeated_scalar_should_be_struct",
-                "severity": "info",
-                "category": "schema_design",
-                "suggestion": "Repeated scalars with related STRUCT siblings often evolve into ARRAY<STRUCT>. Consider ARRAY<STRUCT<id, name, ...>> from the start.",
-                "affected_fields": repeated_scalars_near_structs,
-            }
-        )
 
-    # Anti-pattern 40: Array of STRUCTs missing both id and natural key
-    arrays_missing_keys = []
+def _map_bq_type_to_internal(bq_type: str) -> str:
+    """Map BigQuery types to internal schema-diff types."""
+    type_map = {
+        "STRING": "str",
+        "INT64": "int",
+        "INTEGER": "int",
+        "FLOAT64": "float",
+        "FLOAT": "float",
+        "NUMERIC": "number",
+        "BIGNUMERIC": "number",
+        "BOOL": "bool",
+        "BOOLEAN": "bool",
+        "DATE": "date",
+        "DATETIME": "datetime",
+        "TIME": "time",
+        "TIMESTAMP": "timestamp",
+        "BYTES": "bytes",
+        "GEOGRAPHY": "geography",
+        "JSON": "json",
+        "INTERVAL": "interval",
+    }
+    return type_map.get(bq_type, bq_type.lower())
+
 
-    def check_array_keys(field: SchemaField, path: str = "") -> None:
-        field_path = f"{path}.{field.name}" if path else field.name
+def get_live_table_schema(
+    project_id: str, dataset_id: str, table_id: str
+) -> tuple[dict[str, Any], set[str]]:
+    """Get live BigQuery table schema in schema-diff internal format.
 
-        if field.mode == "REPEATED" and field.field_type == "RECORD":
-            # Check for id or natural keys
-            field_names_lower = {f.name.lower() for f in field.fields}
-            has_key = bool(field_names_lower & analyze_config.ARRAY_NATURAL_KEY_NAMES)
+    Returns:
+        (schema_tree, required_paths)
+    """
+    from .bigquery_cache import get_cached_table
+    from .bigquery_utils import get_bigquery_client
 
-            if not has_key and len(field.fields) > 2:
-                arrays_missing_keys.append(field_path)
+    client = get_bigquery_client(project_id)
+    table = get_cached_table(client, project_id, dataset_id, table_id)
 
-        if field.field_type == "RECORD":
-            for sub in field.fields:
-                check_array_keys(sub, field_path)
+    return bigquery_schema_to_internal(table.schema)
 
-    for field in schema:
-        check_array_keys(field)
 
-    if arrays_missing_keys:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "array_missing_keys",
-                "severity": "warning",
-                "category": "schema_design",
-                "suggestion": "ARRAY<STRUCT> without id or natural key (code, name) makes updates/deduplication difficult. Add an identifier field.",
-                "affected_fields": arrays_missing_keys,
-            }
-        )
+# =========================
+# Schema Anti-Pattern Detection
+# =========================
 
-    # Anti-pattern 41: Fan-out "god child" arrays
-    god_child_arrays = []
 
-    def check_god_arrays(field: SchemaField, path: str = "", depth: int = 0) -> None:
-        field_path = f"{path}.{field.name}" if path else field.name
+def _canon_type(field_type: str) -> str:
+    """Normalize BigQuery type aliases to canonical forms for analysis.
 
-        if field.mode == "REPEATED" and field.field_type == "RECORD":
-            # Check if struct is very wide and deeply nested
-            if (
-                len(field.fields) > analyze_config.GOD_ARRAY_MIN_FIELDS
-                and depth >= analyze_config.GOD_ARRAY_MIN_DEPTH
-            ):
-                god_child_arrays.append(f"{field_path} ({len(field.fields)} fields)")
+    Maps FROM type aliases TO canonical analysis forms (INT64, FLOAT64, BOOLEAN).
+    This is the inverse direction of analyze_config.SCALAR_TYPE_MAP (used for DDL rendering).
 
-        if field.field_type == "RECORD":
-            for sub in field.fields:
-                check_god_arrays(sub, field_path, depth + 1)
+    Why the difference?
+    - DDL rendering: BOOLEAN → BOOL (BigQuery DDL prefers short form)
+    - Analysis: BOOL → BOOLEAN (longer form is more explicit for comparisons)
 
-    for field in schema:
-        check_god_arrays(field)
+    Args:
+        field_type: BigQuery field type (e.g., "INTEGER", "INT64", "FLOAT")
 
-    if god_child_arrays:
-        issues.append(
-            {
-                "field_name": "schema",
-                "pattern": "god_child_array",
-                "severity": "warning",
-                "category": "schema_design",
-                "suggestion": "Extremely wide and deeply nested ARRAY<STRUCT> are expensive to unnest and hard to query. Move to a dedicated child table keyed by parent id.",
-                "affected_fields": god_child_arrays,
-            }
-        )
+    Returns:
+        Canonical type name (e.g., "INT64", "FLOAT64", "BOOLEAN")
+    """
+    t = (field_type or "").upper()
+    return {
+        "INTEGER": "INT64",
+        "FLOAT": "FLOAT64",
+        "BOOL": "BOOLEAN",
+        "BIGNUMERIC": "BIGNUMERIC",
+    }.get(t, t)
 
-    return issues
+
+def detect_bigquery_antipatterns(
+    schema: list[SchemaField],
+    rules: Iterable[str] | None = None,
+    timings: dict[str, float] | None = None,
+) -> list[dict[str, Any]]:
+    """Detect BigQuery schema anti-patterns in raw schema.
+
+    Runs the rules registered in `bigquery_rules` (unnecessary wrappers,
+    naming, types, PII/secrets, documentation, arrays, ...) over a single
+    walk of the schema tree.
+
+    Args:
+        schema: Raw BigQuery schema (top-level SchemaFields)
+        rules: Rule names to run (default: all except
+            analyze_config.ANTIPATTERN_DISABLED_RULES); see
+            `bigquery_rules.list_rules`
+        timings: If given, filled with seconds spent per rule
+
+    Returns list of issues with severity, description, and suggestions.
+    """
+    from .bigquery_rules import run_rules
+
+    return run_rules(schema, rules=rules, timings=timings)
 
 
 def detect_table_antipatterns(
@@ -3482,9 +1337,8 @@ def detect_table_antipatterns(
             event_time_candidates = []
             for field in schema:
                 name_lower = field.name.lower()
-                if any(
-                    indicator in name_lower
-                    for indicator in analyze_config.EVENT_TIME_INDICATORS
+                if keyword_matcher(analyze_config.EVENT_TIME_INDICATORS).search(
+                    name_lower
                 ):
                     if field.field_type in ("TIMESTAMP", "DATETIME", "DATE"):
                         event_time_candidates.append(field.name)
@@ -3526,10 +1380,9 @@ def detect_table_antipatterns(
                     elif field.field_type == "STRING":
                         name_lower = field.name.lower()
                         # Check for likely low-cardinality fields
-                        if any(
-                            low_card in name_lower
-                            for low_card in analyze_config.LOW_CARDINALITY_INDICATORS
-                        ):
+                        if keyword_matcher(
+                            analyze_config.LOW_CARDINALITY_INDICATORS
+                        ).search(name_lower):
                             poor_clustering.append(
                                 f"{cluster_field} (likely low cardinality)"
                             )
@@ -3556,10 +1409,9 @@ def detect_table_antipatterns(
                     if field.field_type == "BOOL":
                         has_low_value = True
                     name_lower = field.name.lower()
-                    if any(
-                        lv in name_lower
-                        for lv in analyze_config.LOW_CARDINALITY_INDICATORS
-                    ):
+                    if keyword_matcher(
+                        analyze_config.LOW_CARDINALITY_INDICATORS
+                    ).search(name_lower):
                         has_low_value = True
 
         if has_low_value:
@@ -3592,13 +1444,59 @@ def detect_dataset_antipatterns(
     Returns:
         List of anti-pattern issues
     """
-    issues = []
-
     # Get all tables in dataset
     dataset_ref = client.dataset(dataset_id, project=project_id)
     tables = list(client.list_tables(dataset_ref))
     table_names = [t.table_id for t in tables]
 
+    from .bigquery_metadata import prefetch_dataset_tables
+    from .rate_limit import get_bigquery_limiter
+
+    prefetched = prefetch_dataset_tables(client, project_id, dataset_id, table_names)
+    limiter = get_bigquery_limiter(project_id)
+
+    def _fetch_schema(table_name: str) -> list[SchemaField]:
+        table = prefetched.get(table_name)
+        if table is None:
+            table_ref = f"{project_id}.{dataset_id}.{table_name}"
+            table = limiter.call(
+                lambda: client.get_table(table_ref),
+                operation_name=f"get_table {table_ref}",
+            )
+        return list(table.schema)
+
+    def _schemas() -> Iterable[list[SchemaField]]:
+        remaining = [t for t in table_names if t not in prefetched]
+        max_workers = min(analyze_config.PARALLEL_WORKERS, len(remaining)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_fetch_schema, t) for t in table_names]
+            for future in futures:
+                try:
+                    yield future.result()
+                except Exception:
+                    continue  # Skip tables we can't access
+
+    return _dataset_antipatterns_from_schemas(table_names, _schemas())
+
+
+def _dataset_antipatterns_from_schemas(
+    table_names: Iterable[str],
+    schemas: Iterable[list[SchemaField]],
+) -> list[dict[str, Any]]:
+    """Dataset-level anti-patterns from already fetched table schemas.
+
+    Shared by `detect_dataset_antipatterns` and `bigquery_scan`, which holds
+    the dataset's metadata already.
+
+    Args:
+        table_names: Every table ID in the dataset
+        schemas: Top-level schema of each table that could be read
+
+    Returns:
+        List of anti-pattern issues
+    """
+    issues = []
+
     # Anti-pattern 46: Sharded tables by name (dataset-level)
     sharded_patterns: dict[str, list[str]] = {}
     import re
@@ -3634,17 +1532,13 @@ def detect_dataset_antipatterns(
     # Collect all *_id field types across tables
     id_field_types: dict[str, set[str]] = {}  # {field_name: {types}}
 
-    for table_ref in tables:
-        try:
-            table = client.get_table(f"{project_id}.{dataset_id}.{table_ref.table_id}")
-            for field in table.schema:
-                name_lower = field.name.lower()
-                if name_lower.endswith("_id") or name_lower == "id":
-                    if name_lower not in id_field_types:
-                        id_field_types[name_lower] = set()
-                    id_field_types[name_lower].add(field.field_type)
-        except Exception:
-            continue  # Skip tables we can't access
+    for schema in schemas:
+        for field in schema:
+            name_lower = field.name.lower()
+            if name_lower.endswith("_id") or name_lower == "id":
+                if name_lower not in id_field_types:
+                    id_field_types[name_lower] = set()
+                id_field_types[name_lower].add(field.field_type)
 
     # Find ID fields with inconsistent types
     inconsistent_ids = []
@@ -3735,18 +1629,14 @@ def _detect_ambiguous_grain(fields: list[SchemaField]) -> dict[str, Any]:
         name_lower = field.name.lower()
 
         # Check for date/timestamp keys
-        if any(
-            name_lower.endswith(suffix)
-            for suffix in analyze_config.ROLE_PLAYING_DATE_SUFFIXES
-        ):
+        if suffix_matcher(analyze_config.ROLE_PLAYING_DATE_SUFFIXES).match(name_lower):
             date_keys.append(field.name)
 
         # Check for surrogate key (exact match or suffix)
         if any(
             name_lower == key for key in analyze_config.FACT_SURROGATE_KEY_NAMES
-        ) or any(
-            name_lower.endswith(suffix)
-            for suffix in analyze_config.FACT_SURROGATE_KEY_SUFFIXES
+        ) or suffix_matcher(analyze_config.FACT_SURROGATE_KEY_SUFFIXES).match(
+            name_lower
         ):
             has_surrogate = True
 
@@ -3781,14 +1671,16 @@ def _classify_measures(
         name_lower = field.name.lower()
 
         # Check measure type by name
-        if any(ind in name_lower for ind in analyze_config.ADDITIVE_MEASURE_INDICATORS):
+        if keyword_matcher(analyze_config.ADDITIVE_MEASURE_INDICATORS).search(
+            name_lower
+        ):
             additive.append(field.name)
-        elif any(
-            ind in name_lower for ind in analyze_config.SEMI_ADDITIVE_MEASURE_INDICATORS
+        elif keyword_matcher(analyze_config.SEMI_ADDITIVE_MEASURE_INDICATORS).search(
+            name_lower
         ):
             semi.append(field.name)
-        elif any(
-            ind in name_lower for ind in analyze_config.NON_ADDITIVE_MEASURE_INDICATORS
+        elif keyword_matcher(analyze_config.NON_ADDITIVE_MEASURE_INDICATORS).search(
+            name_lower
         ):
             non.append(field.name)
 
@@ -3810,10 +1702,7 @@ def _detect_role_playing_dates(
 
     for field in fields:
         name_lower = field.name.lower()
-        if any(
-            name_lower.endswith(suffix)
-            for suffix in analyze_config.ROLE_PLAYING_DATE_SUFFIXES
-        ):
+        if suffix_matcher(analyze_config.ROLE_PLAYING_DATE_SUFFIXES).match(name_lower):
             # Check if it looks like a foreign key (ends with _key, _id, _fk)
             if any(
                 name_lower.endswith(fk_suffix) for fk_suffix in ("_key", "_id", "_fk")
@@ -3878,9 +1767,9 @@ def _find_junk_dim_candidates(fields: list[SchemaField]) -> list[str]:
             candidates.append(field.name)
 
         # Small enums/status codes
-        elif field.field_type == "STRING" and any(
-            name_lower.endswith(suffix) for suffix in analyze_config.JUNK_DIM_INDICATORS
-        ):
+        elif field.field_type == "STRING" and suffix_matcher(
+            analyze_config.JUNK_DIM_INDICATORS
+        ).match(name_lower):
             candidates.append(field.name)
 
     return (
@@ -3902,10 +1791,7 @@ def _detect_nested_line_items(fields: list[SchemaField]) -> list[str]:
     for field in fields:
         if field.mode == "REPEATED" and field.field_type == "RECORD":
             name_lower = field.name.lower()
-            if any(
-                item_name in name_lower
-                for item_name in analyze_config.LINE_ITEM_ARRAY_NAMES
-            ):
+            if keyword_matcher(analyze_config.LINE_ITEM_ARRAY_NAMES).search(name_lower):
                 nested_items.append(field.name)
 
     return nested_items
@@ -4030,7 +1916,7 @@ def _classify_fact_type(
     milestone_dates = [
         f
         for f in timestamp_fields
-        if any(ind in f.lower() for ind in analyze_config.MILESTONE_DATE_INDICATORS)
+        if keyword_matcher(analyze_config.MILESTONE_DATE_INDICATORS).search(f.lower())
     ]
 
     # Check for snapshot indicators
@@ -4043,9 +1929,8 @@ def _classify_fact_type(
         1
         for f in fields
         if f.field_type in ("INT64", "NUMERIC", "BIGNUMERIC", "FLOAT64")
-        and any(
-            ind in f.name.lower()
-            for ind in analyze_config.SEMI_ADDITIVE_MEASURE_INDICATORS
+        and keyword_matcher(analyze_config.SEMI_ADDITIVE_MEASURE_INDICATORS).search(
+            f.name.lower()
         )
     )
 
@@ -4094,10 +1979,9 @@ def _detect_bridge_tables(
     # Detect explicit bridge tables (naming pattern)
     bridge_tables = []
     for table_name in tables_meta.keys():
-        if table_name.startswith(analyze_config.BRIDGE_TABLE_PREFIX) or any(
-            table_name.endswith(suffix)
-            for suffix in analyze_config.BRIDGE_TABLE_SUFFIXES
-        ):
+        if table_name.startswith(analyze_config.BRIDGE_TABLE_PREFIX) or suffix_matcher(
+            analyze_config.BRIDGE_TABLE_SUFFIXES
+        ).match(table_name):
             bridge_tables.append(table_name)
 
     if bridge_tables:
@@ -4206,7 +2090,7 @@ def _detect_hierarchies(tables_meta: dict[str, dict[str, Any]]) -> list[dict[str
         parent_fields = [
             name
             for name in field_names_lower
-            if any(ind in name for ind in analyze_config.PARENT_FIELD_INDICATORS)
+            if keyword_matcher(analyze_config.PARENT_FIELD_INDICATORS).search(name)
         ]
 
         if parent_fields and not self_refs:
@@ -4224,8 +2108,8 @@ def _detect_hierarchies(tables_meta: dict[str, dict[str, Any]]) -> list[dict[str
         helper_fields = [
             f.name
             for f in fields
-            if any(
-                ind in f.name.lower() for ind in analyze_config.HIERARCHY_HELPER_FIELDS
+            if keyword_matcher(analyze_config.HIERARCHY_HELPER_FIELDS).search(
+                f.name.lower()
             )
         ]
 
@@ -4416,13 +2300,11 @@ def _detect_degenerate_dimensions(
         # Check for degenerate patterns using config
         is_degenerate = (
             name_lower_field in analyze_config.DEGENERATE_DIMENSION_PATTERNS
-            or any(
-                name_lower_field.endswith(suffix)
-                for suffix in analyze_config.DEGENERATE_DIMENSION_SUFFIXES
+            or suffix_matcher(analyze_config.DEGENERATE_DIMENSION_SUFFIXES).match(
+                name_lower_field
             )
-            or any(
-                name_lower_field.startswith(prefix)
-                for prefix in analyze_config.DEGENERATE_DIMENSION_PREFIXES
+            or prefix_matcher(analyze_config.DEGENERATE_DIMENSION_PREFIXES).match(
+                name_lower_field
             )
         )
 
@@ -4571,9 +2453,8 @@ def _detect_single_table_dimensional_patterns(
     measures_needing_uom = []
     for field in numeric_fields:
         name_lower_field = field.name.lower()
-        if any(
-            keyword in name_lower_field
-            for keyword in analyze_config.UOM_MEASURE_KEYWORDS
+        if keyword_matcher(analyze_config.UOM_MEASURE_KEYWORDS).search(
+            name_lower_field
         ):
             # Check if there's a sibling UoM column
             base_name = field.name.lower()
@@ -4649,10 +2530,9 @@ def _detect_single_table_dimensional_patterns(
                 [
                     f
                     for f in numeric_fields
-                    if any(
-                        ind in f.name.lower()
-                        for ind in analyze_config.SEMI_ADDITIVE_MEASURE_INDICATORS
-                    )
+                    if keyword_matcher(
+                        analyze_config.SEMI_ADDITIVE_MEASURE_INDICATORS
+                    ).search(f.name.lower())
                 ]
             )
 
@@ -4683,9 +2563,8 @@ def _detect_single_table_dimensional_patterns(
         # Check for surrogate key
         has_surrogate = any(
             f.name.lower() in analyze_config.FACT_SURROGATE_KEY_NAMES
-            or any(
-                f.name.lower().endswith(suffix)
-                for suffix in analyze_config.FACT_SURROGATE_KEY_SUFFIXES
+            or suffix_matcher(analyze_config.FACT_SURROGATE_KEY_SUFFIXES).match(
+                f.name.lower()
             )
             for f in fields
         )
@@ -4707,9 +2586,8 @@ def _detect_single_table_dimensional_patterns(
     if is_dim:
         # Check for natural keys
         has_natural_key = any(
-            any(
-                f.name.lower().endswith(suffix)
-                for suffix in analyze_config.DIMENSION_NATURAL_KEY_SUFFIXES
+            suffix_matcher(analyze_config.DIMENSION_NATURAL_KEY_SUFFIXES).match(
+                f.name.lower()
             )
             for f in fields
         )
@@ -4717,9 +2595,8 @@ def _detect_single_table_dimensional_patterns(
         # Check for surrogate key
         has_surrogate = any(
             f.name.lower() in analyze_config.DIMENSION_SURROGATE_KEY_NAMES
-            or any(
-                f.name.lower().endswith(suffix)
-                for suffix in analyze_config.DIMENSION_SURROGATE_KEY_SUFFIXES
+            or suffix_matcher(analyze_config.DIMENSION_SURROGATE_KEY_SUFFIXES).match(
+                f.name.lower()
             )
             for f in fields
         )
@@ -4728,9 +2605,8 @@ def _detect_single_table_dimensional_patterns(
             natural_keys = [
                 f.name
                 for f in fields
-                if any(
-                    f.name.lower().endswith(suffix)
-                    for suffix in analyze_config.DIMENSION_NATURAL_KEY_SUFFIXES
+                if suffix_matcher(analyze_config.DIMENSION_NATURAL_KEY_SUFFIXES).match(
+                    f.name.lower()
                 )
             ]
             issues.append(
@@ -4750,10 +2626,9 @@ def _detect_single_table_dimensional_patterns(
         rapidly_changing = [
             f.name
             for f in fields
-            if any(
-                keyword in f.name.lower()
-                for keyword in analyze_config.RAPIDLY_CHANGING_ATTRIBUTE_KEYWORDS
-            )
+            if keyword_matcher(
+                analyze_config.RAPIDLY_CHANGING_ATTRIBUTE_KEYWORDS
+            ).search(f.name.lower())
         ]
 
         if len(rapidly_changing) >= 3:
@@ -4857,9 +2732,8 @@ def _detect_advanced_dimensional_patterns(
     if _is_dimension_table(table_name):
         # Check for natural keys
         has_natural_key = any(
-            any(
-                f.name.lower().endswith(suffix)
-                for suffix in analyze_config.DIMENSION_NATURAL_KEY_SUFFIXES
+            suffix_matcher(analyze_config.DIMENSION_NATURAL_KEY_SUFFIXES).match(
+                f.name.lower()
             )
             for f in fields
         )
@@ -4867,9 +2741,8 @@ def _detect_advanced_dimensional_patterns(
         # Check for surrogate key
         has_surrogate = any(
             f.name.lower() in analyze_config.DIMENSION_SURROGATE_KEY_NAMES
-            or any(
-                f.name.lower().endswith(suffix)
-                for suffix in analyze_config.DIMENSION_SURROGATE_KEY_SUFFIXES
+            or suffix_matcher(analyze_config.DIMENSION_SURROGATE_KEY_SUFFIXES).match(
+                f.name.lower()
             )
             for f in fields
         )
@@ -4878,9 +2751,8 @@ def _detect_advanced_dimensional_patterns(
             natural_keys = [
                 f.name
                 for f in fields
-                if any(
-                    f.name.lower().endswith(suffix)
-                    for suffix in analyze_config.DIMENSION_NATURAL_KEY_SUFFIXES
+                if suffix_matcher(analyze_config.DIMENSION_NATURAL_KEY_SUFFIXES).match(
+                    f.name.lower()
                 )
             ]
             issues.append(
@@ -4946,9 +2818,8 @@ def _detect_advanced_dimensional_patterns(
         # Check for surrogate key
         has_surrogate = any(
             f.name.lower() in analyze_config.FACT_SURROGATE_KEY_NAMES
-            or any(
-                f.name.lower().endswith(suffix)
-                for suffix in analyze_config.FACT_SURROGATE_KEY_SUFFIXES
+            or suffix_matcher(analyze_config.FACT_SURROGATE_KEY_SUFFIXES).match(
+                f.name.lower()
             )
             for f in fields
         )
@@ -4996,10 +2867,9 @@ def _detect_advanced_dimensional_patterns(
                 [
                     f
                     for f in numeric_fields
-                    if any(
-                        ind in f.name.lower()
-                        for ind in analyze_config.SEMI_ADDITIVE_MEASURE_INDICATORS
-                    )
+                    if keyword_matcher(
+                        analyze_config.SEMI_ADDITIVE_MEASURE_INDICATORS
+                    ).search(f.name.lower())
                 ]
             )
 
@@ -5093,10 +2963,9 @@ def _detect_advanced_dimensional_patterns(
         rapidly_changing = [
             f.name
             for f in fields
-            if any(
-                keyword in f.name.lower()
-                for keyword in analyze_config.RAPIDLY_CHANGING_ATTRIBUTE_KEYWORDS
-            )
+            if keyword_matcher(
+                analyze_config.RAPIDLY_CHANGING_ATTRIBUTE_KEYWORDS
+            ).search(f.name.lower())
         ]
 
         if len(rapidly_changing) >= 3:
@@ -5144,9 +3013,8 @@ def _detect_advanced_dimensional_patterns(
     measures_needing_uom = []
     for field in numeric_fields:
         name_lower_field = field.name.lower()
-        if any(
-            keyword in name_lower_field
-            for keyword in analyze_config.UOM_MEASURE_KEYWORDS
+        if keyword_matcher(analyze_config.UOM_MEASURE_KEYWORDS).search(
+            name_lower_field
         ):
             # Check if there's a sibling UoM column
             base_name = field.name.lower()
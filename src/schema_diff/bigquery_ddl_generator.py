@@ -388,16 +388,30 @@ def generate_dataset_ddl(
 
     # Get batch constraints if needed (done once for all tables)
     constraints_map: dict[str, tuple[dict[str, Any] | None, list[dict[str, Any]]]] = {}
+    from .rate_limit import get_bigquery_limiter
+
+    # Shared limiter: under throttling fewer calls run at once
+    limiter = get_bigquery_limiter(project_id)
     if include_constraints:
         constraints_map = get_batch_constraints(
-            client, project_id, dataset_id, table_ids
+            client, project_id, dataset_id, table_ids, retry_fn=limiter.call
         )
 
+    # Bulk metadata for large datasets (two queries instead of a get_table per table)
+    from .bigquery_metadata import prefetch_dataset_tables
+
+    prefetched = prefetch_dataset_tables(client, project_id, dataset_id, table_ids)
+
     def _one_table_ddl(table_id: str) -> tuple[str, str]:
         """Generate DDL for a single table (safe for parallel execution)."""
         try:
             table_ref = f"{project_id}.{dataset_id}.{table_id}"
-            tbl: bigquery.Table = client.get_table(table_ref)
+            tbl = prefetched.get(table_id)
+            if tbl is None:
+                tbl = limiter.call(
+                    lambda: client.get_table(table_ref),
+                    operation_name=f"get_table {table_ref}",
+                )
 
             create_header = f"CREATE OR REPLACE TABLE `{table_ref}` ("
             columns_block = render_columns(tbl.schema)
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""Bulk BigQuery table metadata from INFORMATION_SCHEMA.
+
+Fetching a dataset table by table costs one ``get_table`` round trip per
+table, which dominates DDL generation and dataset scans on datasets with
+thousands of tables. This module reads a whole dataset with two
+INFORMATION_SCHEMA queries (tables + options, columns + field paths) and
+rebuilds `bigquery.Table` objects locally, so the rendering and analysis code
+sees the same objects ``get_table`` would return. Tables that cannot be
+rebuilt exactly are left out, and callers fall back to ``get_table`` for them.
+
+Public helpers
+--------------
+- fetch_dataset_tables    – rebuild Table objects for a dataset (raises on query errors)
+- prefetch_dataset_tables – best-effort bulk fetch for large table lists ({} otherwise)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from google.cloud import bigquery
+
+from . import analyze_config
+from .bigquery_ddl import _get_dataset_location
+from .rate_limit import get_bigquery_limiter
+
+logger = logging.getLogger(__name__)
+
+TABLES_SQL = """
+WITH opts AS (
+  SELECT table_name, ARRAY_AGG(STRUCT(option_name, option_value)) AS options
+  FROM `{project}.{dataset}.INFORMATION_SCHEMA.TABLE_OPTIONS`
+  GROUP BY table_name
+)
+SELECT t.table_name, t.table_type, t.ddl, opts.options
+FROM `{project}.{dataset}.INFORMATION_SCHEMA.TABLES` t
+LEFT JOIN opts USING (table_name)
+WHERE TRUE{table_filter}
+"""
+
+COLUMNS_SQL = """
+SELECT
+  c.table_name, c.column_name, c.ordinal_position, c.is_nullable,
+  c.data_type AS column_type, c.is_partitioning_column,
+  c.clustering_ordinal_position, c.column_default,
+  p.field_path, p.description, p.policy_tags
+FROM `{project}.{dataset}.INFORMATION_SCHEMA.COLUMNS` c
+JOIN `{project}.{dataset}.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS` p
+  ON p.table_name = c.table_name AND p.column_name = c.column_name
+WHERE c.is_hidden = 'NO' AND c.is_system_defined = 'NO'{table_filter}
+ORDER BY c.table_name, c.ordinal_position
+"""
+
+# INFORMATION_SCHEMA.TABLES.table_type -> tables.get "type"
+_TABLE_TYPES = {
+    "BASE TABLE": "TABLE",
+    "VIEW": "VIEW",
+    "MATERIALIZED VIEW": "MATERIALIZED_VIEW",
+    "EXTERNAL": "EXTERNAL",
+    "SNAPSHOT": "SNAPSHOT",
+    "CLONE": "TABLE",
+}
+
+# SQL type names -> the legacy names tables.get reports
+_TYPE_NAMES = {
+    "INT64": "INTEGER",
+    "FLOAT64": "FLOAT",
+    "BOOL": "BOOLEAN",
+    "STRUCT": "RECORD",
+}
+
+_TYPE_TOKEN_RE = re.compile(r"`(?:[^`\\]|\\.)*`|'(?:[^'\\]|\\.)*'|\w+|\S")
+_LABEL_RE = re.compile(r'STRUCT\("((?:[^"\\]|\\.)*)",\s*"((?:[^"\\]|\\.)*)"\)')
+_RANGE_PARTITION_RE = re.compile(
+    r"PARTITION BY\s+RANGE_BUCKET\(\s*`?(\w+)`?\s*,\s*GENERATE_ARRAY\(\s*"
+    r"(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*\)\s*\)",
+    re.IGNORECASE,
+)
+_PARTITION_RE = re.compile(r"PARTITION BY\s+([^\n]+)", re.IGNORECASE)
+_PARTITION_UNIT_RE = re.compile(r"\b(HOUR|MONTH|YEAR)\b", re.IGNORECASE)
+
+
+class _Unsupported(ValueError):
+    """Metadata that cannot be rebuilt exactly; the table falls back to get_table."""
+
+
+def _parse_type(tokens: list[str], i: int) -> tuple[dict[str, Any], int]:
+    """Parse one SQL type starting at ``tokens[i]`` into an API field fragment."""
+    name = tokens[i].upper()
+    i += 1
+    if name == "ARRAY":
+        if tokens[i] != "<":
+            raise _Unsupported(f"malformed ARRAY type at {tokens[i]!r}")
+        elem, i = _parse_type(tokens, i + 1)
+        if tokens[i] != ">" or elem.get("mode") == "REPEATED":
+            raise _Unsupported("malformed ARRAY type")
+        elem["mode"] = "REPEATED"
+        return elem, i + 1
+    if name == "STRUCT":
+        if tokens[i] != "<":
+            raise _Unsupported(f"malformed STRUCT type at {tokens[i]!r}")
+        fields: list[dict[str, Any]] = []
+        i += 1
+        while tokens[i] != ">":
+            field_name = tokens[i].strip("`")
+            field, i = _parse_type(tokens, i + 1)
+            field = {"name": field_name, **field}
+            field.setdefault("mode", "NULLABLE")
+            # Trailing column attributes: NOT NULL, COLLATE '...', ...
+            while tokens[i] not in (",", ">"):
+                if tokens[i].upper() == "NOT" and tokens[i + 1].upper() == "NULL":
+                    field["mode"] = "REQUIRED"
+                    i += 2
+                elif tokens[i] in ("(", "<"):
+                    raise _Unsupported(f"unexpected {tokens[i]!r} in STRUCT")
+                else:
+                    i += 1
+            fields.append(field)
+            if tokens[i] == ",":
+                i += 1
+        return {"type": "RECORD", "fields": fields}, i + 1
+    if name == "RANGE":
+        if tokens[i] != "<" or tokens[i + 2] != ">":
+            raise _Unsupported("malformed RANGE type")
+        return {"type": "RANGE", "rangeElementType": {"type": tokens[i + 1]}}, i + 3
+
+    out: dict[str, Any] = {"type": _TYPE_NAMES.get(name, name)}
+    if i < len(tokens) and tokens[i] == "(":
+        params: list[str] = []
+        i += 1
+        while tokens[i] != ")":
+            if tokens[i] != ",":
+                params.append(tokens[i])
+            i += 1
+        i += 1
+        if name in ("STRING", "BYTES"):
+            out["maxLength"] = params[0]
+        elif params:
+            out["precision"] = params[0]
+            if len(params) > 1:
+                out["scale"] = params[1]
+    return out, i
+
+
+def _parse_column_type(data_type: str) -> dict[str, Any]:
+    """Parse an INFORMATION_SCHEMA ``data_type`` into an API field fragment."""
+    tokens = _TYPE_TOKEN_RE.findall(data_type)
+    try:
+        field, i = _parse_type(tokens, 0)
+    except IndexError as e:
+        raise _Unsupported(f"truncated type {data_type!r}") from e
+    if i != len(tokens):
+        raise _Unsupported(f"trailing tokens in type {data_type!r}")
+    return field
+
+
+def _attach_field_paths(
+    field: dict[str, Any], path: str, paths: dict[str, tuple[Any, Any]]
+) -> dict[str, Any]:
+    """Copy per-path descriptions and policy tags onto a parsed field."""
+    description, policy_tags = paths.get(path, (None, None))
+    if description:
+        field["description"] = description
+    if policy_tags:
+        field["policyTags"] = {"names": list(policy_tags)}
+    for sub in field.get("fields", ()):
+        _attach_field_paths(sub, f"{path}.{sub['name']}", paths)
+    return field
+
+
+def _sql_literal(value: Optional[str]) -> Any:
+    """Decode a TABLE_OPTIONS ``option_value`` literal (string, bool or number)."""
+    if value is None:
+        return None
+    v = value.strip()
+    if v.startswith('"'):
+        try:
+            return json.loads(v)
+        except ValueError:
+            return v.strip('"')
+    if v.lower() in ("true", "false"):
+        return v.lower() == "true"
+    try:
+        return float(v)
+    except ValueError:
+        return v
+
+
+def _partitioning_resource(
+    ddl: Optional[str], partition_column: Optional[str]
+) -> dict[str, Any]:
+    """``timePartitioning``/``rangePartitioning`` entries derived from the DDL."""
+    if ddl is None:
+        raise _Unsupported("no DDL to read partitioning from")
+    m_range = _RANGE_PARTITION_RE.search(ddl)
+    if m_range:
+        field, start, end, interval = m_range.groups()
+        return {
+            "rangePartitioning": {
+                "field": field,
+                "range": {"start": start, "end": end, "interval": interval},
+            }
+        }
+    m_part = _PARTITION_RE.search(ddl)
+    if not m_part:
+        if partition_column:
+            raise _Unsupported("partitioning column without PARTITION BY")
+        return {}
+    expr = m_part.group(1)
+    m_unit = _PARTITION_UNIT_RE.search(expr)
+    unit = m_unit.group(1).upper() if m_unit else "DAY"
+    if partition_column is None and "_PARTITION" not in expr.upper():
+        raise _Unsupported(f"unrecognized partitioning {expr!r}")
+    tp: dict[str, Any] = {"type": unit}
+    if partition_column:
+        tp["field"] = partition_column
+    return {"timePartitioning": tp}
+
+
+def _table_resource(
+    project_id: str,
+    dataset_id: str,
+    table: dict[str, Any],
+    columns: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Assemble a tables.get-shaped resource for one table."""
+    fields = [
+        _attach_field_paths(col["field"], col["name"], col["paths"]) for col in columns
+    ]
+    partition_column = next(
+        (c["name"] for c in columns if c["partitioning"] == "YES"), None
+    )
+    resource: dict[str, Any] = {
+        "tableReference": {
+            "projectId": project_id,
+            "datasetId": dataset_id,
+            "tableId": table["table_name"],
+        },
+        "type": _TABLE_TYPES.get(table["table_type"] or "", "TABLE"),
+        "schema": {"fields": fields},
+        **_partitioning_resource(table["ddl"], partition_column),
+    }
+
+    clustering = sorted(
+        (c["clustering"], c["name"]) for c in columns if c["clustering"] is not None
+    )
+    if clustering:
+        resource["clustering"] = {"fields": [name for _, name in clustering]}
+
+    for opt in table["options"] or ():
+        name, value = opt["option_name"], opt["option_value"]
+        if name == "description":
+            resource["description"] = _sql_literal(value)
+        elif name == "friendly_name":
+            resource["friendlyName"] = _sql_literal(value)
+        elif name == "labels":
+            resource["labels"] = {
+                json.loads(f'"{k}"'): json.loads(f'"{v}"')
+                for k, v in _LABEL_RE.findall(value or "")
+            }
+        elif name == "require_partition_filter":
+            required = bool(_sql_literal(value))
+            resource["requirePartitionFilter"] = required
+            if "timePartitioning" in resource:
+                resource["timePartitioning"]["requirePartitionFilter"] = required
+        elif name == "partition_expiration_days" and "timePartitioning" in resource:
+            days = float(_sql_literal(value))
+            resource["timePartitioning"]["expirationMs"] = str(int(days * 86_400_000))
+    return resource
+
+
+def fetch_dataset_tables(
+    client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    table_ids: Optional[Iterable[str]] = None,
+    location: Optional[str] = None,
+) -> dict[str, bigquery.Table]:
+    """Rebuild Table objects for a dataset from INFORMATION_SCHEMA.
+
+    Two queries are issued regardless of the number of tables. Schemas
+    (nested fields, modes, descriptions, policy tags, type parameters,
+    defaults), table type, partitioning, clustering, description and labels
+    are restored. Tables whose metadata cannot be rebuilt exactly are omitted.
+
+    Args:
+        client: BigQuery client instance
+        project_id: GCP project ID
+        dataset_id: Dataset ID
+        table_ids: Tables to fetch (None = every table in the dataset)
+        location: Dataset location (looked up if None)
+
+    Returns:
+        Dictionary mapping table_id to Table
+
+    Raises:
+        Any error raised by the INFORMATION_SCHEMA queries
+    """
+    wanted = None if table_ids is None else sorted(set(table_ids))
+    if wanted == []:
+        return {}
+    if location is None:
+        location = _get_dataset_location(client, project_id, dataset_id)
+
+    def _run(template: str, alias: str) -> list[Any]:
+        params = []
+        table_filter = ""
+        if wanted is not None:
+            params.append(bigquery.ArrayQueryParameter("table_names", "STRING", wanted))
+            table_filter = f"\n  AND {alias}.table_name IN UNNEST(@table_names)"
+        job_config = bigquery.QueryJobConfig(query_parameters=params)
+        sql = template.format(
+            project=project_id, dataset=dataset_id, table_filter=table_filter
+        )
+        return get_bigquery_limiter(project_id).call(
+            lambda: list(
+                client.query(sql, job_config=job_config, location=location).result()
+            ),
+            operation_name=f"Bulk metadata query for {project_id}.{dataset_id}",
+        )
+
+    tables = {row["table_name"]: row for row in _run(TABLES_SQL, "t")}
+
+    columns: dict[str, dict[str, dict[str, Any]]] = {}
+    failed: set[str] = set()
+    for row in _run(COLUMNS_SQL, "c"):
+        table_name = row["table_name"]
+        if table_name in failed:
+            continue
+        table_cols = columns.setdefault(table_name, {})
+        col = table_cols.get(row["column_name"])
+        if col is None:
+            try:
+                field = _parse_column_type(row["column_type"])
+            except _Unsupported as e:
+                logger.debug("Bulk metadata skips %s: %s", table_name, e)
+                failed.add(table_name)
+                continue
+            field["name"] = row["column_name"]
+            field.setdefault("mode", "NULLABLE")
+            if row["is_nullable"] == "NO" and field["mode"] == "NULLABLE":
+                field["mode"] = "REQUIRED"
+            default = row["column_default"]
+            if default and default != "NULL":
+                field["defaultValueExpression"] = default
+            col = table_cols[row["column_name"]] = {
+                "name": row["column_name"],
+                "ordinal": row["ordinal_position"],
+                "partitioning": row["is_partitioning_column"],
+                "clustering": row["clustering_ordinal_position"],
+                "field": field,
+                "paths": {},
+            }
+        col["paths"][row["field_path"]] = (row["description"], row["policy_tags"])
+
+    out: dict[str, bigquery.Table] = {}
+    for table_name, table in tables.items():
+        if table_name in failed or table_name not in columns:
+            continue
+        ordered = sorted(columns[table_name].values(), key=lambda c: c["ordinal"])
+        try:
+            resource = _table_resource(project_id, dataset_id, table, ordered)
+        except (_Unsupported, ValueError) as e:
+            logger.debug("Bulk metadata skips %s: %s", table_name, e)
+            continue
+        out[table_name] = bigquery.Table.from_api_repr(resource)
+    return out
+
+
+def prefetch_dataset_tables(
+    client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    table_ids: list[str],
+    min_tables: Optional[int] = None,
+) -> dict[str, bigquery.Table]:
+    """Bulk-fetch `table_ids` when there are enough of them to pay off.
+
+    Below `min_tables` (default: analyze_config.BULK_METADATA_MIN_TABLES) or
+    when the INFORMATION_SCHEMA queries fail (e.g. missing permissions), an
+    empty dict is returned and callers use ``get_table`` for every table.
+    """
+    threshold = analyze_config.BULK_METADATA_MIN_TABLES
+    if min_tables is not None:
+        threshold = min_tables
+    if len(table_ids) < max(threshold, 1):
+        return {}
+    try:
+        tables = fetch_dataset_tables(client, project_id, dataset_id, table_ids)
+    except Exception as e:
+        logger.warning(
+            "Bulk metadata fetch failed for %s.%s, using get_table: %s",
+            project_id,
+            dataset_id,
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+        return {}
+    logger.debug(
+        "Bulk metadata for %s.%s: %d/%d tables rebuilt",
+        project_id,
+        dataset_id,
+        len(tables),
+        len(table_ids),
+    )
+    return tables
+
+
+__all__ = ["fetch_dataset_tables", "prefetch_dataset_tables"]
@@ -0,0 +1,2073 @@
+#!/usr/bin/env python3
+"""Single-walk rule engine for BigQuery schema anti-pattern detection.
+
+The schema tree is walked once into a flat pre-order list of `FieldNode`s
+carrying the facts every rule needs (path, parent, depth, lowercased name,
+name parts/tokens, canonical type, nesting depth below the node). Each rule
+is a `Rule` subclass registered with `register_rule`; it implements the hooks
+it needs:
+
+- ``field(node)``  – called for every field (or only the types listed in
+  ``field_types``); returning ``PRUNE`` skips the node's subtree when the
+  rule sets ``prunes = True``
+- ``struct(node)`` – called for every RECORD field
+- ``finish()``     – called once afterwards, for schema-level checks
+
+Rules are reported in registration order, and each rule reports its issues
+in field pre-order. Rules with ``field_ordered = True`` report per-field
+issues (``report(issue, node)``); consecutive such rules are merged in field
+pre-order, so the output order matches the original nested-walk
+implementation, which checked all of them field by field.
+
+Public helpers
+--------------
+- FieldNode     – precomputed facts for one field
+- RuleContext   – the flattened schema shared by all rules of one run
+- Rule          – base class for rules
+- register_rule – class decorator adding a rule to the registry
+- list_rules    – registered rule names, in run order
+- select_rules  – validated rule names to run, from enable/disable lists
+- run_rules     – run the enabled rules over a schema (with optional timings)
+"""
+from __future__ import annotations
+
+import logging
+import re
+import time
+from functools import cached_property
+from typing import Any, ClassVar, Iterable, Optional
+
+from google.cloud.bigquery.schema import SchemaField
+
+from . import analyze_config
+from .bigquery_ddl import _canon_type, _policy_tag_names
+from .exceptions import ArgumentError
+from .name_matcher import keyword_matcher, prefix_matcher, suffix_matcher, tokenize_name
+
+logger = logging.getLogger(__name__)
+
+# Returned from Rule.field to skip the node's subtree (rules with prunes=True)
+PRUNE = True
+
+
+class FieldNode:
+    """One schema field with the facts shared by all rules."""
+
+    def __init__(
+        self, field: SchemaField, parent: Optional[FieldNode], index: int
+    ) -> None:
+        self.field = field
+        self.parent: Optional[FieldNode] = parent
+        self.name: str = field.name
+        self.name_lower: str = self.name.lower()
+        self.field_type: str = field.field_type
+        self.mode = field.mode
+        self.is_record = self.field_type == "RECORD"
+        self.is_repeated = self.mode == "REPEATED"
+        self.parent_path: str = parent.path if parent else ""
+        self.path: str = f"{parent.path}.{self.name}" if parent else self.name
+        self.depth: int = parent.depth + 1 if parent else 0
+        self.index = index
+        # Index just past the last descendant in RuleContext.nodes
+        self.end = index + 1
+        # Deepest level reached below this field (its own depth for scalars)
+        self.subtree_depth = self.depth
+
+    @cached_property
+    def parts(self) -> list[str]:
+        """Lowercased name split on underscores."""
+        return self.name_lower.split("_")
+
+    @cached_property
+    def tokens(self) -> frozenset[str]:
+        """Set of name tokens, split on snake_case and camelCase; digits dropped."""
+        return frozenset(tokenize_name(self.name))
+
+    @cached_property
+    def canon_type(self) -> str:
+        """Canonical type name (e.g. ``INT64`` for ``INTEGER``)."""
+        return _canon_type(self.field_type)
+
+    @cached_property
+    def description_lower(self) -> str:
+        """Lowercased field description (empty when unset)."""
+        return (self.field.description or "").lower()
+
+    @cached_property
+    def child_names_lower(self) -> frozenset[str]:
+        """Lowercased names of the direct subfields."""
+        return frozenset(sf.name.lower() for sf in self.field.fields)
+
+
+class RuleContext:
+    """The flattened schema shared by all rules of one run."""
+
+    def __init__(self, schema: list[SchemaField]) -> None:
+        self.schema = schema
+        self.nodes: list[FieldNode] = []
+        for field in schema:
+            self._add(field, None)
+        self.top_level = [n for n in self.nodes if n.depth == 0]
+        self.records = [n for n in self.nodes if n.is_record]
+        self.top_level_names_lower = frozenset(n.name_lower for n in self.top_level)
+        self._by_types: dict[frozenset[str], list[FieldNode]] = {}
+
+    def _add(self, field: SchemaField, parent: Optional[FieldNode]) -> FieldNode:
+        node = FieldNode(field, parent, len(self.nodes))
+        self.nodes.append(node)
+        if node.is_record:
+            for sub in field.fields:
+                child = self._add(sub, node)
+                node.subtree_depth = max(node.subtree_depth, child.subtree_depth)
+        node.end = len(self.nodes)
+        return node
+
+    def nodes_of_types(self, types: frozenset[str]) -> list[FieldNode]:
+        """Fields whose type is in `types`, in pre-order (cached per set)."""
+        nodes = self._by_types.get(types)
+        if nodes is None:
+            nodes = self._by_types[types] = [
+                n for n in self.nodes if n.field_type in types
+            ]
+        return nodes
+
+
+class Rule:
+    """Base class for anti-pattern rules; override the hooks you need."""
+
+    name: ClassVar[str] = ""
+    # Only call `field` for these types (None = every field)
+    field_types: ClassVar[Optional[frozenset[str]]] = None
+    # `field` may return PRUNE to skip the subtree (scans every field)
+    prunes: ClassVar[bool] = False
+    # Issues are merged with neighbouring field_ordered rules by field
+    field_ordered: ClassVar[bool] = False
+
+    def __init__(self, ctx: RuleContext) -> None:
+        self.ctx = ctx
+        self.issues: list[dict[str, Any]] = []
+        # RuleContext.nodes index of each issue's field (schema-level: past end)
+        self.positions: list[int] = []
+
+    def field(self, node: FieldNode) -> Optional[bool]:
+        """Check one field; return PRUNE to skip its subtree (see `prunes`)."""
+        return None
+
+    def struct(self, node: FieldNode) -> None:
+        """Check one RECORD field."""
+        return None
+
+    def finish(self) -> None:
+        """Report schema-level issues once every field was visited."""
+        return None
+
+    def report(self, issue: dict[str, Any], node: Optional[FieldNode] = None) -> None:
+        """Record an issue, ordered by `node` (schema-level issues go last)."""
+        self.issues.append(issue)
+        self.positions.append(node.index if node else len(self.ctx.nodes))
+
+    def run(self) -> None:
+        """Drive the hooks over the context's node lists."""
+        cls = type(self)
+        if cls.field is not Rule.field:
+            if cls.prunes:
+                nodes, i = self.ctx.nodes, 0
+                while i < len(nodes):
+                    node = nodes[i]
+                    i = node.end if self.field(node) else i + 1
+            else:
+                types = cls.field_types
+                for node in (
+                    self.ctx.nodes_of_types(types) if types else self.ctx.nodes
+                ):
+                    self.field(node)
+        if cls.struct is not Rule.struct:
+            for node in self.ctx.records:
+                self.struct(node)
+        self.finish()
+
+
+class _PathRule(Rule):
+    """Collect paths of matching fields into one schema-level issue."""
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.paths: list[str] = []
+
+    def match(self, node: FieldNode) -> bool:
+        raise NotImplementedError
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def field(self, node: FieldNode) -> Optional[bool]:
+        if self.match(node):
+            self.paths.append(node.path)
+        return None
+
+    def finish(self) -> None:
+        if self.paths:
+            self.report(self.issue(self.paths))
+
+
+_RULES: dict[str, type[Rule]] = {}
+
+
+def register_rule(cls: type[Rule]) -> type[Rule]:
+    """Register a rule class under its ``name`` (usable as a decorator)."""
+    if not cls.name:
+        raise ValueError(f"Rule {cls.__name__} has no name")
+    _RULES[cls.name] = cls
+    return cls
+
+
+def list_rules() -> list[str]:
+    """Registered rule names, in the order they run."""
+    return list(_RULES)
+
+
+def select_rules(
+    rules: Optional[Iterable[str]] = None,
+    disabled: Optional[Iterable[str]] = None,
+) -> list[str]:
+    """Rule names to run, in registration order.
+
+    Args:
+        rules: Rules to run (default: all registered rules except
+            analyze_config.ANTIPATTERN_DISABLED_RULES)
+        disabled: Rules to skip on top of that
+
+    Raises:
+        ArgumentError: If `rules` or `disabled` names an unknown rule
+    """
+    skipped = set(disabled or ())
+    for argument_name, names in (("rules", set(rules or ())), ("disabled", skipped)):
+        unknown = sorted(names - set(_RULES))
+        if unknown:
+            raise ArgumentError(
+                f"Unknown anti-pattern rule(s): {', '.join(unknown)}",
+                argument_name=argument_name,
+                argument_value=",".join(unknown),
+            )
+    if rules is None:
+        skipped |= analyze_config.ANTIPATTERN_DISABLED_RULES
+        wanted = set(_RULES)
+    else:
+        wanted = set(rules)
+    return [name for name in _RULES if name in wanted and name not in skipped]
+
+
+def run_rules(
+    schema: list[SchemaField],
+    rules: Optional[Iterable[str]] = None,
+    timings: Optional[dict[str, float]] = None,
+) -> list[dict[str, Any]]:
+    """Run anti-pattern rules over a schema.
+
+    Args:
+        schema: Raw BigQuery schema (top-level SchemaFields)
+        rules: Rule names to run (default: all registered rules except
+            analyze_config.ANTIPATTERN_DISABLED_RULES)
+        timings: If given, filled with seconds spent per rule
+
+    Returns:
+        Issues from all rules, in rule order (runs of field_ordered rules
+        merged in field pre-order)
+
+    Raises:
+        ArgumentError: If `rules` names an unknown rule
+    """
+    selected = [_RULES[name] for name in select_rules(rules)]
+
+    start = time.perf_counter()
+    ctx = RuleContext(schema)
+    logger.debug(
+        "Flattened %d fields in %.1f ms",
+        len(ctx.nodes),
+        (time.perf_counter() - start) * 1000,
+    )
+
+    issues: list[dict[str, Any]] = []
+    # (field index, issue) of the current run of field_ordered rules
+    pending: list[tuple[int, dict[str, Any]]] = []
+    spent: dict[str, float] = {}
+    for cls in selected:
+        t0 = time.perf_counter()
+        rule = cls(ctx)
+        rule.run()
+        spent[cls.name] = time.perf_counter() - t0
+        if cls.field_ordered:
+            pending.extend(zip(rule.positions, rule.issues))
+            continue
+        if pending:
+            # Stable sort: rule order is kept among issues of one field
+            pending.sort(key=lambda entry: entry[0])
+            issues.extend(issue for _, issue in pending)
+            pending.clear()
+        issues.extend(rule.issues)
+    pending.sort(key=lambda entry: entry[0])
+    issues.extend(issue for _, issue in pending)
+
+    if timings is not None:
+        for name, seconds in spent.items():
+            timings[name] = timings.get(name, 0.0) + seconds
+    if logger.isEnabledFor(logging.DEBUG):
+        slowest = sorted(spent.items(), key=lambda kv: kv[1], reverse=True)[:5]
+        logger.debug(
+            "Ran %d rules over %d fields; slowest: %s",
+            len(selected),
+            len(ctx.nodes),
+            ", ".join(f"{n} {s * 1000:.1f} ms" for n, s in slowest),
+        )
+    return issues
+
+
+# =============================================================================
+# Field structure
+# =============================================================================
+
+_RECORD = frozenset({"RECORD"})
+_STRING = frozenset({"STRING"})
+
+
+@register_rule
+class UnnecessaryStructWrapper(Rule):
+    """STRUCT with a single REPEATED ``list`` of single-``element`` STRUCTs."""
+
+    name = "unnecessary_struct_wrapper"
+    field_ordered = True
+
+    def struct(self, node: FieldNode) -> None:
+        field = node.field
+        if node.is_repeated or len(field.fields) != 1:
+            return
+        list_field = field.fields[0]
+        if list_field.name == "list" and list_field.mode == "REPEATED":
+            if list_field.field_type == "RECORD" and len(list_field.fields) == 1:
+                if list_field.fields[0].name == "element":
+                    self.report(
+                        {
+                            "field_name": node.path,
+                            "pattern": "unnecessary_struct_wrapper",
+                            "severity": "warning",
+                            "category": "schema_design",
+                        },
+                        node,
+                    )
+
+
+@register_rule
+class UnnecessaryElementWrapper(Rule):
+    """REPEATED STRUCT whose only field is an ``element`` STRUCT."""
+
+    name = "unnecessary_element_wrapper"
+    field_ordered = True
+
+    def struct(self, node: FieldNode) -> None:
+        field = node.field
+        if node.is_repeated and len(field.fields) == 1:
+            element_field = field.fields[0]
+            if element_field.name == "element" and element_field.field_type == "RECORD":
+                self.report(
+                    {
+                        "field_name": node.path,
+                        "pattern": "unnecessary_element_wrapper",
+                        "severity": "warning",
+                        "category": "schema_design",
+                    },
+                    node,
+                )
+
+
+@register_rule
+class BooleanAsInteger(Rule):
+    name = "boolean_as_integer"
+    field_ordered = True
+    field_types = frozenset({"INTEGER", "INT64"})
+    prefixes = ("is_", "has_", "can_", "should_", "will_", "deleted")
+
+    def field(self, node: FieldNode) -> None:
+        if node.canon_type == "INT64" and node.name_lower.startswith(self.prefixes):
+            self.report(
+                {
+                    "field_name": node.path,
+                    "pattern": "boolean_as_integer",
+                    "severity": "info",
+                    "category": "type_optimization",
+                    "suggestion": f"Use BOOLEAN instead of INTEGER for '{node.path}'",
+                },
+                node,
+            )
+
+
+@register_rule
+class DeepNesting(Rule):
+    """STRUCT more than 10 levels deep."""
+
+    name = "deep_nesting"
+    field_ordered = True
+
+    def struct(self, node: FieldNode) -> None:
+        if node.depth > 10:
+            self.report(
+                {
+                    "field_name": node.path,
+                    "pattern": "deep_nesting",
+                    "severity": "warning",
+                    "category": "complexity",
+                    "depth": node.depth,
+                    "suggestion": f"Consider flattening '{node.path}' (depth: {node.depth})",
+                },
+                node,
+            )
+
+
+@register_rule
+class MissingArrayOrdering(Rule):
+    name = "missing_array_ordering"
+    field_ordered = True
+    order_names = frozenset(
+        {"order", "order_in_profile", "sequence", "position", "index", "sort_order"}
+    )
+
+    def struct(self, node: FieldNode) -> None:
+        if not node.is_repeated:
+            return
+        fields = node.field.fields
+        has_order_field = any(sf.name in self.order_names for sf in fields)
+        if not has_order_field and len(fields) > 1:
+            self.report(
+                {
+                    "field_name": node.path,
+                    "pattern": "missing_array_ordering",
+                    "severity": "info",
+                    "category": "data_quality",
+                    "suggestion": f"Add ordering field to '{node.path}' array",
+                },
+                node,
+            )
+
+
+@register_rule
+class GenericFieldName(Rule):
+    name = "generic_field_name"
+    field_ordered = True
+
+    def field(self, node: FieldNode) -> None:
+        if node.name_lower in analyze_config.GENERIC_FIELD_NAMES:
+            self.report(
+                {
+                    "field_name": node.path,
+                    "pattern": "generic_field_name",
+                    "severity": "info",
+                    "category": "naming",
+                    "suggestion": f"Use more descriptive name instead of '{node.name}'",
+                },
+                node,
+            )
+
+
+@register_rule
+class MissingDescription(Rule):
+    """Complex STRUCT (more than 5 fields) without a description."""
+
+    name = "missing_description"
+    field_ordered = True
+
+    def struct(self, node: FieldNode) -> None:
+        if not node.field.description and len(node.field.fields) > 5:
+            self.report(
+                {
+                    "field_name": node.path,
+                    "pattern": "missing_description",
+                    "severity": "info",
+                    "category": "documentation",
+                    "suggestion": f"Add description to complex field '{node.path}'",
+                },
+                node,
+            )
+
+
+@register_rule
+class InconsistentNaming(Rule):
+    """Mix of snake_case and camelCase names across all fields."""
+
+    name = "inconsistent_naming"
+
+    def finish(self) -> None:
+        names = [n.name for n in self.ctx.nodes]
+        snake_case_count = sum(1 for name in names if "_" in name)
+        camel_case_count = sum(
+            1
+            for name in names
+            if name != name.lower() and name != name.upper() and "_" not in name
+        )
+        total_names = len(names)
+        if total_names > 5 and snake_case_count > 0 and camel_case_count > 0:
+            ratio = min(snake_case_count, camel_case_count) / total_names
+            if ratio > 0.2:  # More than 20% inconsistency
+                self.report(
+                    {
+                        "field_name": "schema",
+                        "pattern": "inconsistent_naming",
+                        "severity": "info",
+                        "category": "naming",
+                        "suggestion": f"Inconsistent naming: {snake_case_count} snake_case vs {camel_case_count} camelCase fields. Standardize on snake_case (BigQuery convention)",
+                    }
+                )
+
+
+@register_rule
+class OverallDeepNesting(Rule):
+    name = "overall_deep_nesting"
+
+    def finish(self) -> None:
+        depths = [n.subtree_depth for n in self.ctx.records]
+        deeply_nested = [d for d in depths if d > 5]
+        if deeply_nested:
+            max_depth = max(depths)
+            if max_depth > 8:
+                self.report(
+                    {
+                        "field_name": "schema",
+                        "pattern": "overall_deep_nesting",
+                        "severity": "warning",
+                        "category": "complexity",
+                        "suggestion": f"Schema has max nesting depth of {max_depth} levels. Consider flattening deeply nested structures.",
+                        "affected_count": len(deeply_nested),
+                    }
+                )
+
+
+@register_rule
+class WideTable(Rule):
+    name = "wide_table"
+
+    def finish(self) -> None:
+        total = len(self.ctx.schema)
+        if total > 100:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "wide_table",
+                    "severity": "warning",
+                    "category": "complexity",
+                    "suggestion": f"Table has {total} columns. Consider splitting into multiple tables or using nested structures for better organization.",
+                    "field_count": total,
+                }
+            )
+        elif total > 50:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "wide_table",
+                    "severity": "info",
+                    "category": "complexity",
+                    "suggestion": f"Table has {total} columns. This is getting wide - consider if splitting would improve maintainability.",
+                    "field_count": total,
+                }
+            )
+
+
+@register_rule
+class InconsistentTimestamps(Rule):
+    """STRING date-like fields alongside typed TIMESTAMP/DATE fields."""
+
+    name = "inconsistent_timestamps"
+    field_types = frozenset({"STRING", "TIMESTAMP", "DATE", "DATETIME"})
+    keywords = (
+        "date",
+        "time",
+        "timestamp",
+        "created",
+        "updated",
+        "modified",
+        "deleted",
+        "_at",
+        "_on",
+    )
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.string_date_fields: list[str] = []
+        self.timestamp_fields: list[str] = []
+
+    def field(self, node: FieldNode) -> None:
+        if node.field_type == "STRING":
+            if any(keyword in node.name_lower for keyword in self.keywords):
+                self.string_date_fields.append(node.path)
+        else:
+            self.timestamp_fields.append(node.path)
+
+    def finish(self) -> None:
+        if self.string_date_fields and self.timestamp_fields:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "inconsistent_timestamps",
+                    "severity": "warning",
+                    "category": "type_consistency",
+                    "suggestion": f"Mix of STRING date fields ({len(self.string_date_fields)}) and TIMESTAMP types ({len(self.timestamp_fields)}). Standardize on TIMESTAMP/DATE types for better performance and type safety.",
+                    "string_dates": self.string_date_fields[:5],
+                    "typed_dates": self.timestamp_fields[:5],
+                }
+            )
+
+
+_NON_ENTITY_IDS = frozenset({"parent_id", "related_id", "ref_id", "reference_id"})
+
+
+def _is_nullable_primary_id(node: FieldNode) -> bool:
+    """Top-level NULLABLE ``id`` or entity ``*_id`` (not a reference id)."""
+    if node.mode != "NULLABLE" or node.depth:
+        return False
+    name_lower = node.name_lower
+    if name_lower == "id":
+        return True
+    return (
+        name_lower.endswith("_id")
+        and not name_lower.endswith("_ref_id")
+        and name_lower not in _NON_ENTITY_IDS
+    )
+
+
+@register_rule
+class NullableForeignKeys(_PathRule):
+    """Nullable ``*_id`` fields other than the table's own primary ids."""
+
+    name = "nullable_foreign_keys"
+
+    def match(self, node: FieldNode) -> bool:
+        return (
+            node.name.endswith("_id")
+            and node.mode == "NULLABLE"
+            and not _is_nullable_primary_id(node)
+            and node.name not in ("id", "uuid", "guid")
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "nullable_foreign_keys",
+            "severity": "info",
+            "category": "data_integrity",
+            "suggestion": f"Foreign key fields are nullable ({len(paths)} fields). Consider making REQUIRED or adding explicit null handling to prevent orphaned references.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class RedundantStructures(Rule):
+    """Identical wide element structures in 3+ top-level arrays."""
+
+    name = "redundant_structures"
+
+    def finish(self) -> None:
+        signatures: dict[tuple, list[str]] = {}
+        for node in self.ctx.top_level:
+            field = node.field
+            if not (
+                node.is_record
+                and node.is_repeated
+                and len(field.fields) == 1
+                and field.fields[0].name == "element"
+            ):
+                continue
+            element_field = field.fields[0]
+            if element_field.field_type != "RECORD":
+                continue
+            signature = tuple(
+                sorted((sf.name, sf.field_type, sf.mode) for sf in element_field.fields)
+            )
+            # Only flag if substantial (>=6 fields)
+            if len(signature) >= 6:
+                signatures.setdefault(signature, []).append(
+                    f"{field.name}.list.element"
+                )
+
+        # Only report if 3+ instances (more likely to be a real issue)
+        redundant = {sig: paths for sig, paths in signatures.items() if len(paths) >= 3}
+        if redundant:
+            signature, paths = max(
+                redundant.items(), key=lambda x: (len(x[1]), len(x[0]))
+            )
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "redundant_structures",
+                    "severity": "info",
+                    "category": "normalization",
+                    "suggestion": f"Identical structure ({len(signature)} fields) appears in {len(paths)} top-level arrays. If these represent the same entity type, consider consolidating or creating a shared reference table.",
+                    "affected_fields": paths,
+                    "field_count": len(signature),
+                }
+            )
+
+
+_DIGIT_RE = re.compile(r"\d")
+_ALLOWED_NUMBERED_SUFFIX_RE = re.compile(r".*(_v\d+|_\d{4}|_at|_on|iso_\d+)$")
+_ALLOWED_NUMBERED_NAME_RE = re.compile(
+    r"^(v\d+|version_?\d+|.*iso.*\d+)$", re.IGNORECASE
+)
+_HUNGARIAN_RE = re.compile(r"^[a-z][A-Z]")
+_VOWELS = frozenset("aeiouAEIOU")
+
+
+@register_rule
+class CrypticNames(Rule):
+    """Very short, vowel-less, numbered or Hungarian-notation names."""
+
+    name = "cryptic_names"
+    prunes = True
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.paths: list[str] = []
+
+    def field(self, node: FieldNode) -> Optional[bool]:
+        name, name_lower = node.name, node.name_lower
+        # Skip ISO standard codes (iso_2, iso_3, ...) and everything below them
+        if "iso" in name_lower:
+            return PRUNE
+
+        acceptable = analyze_config.ACCEPTABLE_ABBREVIATIONS
+        is_cryptic = False
+        # Very short names (1-2 chars) that aren't common
+        if len(name) <= 2 and name_lower not in acceptable:
+            is_cryptic = True
+        # Excessive abbreviation (no vowels, 4-6 chars)
+        if 3 < len(name) <= 6:
+            if not any(c in _VOWELS for c in name) and name_lower not in acceptable:
+                is_cryptic = True
+        # Numbers in names (except versions, years and ISO codes)
+        if _DIGIT_RE.search(name) and not _ALLOWED_NUMBERED_SUFFIX_RE.match(name_lower):
+            if not _ALLOWED_NUMBERED_NAME_RE.match(name_lower):
+                is_cryptic = True
+        # Single letter prefixes (e.g., bActive, sName, iCount)
+        if _HUNGARIAN_RE.match(name):
+            is_cryptic = True
+
+        if is_cryptic:
+            self.paths.append(node.path)
+        return None
+
+    def finish(self) -> None:
+        if self.paths:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "cryptic_names",
+                    "severity": "info",
+                    "category": "naming",
+                    "suggestion": f"Cryptic or overly abbreviated field names detected ({len(self.paths)} fields). Use descriptive names for better readability (e.g., 'usr' → 'user', 'cnt' → 'count').",
+                    "affected_fields": self.paths,
+                }
+            )
+
+
+@register_rule
+class MissingAuditColumns(Rule):
+    name = "missing_audit_columns"
+
+    def finish(self) -> None:
+        names = self.ctx.top_level_names_lower
+        has_timestamp = bool(names & analyze_config.AUDIT_TIMESTAMP_FIELDS)
+        has_actor = bool(names & analyze_config.AUDIT_ACTOR_FIELDS)
+        has_version = bool(names & analyze_config.AUDIT_VERSION_FIELDS)
+        has_soft_delete = bool(names & analyze_config.AUDIT_SOFT_DELETE_FIELDS)
+        has_source = bool(names & analyze_config.AUDIT_SOURCE_FIELDS)
+
+        present_audit = names & analyze_config.ALL_AUDIT_FIELDS
+        missing_recommended = analyze_config.RECOMMENDED_AUDIT_FIELDS - names
+        incomplete_pairs = [
+            f"{ts_field} (missing {actor_field})"
+            for ts_field, actor_field in analyze_config.AUDIT_FIELD_PAIRS
+            if ts_field in names and actor_field not in names
+        ]
+        if not (missing_recommended or incomplete_pairs):
+            return
+
+        suggestion_parts = []
+        if missing_recommended:
+            suggestion_parts.append(
+                f"Missing recommended audit fields: {', '.join(sorted(missing_recommended))}"
+            )
+        if incomplete_pairs:
+            suggestion_parts.append(
+                f"Incomplete audit pairs: {', '.join(incomplete_pairs)}"
+            )
+
+        recommendations = []
+        if not has_timestamp:
+            recommendations.append(
+                "Add timestamp fields (created_at, updated_at) for change tracking"
+            )
+        if not has_actor and has_timestamp:
+            recommendations.append(
+                "Consider adding actor fields (created_by, updated_by) to track who made changes"
+            )
+        if not has_version and (has_timestamp or has_actor):
+            recommendations.append(
+                "Consider adding version/etag for optimistic locking"
+            )
+
+        full_suggestion = ". ".join(suggestion_parts)
+        if recommendations:
+            full_suggestion += ". " + ". ".join(recommendations)
+
+        self.report(
+            {
+                "field_name": "schema",
+                "pattern": "missing_audit_columns",
+                "severity": "warning" if missing_recommended else "info",
+                "category": "data_quality",
+                "suggestion": full_suggestion,
+                "audit_summary": {
+                    "has_timestamp": has_timestamp,
+                    "has_actor": has_actor,
+                    "has_version": has_version,
+                    "has_soft_delete": has_soft_delete,
+                    "has_source": has_source,
+                    "present_fields": sorted(present_audit),
+                    "missing_recommended": sorted(missing_recommended),
+                    "incomplete_pairs": incomplete_pairs,
+                },
+            }
+        )
+
+
+def _casing_style(name: str) -> str:
+    if name.isupper():
+        return "UPPER_CASE"
+    if "_" in name and name.islower():
+        return "snake_case"
+    if name[0].isupper() and "_" not in name:
+        return "PascalCase"
+    if name[0].islower() and name != name.lower() and "_" not in name:
+        return "camelCase"
+    if name.islower():
+        return "snake_case"  # Lowercase, no underscores
+    return "mixed"
+
+
+@register_rule
+class InconsistentCasing(Rule):
+    name = "inconsistent_casing"
+
+    def finish(self) -> None:
+        counts = dict.fromkeys(
+            ("snake_case", "camelCase", "PascalCase", "UPPER_CASE", "mixed"), 0
+        )
+        for node in self.ctx.nodes:
+            counts[_casing_style(node.name)] += 1
+        casing_counts = {k: v for k, v in counts.items() if v > 0}
+        if len(casing_counts) <= 1:
+            return
+
+        total = sum(casing_counts.values())
+        sorted_styles = sorted(casing_counts.items(), key=lambda x: x[1], reverse=True)
+        dominant_style = sorted_styles[0][0]
+        minority_count = sum(count for _, count in sorted_styles[1:])
+        if minority_count / total > 0.15:  # More than 15% inconsistency
+            style_summary = ", ".join(
+                f"{count} {style}" for style, count in sorted_styles
+            )
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "inconsistent_casing",
+                    "severity": "info",
+                    "category": "naming",
+                    "suggestion": f"Inconsistent field name casing: {style_summary}. BigQuery convention is snake_case. Standardize all fields to {dominant_style} or preferably snake_case.",
+                    "casing_distribution": dict(casing_counts),
+                }
+            )
+
+
+_BLOB_INDICATORS = (
+    "json",
+    "metadata",
+    "properties",
+    "config",
+    "data",
+    "payload",
+    "content",
+    "details",
+    "attributes",
+    "extra",
+    "raw",
+    "blob",
+    "params",
+    "options",
+    "settings",
+)
+_BLOB_SUFFIXES = tuple(f"_{i}" for i in _BLOB_INDICATORS)
+_BLOB_PREFIXES = tuple(f"{i}_" for i in _BLOB_INDICATORS)
+
+
+@register_rule
+class JsonStringBlobs(_PathRule):
+    name = "json_string_blobs"
+    field_types = _STRING
+
+    def match(self, node: FieldNode) -> bool:
+        name_lower = node.name_lower
+        return (
+            name_lower in _BLOB_INDICATORS
+            or name_lower.endswith(_BLOB_SUFFIXES)
+            or name_lower.startswith(_BLOB_PREFIXES)
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "json_string_blobs",
+            "severity": "warning",
+            "category": "schema_design",
+            "suggestion": f"STRING fields likely containing JSON/structured data ({len(paths)} fields). Use RECORD/STRUCT for type safety, better compression, and column-level access.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class NullableIdFields(_PathRule):
+    """Primary/entity ID fields that are NULLABLE."""
+
+    name = "nullable_id_fields"
+
+    def match(self, node: FieldNode) -> bool:
+        if node.mode != "NULLABLE":
+            return False
+        name_lower = node.name_lower
+        if name_lower == "id":
+            return node.depth == 0
+        if name_lower.endswith("_id") and not name_lower.endswith("_ref_id"):
+            if name_lower not in _NON_ENTITY_IDS:
+                return node.depth == 0 or "_id" in node.parts[0]
+        return False
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "nullable_id_fields",
+            "severity": "warning",
+            "category": "data_integrity",
+            "suggestion": f"Primary/identifier fields are nullable ({len(paths)} fields). IDs should typically be REQUIRED to ensure data integrity.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class ReservedKeywords(_PathRule):
+    name = "reserved_keywords"
+
+    def match(self, node: FieldNode) -> bool:
+        return node.name_lower in analyze_config.RESERVED_KEYWORDS
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "reserved_keywords",
+            "severity": "warning",
+            "category": "naming",
+            "suggestion": f"Field names use SQL reserved keywords ({len(paths)} fields). Requires backticks in queries. Rename to avoid: `select` → `selection`, `order` → `sort_order`, `group` → `group_name`.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class OverlyGranularTimestamps(_PathRule):
+    """TIMESTAMP fields with date-only semantics."""
+
+    name = "overly_granular_timestamps"
+    field_types = frozenset({"TIMESTAMP"})
+
+    def match(self, node: FieldNode) -> bool:
+        name_lower = node.name_lower
+        return name_lower in analyze_config.DATE_ONLY_FIELD_PATTERNS or (
+            name_lower.endswith("_date") and not name_lower.endswith("_datetime")
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "overly_granular_timestamps",
+            "severity": "info",
+            "category": "type_optimization",
+            "suggestion": f"TIMESTAMP fields with date-only semantics ({len(paths)} fields). Use DATE type for fields like birth_date, hire_date. Saves 8 bytes per row and improves query semantics.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class ExpensiveUnnest(Rule):
+    """ARRAY<STRUCT> with more than 10 fields."""
+
+    name = "expensive_unnest"
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.found: list[tuple[str, int]] = []
+
+    def struct(self, node: FieldNode) -> None:
+        if node.is_repeated and len(node.field.fields) > 10:
+            self.found.append((node.path, len(node.field.fields)))
+
+    def finish(self) -> None:
+        if not self.found:
+            return
+        self.found.sort(key=lambda x: x[1], reverse=True)
+        self.report(
+            {
+                "field_name": "schema",
+                "pattern": "expensive_unnest",
+                "severity": "info",
+                "category": "performance",
+                "suggestion": f"Complex ARRAY<STRUCT> fields ({len(self.found)} arrays, max {self.found[0][1]} fields). UNNEST operations on wide structs are expensive. Consider denormalizing into separate table or reducing struct width.",
+                "affected_fields": [path for path, _ in self.found],
+            }
+        )
+
+
+@register_rule
+class NegativeBooleans(_PathRule):
+    name = "negative_booleans"
+    field_types = frozenset({"BOOLEAN", "INTEGER"})
+    explicit = ("is_not_", "has_no_", "cannot_", "isnt_", "hasnt_")
+    implicit = ("no_", "not_", "non_", "without_")
+    acceptable = frozenset({"no_reply", "notes", "notice", "notification"})
+
+    def match(self, node: FieldNode) -> bool:
+        name_lower = node.name_lower
+        if name_lower.startswith(self.explicit):
+            return True
+        return (
+            name_lower.startswith(self.implicit) and name_lower not in self.acceptable
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "negative_booleans",
+            "severity": "info",
+            "category": "naming",
+            "suggestion": f"Negative boolean field names ({len(paths)} fields). Creates double negatives in queries. Use positive names: `is_not_active` → `is_active`, `has_no_access` → `has_access`.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class OverlyLongNames(Rule):
+    name = "overly_long_names"
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.found: list[tuple[str, int]] = []
+
+    def field(self, node: FieldNode) -> None:
+        if len(node.name) > 50:
+            self.found.append((node.path, len(node.name)))
+
+    def finish(self) -> None:
+        if not self.found:
+            return
+        self.found.sort(key=lambda x: x[1], reverse=True)
+        self.report(
+            {
+                "field_name": "schema",
+                "pattern": "overly_long_names",
+                "severity": "info",
+                "category": "naming",
+                "suggestion": f"Overly long field names ({len(self.found)} fields, max {self.found[0][1]} chars). Keep names concise (<50 chars). Use descriptions for details.",
+                "affected_fields": [path for path, _ in self.found],
+            }
+        )
+
+
+# =============================================================================
+# Types and values
+# =============================================================================
+
+
+@register_rule
+class StringTypeAbuse(Rule):
+    """STRING fields whose names suggest numbers or booleans."""
+
+    name = "string_type_abuse"
+    field_types = _STRING
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.by_type: dict[str, list[str]] = {}
+
+    def field(self, node: FieldNode) -> None:
+        name_lower = node.name_lower
+        # Skip ISO codes, country codes, and code fields (correctly STRING)
+        if keyword_matcher(analyze_config.STRING_FIELD_EXCLUSIONS).search(name_lower):
+            return
+        numeric = analyze_config.NUMERIC_FIELD_INDICATORS
+        if name_lower in numeric or keyword_matcher(numeric, delimited=True).search(
+            name_lower
+        ):
+            self.by_type.setdefault("numeric", []).append(node.path)
+        if prefix_matcher(analyze_config.BOOLEAN_FIELD_PREFIXES).match(
+            name_lower
+        ) or keyword_matcher(analyze_config.BOOLEAN_FIELD_KEYWORDS).search(name_lower):
+            self.by_type.setdefault("boolean", []).append(node.path)
+
+    def finish(self) -> None:
+        for suggested_type, fields in self.by_type.items():
+            type_name = "INTEGER/NUMERIC" if suggested_type == "numeric" else "BOOLEAN"
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "string_type_abuse",
+                    "severity": "warning",
+                    "category": "type_optimization",
+                    "suggestion": f"STRING fields that should be {type_name} ({len(fields)} fields). Use proper types for better performance, validation, and query optimization.",
+                    "affected_fields": fields,
+                }
+            )
+
+
+@register_rule
+class InconsistentIdTypes(Rule):
+    """Top-level ``*_id`` fields (internal entity IDs) with mixed types."""
+
+    name = "inconsistent_id_types"
+
+    def finish(self) -> None:
+        by_type: dict[str, list[str]] = {}
+        for node in self.ctx.top_level:
+            if node.name_lower.endswith("_id"):
+                by_type.setdefault(node.field_type, []).append(node.path)
+        if len(by_type) > 1:
+            type_summary = ", ".join(
+                f"{len(fields)} {ftype}" for ftype, fields in by_type.items()
+            )
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "inconsistent_id_types",
+                    "severity": "warning",
+                    "category": "type_consistency",
+                    "suggestion": f"Internal ID fields have inconsistent types ({type_summary}). Standardize on one type (typically STRING or INTEGER) for primary entity IDs.",
+                    "affected_fields": [
+                        f for fields in by_type.values() for f in fields
+                    ],
+                }
+            )
+
+
+@register_rule
+class FloatForMoney(_PathRule):
+    name = "float_for_money"
+    field_types = frozenset({"FLOAT", "FLOAT64"})
+
+    def match(self, node: FieldNode) -> bool:
+        return keyword_matcher(analyze_config.FLOAT_MONEY_KEYWORDS).search(
+            node.name_lower
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "float_for_money",
+            "severity": "warning",
+            "category": "type_optimization",
+            "suggestion": f"FLOAT64 used for monetary values ({len(paths)} fields). Use NUMERIC/DECIMAL for exact decimal arithmetic to avoid rounding errors.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class GodTable(Rule):
+    name = "god_table"
+
+    def finish(self) -> None:
+        total_fields = len(self.ctx.schema)
+        if total_fields > 80:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "god_table",
+                    "severity": "warning",
+                    "category": "schema_design",
+                    "suggestion": f"Table has {total_fields} top-level fields, suggesting multiple concerns. Consider splitting into focused tables (users + preferences, orders + line_items, etc.) for better maintainability.",
+                    "affected_fields": [],
+                }
+            )
+
+
+@register_rule
+class ArrayWithoutId(_PathRule):
+    name = "array_without_id"
+    field_types = _RECORD
+    id_names = frozenset({"id", "uuid", "guid", "key", "index"})
+
+    def match(self, node: FieldNode) -> bool:
+        return (
+            node.is_repeated
+            and not (node.child_names_lower & self.id_names)
+            and len(node.field.fields) > 2
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "array_without_id",
+            "severity": "warning",
+            "category": "data_quality",
+            "suggestion": f"ARRAY<STRUCT> fields without unique identifiers ({len(paths)} arrays). Add id/uuid field to enable updates, deletes, and unambiguous references.",
+            "affected_fields": paths,
+        }
+
+
+# =============================================================================
+# Security
+# =============================================================================
+
+
+@register_rule
+class Pii(Rule):
+    """PII-looking fields that are not policy-tagged (and maybe undocumented)."""
+
+    name = "pii"
+    weak_indicators = ("image", "photo", "picture")
+    documented_words = ("pii", "sensitive", "confidential", "private", "personal")
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.indicators = keyword_matcher(analyze_config.PII_INDICATORS)
+        self.missing_both: list[str] = []
+        self.missing_tags: list[str] = []
+
+    def field(self, node: FieldNode) -> None:
+        name_lower = node.name_lower
+        # Cut obvious false positives
+        if name_lower in analyze_config.PII_EXCLUDE_EXACT or suffix_matcher(
+            analyze_config.PII_EXCLUDE_SUFFIXES
+        ).match(name_lower):
+            return
+        name_signals = self.indicators.search(name_lower)
+        # Weak signals (only count if STRING/BYTES)
+        if not name_signals and any(t in name_lower for t in self.weak_indicators):
+            name_signals = node.field_type in ("STRING", "BYTES")
+        if not name_signals:
+            return
+
+        documented = any(w in node.description_lower for w in self.documented_words)
+        tagged = bool(_policy_tag_names(node.field))
+        if not documented and not tagged:
+            self.missing_both.append(node.path)
+        elif documented and not tagged:
+            self.missing_tags.append(node.path)
+
+    def finish(self) -> None:
+        if self.missing_both:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "pii_unmarked_undocumented",
+                    "severity": "warning",
+                    "category": "security",
+                    "suggestion": "Fields likely containing PII are neither policy-tagged nor documented. Add data catalog policy tags and docs.",
+                    "affected_fields": self.missing_both,
+                }
+            )
+        if self.missing_tags:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "pii_missing_policy_tags",
+                    "severity": "info",
+                    "category": "security",
+                    "suggestion": "Fields likely containing PII are documented as sensitive but missing policy tags. Attach taxonomy policy tags.",
+                    "affected_fields": self.missing_tags,
+                }
+            )
+
+
+@register_rule
+class Secrets(Rule):
+    """Password/token-like fields, plain STRING or already tagged."""
+
+    name = "secrets"
+    documented_words = ("secret", "credential", "sensitive")
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.untagged: list[str] = []
+        self.tagged_or_doc: list[str] = []
+
+    def field(self, node: FieldNode) -> None:
+        name_lower = node.name_lower
+        # Ignore obvious non-secrets (_id/_key references)
+        if name_lower.endswith(("_id", "_key", "_ref")):
+            return
+        is_secretish = (
+            name_lower in analyze_config.SENSITIVE_SECRETS_EXACT
+            or suffix_matcher(analyze_config.SENSITIVE_SECRET_SUFFIXES).match(
+                name_lower
+            )
+        )
+        if not is_secretish:
+            return
+
+        documented = any(w in node.description_lower for w in self.documented_words)
+        tagged = bool(_policy_tag_names(node.field))
+        # Prefer BYTES or hashed STRING; flag plain STRING strongly
+        if node.field_type == "STRING" and not (tagged or documented):
+            self.untagged.append(node.path)
+        elif tagged or documented:
+            self.tagged_or_doc.append(node.path)
+
+    def finish(self) -> None:
+        if self.untagged:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "plaintext_secrets",
+                    "severity": "error",
+                    "category": "security",
+                    "suggestion": "Likely secrets stored without policy tags/docs. Never store plaintext passwords or long-lived tokens; prefer hashed values or external secret managers and add policy tags.",
+                    "affected_fields": self.untagged,
+                }
+            )
+        if self.tagged_or_doc:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "secrets_needing_review",
+                    "severity": "info",
+                    "category": "security",
+                    "suggestion": "Secret-like fields are present but already tagged/documented. Re-check storage strategy (hashing/rotation) and access policies.",
+                    "affected_fields": self.tagged_or_doc,
+                }
+            )
+
+
+@register_rule
+class UnstructuredAddress(_PathRule):
+    name = "unstructured_address"
+    field_types = _STRING
+
+    def match(self, node: FieldNode) -> bool:
+        return "address" in node.name_lower
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "unstructured_address",
+            "severity": "info",
+            "category": "data_quality",
+            "suggestion": f"Address fields stored as STRING ({len(paths)} fields). Use STRUCT with street, city, state, zip, country for better querying and validation.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class UndocumentedEnum(_PathRule):
+    """Enum-like STRING fields whose description lists no valid values."""
+
+    name = "undocumented_enum"
+    field_types = _STRING
+    documented_words = ("valid", "values", "enum", "one of", "options", ":")
+
+    def match(self, node: FieldNode) -> bool:
+        if not keyword_matcher(analyze_config.ENUM_FIELD_INDICATORS).search(
+            node.name_lower
+        ):
+            return False
+        return not any(w in node.description_lower for w in self.documented_words)
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "undocumented_enum",
+            "severity": "info",
+            "category": "documentation",
+            "suggestion": f"Enum-like fields without documented valid values ({len(paths)} fields). Document constraints in description (e.g., 'Valid values: active, inactive, pending').",
+            "affected_fields": paths,
+        }
+
+
+# =============================================================================
+# Naming and normalization
+# =============================================================================
+
+
+@register_rule
+class PluralSingularConfusion(Rule):
+    """Arrays with singular names and scalars/objects with plural names."""
+
+    name = "plural_singular_confusion"
+    prunes = True
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.by_type: dict[str, list[str]] = {}
+
+    def field(self, node: FieldNode) -> Optional[bool]:
+        name = node.name_lower
+        # Skip wrapper artifacts (.list, .element) and everything below them
+        if name in ("list", "element"):
+            return PRUNE
+
+        is_plural = name.endswith(("s", "es", "ies")) and not name.endswith(
+            ("ss", "us", "is")
+        )
+        # STRUCT wrapper for an array (e.g. awards.list pattern)
+        field = node.field
+        is_array_wrapper = (
+            node.is_record
+            and not node.is_repeated
+            and len(field.fields) == 1
+            and field.fields[0].name == "list"
+            and field.fields[0].mode == "REPEATED"
+        )
+        if node.is_repeated:
+            if not is_plural and len(name) > 3:
+                self.by_type.setdefault("should_be_plural", []).append(node.path)
+        elif is_plural and not is_array_wrapper:
+            self.by_type.setdefault("should_be_singular", []).append(node.path)
+        return None
+
+    def finish(self) -> None:
+        for issue_type, fields in self.by_type.items():
+            if issue_type == "should_be_plural":
+                msg = f"ARRAY fields with singular names ({len(fields)} fields). Use plural names for arrays (user → users, item → items)."
+            else:
+                msg = f"Non-array fields with plural names ({len(fields)} fields). Use singular names for scalar/object fields."
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "plural_singular_confusion",
+                    "severity": "info",
+                    "category": "naming",
+                    "suggestion": msg,
+                    "affected_fields": fields,
+                }
+            )
+
+
+@register_rule
+class TypeInName(_PathRule):
+    name = "type_in_name"
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.suffixes = suffix_matcher(analyze_config.TYPE_SUFFIX_PATTERNS)
+
+    def match(self, node: FieldNode) -> bool:
+        return self.suffixes.match(node.name_lower)
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "type_in_name",
+            "severity": "info",
+            "category": "naming",
+            "suggestion": f"Field names include type information ({len(paths)} fields). Remove type suffixes - schema already defines types (user_id_string → user_id).",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class RedundantPrefix(Rule):
+    """More than half of the top-level fields share one prefix."""
+
+    name = "redundant_prefix"
+
+    def finish(self) -> None:
+        top = self.ctx.top_level
+        if len(top) < 5:
+            return
+        prefixes: dict[str, int] = {}
+        for node in top:
+            if len(node.parts) > 1:
+                prefixes[node.parts[0]] = prefixes.get(node.parts[0], 0) + 1
+        if not prefixes:
+            return
+        most_common_prefix, count = max(prefixes.items(), key=lambda x: x[1])
+        if count / len(top) > 0.5:
+            affected = [
+                n.name for n in top if n.name_lower.startswith(most_common_prefix + "_")
+            ]
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "redundant_prefix",
+                    "severity": "info",
+                    "category": "naming",
+                    "suggestion": f"Redundant prefix '{most_common_prefix}_' in {count} fields. If table is named '{most_common_prefix}', remove prefix (user_name → name).",
+                    "affected_fields": affected[:20],
+                }
+            )
+
+
+@register_rule
+class DenormalizationAbuse(Rule):
+    """Four or more top-level fields sharing a prefix (company_name, ...)."""
+
+    name = "denormalization_abuse"
+
+    def finish(self) -> None:
+        top = self.ctx.top_level
+        field_prefixes: dict[str, int] = {}
+        for node in top:
+            parts = node.parts
+            if len(parts) >= 2:
+                prefix = "_".join(parts[:2]) if len(parts) > 2 else parts[0]
+                field_prefixes[prefix] = field_prefixes.get(prefix, 0) + 1
+        denorm_groups = {p: c for p, c in field_prefixes.items() if c >= 4}
+        if not denorm_groups:
+            return
+        prefix, count = max(denorm_groups.items(), key=lambda x: x[1])
+        affected = [n.name for n in top if n.name_lower.startswith(prefix)]
+        self.report(
+            {
+                "field_name": "schema",
+                "pattern": "denormalization_abuse",
+                "severity": "info",
+                "category": "normalization",
+                "suggestion": f"Multiple related fields with '{prefix}_' prefix ({count} fields). Consider creating a separate table or nested STRUCT for better organization.",
+                "affected_fields": affected[:20],
+            }
+        )
+
+
+@register_rule
+class EavAntipattern(_PathRule):
+    """Generic REPEATED key/value STRUCTs (attributes, properties, ...)."""
+
+    name = "eav_antipattern"
+    field_types = _RECORD
+    container_names = frozenset(
+        {"attributes", "properties", "metadata", "tags", "custom_fields"}
+    )
+
+    def match(self, node: FieldNode) -> bool:
+        if not node.is_repeated or node.name_lower not in self.container_names:
+            return False
+        names = node.child_names_lower
+        return ("key" in names or "name" in names) and "value" in names
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "eav_antipattern",
+            "severity": "warning",
+            "category": "schema_design",
+            "suggestion": f"EAV (key-value) pattern detected ({len(paths)} fields). Loses type safety and makes queries complex. Define explicit fields or use JSON type with schema validation.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class StringForBinary(_PathRule):
+    name = "string_for_binary"
+    field_types = _STRING
+    # URL, URI and path fields are text, not binary
+    text_markers = ("_url", "_uri", "_path", "url", "uri", "link", "href")
+
+    def match(self, node: FieldNode) -> bool:
+        name_lower = node.name_lower
+        if any(marker in name_lower for marker in self.text_markers):
+            return False
+        return keyword_matcher(analyze_config.BINARY_DATA_KEYWORDS).search(name_lower)
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "string_for_binary",
+            "severity": "info",
+            "category": "type_optimization",
+            "suggestion": f"STRING fields likely containing binary data ({len(paths)} fields). Use BYTES type for better storage efficiency and semantic clarity.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class MissingSoftDelete(Rule):
+    name = "missing_soft_delete"
+
+    def finish(self) -> None:
+        names = self.ctx.top_level_names_lower
+        has_soft_delete = bool(
+            names & {"is_deleted", "deleted", "deleted_at", "soft_deleted"}
+        )
+        has_crud_timestamps = bool(names & {"created_at", "updated_at"})
+        if has_crud_timestamps and not has_soft_delete:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "missing_soft_delete",
+                    "severity": "info",
+                    "category": "data_quality",
+                    "suggestion": "Table has audit timestamps but no soft delete mechanism. Add is_deleted or deleted_at field to preserve data history and enable recovery.",
+                    "affected_fields": [],
+                }
+            )
+
+
+class _TypeMixRule(Rule):
+    """Group matching fields by type; report when more than one type is used."""
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.by_type: dict[str, list[str]] = {}
+
+    def match(self, node: FieldNode) -> bool:
+        raise NotImplementedError
+
+    def issue(self, type_summary: str, paths: list[str]) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def field(self, node: FieldNode) -> None:
+        if self.match(node):
+            self.by_type.setdefault(node.field_type, []).append(node.path)
+
+    def finish(self) -> None:
+        if len(self.by_type) > 1:
+            type_summary = ", ".join(
+                f"{len(fields)} {ftype}" for ftype, fields in self.by_type.items()
+            )
+            paths = [f for fields in self.by_type.values() for f in fields]
+            self.report(self.issue(type_summary, paths))
+
+
+@register_rule
+class InconsistentDateGranularity(_TypeMixRule):
+    name = "inconsistent_date_granularity"
+    field_types = frozenset({"DATE", "TIMESTAMP", "DATETIME"})
+
+    def match(self, node: FieldNode) -> bool:
+        return "_date" in node.name_lower or node.name_lower.endswith("date")
+
+    def issue(self, type_summary: str, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "inconsistent_date_granularity",
+            "severity": "info",
+            "category": "type_consistency",
+            "suggestion": f"Date fields have inconsistent types ({type_summary}). Standardize on appropriate granularity: DATE for dates, TIMESTAMP for events.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class MixedNullRepresentation(Rule):
+    """Top-level descriptions mentioning empty strings/magic values as NULL."""
+
+    name = "mixed_null_representation"
+    null_mentions = (
+        "empty string",
+        "0 means",
+        "blank means",
+        "null string",
+        '""',
+        "n/a",
+    )
+
+    def finish(self) -> None:
+        suspect_fields = [
+            n.name
+            for n in self.ctx.top_level
+            if any(m in n.description_lower for m in self.null_mentions)
+        ]
+        if suspect_fields:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "mixed_null_representation",
+                    "severity": "info",
+                    "category": "data_quality",
+                    "suggestion": f"Fields with alternative NULL representations ({len(suspect_fields)} fields). Use proper NULL values, not empty strings or magic numbers.",
+                    "affected_fields": suspect_fields,
+                }
+            )
+
+
+@register_rule
+class InconsistentBooleanType(_TypeMixRule):
+    name = "inconsistent_boolean_type"
+    prefixes = ("is_", "has_", "can_", "should_", "will_")
+    suffixes = ("_enabled", "_active", "_visible", "_published")
+
+    def match(self, node: FieldNode) -> bool:
+        return node.name_lower.startswith(self.prefixes) or node.name_lower.endswith(
+            self.suffixes
+        )
+
+    def issue(self, type_summary: str, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "inconsistent_boolean_type",
+            "severity": "warning",
+            "category": "type_consistency",
+            "suggestion": f"Boolean-semantic fields use inconsistent types ({type_summary}). Standardize on BOOLEAN type for all true/false fields.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class NullablePartitionField(Rule):
+    """Top-level fields named like partition keys that are NULLABLE."""
+
+    name = "nullable_partition_field"
+
+    def finish(self) -> None:
+        for node in self.ctx.top_level:
+            if (
+                node.name_lower in analyze_config.PARTITION_FIELD_NAMES
+                and node.mode == "NULLABLE"
+            ):
+                self.report(
+                    {
+                        "field_name": "schema",
+                        "pattern": "nullable_partition_field",
+                        "severity": "warning",
+                        "category": "performance",
+                        "suggestion": f"Field '{node.name}' appears to be a partition key but is NULLABLE. Partition fields should be REQUIRED for optimal query performance.",
+                        "affected_fields": [node.name],
+                    }
+                )
+
+
+@register_rule
+class OverStructuring(_PathRule):
+    """Top-level STRUCTs with at most two simple fields."""
+
+    name = "over_structuring"
+    field_types = _RECORD
+    simple_types = frozenset(
+        {"STRING", "INTEGER", "FLOAT", "BOOLEAN", "TIMESTAMP", "DATE"}
+    )
+
+    def match(self, node: FieldNode) -> bool:
+        fields = node.field.fields
+        return (
+            not node.is_repeated
+            and node.depth == 0
+            and len(fields) <= 2
+            and all(sf.field_type in self.simple_types for sf in fields)
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "over_structuring",
+            "severity": "info",
+            "category": "schema_design",
+            "suggestion": f"Small STRUCT fields that should be flattened ({len(paths)} structs). Flatten commonly-used fields to top level for simpler queries.",
+            "affected_fields": paths,
+        }
+
+
+# =============================================================================
+# Types and semantics
+# =============================================================================
+
+
+@register_rule
+class EpochAsInt64(_PathRule):
+    name = "epoch_as_int64"
+    field_types = frozenset({"INT64"})
+
+    def match(self, node: FieldNode) -> bool:
+        return keyword_matcher(analyze_config.EPOCH_TIME_INDICATORS).search(
+            node.name_lower
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "epoch_as_int64",
+            "severity": "warning",
+            "category": "types",
+            "suggestion": "Epoch/Unix timestamps stored as INT64 are harder to query. Use TIMESTAMP instead and convert with TIMESTAMP_MILLIS(col) or TIMESTAMP_SECONDS(col).",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class DurationWithoutInterval(_PathRule):
+    name = "duration_without_interval"
+    field_types = frozenset({"INT64", "STRING"})
+
+    def match(self, node: FieldNode) -> bool:
+        return suffix_matcher(analyze_config.DURATION_FIELD_SUFFIXES).match(
+            node.name_lower
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "duration_without_interval",
+            "severity": "info",
+            "category": "types",
+            "suggestion": "Duration fields stored as INT64/STRING lose semantics. Consider using INTERVAL type with MAKE_INTERVAL() for clarity.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class MoneyWithoutCurrency(_PathRule):
+    """Monetary amounts without a sibling currency field."""
+
+    name = "money_without_currency"
+    field_types = frozenset({"NUMERIC", "BIGNUMERIC", "FLOAT64", "INT64"})
+
+    def match(self, node: FieldNode) -> bool:
+        if not keyword_matcher(analyze_config.MONEY_FIELD_INDICATORS).search(
+            node.name_lower
+        ):
+            return False
+        if node.parent is None:
+            siblings = self.ctx.top_level_names_lower
+        else:
+            siblings = node.parent.child_names_lower
+        return not any("currency" in name for name in siblings)
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "money_without_currency",
+            "severity": "warning",
+            "category": "types",
+            "suggestion": "Monetary amounts without currency_code are ambiguous. Add a sibling currency_code STRING field (ISO-4217) or use a normalized currency table.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class LatlonNotGeography(Rule):
+    name = "latlon_not_geography"
+
+    def finish(self) -> None:
+        names = self.ctx.top_level_names_lower
+        has_lon = bool(names & analyze_config.LONGITUDE_FIELD_NAMES)
+        has_geography = any("geo" in n for n in names)
+        found = [
+            f"{n.name} & lon"
+            for n in self.ctx.top_level
+            if n.name_lower in analyze_config.LATITUDE_FIELD_NAMES
+            and n.field_type in ("FLOAT64", "STRING")
+            and has_lon
+            and not has_geography
+        ]
+        if found:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "latlon_not_geography",
+                    "severity": "info",
+                    "category": "types",
+                    "suggestion": "Lat/lon pairs as separate STRING/FLOAT fields are clumsy for spatial queries. Use GEOGRAPHY with ST_GEOGPOINT(lon, lat) and consider clustering by geography.",
+                    "affected_fields": found,
+                }
+            )
+
+
+@register_rule
+class DatetimeForInstants(_PathRule):
+    name = "datetime_for_instants"
+    field_types = frozenset({"DATETIME"})
+
+    def match(self, node: FieldNode) -> bool:
+        return keyword_matcher(analyze_config.INSTANT_EVENT_INDICATORS).search(
+            node.name_lower
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "datetime_for_instants",
+            "severity": "warning",
+            "category": "types",
+            "suggestion": "DATETIME fields for instant events lack timezone info and can cause issues during DST transitions. Use TIMESTAMP unless truly timezone-agnostic.",
+            "affected_fields": paths,
+        }
+
+
+# =============================================================================
+# Naming and documentation
+# =============================================================================
+
+
+@register_rule
+class ProblematicFieldNames(Rule):
+    """Non-ASCII, whitespace, stray underscores or too many name segments."""
+
+    name = "problematic_field_names"
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.found: list[str] = []
+
+    def field(self, node: FieldNode) -> None:
+        name = node.name
+        problems = []
+        if not name.isascii():
+            problems.append("non-ASCII")
+        if " " in name:
+            problems.append("whitespace")
+        if name.startswith("_"):
+            problems.append("leading underscore")
+        if name.endswith("_"):
+            problems.append("trailing underscore")
+        if "__" in name:
+            problems.append("consecutive underscores")
+        if len(node.parts) > 5:
+            problems.append("too many segments")
+        if problems:
+            self.found.append(f"{node.path} ({', '.join(problems)})")
+
+    def finish(self) -> None:
+        if self.found:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "problematic_field_names",
+                    "severity": "warning",
+                    "category": "naming",
+                    "suggestion": "Field names with non-ASCII characters, whitespace, problematic underscores, or too many segments cause tooling friction. Use clean snake_case names.",
+                    "affected_fields": self.found[:20],  # Limit display
+                }
+            )
+
+
+@register_rule
+class LowDocumentationCoverage(Rule):
+    name = "low_documentation_coverage"
+
+    def finish(self) -> None:
+        nodes = self.ctx.nodes
+        if not nodes:
+            return
+        documented = sum(
+            1 for n in nodes if n.field.description and n.field.description.strip()
+        )
+        coverage_pct = (documented / len(nodes)) * 100
+        if coverage_pct >= 60:
+            return
+        undocumented_top = [
+            n.name
+            for n in self.ctx.top_level
+            if not n.field.description or not n.field.description.strip()
+        ]
+        self.report(
+            {
+                "field_name": "schema",
+                "pattern": "low_documentation_coverage",
+                "severity": "error" if coverage_pct < 30 else "warning",
+                "category": "documentation",
+                "suggestion": f"Only {coverage_pct:.1f}% of fields have descriptions. Document all fields for better maintainability. Top-level fields missing descriptions: {', '.join(undocumented_top[:10])}",
+                "coverage_percent": coverage_pct,
+                "documented": documented,
+                "total": len(nodes),
+            }
+        )
+
+
+# =============================================================================
+# Arrays and nested data
+# =============================================================================
+
+
+@register_rule
+class RepeatedScalarShouldBeStruct(Rule):
+    """Top-level repeated scalars next to a related STRUCT sibling."""
+
+    name = "repeated_scalar_should_be_struct"
+
+    def finish(self) -> None:
+        top = self.ctx.top_level
+        found = []
+        for node in top:
+            if node.is_repeated and node.field_type not in ("RECORD", "STRUCT"):
+                stem = node.name.rstrip("s")
+                if any(f.is_record and f.name.startswith(stem) for f in top):
+                    found.append(node.name)
+        if found:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "repeated_scalar_should_be_struct",
+                    "severity": "info",
+                    "category": "schema_design",
+                    "suggestion": "Repeated scalars with related STRUCT siblings often evolve into ARRAY<STRUCT>. Consider ARRAY<STRUCT<id, name, ...>> from the start.",
+                    "affected_fields": found,
+                }
+            )
+
+
+@register_rule
+class ArrayMissingKeys(_PathRule):
+    """ARRAY<STRUCT> without an id or natural key field."""
+
+    name = "array_missing_keys"
+    field_types = _RECORD
+
+    def match(self, node: FieldNode) -> bool:
+        return (
+            node.is_repeated
+            and not (node.child_names_lower & analyze_config.ARRAY_NATURAL_KEY_NAMES)
+            and len(node.field.fields) > 2
+        )
+
+    def issue(self, paths: list[str]) -> dict[str, Any]:
+        return {
+            "field_name": "schema",
+            "pattern": "array_missing_keys",
+            "severity": "warning",
+            "category": "schema_design",
+            "suggestion": "ARRAY<STRUCT> without id or natural key (code, name) makes updates/deduplication difficult. Add an identifier field.",
+            "affected_fields": paths,
+        }
+
+
+@register_rule
+class GodChildArray(Rule):
+    """Very wide ARRAY<STRUCT> nested deep in the schema."""
+
+    name = "god_child_array"
+
+    def __init__(self, ctx: RuleContext) -> None:
+        super().__init__(ctx)
+        self.found: list[str] = []
+
+    def struct(self, node: FieldNode) -> None:
+        count = len(node.field.fields)
+        if (
+            node.is_repeated
+            and count > analyze_config.GOD_ARRAY_MIN_FIELDS
+            and node.depth >= analyze_config.GOD_ARRAY_MIN_DEPTH
+        ):
+            self.found.append(f"{node.path} ({count} fields)")
+
+    def finish(self) -> None:
+        if self.found:
+            self.report(
+                {
+                    "field_name": "schema",
+                    "pattern": "god_child_array",
+                    "severity": "warning",
+                    "category": "schema_design",
+                    "suggestion": "Extremely wide and deeply nested ARRAY<STRUCT> are expensive to unnest and hard to query. Move to a dedicated child table keyed by parent id.",
+                    "affected_fields": self.found,
+                }
+            )
+
+
+__all__ = [
+    "PRUNE",
+    "FieldNode",
+    "RuleContext",
+    "Rule",
+    "register_rule",
+    "list_rules",
+    "select_rules",
+    "run_rules",
+]
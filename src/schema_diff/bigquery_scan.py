@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""Parallel, resumable anti-pattern scans of BigQuery datasets and projects.
+
+`detect_table_antipatterns`/`detect_dataset_antipatterns` analyze one table
+or dataset per call and keep nothing between runs. A scan of a whole project
+instead:
+
+- fetches table metadata per dataset in batches through the persistent
+  metadata cache (`bigquery_cache`, bulk INFORMATION_SCHEMA reads for large
+  batches), fetching the next batch while the current one is analyzed
+- analyzes tables in a process pool (schema rules + table-level checks)
+- streams findings to an NDJSON file as tables complete, one JSON object per
+  finding tagged with ``project``/``dataset``/``table`` (``table`` is null for
+  dataset-level findings; tables that could not be read get an ``error``
+  record instead, as do datasets whose tables could not be listed, with a
+  null ``table``)
+- appends each completed table to a checkpoint file next to the findings
+  (``<findings>.checkpoint``), written after the table's findings
+
+Resuming an interrupted scan skips checkpointed tables and drops any findings
+written for tables that were not checkpointed, so every table's findings
+appear exactly once. Tables and datasets that failed are retried on resume.
+
+Public helpers
+--------------
+- scan_bigquery – scan datasets of a project, streaming findings to NDJSON
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Optional, Union
+
+from google.cloud import bigquery
+
+from . import analyze_config
+
+logger = logging.getLogger(__name__)
+
+# (project, dataset, table); table is None for the dataset-level checks
+_Key = tuple[str, str, Optional[str]]
+
+
+def _analyze_table(
+    resource: dict[str, Any], rules: Optional[list[str]] = None
+) -> list[dict[str, Any]]:
+    """Schema and table-level anti-patterns of one table (runs in a worker)."""
+    from .bigquery_ddl import detect_bigquery_antipatterns, detect_table_antipatterns
+
+    table = bigquery.Table.from_api_repr(resource)
+    issues = detect_bigquery_antipatterns(table.schema, rules=rules)
+    return issues + detect_table_antipatterns(table)
+
+
+class _ScanOutput:
+    """Findings NDJSON plus the checkpoint of completed tables."""
+
+    def __init__(self, findings_path: Path, resume: bool) -> None:
+        self.findings_path = findings_path
+        self.checkpoint_path = findings_path.with_name(
+            findings_path.name + ".checkpoint"
+        )
+        findings_path.parent.mkdir(parents=True, exist_ok=True)
+        self.completed: set[_Key] = set()
+        if resume:
+            self.completed = self._load_checkpoint()
+            self._prune_findings()
+        mode = "a" if resume else "w"
+        self.findings_count = 0
+        self._findings: IO[str] = open(findings_path, mode, encoding="utf-8")
+        self._checkpoint: IO[str] = open(self.checkpoint_path, mode, encoding="utf-8")
+
+    def _load_checkpoint(self) -> set[_Key]:
+        completed: set[_Key] = set()
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        entry = json.loads(line)
+                        completed.add(
+                            (entry["project"], entry["dataset"], entry["table"])
+                        )
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Partial last line of an interrupted run
+        except FileNotFoundError:
+            pass
+        return completed
+
+    def _prune_findings(self) -> None:
+        """Keep only findings of checkpointed tables (rewritten atomically)."""
+        if not self.findings_path.exists():
+            return
+        tmp = self.findings_path.with_name(self.findings_path.name + ".tmp")
+        with open(self.findings_path, encoding="utf-8") as src:
+            with open(tmp, "w", encoding="utf-8") as dst:
+                for line in src:
+                    try:
+                        record = json.loads(line)
+                        key = (record["project"], record["dataset"], record["table"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    if key in self.completed:
+                        dst.write(line)
+        os.replace(tmp, self.findings_path)
+
+    def is_done(self, key: _Key) -> bool:
+        return key in self.completed
+
+    def write(
+        self, key: _Key, issues: list[dict[str, Any]], complete: bool = True
+    ) -> None:
+        """Append a table's findings, then checkpoint it when `complete`."""
+        project, dataset, table = key
+        for issue in issues:
+            record = {"project": project, "dataset": dataset, "table": table}
+            record.update(issue)
+            self._findings.write(json.dumps(record, default=str) + "\n")
+        self.findings_count += len(issues)
+        self._findings.flush()
+        if complete:
+            entry = {"project": project, "dataset": dataset, "table": table}
+            self._checkpoint.write(json.dumps(entry) + "\n")
+            self._checkpoint.flush()
+            self.completed.add(key)
+
+    def error(self, key: _Key, exc: BaseException) -> None:
+        """Record a table that could not be analyzed (retried on resume)."""
+        project, dataset, table = key
+        record = {
+            "project": project,
+            "dataset": dataset,
+            "table": table,
+            "error": f"{type(exc).__name__}: {exc}",
+        }
+        self._findings.write(json.dumps(record) + "\n")
+        self._findings.flush()
+
+    def close(self) -> None:
+        self._findings.close()
+        self._checkpoint.close()
+
+
+def _list_datasets(client: bigquery.Client, project_id: str) -> list[str]:
+    from .rate_limit import get_bigquery_limiter
+
+    return get_bigquery_limiter(project_id).call(
+        lambda: [d.dataset_id for d in client.list_datasets(project=project_id)],
+        operation_name=f"list_datasets {project_id}",
+    )
+
+
+def _list_tables(
+    client: bigquery.Client, project_id: str, dataset_id: str
+) -> list[str]:
+    from .rate_limit import get_bigquery_limiter
+
+    dataset_ref = f"{project_id}.{dataset_id}"
+    return get_bigquery_limiter(project_id).call(
+        lambda: [t.table_id for t in client.list_tables(dataset_ref)],
+        operation_name=f"list_tables {dataset_ref}",
+    )
+
+
+def _fetch_batches(
+    client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    table_ids: list[str],
+    cache_dir: Optional[Path],
+) -> Iterator[tuple[dict[str, bigquery.Table], dict[str, Exception]]]:
+    """Yield (tables, errors) per batch, fetching one batch ahead."""
+    from .bigquery_cache import get_cached_tables
+
+    size = max(analyze_config.SCAN_BATCH_TABLES, 1)
+    batches = [table_ids[i : i + size] for i in range(0, len(table_ids), size)]
+    if not batches:
+        return
+    with ThreadPoolExecutor(max_workers=1) as fetcher:
+
+        def _fetch(batch: list[str]) -> Future:
+            return fetcher.submit(
+                get_cached_tables,
+                client,
+                project_id,
+                dataset_id,
+                batch,
+                cache_dir=cache_dir,
+                allow_partial=True,
+            )
+
+        pending = _fetch(batches[0])
+        for batch in batches[1:]:
+            current, pending = pending, _fetch(batch)
+            yield current.result()
+        yield pending.result()
+
+
+def _scan_dataset(
+    client: bigquery.Client,
+    project_id: str,
+    dataset_id: str,
+    pool: Executor,
+    out: _ScanOutput,
+    stats: dict[str, int],
+    cache_dir: Optional[Path],
+    rules: Optional[list[str]],
+) -> None:
+    from .bigquery_ddl import _dataset_antipatterns_from_schemas
+
+    dataset_key: _Key = (project_id, dataset_id, None)
+    try:
+        table_ids = _list_tables(client, project_id, dataset_id)
+    except Exception as e:
+        # e.g. Forbidden on one dataset: record it and go on with the others
+        logger.warning("Listing tables of %s.%s failed: %s", project_id, dataset_id, e)
+        if not out.is_done(dataset_key):
+            out.error(dataset_key, e)
+            stats["errors"] += 1
+        return
+    if out.is_done(dataset_key):
+        stats["skipped"] += len(table_ids)
+        return
+
+    schemas: list[list[Any]] = []
+    failed = 0
+    for tables, errors in _fetch_batches(
+        client, project_id, dataset_id, table_ids, cache_dir
+    ):
+        for table_id, exc in errors.items():
+            out.error((project_id, dataset_id, table_id), exc)
+            failed += 1
+        futures: dict[Future, str] = {}
+        for table_id, table in tables.items():
+            schemas.append(list(table.schema))
+            if out.is_done((project_id, dataset_id, table_id)):
+                stats["skipped"] += 1
+                continue
+            futures[pool.submit(_analyze_table, table.to_api_repr(), rules)] = table_id
+        for future in as_completed(futures):
+            key = (project_id, dataset_id, futures[future])
+            try:
+                issues = future.result()
+            except Exception as e:
+                logger.warning("Analysis of %s.%s.%s failed: %s", *key, e)
+                out.error(key, e)
+                failed += 1
+                continue
+            out.write(key, issues)
+            stats["tables"] += 1
+
+    # Dataset-level checks see every readable table; the dataset is only
+    # checkpointed once no table failed, so a resume retries both.
+    out.write(
+        dataset_key,
+        _dataset_antipatterns_from_schemas(table_ids, schemas),
+        complete=not failed,
+    )
+    stats["errors"] += failed
+    stats["datasets"] += 1
+    logger.info(
+        "Scanned %s.%s: %d tables, %d failed",
+        project_id,
+        dataset_id,
+        len(table_ids),
+        failed,
+    )
+
+
+def scan_bigquery(
+    project_id: str,
+    findings_path: Union[str, Path],
+    dataset_ids: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    resume: bool = False,
+    client: Optional[bigquery.Client] = None,
+    cache_dir: Optional[Path] = None,
+    rules: Optional[Iterable[str]] = None,
+) -> dict[str, int]:
+    """Scan BigQuery datasets for anti-patterns, streaming findings to NDJSON.
+
+    Args:
+        project_id: GCP project ID
+        findings_path: NDJSON file receiving one record per finding; the
+            checkpoint is kept next to it as ``<findings_path>.checkpoint``
+        dataset_ids: Datasets to scan (None = every dataset in the project)
+        workers: Analysis processes (default: one per CPU; 1 = in-process)
+        resume: Continue a previous scan into the same findings file,
+            skipping checkpointed tables (otherwise both files start empty)
+        client: BigQuery client (default: pooled client for the project)
+        cache_dir: Metadata cache directory (default: bigquery_cache's)
+        rules: Schema anti-pattern rules to run (default: see
+            `bigquery_rules.select_rules`)
+
+    Returns:
+        Counts: datasets scanned, tables analyzed, tables skipped as already
+        complete, tables (and datasets that could not be listed) that failed,
+        and findings written in this run
+    """
+    from .bigquery_utils import get_bigquery_client
+
+    if client is None:
+        client = get_bigquery_client(project_id)
+    if dataset_ids is None:
+        dataset_ids = _list_datasets(client, project_id)
+    workers = workers or os.cpu_count() or 1
+
+    stats = {"datasets": 0, "tables": 0, "skipped": 0, "errors": 0}
+    out = _ScanOutput(Path(findings_path), resume)
+    pool: Executor = (
+        ThreadPoolExecutor(max_workers=1)
+        if workers == 1
+        else ProcessPoolExecutor(max_workers=workers)
+    )
+    try:
+        for dataset_id in dataset_ids:
+            _scan_dataset(
+                client,
+                project_id,
+                dataset_id,
+                pool,
+                out,
+                stats,
+                cache_dir,
+                None if rules is None else list(rules),
+            )
+    except BaseException:
+        # Interrupted: drop queued work; completed tables are checkpointed
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        pool.shutdown()
+    finally:
+        out.close()
+    stats["findings"] = out.findings_count
+    return stats
+
+
+__all__ = ["scan_bigquery"]
@@ -10,7 +10,6 @@ from __future__ import annotations
 
 from typing import Any
 
-from google.cloud import bigquery
 from google.cloud.bigquery.schema import SchemaField
 
 # Import configuration
@@ -326,9 +325,11 @@ def get_live_table_schema(
     Returns:
         (schema_tree, required_paths)
     """
-    client = bigquery.Client(project=project_id)
-    table_ref = f"{project_id}.{dataset_id}.{table_id}"
-    table = client.get_table(table_ref)
+    from .bigquery_cache import get_cached_table
+    from .bigquery_utils import get_bigquery_client
+
+    client = get_bigquery_client(project_id)
+    table = get_cached_table(client, project_id, dataset_id, table_id)
 
     return bigquery_schema_to_internal(table.schema)
 
@@ -7,16 +7,23 @@ eliminating duplication across the codebase.
 from __future__ import annotations
 
 import os
-from typing import Optional
+import threading
+from typing import Any, Optional
 
 from .exceptions import BigQueryError, DependencyError
 
+# Clients are thread-safe and expensive to build (credential discovery, HTTP
+# session), so one is kept per (client class, project) for the process
+_CLIENTS: dict[tuple[Any, Optional[str]], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
 
 def get_bigquery_client(project_id: Optional[str] = None):
     """Get a BigQuery client with optional project override.
 
     This function centralizes BigQuery client creation across the codebase,
-    providing consistent error handling and dependency management.
+    providing consistent error handling and dependency management. Clients
+    are pooled: repeated calls for the same project return the same client.
 
     Parameters
     ----------
@@ -53,10 +60,17 @@ def get_bigquery_client(project_id: Optional[str] = None):
             cause=e,
         ) from e
 
+    key = (bigquery.Client, project_id or None)
     try:
-        if project_id:
-            return bigquery.Client(project=project_id)
-        return bigquery.Client()
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                if project_id:
+                    client = bigquery.Client(project=project_id)
+                else:
+                    client = bigquery.Client()
+                _CLIENTS[key] = client
+            return client
     except Exception as e:
         raise BigQueryError(
             f"Failed to create BigQuery client: {e}",
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 from .analyze import cmd_analyze
 from .compare import cmd_compare
+from .compare_batch import cmd_compare_batch
 from .config import cmd_config
+from .dbt_reconcile import cmd_dbt_reconcile
 from .ddl import _parse_dataset_ref, _parse_table_ref, cmd_ddl
 from .generate import cmd_generate
 
@@ -39,17 +41,21 @@ def main() -> int:
     subparsers = parser.add_subparsers(
         dest="command",
         help="Available commands",
-        metavar="{compare,generate,ddl,config,analyze}",
+        metavar="{compare,compare-batch,dbt-reconcile,generate,ddl,config,analyze}",
     )
 
     # Add subcommands by importing their setup functions
     from .analyze import add_analyze_subcommand
     from .compare import add_compare_subcommand
+    from .compare_batch import add_compare_batch_subcommand
     from .config import add_config_subcommand
+    from .dbt_reconcile import add_dbt_reconcile_subcommand
     from .ddl import add_ddl_subcommand
     from .generate import add_generate_subcommand
 
     add_compare_subcommand(subparsers)
+    add_compare_batch_subcommand(subparsers)
+    add_dbt_reconcile_subcommand(subparsers)
     add_generate_subcommand(subparsers)
     add_ddl_subcommand(subparsers)
     add_config_subcommand(subparsers)
@@ -66,6 +72,10 @@ def main() -> int:
     try:
         if args.command == "compare":
             cmd_compare(args)
+        elif args.command == "compare-batch":
+            cmd_compare_batch(args)
+        elif args.command == "dbt-reconcile":
+            cmd_dbt_reconcile(args)
         elif args.command == "generate":
             cmd_generate(args)
         elif args.command == "ddl":
@@ -95,6 +105,8 @@ __all__ = [
     "main",
     "cmd_analyze",
     "cmd_compare",
+    "cmd_compare_batch",
+    "cmd_dbt_reconcile",
     "cmd_generate",
     "cmd_ddl",
     "cmd_config",
@@ -5,7 +5,7 @@ Provides advanced schema analysis capabilities.
 """
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
 
 def add_analyze_subcommand(subparsers):
@@ -63,12 +63,20 @@ Analyze schema complexity, detect patterns, and get optimization suggestions.
 
   {GREEN}# BigQuery dimensional analysis{RESET}
   schema-diff analyze project:dataset.table --type bigquery --dimensional --output
+
+  {GREEN}# Skip some anti-pattern rules and show where the time goes{RESET}
+  schema-diff analyze project:dataset.table --type bigquery --disable-rules pii --rule-timings
+
+  {GREEN}# Anti-pattern scan of a whole dataset or project (NDJSON, resumable){RESET}
+  schema-diff analyze --dataset my-project:analytics
+  schema-diff analyze --project my-project --workers 8 --resume
         """,
     )
 
     # Positional arguments
     analyze_parser.add_argument(
         "schema_file",
+        nargs="?",
         help="Schema or data file to analyze (supports all schema-diff formats)",
     )
 
@@ -158,6 +166,13 @@ Analyze schema complexity, detect patterns, and get optimization suggestions.
         "--message",
         help="Protobuf message name to analyze from .proto files",
     )
+    analyze_parser.add_argument(
+        "--proto-include",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Directory searched for Protobuf imports (repeatable, like protoc -I)",
+    )
 
     # Data sampling options (for data files)
     analyze_parser.add_argument(
@@ -171,10 +186,86 @@ Analyze schema complexity, detect patterns, and get optimization suggestions.
         action="store_true",
         help="Process all records (no sampling limit)",
     )
+    analyze_parser.add_argument(
+        "--profile-data",
+        action="store_true",
+        help="Profile data files while inferring: null/presence rates, distinct "
+        "counts, min/max, string lengths, top values",
+    )
+
+    # BigQuery anti-pattern rules (see bigquery_rules.list_rules())
+    analyze_parser.add_argument(
+        "--rules",
+        action="append",
+        metavar="RULE[,RULE...]",
+        help="Only run these BigQuery anti-pattern rules (repeatable)",
+    )
+    analyze_parser.add_argument(
+        "--disable-rules",
+        action="append",
+        metavar="RULE[,RULE...]",
+        help="Skip these BigQuery anti-pattern rules (repeatable)",
+    )
+    analyze_parser.add_argument(
+        "--rule-timings",
+        action="store_true",
+        help="Report the time spent in each anti-pattern rule, slowest first "
+        "(BigQuery schemas; implies --suggestions)",
+    )
+
+    # BigQuery dataset/project scans
+    scan_target = analyze_parser.add_mutually_exclusive_group()
+    scan_target.add_argument(
+        "--dataset",
+        metavar="PROJECT:DATASET",
+        help="Scan every table of a BigQuery dataset for anti-patterns "
+        "(instead of SCHEMA_FILE); findings are written as NDJSON",
+    )
+    scan_target.add_argument(
+        "--project",
+        help="Scan every dataset of a BigQuery project for anti-patterns",
+    )
+    analyze_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Analysis processes for --dataset/--project (default: one per CPU)",
+    )
+    analyze_parser.add_argument(
+        "--findings",
+        help="NDJSON findings file for --dataset/--project "
+        "(default: ./output/analysis/antipatterns_<target>.ndjson)",
+    )
+    analyze_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted --dataset/--project scan from its checkpoint",
+    )
+
+
+def _selected_rules(args) -> Optional[list[str]]:
+    """Anti-pattern rules from --rules/--disable-rules (None = defaults)."""
+    if not args.rules and not args.disable_rules:
+        return None
+    from ..bigquery_rules import select_rules
+
+    def _names(values: Optional[list[str]]) -> list[str]:
+        return [n.strip() for v in values or () for n in v.split(",") if n.strip()]
+
+    return select_rules(
+        _names(args.rules) if args.rules else None, _names(args.disable_rules)
+    )
 
 
 def cmd_analyze(args) -> int:
     """Execute the analyze command."""
+    if args.dataset or args.project:
+        return _cmd_scan(args)
+    if not args.schema_file:
+        from .colors import RED, RESET
+
+        print(f"{RED}❌ Error: SCHEMA_FILE, --dataset or --project is required{RESET}")
+        return 1
+
     try:
         import json
         from pathlib import Path
@@ -190,6 +281,8 @@ def cmd_analyze(args) -> int:
         from ..unified_loader import load_schema_unified
 
         cfg = Config()
+        rules = _selected_rules(args)
+        timings: Optional[dict[str, float]] = {} if args.rule_timings else None
 
         # Determine schema type
         schema_type = args.type
@@ -213,6 +306,7 @@ def cmd_analyze(args) -> int:
                 schema_type = "data"  # Default to data
 
         # Handle data files differently
+        profiler = None
         if schema_type == "data":
             from ..io_utils import load_records_with_sampling
             from ..json_data_file_parser import merged_schema_from_samples
@@ -225,8 +319,12 @@ def cmd_analyze(args) -> int:
                 sample_size=args.sample_size,
             )
 
-            # Convert data to schema
-            data_tree = merged_schema_from_samples(records, cfg)
+            # Convert data to schema (profiling in the same pass if requested)
+            if args.profile_data:
+                from ..profiling import DataProfiler
+
+                profiler = DataProfiler()
+            data_tree = merged_schema_from_samples(records, cfg, profiler)
             schema = from_legacy_tree(data_tree, set(), source_type="data")
         else:
             # Load schema using unified loader
@@ -236,12 +334,17 @@ def cmd_analyze(args) -> int:
                 table=args.table,
                 model=args.model,
                 message=args.message,
+                proto_include=args.proto_include,
             )
 
         # Determine what analysis to perform
         show_complexity = args.complexity or args.all
         show_patterns = args.patterns or args.all
-        show_suggestions = args.suggestions or args.all
+        show_suggestions = (
+            args.suggestions
+            or args.all
+            or bool(args.rules or args.disable_rules or args.rule_timings)
+        )
         show_dimensional = args.dimensional or args.all
         show_report = args.report or args.all
         show_field_categories = args.field_categories
@@ -255,12 +358,15 @@ def cmd_analyze(args) -> int:
                 show_dimensional,
                 show_report,
                 show_field_categories,
+                args.profile_data,
             ]
         ):
             show_complexity = True
             show_patterns = True
 
         results: dict[str, Any] = {}
+        if profiler is not None:
+            results["profile"] = profiler.to_dict()
 
         # Perform requested analysis
         from .colors import GREEN, RESET
@@ -286,8 +392,18 @@ def cmd_analyze(args) -> int:
 
         if show_suggestions:
             print(f"{GREEN}🔍 Generating improvement suggestions...{RESET}")
-            suggestions = suggest_schema_improvements(schema)
+            suggestions = suggest_schema_improvements(
+                schema, rules=rules, timings=timings
+            )
             results["suggestions"] = suggestions
+            if timings is not None:
+                # Milliseconds per rule, slowest first
+                results["rule_timings"] = {
+                    name: round(seconds * 1000, 3)
+                    for name, seconds in sorted(
+                        timings.items(), key=lambda kv: kv[1], reverse=True
+                    )
+                }
 
         if show_dimensional:
             print(f"{GREEN}🔍 Analyzing dimensional modeling patterns...{RESET}")
@@ -356,6 +472,53 @@ def cmd_analyze(args) -> int:
     return 0
 
 
+def _cmd_scan(args) -> int:
+    """Scan a BigQuery dataset or project for anti-patterns (NDJSON findings)."""
+    from .colors import GREEN, RED, RESET, YELLOW
+
+    try:
+        from ..bigquery_scan import scan_bigquery
+        from ..bigquery_utils import parse_bigquery_dataset_ref
+        from ..output_utils import ensure_output_dir
+
+        if args.dataset:
+            project, dataset = parse_bigquery_dataset_ref(args.dataset)
+            datasets = [dataset]
+            target = f"{project}:{dataset}"
+        else:
+            project, datasets, target = args.project, None, args.project
+
+        findings = args.findings
+        if not findings:
+            stem = target.replace(":", "_").replace(".", "_")
+            findings = ensure_output_dir("analysis") / f"antipatterns_{stem}.ndjson"
+
+        print(f"{GREEN}🔍 Scanning {target} for anti-patterns...{RESET}")
+        stats = scan_bigquery(
+            project,
+            findings,
+            dataset_ids=datasets,
+            workers=args.workers,
+            resume=args.resume,
+            rules=_selected_rules(args),
+        )
+    except Exception as e:
+        print(f"{RED}❌ Error: {e}{RESET}")
+        return 1
+
+    print(
+        f"{GREEN}✅ {stats['tables']} tables analyzed in {stats['datasets']} "
+        f"datasets ({stats['skipped']} already done), {stats['findings']} "
+        f"findings written to {findings}{RESET}"
+    )
+    if stats["errors"]:
+        print(
+            f"{YELLOW}⚠️  {stats['errors']} tables or datasets failed; rerun with "
+            f"--resume to retry them{RESET}"
+        )
+    return 0
+
+
 def _prepare_for_json(results):
     """Prepare results for JSON serialization."""
     json_results = {}
@@ -870,6 +1033,23 @@ def _format_as_text(results, schema):
                             output.append(f"  ... and {len(fields) - 10} more")
                         output.append("")
 
+    if "profile" in results:
+        from ..profiling import format_profile_text
+
+        output.append("")
+        output.append(format_profile_text(results["profile"], (BOLD, CYAN, RESET)))
+        output.append("─" * 70)
+
+    if "rule_timings" in results:
+        output.append("")
+        output.append(f"{BOLD}{CYAN}⏱️  Anti-pattern Rule Timings{RESET}")
+        output.append("─" * 70)
+        if not results["rule_timings"]:
+            output.append("No anti-pattern rules ran (BigQuery schemas only)")
+        for name, ms in results["rule_timings"].items():
+            output.append(f"  {name:<40} {ms:>10.3f} ms")
+        output.append("")
+
     return "\n".join(output)
 
 
@@ -911,57 +1091,57 @@ def _format_as_markdown(results, schema):
 
         if not suggestions:
             output.append("✅ **No issues found** - schema looks good!\n")
-    else:
-        # Group by severity
-        errors = [s for s in suggestions if s["severity"] == "error"]
-        warnings = [s for s in suggestions if s["severity"] == "warning"]
-        infos = [s for s in suggestions if s["severity"] == "info"]
-
-        # Summary table
-        if errors or warnings or infos:
-            output.append("### Summary\n")
-            output.append("| Severity | Count |")
-            output.append("|----------|-------|")
-            if errors:
-                output.append(f"| 🔴 **Critical Issues** | {len(errors)} |")
-            if warnings:
-                output.append(f"| 🟡 **Warnings** | {len(warnings)} |")
-            if infos:
-                output.append(f"| 🔵 **Recommendations** | {len(infos)} |")
-            output.append("")
+        else:
+            # Group by severity
+            errors = [s for s in suggestions if s["severity"] == "error"]
+            warnings = [s for s in suggestions if s["severity"] == "warning"]
+            infos = [s for s in suggestions if s["severity"] == "info"]
 
-        # Detailed recommendations - grouped by category
-        for group, icon, suggestions_list in [
-            ("Critical Issues", "🔴", errors),
-            ("Warnings", "🟡", warnings),
-            ("Recommendations", "🔵", infos),
-        ]:
-            if suggestions_list:
-                output.append(f"### {icon} {group}\n")
+            # Summary table
+            if errors or warnings or infos:
+                output.append("### Summary\n")
+                output.append("| Severity | Count |")
+                output.append("|----------|-------|")
+                if errors:
+                    output.append(f"| 🔴 **Critical Issues** | {len(errors)} |")
+                if warnings:
+                    output.append(f"| 🟡 **Warnings** | {len(warnings)} |")
+                if infos:
+                    output.append(f"| 🔵 **Recommendations** | {len(infos)} |")
+                output.append("")
 
-                # Group by category
-                by_category = {}
-                for suggestion in suggestions_list:
-                    category = suggestion["type"]
-                    by_category.setdefault(category, []).append(suggestion)
+            # Detailed recommendations - grouped by category
+            for group, icon, suggestions_list in [
+                ("Critical Issues", "🔴", errors),
+                ("Warnings", "🟡", warnings),
+                ("Recommendations", "🔵", infos),
+            ]:
+                if suggestions_list:
+                    output.append(f"### {icon} {group}\n")
 
-                # Sort categories alphabetically
-                for category in sorted(by_category.keys()):
-                    category_suggestions = by_category[category]
-                    output.append(f"#### {category.replace('_', ' ').title()}\n")
-
-                    for suggestion in category_suggestions:
-                        output.append(f"- **Issue:** {suggestion['description']}\n")
-
-                        if suggestion["affected_fields"]:
-                            count = len(suggestion["affected_fields"])
-                            output.append(f"  **Affected Fields ({count}):**")
-                            output.append("  ```")
-                            for field in suggestion["affected_fields"][:10]:
-                                output.append(f"  {field}")
-                            if count > 10:
-                                output.append(f"  ... +{count - 10} more")
-                            output.append("  ```\n")
+                    # Group by category
+                    by_category = {}
+                    for suggestion in suggestions_list:
+                        category = suggestion["type"]
+                        by_category.setdefault(category, []).append(suggestion)
+
+                    # Sort categories alphabetically
+                    for category in sorted(by_category.keys()):
+                        category_suggestions = by_category[category]
+                        output.append(f"#### {category.replace('_', ' ').title()}\n")
+
+                        for suggestion in category_suggestions:
+                            output.append(f"- **Issue:** {suggestion['description']}\n")
+
+                            if suggestion["affected_fields"]:
+                                count = len(suggestion["affected_fields"])
+                                output.append(f"  **Affected Fields ({count}):**")
+                                output.append("  ```")
+                                for field in suggestion["affected_fields"][:10]:
+                                    output.append(f"  {field}")
+                                if count > 10:
+                                    output.append(f"  ... +{count - 10} more")
+                                output.append("  ```\n")
 
     output.append("---\n")
 
@@ -1076,6 +1256,33 @@ def _format_as_markdown(results, schema):
 
         output.append("---\n")
 
+    if "profile" in results:
+        profile = results["profile"]
+        output.append(f"## 📈 Field Profile ({profile['records']} records)\n")
+        output.append("| Field | Present | Null | Distinct | Min | Max | Top values |")
+        output.append("|-------|---------|------|----------|-----|-----|------------|")
+        for path, stats in profile["fields"].items():
+            top = ", ".join(
+                f"`{t['value']}` ×{t['count']}" for t in stats.get("top_values", [])[:3]
+            )
+            output.append(
+                f"| `{path}` | {stats['presence_rate']:.1%} | {stats['null_rate']:.1%} "
+                f"| {stats.get('distinct_approx', 0)} | {stats.get('min', '')} "
+                f"| {stats.get('max', '')} | {top} |"
+            )
+        output.append("")
+
+    if "rule_timings" in results:
+        output.append("## ⏱️ Anti-pattern Rule Timings\n")
+        if not results["rule_timings"]:
+            output.append("_No anti-pattern rules ran (BigQuery schemas only)_\n")
+        else:
+            output.append("| Rule | Time (ms) |")
+            output.append("|------|-----------|")
+            for name, ms in results["rule_timings"].items():
+                output.append(f"| `{name}` | {ms:.3f} |")
+            output.append("")
+
     # Footer
     output.append("\n---")
     output.append("\n*Generated by schema-diff analyze*")
@@ -8,13 +8,14 @@ from __future__ import annotations
 from pathlib import Path
 
 from ..compare import compare_trees  # Needed for data-to-data comparisons
-from ..constants import DEFAULT_SAMPLE_SIZE
+from ..constants import DEFAULT_ARRAY_SAMPLE_SIZE, DEFAULT_SAMPLE_SIZE
 from ..exceptions import ArgumentError
 from ..gcs_utils import get_gcs_status, is_gcs_path
 
 # load_left_or_right also unused in unified approach
 from ..migration_analyzer import analyze_migration_impact
-from ..output_utils import write_output_file
+from ..output_utils import ensure_output_dir
+from ..report_writer import write_report
 
 # flatten_paths unused in unified approach
 
@@ -101,6 +102,22 @@ Compare schemas from different sources and identify differences in:
         action="store_true",
         help="Process only first record (same as --sample-size 1)",
     )
+    compare_parser.add_argument(
+        "--array-sample-size",
+        type=int,
+        default=DEFAULT_ARRAY_SAMPLE_SIZE,
+        help="Elements typed per array: first half, then strided "
+        f"(default: {DEFAULT_ARRAY_SAMPLE_SIZE}; 1 = first element only)",
+    )
+    compare_parser.add_argument(
+        "--infer-required",
+        nargs="?",
+        type=float,
+        const=1.0,
+        metavar="FRACTION",
+        help="Treat data fields present (non-null) in at least FRACTION of "
+        "records as required (default when given: 1.0)",
+    )
 
     # Display options
     compare_parser.add_argument(
@@ -156,6 +173,13 @@ Compare schemas from different sources and identify differences in:
         "--model",
         help="dbt model name (for manifest.json or schema.yml)",
     )
+    compare_parser.add_argument(
+        "--proto-include",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Directory searched for Protobuf imports (repeatable, like protoc -I)",
+    )
 
     # Legacy/backward compatibility arguments
     compare_parser.add_argument(
@@ -166,6 +190,10 @@ Compare schemas from different sources and identify differences in:
     )
     compare_parser.add_argument("--seed", type=int, help="Random seed for sampling")
     compare_parser.add_argument("--json-out", help="Save JSON report to file")
+    compare_parser.add_argument(
+        "--ndjson-out",
+        help="Save report as newline-delimited JSON (one entry per line)",
+    )
     compare_parser.add_argument(
         "--record", type=int, help="Process specific record by index"
     )
@@ -254,7 +282,11 @@ def cmd_compare(args) -> None:
         # Load configuration
         from ..config import Config
 
-        cfg = Config(color_enabled=not args.no_color)
+        cfg = Config(
+            color_enabled=not args.no_color,
+            array_sample_size=args.array_sample_size,
+            required_threshold=args.infer_required,
+        )
 
         # Determine comparison type and perform comparison using unified format
         from ..compare import compare_schemas_unified
@@ -308,7 +340,7 @@ def cmd_compare(args) -> None:
                 f"{BOLD}{CYAN}📊 Comparison:{RESET} {left_highlighted} → {right_highlighted}"
             )
             from ..io_utils import load_records_with_sampling
-            from ..json_data_file_parser import merged_schema_from_samples
+            from ..json_data_file_parser import merged_schema_with_required
 
             # Load left and right side data using helper function
             s1_records = load_records_with_sampling(
@@ -335,8 +367,8 @@ def cmd_compare(args) -> None:
                 right_samples = collect_field_samples(s2_records, max_samples=5)
 
             # Create schemas from both sides
-            left_tree = merged_schema_from_samples(s1_records, cfg)
-            right_tree = merged_schema_from_samples(s2_records, cfg)
+            left_tree, left_required = merged_schema_with_required(s1_records, cfg)
+            right_tree, right_required = merged_schema_with_required(s2_records, cfg)
 
             # Apply field filtering if specified
             if args.fields:
@@ -361,9 +393,9 @@ def cmd_compare(args) -> None:
                 left_label=args.file1,
                 right_label=args.file2,
                 left_tree=left_tree,
-                left_required=set(),
+                left_required=left_required,
                 right_tree=right_tree,
-                right_required=set(),
+                right_required=right_required,
                 cfg=cfg,
                 show_common=args.show_common,
                 only_common=args.only_common,
@@ -419,10 +451,10 @@ def cmd_compare(args) -> None:
                 left_samples = collect_field_samples(s1_records, max_samples=5)
 
             # Convert data to unified schema
-            from ..json_data_file_parser import merged_schema_from_samples
+            from ..json_data_file_parser import merged_schema_with_required
             from ..models import from_legacy_tree
 
-            data_tree = merged_schema_from_samples(s1_records, cfg)
+            data_tree, data_required = merged_schema_with_required(s1_records, cfg)
 
             # Apply field filtering if specified
             if args.fields:
@@ -430,7 +462,9 @@ def cmd_compare(args) -> None:
 
                 data_tree = filter_schema_by_fields(data_tree, args.fields)
 
-            left_schema = from_legacy_tree(data_tree, set(), source_type="data")
+            left_schema = from_legacy_tree(
+                data_tree, data_required, source_type="data"
+            )
 
             # Load right schema in unified format
             right_schema = load_schema_unified(
@@ -438,6 +472,7 @@ def cmd_compare(args) -> None:
                 right_kind,
                 table=args.table,
                 model=args.model,
+                proto_include=args.proto_include,
             )
 
             # Add sampling info to title if sampling was used
@@ -489,12 +524,14 @@ def cmd_compare(args) -> None:
                 left_kind,
                 table=args.table,
                 model=args.model,
+                proto_include=args.proto_include,
             )
             right_schema = load_schema_unified(
                 args.file2,
                 right_kind,
                 table=args.table,
                 model=args.model,
+                proto_include=args.proto_include,
             )
 
             # Perform unified comparison
@@ -536,12 +573,11 @@ def cmd_compare(args) -> None:
             )
 
             # Write migration analysis
-            from ..migration_analyzer import generate_migration_report
+            from ..migration_analyzer import write_migration_report
 
-            write_output_file(
-                generate_migration_report(migration_analysis, format="markdown"),
-                "migration_analysis.md",
-                "reports",
+            write_migration_report(
+                migration_analysis,
+                ensure_output_dir("reports") / "migration_analysis.md",
             )
 
             print(f"{GREEN}✅ Migration analysis saved to output/reports/{RESET}")
@@ -552,11 +588,11 @@ def cmd_compare(args) -> None:
 
         # Handle legacy JSON output
         if hasattr(args, "json_out") and args.json_out and report_struct:
-            import json
-
-            with open(args.json_out, "w") as f:
-                json.dump(report_struct, f, indent=2)
+            write_report(report_struct, args.json_out)
             print(f"{GREEN}✅ JSON report written to: {args.json_out}{RESET}")
+        if getattr(args, "ndjson_out", None) and report_struct:
+            write_report(report_struct, args.ndjson_out, ndjson=True)
+            print(f"{GREEN}✅ NDJSON report written to: {args.ndjson_out}{RESET}")
 
     except ArgumentError as e:
         raise ArgumentError(f"Comparison failed: {e}") from e
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Compare-batch command implementation for schema-diff CLI.
+
+Compares one baseline against many inputs (or every input against every other)
+in a single process, normalizing each input once.
+"""
+from __future__ import annotations
+
+import json
+
+from ..constants import DEFAULT_SAMPLE_SIZE
+from ..exceptions import ArgumentError
+from ..output_utils import write_output_file
+
+
+def add_compare_batch_subcommand(subparsers) -> None:
+    """Add compare-batch subcommand to the parser."""
+    from ..helpfmt import ColorDefaultsFormatter
+    from .colors import BOLD, CYAN, GREEN, RESET, YELLOW
+
+    batch_parser = subparsers.add_parser(
+        "compare-batch",
+        help="Compare one schema against many, or build a drift matrix",
+        formatter_class=ColorDefaultsFormatter,
+        description=f"""
+Compare many schemas in one run. Every input is loaded and normalized once,
+identical inputs are detected by fingerprint, and the remaining pairs are
+diffed in a process pool.
+
+{BOLD}{YELLOW}MODES:{RESET}
+  one-vs-many   First input is the baseline, compared to each other input
+  --matrix      Every input compared against every other input (N×N)
+
+{BOLD}{CYAN}EXAMPLES:{RESET}
+  {GREEN}# Contract schema vs many tables{RESET}
+  schema-diff compare-batch contract.json t1.sql t2.sql t3.sql --table events
+
+  {GREEN}# Targets listed in a file, one per line{RESET}
+  schema-diff compare-batch contract.json --targets-file tables.txt --json-out drift.json
+
+  {GREEN}# Every table of a multi-table DDL dump against a contract{RESET}
+  schema-diff compare-batch contract.json dump.sql --all-tables
+
+  {GREEN}# Drift matrix across environments{RESET}
+  schema-diff compare-batch dev.json staging.json prod.json --matrix --markdown-out drift.md
+        """,
+    )
+
+    batch_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Baseline followed by targets (or all inputs with --matrix)",
+    )
+    batch_parser.add_argument(
+        "--targets-file",
+        help="File listing additional inputs, one per line (# for comments)",
+    )
+    batch_parser.add_argument(
+        "--matrix",
+        action="store_true",
+        help="Compare every input against every other input",
+    )
+    batch_parser.add_argument(
+        "--format",
+        metavar="FORMAT",
+        help="Override format for all inputs (auto-detected per input)",
+    )
+    batch_parser.add_argument(
+        "--table",
+        help="Table name for SQL inputs",
+    )
+    batch_parser.add_argument(
+        "--all-tables",
+        action="store_true",
+        help="Expand each SQL DDL input into one input per CREATE TABLE",
+    )
+    batch_parser.add_argument(
+        "--model",
+        help="dbt model name (for manifest.json or schema.yml)",
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for pairwise diffs (default: CPU count)",
+    )
+    batch_parser.add_argument(
+        "--sample-size",
+        type=int,
+        default=DEFAULT_SAMPLE_SIZE,
+        help=f"Records to sample from data inputs (default: {DEFAULT_SAMPLE_SIZE})",
+    )
+    batch_parser.add_argument(
+        "--all-records",
+        action="store_true",
+        help="Process all records of data inputs",
+    )
+    batch_parser.add_argument(
+        "--first-record",
+        action="store_true",
+        help="Process only the first record of data inputs",
+    )
+    batch_parser.add_argument("--json-out", help="Save consolidated JSON to file")
+    batch_parser.add_argument(
+        "--markdown-out", help="Save consolidated markdown to file"
+    )
+    batch_parser.add_argument(
+        "--output",
+        action="store_true",
+        help="Save JSON and markdown to ./output/comparisons/",
+    )
+    batch_parser.add_argument(
+        "--no-color",
+        action="store_true",
+        help="Plain text output (for CI/CD or logs)",
+    )
+
+
+def _read_targets_file(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as fh:
+        return [
+            line.strip()
+            for line in fh
+            if line.strip() and not line.strip().startswith("#")
+        ]
+
+
+def cmd_compare_batch(args) -> None:
+    """Execute the compare-batch command."""
+    from ..batch_compare import (
+        BatchInput,
+        compare_batch,
+        load_batch_input,
+        load_sql_table_inputs,
+        render_batch_markdown,
+    )
+    from ..config import Config
+    from ..format_resolver import get_family, resolve_format
+    from ..loader import _guess_kind
+
+    paths = list(args.inputs)
+    if args.targets_file:
+        paths.extend(_read_targets_file(args.targets_file))
+    if len(paths) < 2 and not args.all_tables:
+        raise ArgumentError("compare-batch needs at least two inputs")
+    if args.all_tables and args.table:
+        raise ArgumentError("--all-tables and --table are mutually exclusive")
+
+    kind = None
+    if args.format:
+        try:
+            kind = resolve_format(args.format)
+        except ValueError as e:
+            raise ArgumentError(f"Invalid --format: {e}") from e
+
+    cfg = Config(color_enabled=not args.no_color)
+    if args.no_color:
+        BOLD = CYAN = GREEN = RED = RESET = YELLOW = ""
+    else:
+        from .colors import BOLD, CYAN, GREEN, RED, RESET, YELLOW
+
+    # Load and normalize every distinct input exactly once
+    cache: dict[str, BatchInput] = {}
+    inputs: list[BatchInput] = []
+    for path in paths:
+        if args.all_tables and get_family(kind or _guess_kind(path)) == "sql":
+            inputs.extend(load_sql_table_inputs(path, workers=args.workers))
+            continue
+        if path not in cache:
+            cache[path] = load_batch_input(
+                path,
+                kind,
+                cfg=cfg,
+                table=args.table,
+                model=args.model,
+                first_record=args.first_record,
+                all_records=args.all_records,
+                sample_size=args.sample_size,
+            )
+        inputs.append(cache[path])
+
+    if len(inputs) < 2:
+        raise ArgumentError("compare-batch needs at least two inputs")
+
+    mode = "matrix" if args.matrix else "one-vs-many"
+    print(f"{BOLD}{CYAN}📊 Batch comparison ({mode}):{RESET} {len(inputs)} inputs")
+
+    result = compare_batch(inputs, matrix=args.matrix, workers=args.workers)
+
+    for r in result["results"]:
+        if r["identical"]:
+            status = f"{GREEN}identical{RESET}"
+        else:
+            status = (
+                f"{RED}{r['total']} differences{RESET} "
+                f"(-{r['only_in_left']} +{r['only_in_right']} "
+                f"~{r['type_mismatches']} type, {r['presence_issues']} presence)"
+            )
+        print(f"  {r['left']} {YELLOW}→{RESET} {r['right']}: {status}")
+
+    markdown = render_batch_markdown(result)
+    payload = json.dumps(result, ensure_ascii=False, indent=2)
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as fh:
+            fh.write(payload)
+        print(f"{GREEN}✅ JSON report written to: {args.json_out}{RESET}")
+    if args.markdown_out:
+        with open(args.markdown_out, "w", encoding="utf-8") as fh:
+            fh.write(markdown)
+        print(f"{GREEN}✅ Markdown report written to: {args.markdown_out}{RESET}")
+    if args.output:
+        write_output_file(payload, "batch_comparison.json", "comparisons")
+        write_output_file(markdown, "batch_comparison.md", "comparisons")
+        print(f"{GREEN}✅ Batch comparison saved to output/comparisons/{RESET}")
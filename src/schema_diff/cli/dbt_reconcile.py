@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Dbt-reconcile command implementation for schema-diff CLI.
+
+Checks every dbt model in a manifest against its live BigQuery table in one
+run: the manifest is parsed once, table schemas are fetched concurrently and
+model/table pairs are diffed in a process pool.
+"""
+from __future__ import annotations
+
+import json
+
+from ..output_utils import write_output_file
+
+
+def add_dbt_reconcile_subcommand(subparsers) -> None:
+    """Add dbt-reconcile subcommand to the parser."""
+    from ..helpfmt import ColorDefaultsFormatter
+    from .colors import BLUE, BOLD, CYAN, GREEN, RESET, YELLOW
+
+    reconcile_parser = subparsers.add_parser(
+        "dbt-reconcile",
+        help="Check every dbt model in a manifest against its BigQuery table",
+        formatter_class=ColorDefaultsFormatter,
+        description=f"""
+Reconcile a whole dbt manifest against a BigQuery dataset. Each model's
+declared columns (data_type, not_null tests/constraints) are compared with the
+live table named by the model's alias (or name).
+
+{BOLD}{YELLOW}DATASET REFERENCE FORMAT:{RESET}
+  {BLUE}project:dataset{RESET}  or  {BLUE}dataset{RESET} (default project)
+
+{BOLD}{YELLOW}STATUSES:{RESET}
+  match          Declared columns agree with the live table
+  drift          Columns or types differ
+  missing_table  No table for the model in the dataset
+  undocumented   Model declares no columns (not diffed)
+  error          Table schema could not be fetched
+
+{BOLD}{CYAN}EXAMPLES:{RESET}
+  {GREEN}# Every model materialized into the dataset{RESET}
+  schema-diff dbt-reconcile target/manifest.json my-project:analytics
+
+  {GREEN}# A few models, consolidated reports saved to output/{RESET}
+  schema-diff dbt-reconcile target/manifest.json my-project:analytics \\
+      --model orders --model customers --output
+        """,
+    )
+
+    reconcile_parser.add_argument("manifest", help="dbt target/manifest.json")
+    reconcile_parser.add_argument(
+        "dataset_ref", help="BigQuery dataset (project:dataset)"
+    )
+    reconcile_parser.add_argument(
+        "--model",
+        action="append",
+        dest="models",
+        help="Only reconcile this model (name, alias or node id; repeatable)",
+    )
+    reconcile_parser.add_argument(
+        "--all-schemas",
+        action="store_true",
+        help="Include models whose dbt schema is not the given dataset",
+    )
+    reconcile_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for pairwise diffs (default: CPU count)",
+    )
+    reconcile_parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        help="Concurrent BigQuery schema requests",
+    )
+    reconcile_parser.add_argument(
+        "--no-presence",
+        action="store_true",
+        help="Ignore not-null vs REQUIRED differences",
+    )
+    reconcile_parser.add_argument("--json-out", help="Save consolidated JSON to file")
+    reconcile_parser.add_argument(
+        "--markdown-out", help="Save consolidated markdown to file"
+    )
+    reconcile_parser.add_argument(
+        "--output",
+        action="store_true",
+        help="Save JSON and markdown to ./output/comparisons/",
+    )
+    reconcile_parser.add_argument(
+        "--no-color",
+        action="store_true",
+        help="Plain text output (for CI/CD or logs)",
+    )
+
+
+def cmd_dbt_reconcile(args) -> None:
+    """Execute the dbt-reconcile command."""
+    from ..bigquery_utils import get_bigquery_client, parse_bigquery_dataset_ref
+    from ..dbt_reconcile import reconcile_dbt_manifest, render_reconcile_markdown
+
+    if args.no_color:
+        BOLD = CYAN = GREEN = RED = RESET = YELLOW = ""
+    else:
+        from .colors import BOLD, CYAN, GREEN, RED, RESET, YELLOW
+
+    project, dataset = parse_bigquery_dataset_ref(args.dataset_ref)
+    print(
+        f"{BOLD}{CYAN}🔁 Reconciling {args.manifest} against "
+        f"{project}:{dataset}{RESET}"
+    )
+
+    result = reconcile_dbt_manifest(
+        args.manifest,
+        project,
+        dataset,
+        client=get_bigquery_client(project),
+        models=args.models,
+        all_schemas=args.all_schemas,
+        workers=args.workers,
+        fetch_workers=args.fetch_workers,
+        include_presence=not args.no_presence,
+    )
+
+    colors = {"match": GREEN, "drift": RED, "error": RED}
+    for r in result["results"]:
+        status = r["status"]
+        detail = ""
+        if status == "drift":
+            detail = (
+                f" (-{r['only_in_left']} +{r['only_in_right']} "
+                f"~{r['type_mismatches']} type, {r['presence_issues']} presence)"
+            )
+        elif status == "error":
+            detail = f" ({r['error']})"
+        color = colors.get(status, YELLOW)
+        pair = f"{r['model']} {YELLOW}→{RESET} {r['table']}"
+        print(f"  {pair}: {color}{status}{RESET}{detail}")
+
+    summary = ", ".join(f"{n} {s}" for s, n in result["summary"].items() if n)
+    print(f"{BOLD}Summary:{RESET} {summary or 'no models'}")
+    if result["meta"]["throttle_events"]:
+        print(
+            f"{YELLOW}⚠️  BigQuery throttled {result['meta']['throttle_events']} "
+            f"schema request(s); concurrency was reduced and retried{RESET}"
+        )
+
+    markdown = render_reconcile_markdown(result)
+    payload = json.dumps(result, ensure_ascii=False, indent=2)
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as fh:
+            fh.write(payload)
+        print(f"{GREEN}✅ JSON report written to: {args.json_out}{RESET}")
+    if args.markdown_out:
+        with open(args.markdown_out, "w", encoding="utf-8") as fh:
+            fh.write(markdown)
+        print(f"{GREEN}✅ Markdown report written to: {args.markdown_out}{RESET}")
+    if args.output:
+        write_output_file(payload, "dbt_reconcile.json", "comparisons")
+        write_output_file(markdown, "dbt_reconcile.md", "comparisons")
+        print(f"{GREEN}✅ Reconciliation saved to output/comparisons/{RESET}")
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from ..constants import DEFAULT_ARRAY_SAMPLE_SIZE
 from ..exceptions import ArgumentError
 from ..gcs_utils import get_gcs_status, is_gcs_path
 from ..output_utils import write_output_file
@@ -47,6 +48,9 @@ Generate schema from data files by sampling records and inferring types.
 
   {GREEN}# Process all records and save{RESET}
   schema-diff generate gs://bucket/data.json.gz --all-records --output
+
+  {GREEN}# Profile field values alongside the schema{RESET}
+  schema-diff generate data.json --profile-data
         """,
     )
 
@@ -83,6 +87,19 @@ Generate schema from data files by sampling records and inferring types.
         default=1000,
         help="Number of records to sample (default: 1000)",
     )
+    generate_parser.add_argument(
+        "--array-sample-size",
+        type=int,
+        default=DEFAULT_ARRAY_SAMPLE_SIZE,
+        help="Elements typed per array: first half, then strided "
+        f"(default: {DEFAULT_ARRAY_SAMPLE_SIZE}; 1 = first element only)",
+    )
+    generate_parser.add_argument(
+        "--profile-data",
+        action="store_true",
+        help="Also profile each field while inferring (null/presence rates, "
+        "distinct counts, min/max, string lengths, top values)",
+    )
 
     # Schema options
     generate_parser.add_argument(
@@ -192,11 +209,16 @@ def cmd_generate(args) -> None:
         )
 
         # Generate schema
-        cfg = Config()
+        cfg = Config(array_sample_size=args.array_sample_size)
 
         # Prepare parameters
         table_name = args.table_name or "generated_table"
         required_fields = set(args.required_fields) if args.required_fields else None
+        profiler = None
+        if args.profile_data:
+            from ..profiling import DataProfiler
+
+            profiler = DataProfiler()
 
         schema = generate_schema_from_data(
             records,
@@ -205,6 +227,7 @@ def cmd_generate(args) -> None:
             table_name=table_name,
             required_fields=required_fields,
             validate=validate,
+            profiler=profiler,
         )
 
         # Handle output
@@ -214,8 +237,23 @@ def cmd_generate(args) -> None:
             from .colors import GREEN, RESET
 
             print(f"{GREEN}✅ Schema saved to output/schemas/{filename}{RESET}")
+            if profiler is not None:
+                import json
+
+                profile_name = filename.rsplit("_schema.", 1)[0] + "_profile.json"
+                write_output_file(
+                    json.dumps(profiler.to_dict(), indent=2, default=str),
+                    profile_name,
+                    "profiles",
+                )
+                print(f"{GREEN}✅ Profile saved to output/profiles/{profile_name}{RESET}")
         else:
             print(schema)
+            if profiler is not None:
+                from ..profiling import format_profile_text
+
+                print()
+                print(format_profile_text(profiler.to_dict()))
 
     except ArgumentError as e:
         raise ArgumentError(f"Schema generation failed: {e}") from e
@@ -14,12 +14,21 @@ This module exposes two primary entry points:
     be added later if needed.)
 
 Implementation notes:
-- We normalize both sides via `walk_normalize(...)`.
+- We normalize both sides via `walk_normalize(...)`; schema sources go through
+  `walk_normalize_with_presence(...)`, which injects presence in the same pass.
 - If a root is a *list of field entries* (e.g., Spark/BigQuery/Protobuf-like),
   we coerce it to a `{name: type}` dict to get stable, per-path diffs instead
   of noisy list-index changes.
 - We also print a “path changes” section to highlight the same field name that
-  appears in different locations (e.g., moved or nested differently).
+  appears in different locations (e.g., moved or nested differently). Fields
+  that look renamed are reported as ``rename_candidates`` (see
+  `rename_detection`).
+- Each normalized tree is flattened once into a `PathIndex`, which the report
+  builder, common-field listing and path-change detection all share.
+- The indexes carry Merkle subtree hashes: identical roots return "No
+  differences" without diffing, and identical branches are skipped.
+- ``json_out`` reports are written by `report_writer`; a ``.ndjson``/``.jsonl``
+  extension selects newline-delimited output.
 """
 
 from __future__ import annotations
@@ -29,19 +38,114 @@ from typing import Any
 
 from deepdiff import DeepDiff
 
-from .normalize import walk_normalize
+from .normalize import walk_normalize, walk_normalize_with_presence
 from .report import (
     build_report_struct,
     print_common_fields,
     print_path_changes,
     print_report_text,
 )
+from .rename_detection import detect_renames
+from .report_writer import write_report
 from .utils import (
+    PathIndex,
+    build_path_index,
     coerce_root_to_field_dict,
     compute_path_changes,
-    inject_presence_for_diff,
+    prune_equal_subtrees,
 )
 
+# Apply presence injection to schema sources (not data sources)
+# Data sources already have 'missing' unions; schema sources need them injected
+SCHEMA_SOURCES = {
+    "sql",
+    "spark",
+    "jsonschema",
+    "json_schema",  # Support both variants
+    "protobuf",
+    "dbt-manifest",
+    "dbt-yml",
+    "dbt-model",
+    "bigquery",
+    "bigquery_api_json",  # BigQuery API JSON format
+}
+
+
+def normalize_for_diff(
+    tree: Any, required: set[str], source_type: str | None = None
+) -> Any:
+    """Prepare one side of a comparison: coerce, inject presence and normalize.
+
+    The result is what the differ consumes, so callers comparing one input
+    against many can normalize it once and reuse it for every pair.
+    """
+    # Coerce list-of-fields roots into dicts so diffs are per-path, not list indices
+    tree = coerce_root_to_field_dict(tree)
+
+    # Presence injection is fused into normalization: one output tree per side
+    # instead of an injected deep copy followed by a normalized copy.
+    # If we don't know the source type but it has required paths, assume schema source.
+    if source_type in SCHEMA_SOURCES or required:
+        normalized = walk_normalize_with_presence(tree, required)
+    else:
+        normalized = walk_normalize(tree)
+
+    return coerce_root_to_field_dict(normalized)
+
+
+def _diff_normalized(sch1n: Any, sch2n: Any) -> tuple[Any, PathIndex, PathIndex]:
+    """Diff two normalized trees, returning the DeepDiff and both PathIndexes."""
+    # Flatten each side once; every later stage reads paths from these indexes.
+    # The indexes also carry subtree hashes: equal roots mean no differences,
+    # and equal branches are pruned before DeepDiff ever visits them.
+    left_index = build_path_index(sch1n)
+    right_index = build_path_index(sch2n)
+
+    if left_index.root_hash == right_index.root_hash:
+        return {}, left_index, right_index
+    diff = DeepDiff(
+        *prune_equal_subtrees(sch1n, sch2n, left_index, right_index),
+        ignore_order=True,
+    )
+    return diff, left_index, right_index
+
+
+def diff_normalized_trees(
+    left_label: str,
+    right_label: str,
+    sch1n: Any,
+    sch2n: Any,
+    *,
+    include_presence: bool = True,
+) -> dict[str, Any]:
+    """Diff two trees produced by `normalize_for_diff` without printing anything.
+
+    Returns the same structure as `compare_trees`, including the
+    ``path_changes`` and ``rename_candidates`` lists, which makes it suitable
+    for batch and programmatic comparisons.
+    """
+    direction = f"{left_label} -> {right_label}"
+    diff, left_index, right_index = _diff_normalized(sch1n, sch2n)
+    if not diff:
+        return {"meta": {"direction": direction}, "note": "No differences"}
+
+    report = build_report_struct(
+        diff,
+        left_label,
+        right_label,
+        include_presence=include_presence,
+        left_index=left_index,
+        right_index=right_index,
+    )
+    report["path_changes"] = compute_path_changes(left_index, right_index)
+    report["rename_candidates"] = detect_renames(
+        left_index,
+        right_index,
+        only_in_left=report["only_in_file1"],
+        only_in_right=report["only_in_file2"],
+    )
+    return report
+
 
 # ----------------------------------------------------------------------
 # Tree ↔ tree comparison (any ↔ any)
@@ -95,47 +199,9 @@ def compare_trees(
       with data-derived schemas that include 'missing' unions.
     - Data sources don't need presence injection as they already include 'missing'.
     """
-    # Coerce list-of-fields roots into dicts so diffs are per-path, not list indices
-    left_tree = coerce_root_to_field_dict(left_tree)
-    right_tree = coerce_root_to_field_dict(right_tree)
-
-    # Apply presence injection to schema sources (not data sources)
-    # Data sources already have 'missing' unions; schema sources need them injected
-    SCHEMA_SOURCES = {
-        "sql",
-        "spark",
-        "jsonschema",
-        "json_schema",  # Support both variants
-        "protobuf",
-        "dbt-manifest",
-        "dbt-yml",
-        "dbt-model",
-        "bigquery",
-        "bigquery_api_json",  # BigQuery API JSON format
-    }
-
-    if left_source_type in SCHEMA_SOURCES:
-        # Left side is a schema source - apply presence injection
-        left_tree = inject_presence_for_diff(left_tree, left_required)
-    elif left_required:
-        # Fallback: if we don't know the source type but it has required paths, assume schema source
-        left_tree = inject_presence_for_diff(left_tree, left_required)
-
-    if right_source_type in SCHEMA_SOURCES:
-        # Right side is a schema source - apply presence injection
-        right_tree = inject_presence_for_diff(right_tree, right_required)
-    elif right_required:
-        # Fallback: if we don't know the source type but it has required paths, assume schema source
-        right_tree = inject_presence_for_diff(right_tree, right_required)
-
-    # Normalize trees
-    sch1n = walk_normalize(left_tree)
-    sch2n = walk_normalize(right_tree)
-
-    sch1n = coerce_root_to_field_dict(sch1n)
-    sch2n = coerce_root_to_field_dict(sch2n)
-
-    diff = DeepDiff(sch1n, sch2n, ignore_order=True)
+    sch1n = normalize_for_diff(left_tree, left_required, left_source_type)
+    sch2n = normalize_for_diff(right_tree, right_required, right_source_type)
+    diff, left_index, right_index = _diff_normalized(sch1n, sch2n)
 
     direction = f"{left_label} -> {right_label}"
     RED, GRN, YEL, CYN, RST = cfg.colors()
@@ -149,27 +215,21 @@ def compare_trees(
                 json.dump(
                     {"left": sch1n, "right": sch2n}, fh, ensure_ascii=False, indent=2
                 )
-        if json_out:
-            with open(json_out, "w", encoding="utf-8") as fh:
-                json.dump(
-                    {
-                        "meta": {
-                            "direction": direction,
-                            "mode": title_suffix.strip("; ").strip(),
-                        },
-                        "note": "No differences",
-                    },
-                    fh,
-                    ensure_ascii=False,
-                    indent=2,
-                )
-        return {
+        report: dict[str, Any] = {
             "meta": {"direction": direction, "mode": title_suffix.strip("; ").strip()},
             "note": "No differences",
         }
+        if json_out:
+            write_report(report, json_out)
+        return report
 
     report = build_report_struct(
-        diff, left_label, right_label, include_presence=cfg.show_presence
+        diff,
+        left_label,
+        right_label,
+        include_presence=cfg.show_presence,
+        left_index=left_index,
+        right_index=right_index,
     )
     report["meta"]["mode"] = title_suffix.strip("; ").strip()
 
@@ -185,24 +245,39 @@ def compare_trees(
         only_common=only_common,
         left_samples=left_samples,
         right_samples=right_samples,
+        data_presence=cfg.required_threshold is not None,
     )
 
     # Show common fields when only_common or show_common is True
     if only_common or show_common:
-        print_common_fields(left_label, right_label, sch1n, sch2n, colors=cfg.colors())
+        print_common_fields(
+            left_label,
+            right_label,
+            sch1n,
+            sch2n,
+            colors=cfg.colors(),
+            left_index=left_index,
+            right_index=right_index,
+        )
 
     # Path changes on normalized/coerced trees (skip when only_common is True)
     if not only_common:
-        path_changes = compute_path_changes(sch1n, sch2n)
+        path_changes = compute_path_changes(left_index, right_index)
         print_path_changes(left_label, right_label, path_changes, colors=cfg.colors())
+        report["path_changes"] = path_changes
+        report["rename_candidates"] = detect_renames(
+            left_index,
+            right_index,
+            only_in_left=report["only_in_file1"],
+            only_in_right=report["only_in_file2"],
+        )
 
     if dump_schemas:
         with open(dump_schemas, "w", encoding="utf-8") as fh:
             json.dump({"left": sch1n, "right": sch2n}, fh, ensure_ascii=False, indent=2)
 
     if json_out:
-        with open(json_out, "w", encoding="utf-8") as fh:
-            json.dump(report, fh, ensure_ascii=False, indent=2)
+        write_report(report, json_out)
 
     return report
 
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Optional
+
+from .constants import DEFAULT_ARRAY_SAMPLE_SIZE
 
 
 @dataclass(frozen=True)
@@ -6,6 +9,11 @@ class Config:
     infer_datetimes: bool = False
     color_enabled: bool = True  # Enable colors by default
     show_presence: bool = True
+    # Max elements typed per array (1 = first element only)
+    array_sample_size: int = DEFAULT_ARRAY_SAMPLE_SIZE
+    # Data paths present (non-null) in at least this fraction of their parent
+    # objects are inferred as required; None keeps data presence-free
+    required_threshold: Optional[float] = None
 
     # derived ANSI codes (empty strings if color disabled)
     def colors(self):
@@ -22,6 +22,10 @@ MAX_BATCH_SIZE = 10_000
 # Default record index for single record processing
 DEFAULT_RECORD_INDEX = 0
 
+# Elements typed per array when inferring schemas from data (first half of the
+# budget from the head of the array, the rest strided across the remainder)
+DEFAULT_ARRAY_SAMPLE_SIZE = 16
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Caching and Performance
 # ──────────────────────────────────────────────────────────────────────────────
@@ -213,6 +217,7 @@ __all__ = [
     "MAX_RECORD_SAFETY_LIMIT",
     "MAX_BATCH_SIZE",
     "DEFAULT_RECORD_INDEX",
+    "DEFAULT_ARRAY_SAMPLE_SIZE",
     # Caching and Performance
     "DEFAULT_CACHE_TTL_SECONDS",
     "MAX_CACHE_SIZE_MB",
@@ -0,0 +1,213 @@
+"""Streaming access to model nodes of large dbt ``manifest.json`` files.
+
+A monorepo manifest can be hundreds of megabytes; ``json.load`` on it costs
+seconds and gigabytes just to read one model's columns. This module walks
+``nodes.*`` with ijson, holding one node at a time and keeping ``columns``
+only for the models the caller asks for. The same pass records each model
+node's byte range, so a persisted node-id → offset index lets repeated
+lookups seek straight to the node.
+
+Public helpers
+--------------
+- ManifestModel            – one model node seen while streaming
+- iter_manifest_models     – stream model nodes, building selected columns
+- build_dbt_manifest_index – node id → byte range, plus name/alias lookup
+- load_dbt_manifest_index  – cached index for a local file (None if not indexable)
+- read_manifest_node       – decode one node from its byte range
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional
+
+import ijson
+
+from .io_utils import load_cached_file_index
+
+__all__ = [
+    "ManifestModel",
+    "iter_manifest_models",
+    "build_dbt_manifest_index",
+    "load_dbt_manifest_index",
+    "read_manifest_node",
+]
+
+# Bump when the index layout changes
+_INDEX_VERSION = 1
+
+_CHUNK_SIZE = 1 << 16
+_JSON_WS = b" \t\r\n"
+_BOM = b"\xef\xbb\xbf"
+_MAX_PENDING = 64 << 20
+
+
+@dataclass
+class ManifestModel:
+    """A model node's selectors, location and (if selected) columns.
+
+    `start`/`end` bound the node's JSON object in the file: `start` may sit
+    before whitespace, `end` may overshoot by up to one read chunk (see
+    `read_manifest_node`). `start` is None if the node key was not located.
+    """
+
+    node_id: str
+    name: str = ""
+    alias: str = ""
+    schema: str = ""
+    materialized: str = ""
+    start: Optional[int] = None
+    end: Optional[int] = None
+    columns: Optional[dict[str, Any]] = None
+
+
+class _TrackingReader:
+    """File wrapper that keeps the bytes read since the last located node.
+
+    ijson parses whole chunks before yielding, so by the time a node is
+    yielded its key and body are in `buf`; `release` drops what precedes it.
+    """
+
+    def __init__(self, fb: BinaryIO, track: bool = True):
+        self._fb = fb
+        self._track = track
+        self.buf = bytearray()
+        self.base = 0  # file offset of buf[0]
+        self.fed = 0  # file offset after the last read
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._fb.read(size)
+        head = chunk
+        if self.fed == 0 and chunk[:3] == _BOM:
+            # open_text accepts a UTF-8 BOM; yajl does not
+            chunk = chunk[3:]
+        self.fed += len(head)
+        if self._track:
+            self.buf += head
+        if len(self.buf) > _MAX_PENDING:
+            # Long stretch without model nodes (e.g. macros): bound memory
+            self.release(self.fed - _MAX_PENDING // 2)
+        return chunk
+
+    def release(self, offset: int) -> None:
+        # Trim only once the dead prefix dominates, so the copy is amortized
+        if offset - self.base > len(self.buf) // 2:
+            del self.buf[: offset - self.base]
+            self.base = offset
+
+
+def _locate_value(window: bytearray, key: str, lower: int) -> Optional[int]:
+    """Offset in `window` just past ``"key":`` at or after `lower`.
+
+    The colon check skips the id where it appears as a value (e.g. in another
+    node's ``depends_on``).
+    """
+    if key.isascii() and key.isprintable() and '"' not in key and "\\" not in key:
+        needles = [b'"' + key.encode() + b'"']
+    else:
+        needles = [
+            json.dumps(key).encode(),
+            json.dumps(key, ensure_ascii=False).encode(),
+        ]
+    for needle in needles:
+        pos = window.find(needle, lower)
+        while pos != -1:
+            i = pos + len(needle)
+            while i < len(window) and window[i] in _JSON_WS:
+                i += 1
+            if window[i : i + 1] == b":":
+                return i + 1
+            pos = window.find(needle, pos + 1)
+    return None
+
+
+def iter_manifest_models(
+    fb: BinaryIO,
+    select: Optional[Callable[[ManifestModel], bool]] = None,
+    chunk_size: int = _CHUNK_SIZE,
+    offsets: bool = True,
+) -> Iterator[ManifestModel]:
+    """Stream the model nodes of a manifest opened in binary mode.
+
+    Nodes are decoded one at a time by ijson, so memory stays at one node
+    plus a read chunk. `select` sees each model's selectors; only models it
+    accepts keep their ``columns``. Nodes of other resource types are skipped.
+    With ``offsets=False`` node byte ranges are not tracked (all None).
+    """
+    reader = _TrackingReader(fb, track=offsets)
+    lower = 0
+    for node_id, node in ijson.kvitems(reader, "nodes", buf_size=chunk_size):
+        start = end = None
+        if offsets:
+            pos = _locate_value(reader.buf, node_id, max(lower - reader.base, 0))
+            if pos is not None:
+                start = lower = reader.base + pos
+                end = reader.fed
+                reader.release(start)
+        if not isinstance(node, dict) or node.get("resource_type") != "model":
+            continue
+        m = ManifestModel(
+            node_id,
+            name=node.get("name") or "",
+            alias=node.get("alias") or "",
+            schema=node.get("schema") or "",
+            materialized=(node.get("config") or {}).get("materialized") or "",
+            start=start,
+            end=end,
+        )
+        if select is None or select(m):
+            m.columns = node.get("columns") or {}
+        yield m
+
+
+def build_dbt_manifest_index(fb: BinaryIO) -> dict[str, Any]:
+    """Index the model nodes of a manifest opened in binary mode.
+
+    Returns:
+        ``{"nodes": {node_id: [start, end]}, "names": {selector: [node_id]}}``
+        where selectors are the lower-cased node id, name and alias, matching
+        how `schema_from_dbt_manifest` resolves ``model=``.
+    """
+    nodes: dict[str, list[int]] = {}
+    names: dict[str, list[str]] = {}
+    for m in iter_manifest_models(fb, select=lambda _m: False):
+        if m.start is None or m.end is None:
+            continue
+        nodes[m.node_id] = [m.start, m.end]
+        for selector in {m.node_id.lower(), m.name.lower(), m.alias.lower()} - {""}:
+            names.setdefault(selector, []).append(m.node_id)
+    return {"nodes": nodes, "names": names}
+
+
+def load_dbt_manifest_index(
+    path: str, cache_dir: Optional[Path] = None
+) -> Optional[dict[str, Any]]:
+    """Return the model index for a local, uncompressed manifest.
+
+    Cached under `cache_dir` (default ``~/.cache/schema-diff/dbt_index``) and
+    rebuilt when the file's size or mtime changes. Returns None for paths
+    whose byte offsets are not meaningful (missing, remote or gzip files).
+    """
+    index: Optional[dict[str, Any]] = load_cached_file_index(
+        path,
+        "dbt_index",
+        build_dbt_manifest_index,
+        version=_INDEX_VERSION,
+        cache_dir=cache_dir,
+    )
+    return index
+
+
+def read_manifest_node(path: str, start: int, end: int) -> Optional[dict[str, Any]]:
+    """Decode the node object at ``[start, end)``; None if it does not parse."""
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        text = fh.read(end - start).decode("utf-8", errors="replace").lstrip()
+    try:
+        node, _ = json.JSONDecoder().raw_decode(text)
+    except ValueError:
+        return None
+    return node if isinstance(node, dict) else None
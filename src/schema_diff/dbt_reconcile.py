@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""Reconcile every dbt model of a manifest against its live BigQuery table.
+
+Checking a dbt project against BigQuery one ``compare`` call per model parses
+the manifest and opens a client for every model. This module streams the
+manifest once, fetches every table schema concurrently over one client, and
+diffs all model/table pairs through `batch_compare.diff_pairs` (fingerprint
+short-circuit + process pool) into one consolidated report.
+
+Public helpers
+--------------
+- DbtModelInput             – declared columns of one dbt model
+- load_manifest_models      – stream a manifest once into per-model inputs
+- fetch_table_schemas       – fetch many table schemas concurrently
+- reconcile_dbt_manifest    – fetch, diff and summarize every model/table pair
+- render_reconcile_markdown – consolidated markdown report
+"""
+from __future__ import annotations
+
+import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .batch_compare import BatchInput, _summarize, diff_pairs
+from .compare import normalize_for_diff
+from .dbt_manifest_index import ManifestModel, iter_manifest_models
+from .dbt_schema_parser import _schema_from_manifest_node
+from .io_utils import open_binary
+
+logger = logging.getLogger(__name__)
+
+# Live BigQuery labels that the dbt type map folds into coarser ones
+_BQ_TO_DBT_LABELS = {
+    "number": "float",
+    "bytes": "str",
+    "json": "str",
+    "datetime": "timestamp",
+}
+
+STATUSES = ("match", "drift", "missing_table", "undocumented", "error")
+
+
+@dataclass
+class DbtModelInput:
+    """Declared columns of one dbt model and the table it materializes to."""
+
+    node_id: str
+    name: str
+    table: str
+    tree: dict[str, Any] = field(default_factory=dict)
+    required: set[str] = field(default_factory=set)
+
+
+def load_manifest_models(
+    path: str,
+    dataset: Optional[str] = None,
+    models: Optional[list[str]] = None,
+) -> list[DbtModelInput]:
+    """Stream a manifest once and return its materialized models.
+
+    Args:
+        path: manifest.json path (local, GCS or gzip)
+        dataset: Keep only models whose dbt ``schema`` is this dataset
+        models: Keep only models matching these names, aliases or node ids
+
+    Returns:
+        Models in manifest order; ephemeral models are skipped
+    """
+    wanted = {m.lower() for m in models} if models else None
+    ds = dataset.lower() if dataset else None
+
+    def _include(m: ManifestModel) -> bool:
+        if m.materialized == "ephemeral":
+            return False
+        if ds and m.schema and m.schema.lower() != ds:
+            return False
+        if wanted is None:
+            return True
+        return bool(wanted & {m.node_id.lower(), m.name.lower(), m.alias.lower()})
+
+    out: list[DbtModelInput] = []
+    with open_binary(path) as fb:
+        for m in iter_manifest_models(fb, select=_include, offsets=False):
+            if m.columns is None:
+                continue
+            tree, required = _schema_from_manifest_node({"columns": m.columns})
+            out.append(
+                DbtModelInput(m.node_id, m.name, m.alias or m.name, tree, required)
+            )
+    return out
+
+
+def fetch_table_schemas(
+    client: Any,
+    project: str,
+    dataset: str,
+    tables: list[str],
+    workers: Optional[int] = None,
+) -> tuple[dict[str, Optional[tuple[dict[str, Any], set[str]]]], dict[str, str]]:
+    """Fetch the schemas of many tables of one dataset concurrently.
+
+    Large table lists are read in bulk from INFORMATION_SCHEMA first (see
+    `bigquery_metadata.prefetch_dataset_tables`); the remaining tables are
+    fetched with ``client.get_table`` through the project's shared limiter
+    (`rate_limit.get_bigquery_limiter`), which retries throttled calls and
+    narrows concurrency under quota pressure. A table that does not exist
+    maps to None.
+
+    Args:
+        client: BigQuery client (anything with ``get_table(ref)``)
+        project: GCP project ID
+        dataset: Dataset ID
+        tables: Table IDs to fetch
+        workers: Concurrent requests (default: analyze_config.PARALLEL_WORKERS)
+
+    Returns:
+        ``(schemas, errors)``: table -> (tree, required) or None, and
+        table -> message for tables that failed for any other reason
+    """
+    from google.api_core import exceptions as gcp_exceptions
+
+    from . import analyze_config
+    from .bigquery_ddl import bigquery_schema_to_internal
+    from .bigquery_metadata import prefetch_dataset_tables
+    from .rate_limit import get_bigquery_limiter
+
+    limiter = get_bigquery_limiter(project)
+
+    def _fetch(table_id: str) -> Optional[tuple[dict[str, Any], set[str]]]:
+        ref = f"{project}.{dataset}.{table_id}"
+        try:
+            tbl = limiter.call(
+                lambda: client.get_table(ref), operation_name=f"get_table {ref}"
+            )
+        except gcp_exceptions.NotFound:
+            return None
+        return bigquery_schema_to_internal(tbl.schema)
+
+    schemas: dict[str, Optional[tuple[dict[str, Any], set[str]]]] = {}
+    errors: dict[str, str] = {}
+    if not tables:
+        return schemas, errors
+
+    for table_id, tbl in prefetch_dataset_tables(
+        client, project, dataset, tables
+    ).items():
+        schemas[table_id] = bigquery_schema_to_internal(tbl.schema)
+    remaining = [t for t in tables if t not in schemas]
+    if not remaining:
+        return schemas, errors
+
+    max_workers = min(workers or analyze_config.PARALLEL_WORKERS, len(remaining))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {t: executor.submit(_fetch, t) for t in remaining}
+        for table_id, future in futures.items():
+            try:
+                schemas[table_id] = future.result()
+            except Exception as e:
+                logger.warning(
+                    "Failed to fetch schema for %s.%s.%s: %s",
+                    project,
+                    dataset,
+                    table_id,
+                    e,
+                )
+                errors[table_id] = str(e)
+    return schemas, errors
+
+
+def _nest_dotted_columns(tree: dict[str, Any]) -> dict[str, Any]:
+    """Turn dbt's ``parent.child`` column names into nested fields."""
+    out: dict[str, Any] = {}
+    for name, typ in tree.items():
+        *parents, leaf = name.split(".")
+        node = out
+        for p in parents:
+            if not isinstance(node.get(p), dict):
+                node[p] = {}
+            node = node[p]
+        if not (isinstance(node.get(leaf), dict) and typ == "any"):
+            node[leaf] = typ
+    return out
+
+
+def _fold_live_types(tree: Any) -> Any:
+    """Map live BigQuery labels onto the coarser dbt type vocabulary."""
+    if isinstance(tree, dict):
+        return {k: _fold_live_types(v) for k, v in tree.items()}
+    if isinstance(tree, list):
+        return [_fold_live_types(v) for v in tree]
+    return _BQ_TO_DBT_LABELS.get(tree, tree)
+
+
+def _fill_untyped(dbt_tree: dict[str, Any], live: Any) -> dict[str, Any]:
+    """Give columns declared without a ``data_type`` their live type.
+
+    Such columns are then only checked for existence, not for type.
+    """
+    live = live if isinstance(live, dict) else {}
+    out: dict[str, Any] = {}
+    for name, typ in dbt_tree.items():
+        if typ == "any" and name in live:
+            out[name] = live[name]
+        elif isinstance(typ, dict):
+            out[name] = _fill_untyped(typ, live.get(name))
+        else:
+            out[name] = typ
+    return out
+
+
+def reconcile_dbt_manifest(
+    manifest_path: str,
+    project: str,
+    dataset: str,
+    *,
+    client: Any = None,
+    models: Optional[list[str]] = None,
+    all_schemas: bool = False,
+    workers: Optional[int] = None,
+    fetch_workers: Optional[int] = None,
+    include_presence: bool = True,
+    include_reports: bool = True,
+) -> dict[str, Any]:
+    """Diff every dbt model's declared columns against its BigQuery table.
+
+    Args:
+        manifest_path: dbt ``target/manifest.json``
+        project: GCP project of the dataset
+        dataset: BigQuery dataset holding the model tables
+        client: BigQuery client (created for `project` if None)
+        models: Restrict to these model names, aliases or node ids
+        all_schemas: Include models whose dbt schema is not `dataset`
+        workers: Process pool size for diffs (None = CPU count, 1 = in-process)
+        fetch_workers: Concurrent ``get_table`` requests
+        include_presence: Include presence (not-null vs REQUIRED) issues
+        include_reports: Keep the full per-pair report in the results
+
+    Returns:
+        Consolidated result with ``meta``, ``summary`` (count per status) and
+        ``results`` (one entry per model; status is one of `STATUSES`)
+    """
+    dbt_models = load_manifest_models(
+        manifest_path, None if all_schemas else dataset, models
+    )
+    if client is None:
+        from .bigquery_utils import get_bigquery_client
+
+        client = get_bigquery_client(project)
+
+    from .rate_limit import get_bigquery_limiter
+
+    limiter = get_bigquery_limiter(project)
+    throttles_before = limiter.metrics.throttles
+    tables = sorted({m.table for m in dbt_models if m.tree})
+    schemas, errors = fetch_table_schemas(
+        client, project, dataset, tables, workers=fetch_workers
+    )
+    throttled = limiter.metrics.throttles - throttles_before
+
+    inputs: list[BatchInput] = []
+    pairs: list[tuple[int, int]] = []
+    results: list[dict[str, Any]] = []
+    for m in dbt_models:
+        table_ref = f"{project}.{dataset}.{m.table}"
+        entry: dict[str, Any] = {"model": m.node_id, "table": table_ref}
+        results.append(entry)
+        if not m.tree:
+            entry["status"] = "undocumented"
+        elif m.table in errors:
+            entry.update(status="error", error=errors[m.table])
+        elif schemas.get(m.table) is None:
+            entry["status"] = "missing_table"
+        else:
+            bq_tree, bq_required = schemas[m.table]  # type: ignore[misc]
+            bq_tree = _fold_live_types(bq_tree)
+            dbt_tree = _fill_untyped(_nest_dotted_columns(m.tree), bq_tree)
+            inputs.append(
+                BatchInput(
+                    m.node_id,
+                    normalize_for_diff(dbt_tree, m.required, "dbt-manifest"),
+                    "dbt-manifest",
+                )
+            )
+            inputs.append(
+                BatchInput(
+                    table_ref,
+                    normalize_for_diff(bq_tree, bq_required, "bigquery"),
+                    "bigquery",
+                )
+            )
+            pairs.append((len(inputs) - 2, len(inputs) - 1))
+            entry["pair"] = pairs[-1]
+
+    reports = diff_pairs(
+        inputs, pairs, workers=workers, include_presence=include_presence
+    )
+    for entry in results:
+        if "pair" not in entry:
+            continue
+        report = reports[entry.pop("pair")]
+        identical = report.get("note") == "No differences"
+        entry["status"] = "match" if identical else "drift"
+        entry.update(_summarize(report))
+        if include_reports:
+            entry["report"] = report
+
+    summary = {status: 0 for status in STATUSES}
+    for entry in results:
+        summary[entry["status"]] += 1
+    return {
+        "meta": {
+            "manifest": manifest_path,
+            "dataset": f"{project}:{dataset}",
+            "generated": datetime.datetime.now().isoformat(timespec="seconds"),
+            "models": len(dbt_models),
+            "tables_fetched": len(tables),
+            "throttle_events": throttled,
+            "diffed": sum(
+                1 for i, j in pairs if inputs[i].fingerprint != inputs[j].fingerprint
+            ),
+        },
+        "summary": summary,
+        "results": results,
+    }
+
+
+def render_reconcile_markdown(result: dict[str, Any]) -> str:
+    """Render a `reconcile_dbt_manifest` result as a markdown report."""
+    meta, summary = result["meta"], result["summary"]
+    lines = [
+        "# 🔁 dbt ↔ BigQuery Reconciliation",
+        "",
+        f"- **Generated**: {meta['generated']}",
+        f"- **Manifest**: `{meta['manifest']}`",
+        f"- **Dataset**: `{meta['dataset']}`",
+        f"- **Models**: {meta['models']} "
+        f"({meta['tables_fetched']} tables fetched, {meta['diffed']} diffed)",
+        "",
+        "## Summary",
+        "",
+        "| Status | Models |",
+        "|---|---|",
+    ]
+    lines.extend(f"| {status} | {summary[status]} |" for status in STATUSES)
+    lines.extend(
+        [
+            "",
+            "## Models",
+            "",
+            "| Model | Table | Status | Only dbt | Only BigQuery | Type | Presence |",
+            "|---|---|---|---|---|---|---|",
+        ]
+    )
+    for r in result["results"]:
+        if r["status"] in ("match", "drift"):
+            counts = (
+                f"{r['only_in_left']} | {r['only_in_right']} | "
+                f"{r['type_mismatches']} | {r['presence_issues']}"
+            )
+        else:
+            counts = f"{r.get('error', '')} | | |"
+        lines.append(f"| `{r['model']}` | `{r['table']}` | {r['status']} | {counts} |")
+    lines.append("")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "DbtModelInput",
+    "STATUSES",
+    "load_manifest_models",
+    "fetch_table_schemas",
+    "reconcile_dbt_manifest",
+    "render_reconcile_markdown",
+]
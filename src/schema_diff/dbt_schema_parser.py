@@ -17,13 +17,18 @@ Both return:
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any
 
 import yaml
 
-from .io_utils import open_text
+from .dbt_manifest_index import (
+    ManifestModel,
+    iter_manifest_models,
+    load_dbt_manifest_index,
+    read_manifest_node,
+)
+from .io_utils import open_binary, open_text
 
 __all__ = [
     "schema_from_dbt_manifest",
@@ -46,12 +51,14 @@ TYPE_MAP_DBT: dict[str, str] = {
     "int4": "int",
     "bigint": "int",
     "int8": "int",
+    "int64": "int",
     "serial": "int",
     "bigserial": "int",
     # floats / decimals
     "float": "float",
     "float4": "float",
     "float8": "float",
+    "float64": "float",
     "double": "float",
     "double precision": "float",
     "real": "float",
@@ -148,34 +155,74 @@ def schema_from_dbt_manifest(
       model: model selector; can be simple name ('my_model'), alias, or full node id
              (e.g. 'model.project_name.my_model'). If None, picks the first model.
 
+    The manifest is streamed so only the selected model's columns are
+    materialized; for local uncompressed files, `model` lookups go through a
+    cached node offset index (see `dbt_manifest_index`).
+
     Returns:
       (schema_tree, required_paths)
     """
-    with open_text(path) as f:
-        man = json.load(f)
-
-    nodes: dict[str, Any] = man.get("nodes", {}) or {}
-    matches: list[tuple[str, Any]] = []
     mlc = (model or "").lower()
-
-    for node_id, node in nodes.items():
-        if node.get("resource_type") != "model":
-            continue
-        name = (node.get("name") or "").lower()
-        alias = (node.get("alias") or "").lower()
-        fq = node_id.lower()  # e.g., model.project_name.my_model
-        if not model:
-            matches.append((fq, node))
-        else:
-            if mlc in {name, alias, fq}:
-                matches.append((fq, node))
+    matches = _indexed_manifest_matches(path, mlc) if model else None
+    if matches is None:
+        matches = _streamed_manifest_matches(path, mlc)
 
     if not matches:
         raise ValueError(f"No dbt model found matching '{model}' in {path}")
 
     # Prefer exact name/alias/node-id match if provided; else take the first sorted
     _, node = sorted(matches, key=lambda x: (x[0] != mlc, x[0]))[0]
+    return _schema_from_manifest_node(node)
+
 
+def _indexed_manifest_matches(
+    path: str, mlc: str
+) -> list[tuple[str, dict[str, Any]]] | None:
+    """Resolve `mlc` through the cached node offset index.
+
+    Returns None when the file cannot be indexed or the index looks stale, so
+    the caller falls back to streaming.
+    """
+    index = load_dbt_manifest_index(path)
+    if index is None:
+        return None
+    matches: list[tuple[str, dict[str, Any]]] = []
+    for node_id in index["names"].get(mlc, []):
+        node = read_manifest_node(path, *index["nodes"][node_id])
+        if node is None or node.get("unique_id", node_id) != node_id:
+            return None
+        matches.append((node_id.lower(), node))
+    return matches
+
+
+def _streamed_manifest_matches(
+    path: str, mlc: str
+) -> list[tuple[str, dict[str, Any]]]:
+    """Stream `nodes.*`, keeping columns only for nodes that can match."""
+    matches: list[tuple[str, dict[str, Any]]] = []
+
+    def _wanted(m: ManifestModel) -> bool:
+        if not mlc:
+            # Only the first node id in sort order is used
+            return not matches or m.node_id.lower() < matches[0][0]
+        return mlc in {m.node_id.lower(), m.name.lower(), m.alias.lower()}
+
+    with open_binary(path) as fb:
+        for m in iter_manifest_models(fb, select=_wanted, offsets=False):
+            fq = m.node_id.lower()  # e.g., model.project_name.my_model
+            node = {"columns": m.columns or {}}
+            if not mlc:
+                if not matches or fq < matches[0][0]:
+                    matches[:] = [(fq, node)]
+            elif mlc in {m.name.lower(), m.alias.lower(), fq}:
+                matches.append((fq, node))
+    return matches
+
+
+def _schema_from_manifest_node(
+    node: dict[str, Any],
+) -> tuple[dict[str, Any], set[str]]:
+    """Build (schema_tree, required_paths) from a manifest node's columns."""
     cols = node.get("columns", {}) or {}
     schema: dict[str, Any] = {}
     required: set[str] = set()
@@ -27,13 +27,30 @@ class CacheManager:
 
     def _get_cache_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
         """Generate a cache key from function name and arguments."""
-        # Create a stable hash from function name and arguments
-        key_data = {"func": func_name, "args": args, "kwargs": sorted(kwargs.items())}
+        # Create a stable hash from function name and arguments; file arguments
+        # also contribute their size/mtime so rewritten files are re-parsed
+        key_data = {
+            "func": func_name,
+            "args": args,
+            "kwargs": sorted(kwargs.items()),
+            "files": [self._file_signature(a) for a in args],
+        }
         key_str = json.dumps(key_data, sort_keys=True, default=str)
         return hashlib.md5(
             key_str.encode(), usedforsecurity=False
         ).hexdigest()  # trunk-ignore(bandit/B324)
 
+    @staticmethod
+    def _file_signature(arg: Any) -> Optional[list[int]]:
+        """Return [size, mtime_ns] if `arg` names an existing local file."""
+        if not isinstance(arg, (str, Path)):
+            return None
+        try:
+            st = os.stat(arg)
+        except (OSError, ValueError):
+            return None
+        return [st.st_size, st.st_mtime_ns]
+
     def _get_cache_path(self, cache_key: str) -> Path:
         """Get the file path for a cache key."""
         return self.cache_dir / f"{cache_key}.cache"
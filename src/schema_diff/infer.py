@@ -9,11 +9,18 @@ Datetime inference is gated by Config.infer_datetimes; when enabled, we detect:
 - date:      YYYY-MM-DD
 - time:      HH:MM[:SS[.ffffff]]
 - timestamp: YYYY-MM-DD[ T]HH:MM[:SS[.ffffff]][Z|±HH:MM]
+
+String classification runs cheap length/character pre-filters first, so most
+values never reach a regex, and memoizes the candidates that do (repeated
+enum values, status codes and timestamps). `tname_many` classifies a batch of
+values in one call.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
 from .config import Config
@@ -27,6 +34,42 @@ ISO_TS_RE = re.compile(
     r"(?:[Zz]|[+-]\d{2}:\d{2})?$"
 )
 
+# Length bounds of strings the patterns above can match
+_TIME_LEN = (5, 18)  # HH:MM .. HH:MM:SS.fffffffff
+_DATE_LEN = 10  # YYYY-MM-DD
+_TS_LEN = (16, 35)  # YYYY-MM-DDTHH:MM .. with 9 fraction digits and ±HH:MM
+
+
+@lru_cache(maxsize=4096)
+def _classify_candidate(s: str) -> str:
+    """Run the single regex a pre-filtered candidate can match (memoized)."""
+    if s[2] == ":":
+        return "time" if ISO_TIME_RE.match(s) else "str"
+    if len(s) == _DATE_LEN:
+        return "date" if ISO_DATE_RE.match(s) else "str"
+    return "timestamp" if ISO_TS_RE.match(s) else "str"
+
+
+def classify_datetime_str(v: str) -> str:
+    """Classify a non-empty string as "timestamp", "date", "time" or "str".
+
+    Equivalent to matching `ISO_TS_RE`, `ISO_DATE_RE` and `ISO_TIME_RE` against
+    ``v.strip()``, but strings that cannot match (wrong length, first char not
+    a digit, no ``:``/``-`` at the expected offset) are rejected without a
+    regex, and plausible candidates are memoized.
+    """
+    if v[0].isspace() or v[-1].isspace():
+        v = v.strip()
+    n = len(v)
+    if n < _TIME_LEN[0] or n > _TS_LEN[1] or not v[0].isdecimal():
+        return "str"
+    if v[2] == ":":
+        if n > _TIME_LEN[1]:
+            return "str"
+    elif v[4] != "-" or (n != _DATE_LEN and n < _TS_LEN[0]):
+        return "str"
+    return _classify_candidate(v)
+
 
 def tname(v: Any, cfg: Config) -> str:
     """Map a Python value to the internal atomic type label.
@@ -58,13 +101,8 @@ def tname(v: Any, cfg: Config) -> str:
             return "empty_string"
 
         if cfg.infer_datetimes:
-            s = v.strip()  # be tolerant of incidental whitespace
-            if ISO_TS_RE.match(s):
-                return "timestamp"
-            if ISO_DATE_RE.match(s):
-                return "date"
-            if ISO_TIME_RE.match(s):
-                return "time"
+            # Tolerant of incidental whitespace
+            return classify_datetime_str(v)
         return "str"
 
     if isinstance(v, dict):
@@ -77,3 +115,21 @@ def tname(v: Any, cfg: Config) -> str:
 
     # Fallback for uncommon types (bytes, decimal, numpy scalars, etc.)
     return type(v).__name__
+
+
+def tname_many(values: Iterable[Any], cfg: Config) -> list[str]:
+    """Classify a batch of values; equivalent to ``[tname(v, cfg) for v in values]``.
+
+    Repeated strings within the batch are classified once.
+    """
+    out: list[str] = []
+    seen: dict[str, str] = {}
+    for v in values:
+        if type(v) is str:
+            label = seen.get(v)
+            if label is None:
+                label = seen[v] = tname(v, cfg)
+            out.append(label)
+        else:
+            out.append(tname(v, cfg))
+    return out
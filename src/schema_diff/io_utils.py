@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import gzip
+import hashlib
 import io
 import json
+import os
 import subprocess  # nosec B404: subprocess is used safely for internal commands
 from collections.abc import Iterator, Sequence
-from typing import Any
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional
 
 import ijson
 
@@ -54,6 +57,7 @@ __all__ = [
     "resolve_file_path",
     "open_text",
     "open_binary",
+    "load_cached_file_index",
     "sniff_ndjson",
     "iter_records",
     "sample_records",
@@ -153,6 +157,61 @@ def open_binary(path: str):
     return f  # binary file-like
 
 
+def load_cached_file_index(
+    path: str,
+    namespace: str,
+    build: Callable[[BinaryIO], Any],
+    version: int = 1,
+    cache_dir: Optional[Path] = None,
+) -> Any:
+    """Return a byte-offset index of a local file, cached on disk.
+
+    `build` receives the open binary file and returns a JSON-serializable
+    index. The result is cached as JSON under `cache_dir` (default
+    ``~/.cache/schema-diff/<namespace>``), keyed by the file's real path and
+    reused while its size and mtime (and `version`) are unchanged.
+
+    Returns None for paths where byte offsets are not meaningful (missing,
+    remote or gzip-compressed files).
+    """
+    try:
+        st = os.stat(path)
+        with open(path, "rb") as fh:
+            if fh.read(2) == b"\x1f\x8b":
+                return None
+    except OSError:
+        return None
+
+    real = os.path.realpath(path)
+    if cache_dir is None:
+        from .decorators import _cache_manager
+
+        cache_dir = _cache_manager.cache_dir / namespace
+    digest = hashlib.sha1(real.encode("utf-8"), usedforsecurity=False).hexdigest()
+    cache_path = cache_dir / f"{digest}.json"
+    signature = [version, st.st_size, st.st_mtime_ns]
+
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            cached = json.load(fh)
+        if cached.get("path") == real and cached.get("signature") == signature:
+            return cached["index"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    with open(path, "rb") as fh:
+        index = build(fh)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"path": real, "signature": signature, "index": index}, fh)
+        os.replace(tmp, cache_path)
+    except OSError:
+        logger.debug("Could not write %s index cache %s", namespace, cache_path)
+    return index
+
+
 def sniff_ndjson(sample: str) -> bool:
     """
     Heuristic: if the first two non-empty lines both start with '{', treat as NDJSON.
@@ -13,16 +13,21 @@ Conventions
 
 from __future__ import annotations
 
-from typing import Any
+from array import array
+from typing import Any, Iterable
 
 from .config import Config
-from .infer import tname
+from .infer import tname, tname_many
 
 __all__ = [
     "to_schema",
+    "sample_indices",
     "union_types",
     "merge_schema",
     "merged_schema_from_samples",
+    "merged_schema_with_required",
+    "TypeCounter",
+    "mark_required",
 ]
 
 # Mapping for normalizers that want a base type for empties (not used here directly)
@@ -38,7 +43,8 @@ def to_schema(o: Any, cfg: Config) -> Any:
 
     Notes
     -----
-    - Arrays: we preserve element type shape as a single-element list.
+    - Arrays: we preserve element type shape as a single-element list, merged
+      over up to `cfg.array_sample_size` elements (see `sample_indices`).
       If the array is empty, we return "empty_array".
     - Objects: recursively convert fields; empty dict → "empty_object".
     - Strings: empty string → "empty_string"; otherwise uses `tname(...)`
@@ -47,9 +53,7 @@ def to_schema(o: Any, cfg: Config) -> Any:
     if o is None:
         return "missing"
     if isinstance(o, list):
-        # For performance we keep the convention of using only the first element's shape.
-        # The merge step will union across multiple samples anyway.
-        return [to_schema(o[0], cfg)] if o else "empty_array"
+        return [_array_element_schema(o, cfg)] if o else "empty_array"
     if isinstance(o, dict):
         return {k: to_schema(v, cfg) for k, v in o.items()} if o else "empty_object"
     if isinstance(o, str) and o == "":
@@ -57,6 +61,44 @@ def to_schema(o: Any, cfg: Config) -> Any:
     return tname(o, cfg)
 
 
+def sample_indices(n: int, budget: int) -> range | list[int]:
+    """Indices of the array elements to type, at most `budget` of them.
+
+    Short arrays are typed in full. Longer ones use the first ``budget // 2``
+    elements plus an even stride over the rest (ending at the last element),
+    so both leading elements and late outliers are seen while the cost stays
+    bounded per array.
+    """
+    if n <= budget:
+        return range(n)
+    if budget <= 1:
+        return range(1)
+    head = budget // 2
+    rest = budget - head
+    if rest == 1:
+        return [*range(head), n - 1]
+    span = n - 1 - head
+    return [*range(head), *(head + i * span // (rest - 1) for i in range(rest))]
+
+
+def _array_element_schema(o: list[Any], cfg: Config) -> Any:
+    """Type the sampled elements of a non-empty array and merge them in one pass."""
+    if len(o) == 1 or cfg.array_sample_size <= 1:
+        return to_schema(o[0], cfg)
+
+    elems = [o[i] for i in sample_indices(len(o), cfg.array_sample_size)]
+    # Scalars (the common case) are classified as one batch
+    scalars = [e for e in elems if not isinstance(e, (list, dict))]
+    shape: Any = None
+    for label in dict.fromkeys(tname_many(scalars, cfg)):
+        shape = label if shape is None else union_types(shape, label)
+    for e in elems:
+        if isinstance(e, (list, dict)):
+            s = to_schema(e, cfg)
+            shape = s if shape is None else merge_schema(shape, s)
+    return shape
+
+
 def union_types(a: str, b: str) -> str:
     """Union two scalar/union type strings into a normalized "union(...)" form.
 
@@ -134,13 +176,289 @@ def merge_schema(a: Any, b: Any) -> Any:
     )
 
 
-def merged_schema_from_samples(recs: list[Any], cfg: Config) -> Any:
+# Exact-type fast path for TypeCounter; anything else goes through `tname`
+_SCALAR_LABELS = {int: "int", float: "float", bool: "bool", type(None): "missing"}
+
+
+class TypeCounter:
+    """Columnar type-occurrence counters per path; the schema tree is built last.
+
+    Every path gets a dense integer id on first sight. For each type label
+    (as returned by `tname`, plus "object"/"array" for non-empty containers)
+    there is one ``array('q')`` column indexed by path id, so observing a
+    value is a single integer increment. `materialize` turns the counts into
+    the same tree `merge_schema` folds record by record:
+
+    - a path seen only as non-empty objects becomes a dict of its children;
+      a child absent from some of those objects gains "missing"
+    - a path seen only as arrays (possibly empty) becomes ``[element]``
+    - anything else becomes the union of its labels
+
+    The one divergence is where the pairwise fold is itself order-dependent:
+    empty arrays mixed with other kinds. Here "empty_array" is always absorbed
+    by "array" (normalization collapses the two anyway). `distribution`
+    exposes the exact counts per path and `required_paths` the paths present
+    in enough of their parent objects.
+    """
+
+    def __init__(self, cfg: Config) -> None:
+        self.cfg = cfg
+        self.records = 0
+        self.paths: list[str] = [""]
+        self.parents = array("l", [-1])
+        # Per path id: child key -> child path id
+        self._kids: list[dict[str, int]] = [{}]
+        self.labels: list[str] = []
+        self.columns: list[array] = []
+        self._columns_by_label: dict[str, array] = {}
+
+    def _child(self, parent: int, key: str) -> int:
+        i = self._kids[parent].get(key)
+        if i is None:
+            i = self._kids[parent][key] = len(self.paths)
+            prefix = self.paths[parent]
+            if key == "[]" or not prefix:
+                self.paths.append(prefix + key)
+            else:
+                self.paths.append(f"{prefix}.{key}")
+            self.parents.append(parent)
+            self._kids.append({})
+            for col in self.columns:
+                col.append(0)
+        return i
+
+    def _column(self, label: str) -> array:
+        col = self._columns_by_label.get(label)
+        if col is None:
+            self.labels.append(label)
+            col = array("q", bytes(8 * len(self.paths)))
+            self.columns.append(col)
+            self._columns_by_label[label] = col
+        return col
+
+    def observe(self, record: Any) -> None:
+        """Count the type of every value in one record."""
+        self.records += 1
+        self._add(0, record)
+
+    def observe_many(self, records: Iterable[Any]) -> TypeCounter:
+        """Observe a batch of records; returns self."""
+        add = self._add
+        for r in records:
+            self.records += 1
+            add(0, r)
+        return self
+
+    def _add(self, i: int, v: Any) -> None:
+        t = type(v)
+        if t is dict:
+            if not v:
+                label = "empty_object"
+            else:
+                self._column("object")[i] += 1
+                kids, by_label = self._kids[i], self._columns_by_label
+                plain_str = not self.cfg.infer_datetimes
+                for k, x in v.items():
+                    c = kids.get(k)
+                    if c is None:
+                        c = self._child(i, k)
+                    # Inline the common scalar cases; everything else recurses
+                    tx = type(x)
+                    xlabel = _SCALAR_LABELS.get(tx)
+                    if xlabel is None and tx is str and x and plain_str:
+                        xlabel = "str"
+                    col = by_label.get(xlabel) if xlabel is not None else None
+                    if col is not None:
+                        col[c] += 1
+                    else:
+                        self._add(c, x)
+                return
+        elif t is list:
+            if not v:
+                label = "empty_array"
+            else:
+                self._column("array")[i] += 1
+                self._add_elements(self._child(i, "[]"), v)
+                return
+        elif t is str and v and not self.cfg.infer_datetimes:
+            label = "str"
+        else:
+            label = _SCALAR_LABELS.get(t) or tname(v, self.cfg)
+            if label in ("object", "array"):  # dict/list subclasses
+                self._add(i, dict(v) if label == "object" else list(v))
+                return
+        col = self._columns_by_label.get(label)
+        if col is None:
+            col = self._column(label)
+        col[i] += 1
+
+    def _add_elements(self, elem: int, v: list[Any]) -> None:
+        budget = self.cfg.array_sample_size
+        if len(v) == 1 or budget <= 1:
+            self._add(elem, v[0])
+            return
+        elems = [v[j] for j in sample_indices(len(v), budget)]
+        scalars = [e for e in elems if not isinstance(e, (list, dict))]
+        for label in tname_many(scalars, self.cfg):
+            self._column(label)[elem] += 1
+        for e in elems:
+            if isinstance(e, (list, dict)):
+                self._add(elem, e)
+
+    def merge(self, other: TypeCounter) -> TypeCounter:
+        """Add `other`'s counts (e.g. from another shard) into this counter."""
+        self.records += other.records
+        remap = [0] * len(other.paths)
+        for parent, kids in enumerate(other._kids):
+            for key, j in kids.items():
+                remap[j] = self._child(remap[parent], key)
+        for label, col in zip(other.labels, other.columns):
+            mine = self._column(label)
+            for j, n in enumerate(col):
+                if n:
+                    mine[remap[j]] += n
+        return self
+
+    def _counts(self, i: int) -> dict[str, int]:
+        return {
+            label: col[i] for label, col in zip(self.labels, self.columns) if col[i]
+        }
+
+    def distribution(self) -> dict[str, dict[str, int]]:
+        """Exact ``{path: {label: count}}``; absences from objects count as "missing"."""
+        objects = self._columns_by_label.get("object")
+        out: dict[str, dict[str, int]] = {}
+        for i in range(1, len(self.paths)):
+            counts = self._counts(i)
+            if objects is not None and not self.paths[i].endswith("[]"):
+                absent = objects[self.parents[i]] - sum(counts.values())
+                if absent > 0:
+                    counts["missing"] = counts.get("missing", 0) + absent
+            out[self.paths[i]] = counts
+        return out
+
+    def required_paths(self, threshold: float = 1.0) -> set[str]:
+        """Paths present (non-null) in at least `threshold` of their parents.
+
+        The denominator is the number of objects seen at the parent path (the
+        root counts records), so nested paths are relative to their parent
+        object, as in JSON Schema. Array elements use the ``[0]`` segment.
+        """
+        objects = self._columns_by_label.get("object")
+        empties = self._columns_by_label.get("empty_object")
+        nulls = self._columns_by_label.get("missing")
+        required = set()
+        for i in range(1, len(self.paths)):
+            path = self.paths[i]
+            if path.endswith("[]"):
+                continue
+            parent = self.parents[i]
+            if parent == 0:
+                total = self.records
+            else:
+                total = (objects[parent] if objects is not None else 0) + (
+                    empties[parent] if empties is not None else 0
+                )
+            present = sum(col[i] for col in self.columns)
+            if nulls is not None:
+                present -= nulls[i]
+            if total and present >= threshold * total:
+                required.add(path.replace("[]", "[0]"))
+        return required
+
+    def materialize(self) -> Any:
+        """Build the legacy type tree; "missing" if nothing was observed."""
+        if not self.records:
+            return "missing"
+        kids = self._kids
+        objects = self._columns_by_label.get("object")
+
+        def build(i: int, absent: bool) -> Any:
+            kinds = set(self._counts(i))
+            if absent:
+                kinds.add("missing")
+            if kinds == {"object"}:
+                n = objects[i]  # type: ignore[index]
+                return {
+                    key: build(c, sum(self._counts(c).values()) < n)
+                    for key, c in kids[i].items()
+                }
+            if "array" in kinds:
+                kinds.discard("empty_array")
+                if kinds == {"array"}:
+                    return [build(kids[i]["[]"], False)]
+            shape = None
+            for label in sorted(kinds):
+                shape = label if shape is None else union_types(shape, label)
+            return shape
+
+        return build(0, False)
+
+
+def mark_required(tree: Any, required: Iterable[str]) -> Any:
+    """Drop "missing" from the leaf types of `required` paths.
+
+    With a presence threshold below 1.0 a required path may still have been
+    absent (or null) in a few records; its type then carries "missing", which
+    would contradict the inferred requirement in a comparison.
+    """
+    required = set(required)
+    if not required:
+        return tree
+
+    def walk(node: Any, path: str) -> Any:
+        if isinstance(node, dict):
+            return {
+                k: walk(v, f"{path}.{k}" if path else k) for k, v in node.items()
+            }
+        if isinstance(node, list) and node and isinstance(node[0], dict):
+            return [walk(node[0], f"{path}[0]")]
+        if path in required and isinstance(node, str) and node.startswith("union("):
+            parts = [p for p in node[6:-1].split("|") if p != "missing"]
+            return parts[0] if len(parts) == 1 else "union(" + "|".join(parts) + ")"
+        return node
+
+    return walk(tree, "")
+
+
+def _count_types(recs: list[Any], cfg: Config, profiler: Any | None) -> TypeCounter:
+    counter = TypeCounter(cfg)
+    if profiler is None:
+        return counter.observe_many(recs)
+    for r in recs:
+        profiler.observe(r)
+        counter.observe(r)
+    profiler.types = counter.distribution()
+    return counter
+
+
+def merged_schema_from_samples(
+    recs: list[Any], cfg: Config, profiler: Any | None = None
+) -> Any:
     """Merge a list of JSON records into a single schema tree.
 
+    Types are accumulated per path in a `TypeCounter` and the tree is built
+    once at the end. If `profiler` (a `profiling.DataProfiler`) is given, each
+    record is also observed in the same pass and the profiler receives the
+    exact type distributions.
+
     Returns "missing" if `recs` is empty.
     """
-    sch: Any | None = None
-    for r in recs:
-        s = to_schema(r, cfg)
-        sch = s if sch is None else merge_schema(sch, s)
-    return sch if sch is not None else "missing"
+    return _count_types(recs, cfg, profiler).materialize()
+
+
+def merged_schema_with_required(
+    recs: list[Any], cfg: Config, profiler: Any | None = None
+) -> tuple[Any, set[str]]:
+    """Merge records into a schema tree and infer required paths in one pass.
+
+    Paths are required when present in at least `cfg.required_threshold` of
+    their parent objects (see `TypeCounter.required_paths`); with no
+    threshold configured none are inferred.
+    """
+    counter = _count_types(recs, cfg, profiler)
+    tree = counter.materialize()
+    if cfg.required_threshold is None:
+        return tree, set()
+    required = counter.required_paths(cfg.required_threshold)
+    return mark_required(tree, required), required
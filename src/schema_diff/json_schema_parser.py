@@ -12,12 +12,25 @@ Objects : { key: subtree }
 Arrays  : [ element_subtree ]         (even when the element is a union/object)
 Unions  : "union(a|b|...)"            (sorted, deduped; "any" dropped if others present)
 Presence: NOT encoded in the tree (handled by compare layer via required_paths)
+
+References
+----------
+Local ``$ref`` pointers (``#/definitions/X``, ``#/$defs/X`` or any ``#/...``
+JSON pointer) are resolved through `_RefResolver`, which converts each target
+once and hands the same subtree to every use site, so work and output size
+grow with the number of unique definitions rather than with their uses.
+Recursive refs are cut per strongly connected component of the ref graph:
+inside a definition, a ref back into the definition's own cycle is typed
+"object" (with no required paths), so each definition converts to the same
+tree wherever and in whatever order it is first used. Remote refs are typed
+"any".
 """
 
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Optional
+from urllib.parse import unquote
 
 from .io_utils import open_text
 from .json_data_file_parser import merge_schema
@@ -82,7 +95,173 @@ def _literal_tname_for_enum(v: Any) -> str:
     return "any"
 
 
-def _schema_from_js(node: Any, *, _optional: bool) -> Any:
+# Distinct refs that may be open at once before a chain is cut to "any"
+_MAX_REF_DEPTH = 64
+
+
+class _RefResolver:
+    """Resolve local ``$ref`` pointers of one document, memoized per target.
+
+    ``definitions`` / ``$defs`` are indexed up front; other ``#/...`` pointers
+    are walked on first use. Converted type subtrees and (relative) required
+    paths are cached per target, so a definition referenced from many places
+    is converted once and shared. Refs are grouped into the strongly connected
+    components of the ref graph; while a target is expanded, refs into its own
+    component are cut, which keeps every cached result independent of the
+    order in which targets were reached.
+    """
+
+    def __init__(self, root: Any):
+        self.root = root
+        self._targets: dict[str, Any] = {"#": root}
+        if isinstance(root, dict):
+            for key in ("definitions", "$defs"):
+                defs = root.get(key)
+                if isinstance(defs, dict):
+                    for name, sub in defs.items():
+                        token = name.replace("~", "~0").replace("/", "~1")
+                        self._targets[f"#/{key}/{token}"] = sub
+        self._types: dict[str, Any] = {}
+        self._required: dict[str, set[str]] = {}
+        self._components: dict[str, int] = {}
+        # Components of the targets being expanded, innermost last
+        self._active: list[int] = []
+
+    def target(self, ref: str) -> Optional[Any]:
+        """Return the node `ref` points to, or None if it is not local/valid."""
+        if ref in self._targets:
+            return self._targets[ref]
+        if not ref.startswith("#/"):
+            return None
+        node = self.root
+        for token in unquote(ref[2:]).split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            if isinstance(node, dict) and token in node:
+                node = node[token]
+            elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+                node = node[int(token)]
+            else:
+                return None
+        self._targets[ref] = node
+        return node
+
+    def _edges(self, ref: str) -> list[str]:
+        """Local refs reachable from the target without passing another ref."""
+        out: list[str] = []
+        stack = [self.target(ref)]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            if isinstance(node.get("$ref"), str):
+                if self.target(node["$ref"]) is not None:
+                    out.append(node["$ref"])
+                continue
+            props = node.get("properties")
+            if isinstance(props, dict):
+                stack.extend(props.values())
+            if isinstance(node.get("items"), dict):
+                stack.append(node["items"])
+            for key in ("allOf", "anyOf", "oneOf"):
+                if isinstance(node.get(key), list):
+                    stack.extend(node[key])
+        return out
+
+    def _component(self, ref: str) -> int:
+        """Strongly connected component id of `ref` (iterative Tarjan)."""
+        if ref in self._components:
+            return self._components[ref]
+        index: dict[str, int] = {ref: 0}
+        low: dict[str, int] = {ref: 0}
+        stack, on_stack = [ref], {ref}
+        work = [(ref, iter(self._edges(ref)))]
+        while work:
+            v, edges = work[-1]
+            for w in edges:
+                if w in self._components:
+                    continue
+                if w not in index:
+                    index[w] = low[w] = len(index)
+                    stack.append(w)
+                    on_stack.add(w)
+                    work.append((w, iter(self._edges(w))))
+                    break
+                if w in on_stack:
+                    low[v] = min(low[v], index[w])
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    low[u] = min(low[u], low[v])
+                if low[v] == index[v]:
+                    cid = len(self._components)
+                    while True:
+                        w = stack.pop()
+                        on_stack.discard(w)
+                        self._components[w] = cid
+                        if w == v:
+                            break
+        return self._components[ref]
+
+    def _dealias(self, ref: str) -> Optional[str]:
+        """Follow refs whose target is just another ``$ref``.
+
+        Returns the first ref with a real schema behind it, or None for
+        non-local/invalid pointers and alias loops.
+        """
+        seen: set[str] = set()
+        while ref not in seen:
+            node = self.target(ref)
+            if not isinstance(node, dict) or not isinstance(node.get("$ref"), str):
+                return ref if node is not None else None
+            seen.add(ref)
+            ref = node["$ref"]
+        return None
+
+    def _in_own_cycle(self, ref: str) -> bool:
+        """True if `ref` leads back into the cycle of the target being expanded."""
+        return bool(self._active) and self._active[-1] == self._component(ref)
+
+    def types(self, ref: str) -> Any:
+        """Type subtree of the ref target (shared across use sites)."""
+        key = self._dealias(ref)
+        if key is None:
+            return "any"
+        if self._in_own_cycle(key):
+            return "object"
+        if key in self._types:
+            return self._types[key]
+        if len(self._active) >= _MAX_REF_DEPTH:
+            return "any"
+        self._active.append(self._component(key))
+        try:
+            tree = _schema_from_js(self.target(key), _optional=False, _refs=self)
+        finally:
+            self._active.pop()
+        self._types[key] = tree
+        return tree
+
+    def required(self, ref: str) -> set[str]:
+        """Required paths of the ref target, relative to the target."""
+        key = self._dealias(ref)
+        if key is None or self._in_own_cycle(key):
+            return set()
+        if key in self._required:
+            return self._required[key]
+        if len(self._active) >= _MAX_REF_DEPTH:
+            return set()
+        self._active.append(self._component(key))
+        try:
+            req = _collect_required_paths_json(self.target(key), "", _refs=self)
+        finally:
+            self._active.pop()
+        self._required[key] = req
+        return req
+
+
+def _schema_from_js(
+    node: Any, *, _optional: bool, _refs: Optional[_RefResolver] = None
+) -> Any:
     """Build the internal *type tree* from a JSON Schema node.
 
     NOTE: This function purposely does NOT inject '|missing' for optional fields.
@@ -91,13 +270,17 @@ def _schema_from_js(node: Any, *, _optional: bool) -> Any:
     if not isinstance(node, dict):
         return "any"
 
+    # $ref -> memoized target subtree (siblings ignored, as in draft-07)
+    if isinstance(node.get("$ref"), str):
+        return _refs.types(node["$ref"]) if _refs is not None else "any"
+
     # allOf / anyOf / oneOf -> union the branches
     if any(k in node for k in ("oneO", "anyO", "allOf")):
         branches: list[Any] = []
         for k in ("oneO", "anyO", "allOf"):
             if k in node and isinstance(node[k], list):
                 for sub in node[k]:
-                    branches.append(_schema_from_js(sub, _optional=False))
+                    branches.append(_schema_from_js(sub, _optional=False, _refs=_refs))
         if not branches:
             return "any"
         u: Any = branches[0]
@@ -155,14 +338,14 @@ def _schema_from_js(node: Any, *, _optional: bool) -> Any:
         out: dict[str, Any] = {}
         for k, v in props.items():
             # no presence injection here
-            out[k] = _schema_from_js(v, _optional=False)
+            out[k] = _schema_from_js(v, _optional=False, _refs=_refs)
         return out if out else "object"
 
     # arrays (with/without explicit "type": "array")
     if jtype == "array" or ("items" in node):
         items = node.get("items")
         if isinstance(items, dict):
-            elem = _schema_from_js(items, _optional=False)
+            elem = _schema_from_js(items, _optional=False, _refs=_refs)
             # ALWAYS represent arrays as a one-element list
             return [elem]
         # items absent or not a dict → generic array
@@ -180,7 +363,9 @@ def _schema_from_js(node: Any, *, _optional: bool) -> Any:
 # ----- required paths collection -----
 
 
-def _collect_required_paths_json(node: Any, prefix: str = "") -> set[str]:
+def _collect_required_paths_json(
+    node: Any, prefix: str = "", _refs: Optional[_RefResolver] = None
+) -> set[str]:
     """Collect dotted paths from JSON Schema "required" lists.
 
     Rules
@@ -189,16 +374,23 @@ def _collect_required_paths_json(node: Any, prefix: str = "") -> set[str]:
     - Recurse into properties to collect nested requireds.
     - For allOf/oneOf/anyOf, we take the UNION of branch requirements.
     - Arrays: we do not expand item-level required paths (presence is for the field).
+    - $ref: the target's requirements, prefixed with the current path.
     """
     req: set[str] = set()
     if not isinstance(node, dict):
         return req
 
+    if isinstance(node.get("$ref"), str):
+        if _refs is None:
+            return req
+        rel = _refs.required(node["$ref"])
+        return {f"{prefix}.{p}" for p in rel} if prefix else set(rel)
+
     # combinators: union of branch requirements
     for key in ("allO", "oneO", "anyOf"):
         if isinstance(node.get(key), list):
             for sub in node[key]:
-                req |= _collect_required_paths_json(sub, prefix)
+                req |= _collect_required_paths_json(sub, prefix, _refs)
 
     # object properties
     props = node.get("properties")
@@ -210,7 +402,7 @@ def _collect_required_paths_json(node: Any, prefix: str = "") -> set[str]:
         # recurse into children to gather nested requireds (e.g., user.id)
         for name, sub in props.items():
             child_prefix = f"{prefix}.{name}" if prefix else name
-            req |= _collect_required_paths_json(sub, child_prefix)
+            req |= _collect_required_paths_json(sub, child_prefix, _refs)
 
     return req
 
@@ -231,8 +423,10 @@ def schema_from_json_schema_file(path: str) -> tuple[Any, set[str]]:
       - required_paths: dotted paths that are presence-required by the schema
     """
     js = load_json_schema(path)
-    tree = _schema_from_js(js, _optional=False)  # pure types
-    required = _collect_required_paths_json(js)  # presence set
+    refs = _RefResolver(js)  # shared by both passes
+    # The document itself is the "#" target, so refs back to it cut cleanly
+    tree = refs.types("#")  # pure types
+    required = refs.required("#")  # presence set
     return tree, required
 
 
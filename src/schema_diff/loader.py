@@ -19,13 +19,15 @@ This module now uses the ParserFactory pattern for better extensibility and type
 
 from __future__ import annotations
 
-import json
+import io
+from collections.abc import Sequence
 from typing import Any
 
+import ijson
+
 from .exceptions import ArgumentError, ConfigurationError
 from .io_utils import open_text, sniff_ndjson
 from .parser_factory import ParserFactory
-from .protobuf_schema_parser import list_protobuf_messages
 
 __all__ = [
     "load_left_or_right",
@@ -58,6 +60,43 @@ KIND_AUTO = "auto"
 # ---- Small helpers --------------------------------------------------------
 
 
+def _json_root_summary(buf: str) -> dict[str, Any]:
+    """Shallow view of a JSON object from a (possibly truncated) peek.
+
+    Top-level scalars are kept, top-level objects become dicts of their own
+    keys (nested containers as None) and top-level arrays become []. Events
+    are read until the peek runs out, so a manifest or schema cut off after
+    128 KiB still shows its root keys instead of failing to parse.
+    """
+    root: dict[str, Any] = {}
+    child: Any = None
+    key = subkey = ""
+    depth = 0
+    try:
+        for _prefix, event, value in ijson.parse(io.BytesIO(buf.encode("utf-8"))):
+            if event in ("start_map", "start_array"):
+                depth += 1
+                if depth == 2:
+                    child = {} if event == "start_map" else []
+                    root[key] = child
+                elif depth == 3 and isinstance(child, dict):
+                    child[subkey] = None
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            elif event == "map_key":
+                if depth == 1:
+                    key = value
+                elif depth == 2:
+                    subkey = value
+            elif depth == 1:
+                root[key] = value
+            elif depth == 2 and isinstance(child, dict):
+                child[subkey] = value
+    except ijson.JSONError:
+        pass
+    return root
+
+
 def _sniff_json_kind(path: str) -> str | None:
     """Peek into a .json/.json.gz (or similar) and try to distinguish:
 
@@ -90,14 +129,7 @@ def _sniff_json_kind(path: str) -> str | None:
 
     # Try JSON object root
     if s.startswith("{"):
-        try:
-            obj = json.loads(buf)
-        except Exception:
-            # Likely a very large single JSON record that was truncated in the peek
-            return KIND_DATA
-
-        if not isinstance(obj, dict):
-            return KIND_DATA
+        obj = _json_root_summary(buf)
 
         # BigQuery API JSON signatures (check before dbt manifest)
         if (
@@ -264,6 +296,7 @@ def load_left_or_right(
     sql_table: str | None = None,
     dbt_model: str | None = None,
     proto_message: str | None = None,
+    proto_include: Sequence[str] = (),
 ) -> tuple[Any, set[str], str]:
     """Load `path` as either a DATA source or a SCHEMA source and return: (type_tree,
     required_paths, label)
@@ -288,6 +321,8 @@ def load_left_or_right(
         Model name to extract from dbt manifest/schema files
     proto_message : Optional[str]
         Message name to extract from Protobuf .proto files
+    proto_include : Sequence[str]
+        Directories searched for Protobuf imports (like protoc's ``-I``)
 
     Returns
     -------
@@ -313,7 +348,7 @@ def load_left_or_right(
 
     # Handle Protobuf message selection (special case)
     if chosen == KIND_PROTOBUF:
-        return _handle_protobuf_parsing(path, proto_message)
+        return _handle_protobuf_parsing(path, proto_message, proto_include)
 
     # Use ParserFactory for standard parsing
     try:
@@ -367,7 +402,7 @@ def _handle_bigquery_live_table(path: str) -> tuple[Any, set[str], str]:
 
     # Use default project if not specified
     try:
-        from google.cloud import bigquery
+        from google.cloud import bigquery  # noqa: F401
     except ImportError as e:
         from .exceptions import DependencyError
 
@@ -383,8 +418,9 @@ def _handle_bigquery_live_table(path: str) -> tuple[Any, set[str], str]:
     else:
         # Try to get default project
         try:
-            client = bigquery.Client()
-            project_id = client.project
+            from .bigquery_utils import get_bigquery_client
+
+            project_id = get_bigquery_client().project
         except Exception as e:
             raise ConfigurationError(
                 "No project specified and unable to determine default project. Use format: project:dataset.table",
@@ -398,15 +434,18 @@ def _handle_bigquery_live_table(path: str) -> tuple[Any, set[str], str]:
 
 
 def _handle_protobuf_parsing(
-    path: str, proto_message: str | None
+    path: str, proto_message: str | None, proto_include: Sequence[str] = ()
 ) -> tuple[Any, set[str], str]:
     """Handle Protobuf message selection and parsing."""
-    from .protobuf_schema_parser import schema_from_protobuf_file
+    from .protobuf_schema_parser import ProtoWorkspace
+
+    # One workspace: listing and schema building share the parsed files
+    workspace = ProtoWorkspace(proto_include)
 
     # Autoselect single message; prompt if multiple
     if not proto_message:
         try:
-            msgs = list_protobuf_messages(path)  # List[str]
+            msgs = workspace.list_messages(path)  # List[str]
         except Exception:
             msgs = []
         if len(msgs) == 1:
@@ -423,7 +462,7 @@ def _handle_protobuf_parsing(
             )
         # else: zero → let the parser raise a clear error
 
-    tree, required, selected = schema_from_protobuf_file(path, message=proto_message)
+    tree, required, selected = workspace.schema(path, message=proto_message)
     label = (
         f"{path}#{selected or proto_message}" if (selected or proto_message) else path
     )
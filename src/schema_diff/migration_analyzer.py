@@ -7,8 +7,15 @@ providing generic impact assessment and recommendations.
 from __future__ import annotations
 
 import datetime
-from dataclasses import dataclass
-from typing import Any, Optional
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .rename_detection import match_renames
+
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
 @dataclass
@@ -39,6 +46,16 @@ class MigrationAnalysis:
     # Full schema-diff output for reference
     full_diff_output: Optional[str] = None
 
+    # Structured diff report the analysis was built from
+    diff_report: Optional[dict[str, Any]] = None
+
+    # Removed/added field pairs that look like renames
+    renames: list[dict[str, Any]] = field(default_factory=list)
+
+    # Removed/added fields that are not part of a likely rename
+    removed_fields: list[str] = field(default_factory=list)
+    added_fields: list[str] = field(default_factory=list)
+
 
 def analyze_migration_impact(
     diff_report: dict[str, Any],
@@ -54,7 +71,9 @@ def analyze_migration_impact(
         source_label: Label for source schema/data
         target_label: Label for target schema/data
         commands_used: List of commands used to generate the analysis
-        full_diff_output: Complete schema-diff output for reference
+        full_diff_output: Console schema-diff output; when given, the markdown
+            report ends with a full-diff section rendered from `diff_report`
+            (the text itself is only used when no report is available)
 
     Returns:
         MigrationAnalysis with structured assessment
@@ -67,21 +86,34 @@ def analyze_migration_impact(
     presence_changes = len(diff_report.get("presence_issues", []))
     path_changes = len(diff_report.get("path_changes", []))
 
+    # Likely renames are reported as such rather than as a removal plus an
+    # addition; reports without candidates are matched by name only
+    removed_fields = diff_report.get("only_in_file1", [])
+    added_fields = diff_report.get("only_in_file2", [])
+    renames = diff_report.get("rename_candidates")
+    if renames is None:
+        renames = match_renames(
+            dict.fromkeys(removed_fields), dict.fromkeys(added_fields)
+        )
+    renamed_from = {r["left"] for r in renames}
+    renamed_to = {r["right"] for r in renames}
+    removed_fields = [f for f in removed_fields if f not in renamed_from]
+    added_fields = [f for f in added_fields if f not in renamed_to]
+
     # Analyze breaking changes
     breaking_changes: list[str] = []
     warnings: list[str] = []
     recommendations: list[str] = []
 
     # Critical analysis based on schema differences
+    _analyze_renames(renames, warnings, recommendations)
     _analyze_field_removals(
-        only_in_source, diff_report.get("only_in_file1", []), breaking_changes, warnings
+        len(removed_fields), removed_fields, breaking_changes, warnings
     )
     _analyze_type_mismatches(
         type_mismatches, diff_report.get("schema_mismatches", []), breaking_changes
     )
-    _analyze_field_additions(
-        only_in_target, diff_report.get("only_in_file2", []), warnings, recommendations
-    )
+    _analyze_field_additions(len(added_fields), added_fields, warnings, recommendations)
     _analyze_presence_changes(
         presence_changes, diff_report.get("presence_issues", []), recommendations
     )
@@ -104,6 +136,28 @@ def analyze_migration_impact(
         recommendations=recommendations,
         commands_used=commands_used or [],
         full_diff_output=full_diff_output,
+        renames=renames,
+        removed_fields=removed_fields,
+        added_fields=added_fields,
+        diff_report=diff_report,
+    )
+
+
+def _analyze_renames(
+    renames: list[dict[str, Any]], warnings: list[str], recommendations: list[str]
+) -> None:
+    """Analyze fields that were most likely renamed."""
+    if not renames:
+        return
+
+    if len(renames) <= 5:
+        pairs = ", ".join(f"`{r['left']}` → `{r['right']}`" for r in renames)
+        warnings.append(f"Fields likely renamed: {pairs}")
+    else:
+        warnings.append(f"Multiple fields likely renamed: {len(renames)} fields")
+
+    recommendations.append(
+        "Map renamed fields in migration scripts instead of dropping and re-adding them"
     )
 
 
@@ -146,19 +200,19 @@ def _analyze_field_removals(
     critical_fields = []
     regular_fields = []
 
-    for field in removed_fields:
-        field_name = field.split(".")[-1].lower()
+    for path in removed_fields:
+        field_name = path.split(".")[-1].lower()
         if any(pattern in field_name for pattern in critical_patterns):
-            critical_fields.append(field)
+            critical_fields.append(path)
         else:
-            regular_fields.append(field)
+            regular_fields.append(path)
 
     # Report critical field removals as breaking changes
     if critical_fields:
         if len(critical_fields) <= 3:
-            for field in critical_fields:
+            for path in critical_fields:
                 breaking_changes.append(
-                    f"Potentially critical field removed: `{field}`"
+                    f"Potentially critical field removed: `{path}`"
                 )
         else:
             breaking_changes.append(
@@ -220,12 +274,12 @@ def _analyze_field_additions(
     metadata_fields = []
     business_fields = []
 
-    for field in added_fields:
-        field_name = field.split(".")[-1].lower()
+    for path in added_fields:
+        field_name = path.split(".")[-1].lower()
         if any(pattern in field_name for pattern in metadata_patterns):
-            metadata_fields.append(field)
+            metadata_fields.append(path)
         else:
-            business_fields.append(field)
+            business_fields.append(path)
 
     # Report metadata field additions
     if metadata_fields:
@@ -307,6 +361,32 @@ def generate_migration_report(
         return _generate_markdown_report(analysis)
 
 
+def write_migration_report(
+    analysis: MigrationAnalysis,
+    path: Union[str, Path],
+    format: str = "markdown",
+) -> Path:
+    """Write a migration report to `path` (markdown is written line by line).
+
+    Args:
+        analysis: MigrationAnalysis results
+        path: Destination file
+        format: Output format ('markdown', 'text', or 'json')
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        if format in ("json", "text"):
+            fh.write(generate_migration_report(analysis, format=format))
+            return path
+        for i, line in enumerate(_iter_markdown_report(analysis)):
+            fh.write(f"\n{line}" if i else line)
+    return path
+
+
 def _count_audit_fields(added_count: int, analysis: MigrationAnalysis) -> int:
     """Count audit-related fields in the added fields."""
     # This is a simplified version - in a real implementation, you'd analyze the actual field names
@@ -317,7 +397,12 @@ def _count_audit_fields(added_count: int, analysis: MigrationAnalysis) -> int:
 
 def _generate_markdown_report(analysis: MigrationAnalysis) -> str:
     """Generate markdown migration report."""
-    report_lines = [
+    return "\n".join(_iter_markdown_report(analysis))
+
+
+def _iter_markdown_report(analysis: MigrationAnalysis) -> Iterator[str]:
+    """Yield markdown migration report lines as they are rendered."""
+    yield from [
         "# 📊 Schema Migration Analysis",
         "",
         "## Migration Overview",
@@ -330,100 +415,91 @@ def _generate_markdown_report(analysis: MigrationAnalysis) -> str:
 
     # Generate compatibility summary with emojis and clear messaging
     common_count = analysis.common_fields
-    removed_count = analysis.only_in_source
-    added_count = analysis.only_in_target
+    # Likely renames are listed on their own, not as a removal plus an addition
+    removed_count = len(analysis.removed_fields)
+    added_count = len(analysis.added_fields)
     type_conflicts = analysis.type_mismatches
     nullability_changes = analysis.presence_changes
     structure_changes = analysis.path_changes
 
     # Format exactly like final_demo.md
     if common_count > 50:
-        report_lines.append(
-            f"- ✅ **{common_count} common fields** - good compatibility"
-        )
+        yield f"- ✅ **{common_count} common fields** - good compatibility"
     elif common_count > 20:
-        report_lines.append(
-            f"- ⚠️ **{common_count} common fields** - moderate compatibility"
-        )
+        yield f"- ⚠️ **{common_count} common fields** - moderate compatibility"
     else:
-        report_lines.append(
-            f"- ❌ **{common_count} common fields** - limited compatibility"
-        )
+        yield f"- ❌ **{common_count} common fields** - limited compatibility"
 
     # Breaking changes assessment
     breaking_count = len(analysis.breaking_changes)
     if breaking_count > 0:
-        report_lines.append(
-            f"- ❌ **Critical issues**: {breaking_count} breaking changes"
-        )
+        yield f"- ❌ **Critical issues**: {breaking_count} breaking changes"
 
     # Field changes
     if removed_count > 0:
-        report_lines.append(f"- ⚠️ **{removed_count} fields removed**")
+        yield f"- ⚠️ **{removed_count} fields removed**"
     if added_count > 0:
-        report_lines.append(f"- ➕ **{added_count} new fields** added")
+        yield f"- ➕ **{added_count} new fields** added"
+    if analysis.renames:
+        yield f"- ✏️ **{len(analysis.renames)} fields likely renamed**"
 
     # Type compatibility
     if type_conflicts == 0:
-        report_lines.append(
-            f"- 🎯 **{type_conflicts} type mismatches** - perfect data type compatibility"
-        )
+        yield f"- 🎯 **{type_conflicts} type mismatches** - perfect data type compatibility"
     else:
-        report_lines.append(
-            f"- 🔄 **{type_conflicts} type mismatches** - requires data transformation"
-        )
+        yield f"- 🔄 **{type_conflicts} type mismatches** - requires data transformation"
 
     # Nullability changes
     if nullability_changes > 0:
-        report_lines.append(f"- 🔄 **{nullability_changes} nullability changes**")
+        yield f"- 🔄 **{nullability_changes} nullability changes**"
 
     # Critical Issues section
     if analysis.breaking_changes:
-        report_lines.extend(["", "## ❌ Critical Issues", ""])
-        report_lines.append("These issues **must** be addressed before migration:")
-        report_lines.append("")
+        yield from ["", "## ❌ Critical Issues", ""]
+        yield "These issues **must** be addressed before migration:"
+        yield ""
 
         for i, change in enumerate(analysis.breaking_changes, 1):
             # Clean up the change text to remove redundant prefixes
             clean_change = change.replace("Potentially critical field removed: ", "")
-            report_lines.append(
-                f"{i}. **Field removal**: `{clean_change}` will be lost during migration"
-            )
-        report_lines.append("")
+            yield f"{i}. **Field removal**: `{clean_change}` will be lost during migration"
+        yield ""
 
     # Warnings section
     warnings_exist = (
         removed_count > 0
         or _count_audit_fields(added_count, analysis) > 10
         or structure_changes > 0
+        or bool(analysis.renames)
     )
 
     if warnings_exist:
-        report_lines.extend(["## ⚠️ Warnings", ""])
-        report_lines.append("Review these changes for potential impact:")
-        report_lines.append("")
+        yield from ["## ⚠️ Warnings", ""]
+        yield "Review these changes for potential impact:"
+        yield ""
 
         warning_count = 1
         if removed_count > 0:
-            report_lines.append(
-                f"{warning_count}. **{removed_count} fields removed** - Verify no critical data loss"
-            )
+            yield f"{warning_count}. **{removed_count} fields removed** - Verify no critical data loss"
             warning_count += 1
 
         audit_fields = _count_audit_fields(added_count, analysis)
         if audit_fields > 10:
-            report_lines.append(
-                f"{warning_count}. **{audit_fields} new audit fields** - Storage and performance impact"
-            )
+            yield f"{warning_count}. **{audit_fields} new audit fields** - Storage and performance impact"
             warning_count += 1
 
         if structure_changes > 0:
-            report_lines.append(
-                f"{warning_count}. **{structure_changes} fields relocated** - Update field mappings"
+            yield f"{warning_count}. **{structure_changes} fields relocated** - Update field mappings"
+            warning_count += 1
+
+        for rename in analysis.renames:
+            yield (
+                f"{warning_count}. **Likely rename**: `{rename['left']}` → "
+                f"`{rename['right']}` (similarity {rename['score']:.2f})"
             )
             warning_count += 1
 
-        report_lines.append("")
+        yield ""
 
     # Compatibility assessment
     total_changes = (
@@ -442,393 +518,128 @@ def _generate_markdown_report(analysis: MigrationAnalysis) -> str:
     else:
         compatibility = "🔄 **Significant Changes** - Careful migration planning needed"
 
-    report_lines.extend(
-        [
-            "## 🎯 Migration Recommendation",
-            "",
-            compatibility,
-            "",
-        ]
-    )
+    yield from [
+        "## 🎯 Migration Recommendation",
+        "",
+        compatibility,
+        "",
+    ]
 
     # Recommendations
     if analysis.recommendations:
-        report_lines.extend(
-            [
-                "## 💡 Recommendations",
-                "",
-                "Consider these actions for a smooth migration:",
-                "",
-            ]
-        )
+        yield from [
+            "## 💡 Recommendations",
+            "",
+            "Consider these actions for a smooth migration:",
+            "",
+        ]
         for rec in analysis.recommendations:
-            report_lines.append(f"- {rec}")
-        report_lines.append("")
+            yield f"- {rec}"
+        yield ""
 
     # Commands used
     if analysis.commands_used:
-        report_lines.extend(
-            [
-                "## 🔧 Analysis Commands",
-                "",
-                "Commands used to generate this analysis:",
-                "",
-            ]
-        )
+        yield from [
+            "## 🔧 Analysis Commands",
+            "",
+            "Commands used to generate this analysis:",
+            "",
+        ]
         for cmd in analysis.commands_used:
-            report_lines.append(f"```bash\n{cmd}\n```")
-        report_lines.append("")
+            yield f"```bash\n{cmd}\n```"
+        yield ""
 
-    # Full diff output
+    # Full diff output (only when the caller supplied one), rendered from the
+    # structured report when available
     if analysis.full_diff_output:
-        report_lines.extend(
-            [
-                "---",
-                "",
-                "## 📊 Full Schema-Diff Output",
-                "",
-                "For complete technical reference, here is the detailed schema-diff analysis:",
-                "",
-            ]
-        )
-
-        # Format the console output with enhanced markdown
-        formatted_diff = _format_console_output_for_markdown(analysis.full_diff_output)
-        report_lines.append(formatted_diff)
-
-        report_lines.extend(
-            [
-                "",
-                "</details>",
-            ]
-        )
-
-    return "\n".join(report_lines)
-
-
-def _format_console_output_for_markdown(diff_output: str) -> str:
-    """Format console output as enhanced markdown with collapsible sections and.
+        yield from [
+            "---",
+            "",
+            "## 📊 Full Schema-Diff Output",
+            "",
+            "For complete technical reference, here is the detailed schema-diff analysis:",
+            "",
+        ]
 
-    color coding.
-    """
-    if not diff_output.strip():
-        return "No differences found."
-
-    # Strip ANSI color codes
-    import re
-
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    clean_output = ansi_escape.sub("", diff_output)
-
-    lines = clean_output.strip().split("\n")
-    formatted_lines = []
-
-    # Parse the output into sections
-    sections = _parse_diff_output(lines)
-
-    # Format each section
-    for section in sections:
-        if section["type"] == "header":
-            formatted_lines.extend(_format_header_section(section))
-        elif section["type"] == "common":
-            formatted_lines.extend(_format_common_section(section))
-        elif section["type"] == "only_in":
-            formatted_lines.extend(_format_only_in_section(section))
-        elif section["type"] == "missing_data":
-            formatted_lines.extend(_format_missing_data_section(section))
-        elif section["type"] == "type_mismatches":
-            formatted_lines.extend(_format_type_mismatches_section(section))
-        elif section["type"] == "path_changes":
-            formatted_lines.extend(_format_path_changes_section(section))
-
-    return "\n".join(formatted_lines)
-
-
-def _parse_diff_output(lines: list[str]) -> list[dict[str, Any]]:
-    """Parse the console output into structured sections."""
-    sections: list[dict[str, Any]] = []
-    current_section: Optional[dict[str, Any]] = None
-    field_list: list[str] = []
-    path_changes_data: dict[str, dict[str, list[str]]] = {}
-    current_field = None
-    current_subsection = None
-    parsed_source_file = ""
-    parsed_target_file = ""
-
-    for line in lines:
-        line = line.rstrip()
-
-        # Skip empty lines at the start
-        if not line and not sections:
-            continue
-
-        # Common fields header (appears before main schema diff)
-        if line.startswith("-- Common fields") and "∩" in line:
-            if current_section:
-                if current_section["type"] == "path_changes":
-                    current_section["data"] = path_changes_data.copy()
-                    path_changes_data = {}
-                else:
-                    current_section["fields"] = field_list[:]
-                sections.append(current_section)
-                field_list = []
-
-            # Extract count
-            section_count = "0"
-            if "(" in line and ")" in line:
-                section_count = line[line.rfind("(") + 1 : line.rfind(")")]
-
-            current_section = {"type": "common", "count": section_count, "fields": []}
-            continue
-
-        # Main header
-        if line.startswith("=== Schema diff"):
-            if current_section:
-                if current_section["type"] == "path_changes":
-                    current_section["data"] = path_changes_data.copy()
-                    path_changes_data = {}
-                else:
-                    current_section["fields"] = field_list[:]
-                sections.append(current_section)
-                field_list = []
-
-            # Extract source and target file names from header
-            header_text = line.replace("===", "").strip()
-            if "→" in header_text:
-                parts = header_text.split("→")
-                if len(parts) >= 2:
-                    source_part = parts[0].strip()
-                    target_part = parts[1].strip()
-                    # Extract file names (remove "Schema diff (types only," prefix)
-                    if "," in source_part:
-                        parsed_source_file = source_part.split(",")[-1].strip()
-                    if ")" in target_part:
-                        parsed_target_file = target_part.split(")")[0].strip()
-
-            sections.append(
-                {
-                    "type": "header",
-                    "text": header_text,
-                    "source_file": parsed_source_file,
-                    "target_file": parsed_target_file,
-                }
+        if analysis.diff_report is not None:
+            yield from _iter_diff_markdown(
+                analysis.diff_report, analysis.source_label, analysis.target_label
             )
-            current_section = None
-            continue
-
-        # Section headers (handle both "-- text --" and "-- text -- (count)" formats)
-        if line.startswith("-- ") and (" --" in line):
-            if current_section:
-                if current_section["type"] == "path_changes":
-                    current_section["data"] = path_changes_data.copy()
-                    path_changes_data = {}
-                else:
-                    current_section["fields"] = field_list[:]
-                sections.append(current_section)
-                field_list = []
-
-            section_name = line.replace("--", "").strip()
-            section_count = "0"
-            if "(" in section_name and ")" in section_name:
-                section_count = section_name[
-                    section_name.rfind("(") + 1 : section_name.rfind(")")
-                ]
-                section_name = section_name[: section_name.rfind("(")].strip()
-
-            if "Only in" in section_name:
-                # Determine source/target
-                is_source = True
-                source_name = section_name.replace("Only in", "").strip()
-                # Look for arrow in header to determine direction
-                header_line = next(
-                    (
-                        line_item
-                        for line_item in lines
-                        if "→" in line_item and "Schema diff" in line_item
-                    ),
-                    "",
-                )
-                if header_line and "→" in header_line:
-                    header_parts = header_line.split("→")
-                    if len(header_parts) >= 2:
-                        left_part = header_parts[0].strip()
-                        is_source = source_name in left_part
-
-                current_section = {
-                    "type": "only_in",
-                    "is_source": is_source,
-                    "source_name": source_name,
-                    "count": section_count,
-                    "fields": [],
-                }
-            elif "Missing Data" in section_name or "NULL-ABILITY" in section_name:
-                current_section = {
-                    "type": "missing_data",
-                    "count": section_count,
-                    "fields": [],
-                }
-            elif "Type mismatches" in section_name:
-                current_section = {
-                    "type": "type_mismatches",
-                    "count": section_count,
-                    "fields": [],
-                }
-            elif "Path changes" in section_name:
-                current_section = {
-                    "type": "path_changes",
-                    "count": section_count,
-                    "data": {},
-                    "source_file": parsed_source_file,
-                    "target_file": parsed_target_file,
-                }
-            continue
-
-        # Field entries (lines that start with spaces) - but not for path changes which has special structure
-        if (
-            line.startswith("  ")
-            and line.strip()
-            and current_section
-            and current_section["type"] != "path_changes"
-        ):
-            field_list.append(line.strip())
-            continue
-
-        # Path changes content
-        if current_section and current_section["type"] == "path_changes":
-            if (
-                line.strip()
-                and line.endswith(":")
-                and not line.strip().startswith("Shared")
-                and not line.strip().startswith("Only in")
-            ):
-                # Field name for path changes (e.g., "company_id:")
-                field_name = line.strip().rstrip(":")
-                path_changes_data[field_name] = {
-                    "shared": [],
-                    "only_in_source": [],
-                    "only_in_target": [],
-                }
-                current_field = field_name
-                continue
-            elif (
-                line.strip()
-                and line.endswith(":")
-                and ("Shared field locations" in line or "Only in" in line)
-            ):
-                # Subsection headers (e.g., "Shared field locations and/or field paths:", "Only in data/...")
-                if "Shared field locations" in line:
-                    current_subsection = "shared"
-                elif "Only in" in line:
-                    # Determine if this is source or target based on the file name
-                    source_part = line.split(":")[0].strip()
-                    # Look for the arrow in the main header to determine source vs target
-                    header_line = next(
-                        (
-                            line_item
-                            for line_item in lines
-                            if "→" in line_item and "Schema diff" in line_item
-                        ),
-                        "",
-                    )
-                    if header_line and "→" in header_line:
-                        header_parts = header_line.split("→")
-                        if len(header_parts) >= 2:
-                            left_part = header_parts[0].strip()
-                            # Check if the source name appears in the left part (source)
-                            source_file_part = source_part.replace(
-                                "Only in", ""
-                            ).strip()
-                            if source_file_part in left_part:
-                                current_subsection = "only_in_source"
-                            else:
-                                current_subsection = "only_in_target"
-                        else:
-                            current_subsection = "only_in_source"  # Default
-                    else:
-                        current_subsection = "only_in_source"  # Default
-                continue
-            elif (
-                line.strip()
-                and line.startswith("      •")
-                and current_field
-                and current_subsection
-            ):
-                # Path entry (e.g., "      • experience[].company_id")
-                if current_field in path_changes_data:
-                    path_entry = line.strip().lstrip("•").strip()
-                    path_changes_data[current_field][current_subsection].append(
-                        path_entry
-                    )
-                continue
-
-    # Add final section
-    if current_section:
-        if current_section["type"] == "path_changes":
-            current_section["data"] = path_changes_data
         else:
-            current_section["fields"] = field_list
-        sections.append(current_section)
+            # Console text supplied by the caller is included verbatim
+            console_text = _ANSI_ESCAPE.sub("", analysis.full_diff_output).strip()
+            yield from ["```", console_text, "```"]
 
-    return sections
 
+def _iter_diff_markdown(
+    report: dict[str, Any], source_label: str, target_label: str
+) -> Iterator[str]:
+    """Yield markdown for a structured diff report, section by section."""
+    yield from _format_header_section(source_label, target_label)
 
-def _format_header_section(section: dict) -> list[str]:
-    """Format the main header section."""
-    # Extract and format file names from the header text
-    header_text = (
-        section["text"].replace("Schema diff (types only,", "").replace(")", "").strip()
-    )
-
-    # Format file names with bold backticks if arrow is present
-    if "→" in header_text:
-        parts = header_text.split("→")
-        if len(parts) == 2:
-            left_file = parts[0].strip()
-            right_file = parts[1].strip()
+    if "common_fields" in report:
+        yield from _format_common_section(sorted(report["common_fields"]))
+    if report.get("note") == "No differences":
+        yield "No differences found."
+        return
 
-            # Clean up any extra text like "; all 100000 vs 100000 records"
-            if ";" in right_file:
-                right_file = right_file.split(";")[0].strip()
+    yield from _format_only_in_section(report.get("only_in_file1", []), True)
+    yield from _format_only_in_section(report.get("only_in_file2", []), False)
+    yield from _format_changes_section(
+        report.get("presence_issues", []),
+        "#### ⚠️ Presence Changes",
+        "Fields with **nullability** or presence differences between schemas",
+    )
+    yield from _format_changes_section(
+        report.get("schema_mismatches", []),
+        "#### 🔄 Type Conflicts",
+        "Fields with **incompatible data types** that require conversion",
+    )
+    if report.get("path_changes"):
+        yield from _format_path_changes_section(
+            report["path_changes"], source_label, target_label
+        )
 
-            formatted_text = f"**`{left_file}`** → **`{right_file}`**"
-        else:
-            formatted_text = header_text
-    else:
-        formatted_text = header_text
 
-    return ["### 📊 Schema Comparison", "", f"Comparing {formatted_text}", "", ""]
+def _format_header_section(source_label: str, target_label: str) -> list[str]:
+    """Format the main header section."""
+    return [
+        "### 📊 Schema Comparison",
+        "",
+        f"Comparing **`{source_label}`** → **`{target_label}`**",
+        "",
+        "",
+    ]
 
 
-def _format_common_section(section: dict) -> list[str]:
+def _format_common_section(fields: list[str]) -> list[str]:
     """Format the common fields section."""
     lines = [
-        f"#### ✅ Common Fields ({section['count']})",
+        f"#### ✅ Common Fields ({len(fields)})",
         "",
         "Fields present in **both** schemas with matching types",
         "",
         "",
         "<details>",
-        f"<summary><strong><small>&nbsp;&nbsp;&nbsp;&nbsp;View {section['count']} common fields</small></strong></summary>",
+        f"<summary><strong><small>&nbsp;&nbsp;&nbsp;&nbsp;View {len(fields)} common fields</small></strong></summary>",
         "",
     ]
-
-    if section["fields"]:
-        for field in section["fields"]:
-            lines.append(f"  - `{field}`")
-        lines.extend(["", "</details>", "", ""])
+    for field_path in fields:
+        lines.append(f"  - `{field_path}`")
+    lines.extend(["", "</details>", "", ""])
 
     return lines
 
 
-def _format_only_in_section(section: dict) -> list[str]:
+def _format_only_in_section(fields: list[str], is_source: bool) -> list[str]:
     """Format the 'only in' sections."""
-    if section["is_source"]:
+    if is_source:
         emoji = "⬅️"
-        title = f"Only in Source ({section['count']})"
+        title = f"Only in Source ({len(fields)})"
         description = "Fields that exist **only in source** data and will be **lost** in migration"
     else:
         emoji = "➡️"
-        title = f"Only in Target ({section['count']})"
+        title = f"Only in Target ({len(fields)})"
         description = "**New fields** that exist only in target data"
 
     lines = [
@@ -838,167 +649,80 @@ def _format_only_in_section(section: dict) -> list[str]:
         "",
         "",
         "<details>",
-        f"<summary><strong><small>&nbsp;&nbsp;&nbsp;&nbsp;View {section['count']} fields</small></strong></summary>",
-        "",
-    ]
-
-    if section["fields"]:
-        for field in section["fields"]:
-            lines.append(f"  - `{field}`")
-        lines.extend(["", "</details>", "", ""])
-
-    return lines
-
-
-def _format_missing_data_section(section: dict) -> list[str]:
-    """Format the missing data section."""
-    lines = [
-        f"#### ⚠️ Presence Changes ({section['count']})",
-        "",
-        "Fields with **nullability** or presence differences between schemas",
+        f"<summary><strong><small>&nbsp;&nbsp;&nbsp;&nbsp;View {len(fields)} fields</small></strong></summary>",
         "",
     ]
-
-    if section["fields"]:
-        for field in section["fields"]:
-            # Parse field name and type transition from format "field: type1 → type2"
-            if ": " in field:
-                field_name, type_transition = field.split(": ", 1)
-                lines.append(f"- **`{field_name}`**: `{type_transition}`")
-            else:
-                lines.append(f"- **`{field}`**")
-        lines.extend(["", "", "---", ""])
-    else:
-        lines.extend(["", "", "---", ""])
+    for field_path in fields:
+        lines.append(f"  - `{field_path}`")
+    lines.extend(["", "</details>", "", ""])
 
     return lines
 
 
-def _format_type_mismatches_section(section: dict) -> list[str]:
-    """Format the type mismatches section."""
-    lines = [
-        f"#### 🔄 Type Conflicts ({section['count']})",
-        "",
-        "Fields with **incompatible data types** that require conversion",
-        "",
-    ]
-
-    if section["fields"]:
-        for field in section["fields"]:
-            # Parse field name and type transition from format "field: type1 → type2"
-            if ": " in field:
-                field_name, type_transition = field.split(": ", 1)
-                lines.append(f"- **`{field_name}`**: `{type_transition}`")
-            else:
-                lines.append(f"- **`{field}`**")
-        lines.extend(["", "", "---", ""])
-    else:
-        lines.extend(["", "", "---", ""])
+def _format_changes_section(
+    entries: list[dict[str, Any]], heading: str, description: str
+) -> list[str]:
+    """Format presence or type changes (``{"path", "file1", "file2"}`` entries)."""
+    lines = [f"{heading} ({len(entries)})", "", description, ""]
+    for entry in entries:
+        lines.append(
+            f"- **`{entry['path']}`**: `{entry['file1']} → {entry['file2']}`"
+        )
+    lines.extend(["", "", "---", ""])
 
     return lines
 
 
-def _format_path_changes_section(section: dict) -> list[str]:
-    """Format the path changes section."""
+def _format_path_changes_section(
+    path_changes: list[dict[str, Any]], source_label: str, target_label: str
+) -> list[str]:
+    """Format the path changes section from `compute_path_changes` entries."""
     lines = [
-        f"#### 🔀 Path Changes ({section['count']})",
+        f"#### 🔀 Path Changes ({len(path_changes)})",
         "",
         "Same field names appearing in **different locations** across schemas",
         "",
     ]
 
-    source_file = section.get("source_file", "source")
-    target_file = section.get("target_file", "target")
+    def details(summary: str, paths: list[str]) -> list[str]:
+        out = [
+            "<details>",
+            f"<summary><small>&nbsp;&nbsp;&nbsp;&nbsp;{summary}</small></summary>",
+            "",
+            "",
+        ]
+        out.extend(f"  • `{p.replace('[0]', '[]')}`" for p in paths)
+        out.extend(["", "", "</details>", "", ""])
+        return out
 
-    field_counter = 1
-    for field_name, data in section["data"].items():
+    for field_counter, change in enumerate(path_changes, 1):
         # Add minor divider between fields (except for the first one)
         if field_counter > 1:
-            lines.extend(
-                [
-                    "",
-                    "--",
-                    "",
-                ]
-            )
-
-        lines.extend(
-            [
-                f"#### {field_counter}. **`{field_name}`**",
-                "",
-                "",
-                "",
-            ]
-        )
-
-        # Shared locations
-        if data["shared"]:
-            lines.extend(
-                [
-                    "<details>",
-                    "<summary><small>&nbsp;&nbsp;&nbsp;&nbsp;🔗 <strong>Shared</strong> field locations and/or field paths</small></summary>",
-                    "",
-                    "",
-                ]
-            )
-            for path in data["shared"]:
-                lines.append(f"  • `{path}`")
-            lines.extend(
-                [
-                    "",
-                    "",
-                    "</details>",
-                    "",
-                    "",
-                ]
-            )
+            lines.extend(["", "--", ""])
+        lines.extend([f"#### {field_counter}. **`{change['name']}`**", "", "", ""])
 
-        # Only in source
-        if data["only_in_source"]:
+        if change.get("shared"):
             lines.extend(
-                [
-                    "<details>",
-                    f"<summary><small>&nbsp;&nbsp;&nbsp;&nbsp;⬅️ <strong>Only in</strong> <code>{source_file}**</code></small></summary>",
-                    "",
-                    "",
-                ]
+                details(
+                    "🔗 <strong>Shared</strong> field locations and/or field paths",
+                    change["shared"],
+                )
             )
-            for path in data["only_in_source"]:
-                lines.append(f"  • `{path}`")
+        if change.get("left"):
             lines.extend(
-                [
-                    "",
-                    "",
-                    "</details>",
-                    "",
-                    "",
-                ]
-            )
-
-        # Only in target
-        if data["only_in_target"]:
-            lines.extend(
-                [
-                    "<details>",
-                    f"<summary><small>&nbsp;&nbsp;&nbsp;&nbsp;➡️ <strong>Only in</strong> <code>{target_file}**</code></small></summary>",
-                    "",
-                    "",
-                ]
+                details(
+                    f"⬅️ <strong>Only in</strong> <code>{source_label}</code>",
+                    change["left"],
+                )
             )
-            for path in data["only_in_target"]:
-                lines.append(f"  • `{path}`")
+        if change.get("right"):
             lines.extend(
-                [
-                    "",
-                    "",
-                    "",
-                    "</details>",
-                    "",
-                ]
+                details(
+                    f"➡️ <strong>Only in</strong> <code>{target_label}</code>",
+                    change["right"],
+                )
             )
 
-        field_counter += 1
-
     return lines
 
 
@@ -1015,8 +739,9 @@ def _generate_text_report(analysis: MigrationAnalysis) -> str:
         "SUMMARY STATISTICS",
         "-" * 20,
         f"Common fields: {analysis.common_fields}",
-        f"Fields removed: {analysis.only_in_source}",
-        f"Fields added: {analysis.only_in_target}",
+        f"Fields removed: {len(analysis.removed_fields)}",
+        f"Fields added: {len(analysis.added_fields)}",
+        f"Fields likely renamed: {len(analysis.renames)}",
         f"Type conflicts: {analysis.type_mismatches}",
         f"Nullability changes: {analysis.presence_changes}",
         f"Structure changes: {analysis.path_changes}",
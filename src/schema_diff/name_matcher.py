@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Compiled matchers for the field-name catalogs in `analyze_config`.
+
+The anti-pattern and policy-tag checks classify every field name against
+keyword catalogs (PII indicators, secret suffixes, money/epoch/enum
+keywords, ...). Looping over every catalog entry per name makes the cost
+grow with the catalog; here each catalog is compiled once into an automaton
+whose cost is proportional to the length of the name instead:
+
+- substring catalogs become an Aho-Corasick automaton (one pass over the
+  name finds every keyword it contains)
+- prefix/suffix catalogs become a character trie walked from either end
+- token catalogs (``credit_card`` matches ``card_credit_no``) become an
+  inverted index from token to the indicators that need it
+
+Results are memoized per name, so the same column name seen across
+thousands of tables is classified once. Compiled matchers are cached per
+catalog object; catalogs are treated as immutable, and rebinding a catalog
+in `analyze_config` compiles a new matcher on next use.
+
+Public helpers
+--------------
+- tokenize_name    – lowercase name tokens (snake_case and camelCase aware)
+- KeywordMatcher   – Aho-Corasick substring matcher
+- AffixMatcher     – prefix or suffix trie matcher
+- TokenMatcher     – categorized token-subset classifier
+- keyword_matcher  – cached KeywordMatcher for a catalog
+- prefix_matcher   – cached prefix AffixMatcher for a catalog
+- suffix_matcher   – cached suffix AffixMatcher for a catalog
+- token_matcher    – cached TokenMatcher for a {category: indicators} catalog
+"""
+from __future__ import annotations
+
+import re
+import threading
+from collections import deque
+from typing import Any, Callable, Iterable, Mapping, Optional, TypeVar, Union, cast
+
+# Memoized names per matcher before the memo is reset
+MEMO_LIMIT = 1 << 16
+
+Catalog = Union[Iterable[str], Mapping[str, Iterable[str]]]
+
+_T = TypeVar("_T")
+_M = TypeVar("_M")
+
+_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
+_NON_ALNUM_RE = re.compile(r"[^0-9A-Za-z]+")
+
+
+def tokenize_name(name: str) -> list[str]:
+    """Split field name into lowercase tokens (handles snake & camelCase)."""
+    n = name or ""
+    # replace non-alnum with underscores, then split
+    base = _NON_ALNUM_RE.sub("_", n)
+    parts = []
+    for p in base.split("_"):
+        if not p:
+            continue
+        # split camelCase chunks too
+        parts.extend(_CAMEL_SPLIT_RE.sub("_", p).lower().split("_"))
+    # drop purely numeric tokens
+    return [t for t in parts if t and not t.isdigit()]
+
+
+def _flatten(catalog: Catalog) -> list[str]:
+    """Catalog entries in iteration order; mappings contribute their values."""
+    if isinstance(catalog, Mapping):
+        return [entry for entries in catalog.values() for entry in entries]
+    return list(catalog)
+
+
+class _Memo(dict[str, _T]):
+    """Bounded per-matcher memo; cleared wholesale when full."""
+
+    def put(self, key: str, value: _T) -> _T:
+        if len(self) >= MEMO_LIMIT:
+            self.clear()
+        self[key] = value
+        return value
+
+
+class KeywordMatcher:
+    """Find which catalog keywords occur as substrings of a name.
+
+    Equivalent to ``[k for k in keywords if k in text]`` (in catalog order),
+    computed in a single pass over ``text``.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(keywords))
+        self._memo: _Memo[tuple[str, ...]] = _Memo()
+        # The empty keyword occurs in every string
+        self._always = tuple(i for i, k in enumerate(self.keywords) if not k)
+
+        goto: list[dict[str, int]] = [{}]
+        out: list[tuple[int, ...]] = [()]
+        for idx, keyword in enumerate(self.keywords):
+            if not keyword:
+                continue
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] += (idx,)
+
+        # Breadth-first failure links, folded into a full transition table
+        # so matching is one dict lookup per character.
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            out[state] += out[fail[state]]
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0) if state else 0
+                queue.append(nxt)
+        self._delta = delta
+        self._out = out
+
+    def find(self, text: str) -> tuple[str, ...]:
+        """Keywords contained in ``text``, in catalog order."""
+        hit = self._memo.get(text)
+        if hit is not None:
+            return hit
+        found = set(self._always)
+        delta, out = self._delta, self._out
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        keywords = self.keywords
+        return self._memo.put(text, tuple(keywords[i] for i in sorted(found)))
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in ``text``."""
+        return bool(self.find(text))
+
+
+class AffixMatcher:
+    """Test whether a name starts (or ends) with any catalog entry.
+
+    Equivalent to ``text.startswith(tuple(affixes))`` (``endswith`` with
+    ``suffix=True``), walking at most the longest entry's length.
+    """
+
+    _END = ""
+
+    def __init__(self, affixes: Iterable[str], suffix: bool = False) -> None:
+        self.affixes: tuple[str, ...] = tuple(dict.fromkeys(affixes))
+        self.suffix = suffix
+        self._memo: _Memo[bool] = _Memo()
+        self._trie: dict[str, Any] = {}
+        for affix in self.affixes:
+            node = self._trie
+            for ch in reversed(affix) if suffix else affix:
+                node = node.setdefault(ch, {})
+            node[self._END] = True
+
+    def match(self, text: str) -> bool:
+        """True if ``text`` has any catalog entry as its prefix/suffix."""
+        hit = self._memo.get(text)
+        if hit is not None:
+            return hit
+        node = self._trie
+        matched = self._END in node
+        if not matched:
+            for ch in reversed(text) if self.suffix else text:
+                nxt: Optional[dict[str, Any]] = node.get(ch)
+                if nxt is None:
+                    break
+                node = nxt
+                if self._END in node:
+                    matched = True
+                    break
+        return self._memo.put(text, matched)
+
+
+class TokenMatcher:
+    """Classify names by categorized indicators matched on name tokens.
+
+    An indicator matches when all of its tokens are among the name's tokens
+    (``credit_card`` matches ``cardCreditNumber``). Equivalent to looping
+    over every category and indicator, but only the indicators sharing a
+    token with the name are ever looked at.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]) -> None:
+        self._memo: _Memo[tuple[tuple[str, tuple[str, ...]], ...]] = _Memo()
+        # (category, indicator, distinct token count), in catalog order
+        self._entries: list[tuple[str, str, int]] = []
+        self._index: dict[str, list[int]] = {}
+        self._always: list[int] = []
+        for category, indicators in categories.items():
+            for indicator in indicators:
+                idx = len(self._entries)
+                tokens = set(tokenize_name(indicator))
+                self._entries.append((category, indicator, len(tokens)))
+                if not tokens:
+                    self._always.append(idx)
+                for token in tokens:
+                    self._index.setdefault(token, []).append(idx)
+
+    def _matches(self, name: str) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        hit = self._memo.get(name)
+        if hit is not None:
+            return hit
+        counts: dict[int, int] = {}
+        for token in set(tokenize_name(name)):
+            for idx in self._index.get(token, ()):
+                counts[idx] = counts.get(idx, 0) + 1
+        entries = self._entries
+        matched = sorted(
+            [idx for idx, n in counts.items() if n == entries[idx][2]] + self._always
+        )
+        grouped: dict[str, list[str]] = {}
+        for idx in matched:
+            category, indicator, _ = entries[idx]
+            grouped.setdefault(category, []).append(indicator)
+        return self._memo.put(
+            name, tuple((cat, tuple(inds)) for cat, inds in grouped.items())
+        )
+
+    def classify(self, name: str) -> dict[str, list[str]]:
+        """Return {category: [matched_indicator, ...]} for ``name``."""
+        return {cat: list(inds) for cat, inds in self._matches(name)}
+
+
+_COMPILED: dict[tuple[str, int], tuple[Any, Any]] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+def _compiled(kind: str, catalog: Any, build: Callable[[Any], _M]) -> _M:
+    """Matcher of ``kind`` for ``catalog``, compiled on first use.
+
+    Keyed by object identity; the catalog is kept alive alongside its
+    matcher so the id cannot be reused by another object.
+    """
+    key = (kind, id(catalog))
+    entry = _COMPILED.get(key)
+    if entry is None or entry[0] is not catalog:
+        with _COMPILED_LOCK:
+            entry = _COMPILED.get(key)
+            if entry is None or entry[0] is not catalog:
+                entry = (catalog, build(catalog))
+                _COMPILED[key] = entry
+    return cast(_M, entry[1])
+
+
+def keyword_matcher(catalog: Catalog, delimited: bool = False) -> KeywordMatcher:
+    """Compiled substring matcher for ``catalog``.
+
+    Args:
+        catalog: Keywords, or a mapping whose values are keyword collections.
+        delimited: Match keywords only next to an underscore, i.e. search for
+            ``_kw`` and ``kw_`` (exact names must be checked separately).
+
+    Returns:
+        KeywordMatcher shared by every caller using the same catalog object.
+    """
+    if delimited:
+        return _compiled(
+            "keyword_delimited",
+            catalog,
+            lambda c: KeywordMatcher(
+                p for kw in _flatten(c) for p in (f"_{kw}", f"{kw}_")
+            ),
+        )
+    return _compiled("keyword", catalog, lambda c: KeywordMatcher(_flatten(c)))
+
+
+def prefix_matcher(catalog: Catalog) -> AffixMatcher:
+    """Compiled ``startswith`` matcher for ``catalog``."""
+    return _compiled("prefix", catalog, lambda c: AffixMatcher(_flatten(c)))
+
+
+def suffix_matcher(catalog: Catalog) -> AffixMatcher:
+    """Compiled ``endswith`` matcher for ``catalog``."""
+    return _compiled(
+        "suffix", catalog, lambda c: AffixMatcher(_flatten(c), suffix=True)
+    )
+
+
+def token_matcher(categories: Mapping[str, Iterable[str]]) -> TokenMatcher:
+    """Compiled token classifier for a {category: indicators} catalog."""
+    return _compiled("tokens", categories, TokenMatcher)
@@ -18,20 +18,26 @@ Conventions enforced by normalization
     * [<normalized_element>] otherwise
 - Objects are normalized recursively key-by-key.
 - Presence is NOT decided here. Presence-specific logic is handled elsewhere
-  (e.g., via injecting `missing` or by presence sets).
+  (e.g., via injecting `missing` or by presence sets). The one exception is
+  `walk_normalize_with_presence`, which fuses presence injection into the
+  normalization pass so the pipeline builds one output tree instead of two.
 
 Public helpers exposed
 ----------------------
 - collapse_empty
 - normalize_union
 - walk_normalize
+- walk_normalize_with_presence
 - _has_any               (internal, but used by reporter)
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
+from .utils import wrap_optional
+
 # Mapping of "empty_*" markers to their base kinds
 BASE_OF_EMPTY = {
     "empty_array": "array",
@@ -103,6 +109,38 @@ def walk_normalize(x: Any) -> Any:
     return normalize_union(x)
 
 
+def walk_normalize_with_presence(
+    x: Any, required_paths: Iterable[str] | None
+) -> Any:
+    """Inject presence and normalize in a single pass.
+
+    Equivalent to ``walk_normalize(inject_presence_for_diff(x, required_paths))``
+    but constructs the normalized tree directly, without materializing the
+    intermediate injected copy. Non-required leaves are wrapped with
+    ``union(...|missing)``; required leaves keep their pure type.
+    """
+    required: set[str] = set(required_paths or [])
+
+    def walk(node: dict, prefix: str) -> dict:
+        out: dict[str, Any] = {}
+        for k, v in node.items():
+            path = f"{prefix}.{k}" if prefix else k
+            if isinstance(v, dict):
+                out[k] = walk(v, path)
+            elif isinstance(v, list) and len(v) > 0 and isinstance(v[0], dict):
+                # Presence applies to the array field; recurse into the element
+                out[k] = [walk(v[0], f"{path}[0]")]
+            elif path in required:
+                out[k] = walk_normalize(v)
+            else:
+                out[k] = walk_normalize(wrap_optional(v))
+        return out
+
+    if isinstance(x, dict):
+        return walk(x, "")
+    return walk_normalize(x)
+
+
 def _has_any(x: Any) -> bool:
     """Return True if `x` is (or contains) the 'any' type.
 
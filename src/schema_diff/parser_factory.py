@@ -19,7 +19,7 @@ from .dbt_schema_parser import (
     schema_from_dbt_schema_yml,
 )
 from .io_utils import nth_record, sample_records, sniff_ndjson
-from .json_data_file_parser import merged_schema_from_samples
+from .json_data_file_parser import merged_schema_with_required
 from .json_schema_parser import schema_from_json_schema_file
 from .logging_config import get_logger
 from .protobuf_schema_parser import schema_from_protobuf_file
@@ -91,13 +91,12 @@ class DataParser:
         else:
             records = sample_records(path, samples)
 
-        # Infer schema from samples
-        schema_tree = merged_schema_from_samples(records, cfg)
+        # Infer schema from samples. Data files have no explicit required
+        # fields; with cfg.required_threshold set they are inferred from
+        # presence counts gathered in the same pass
+        schema_tree, required_paths = merged_schema_with_required(records, cfg)
         schema_tree = coerce_root_to_field_dict(schema_tree)
 
-        # Data files don't have explicit required fields
-        required_paths: Set[str] = set()
-
         # Generate label
         record_count = len(records) if records else 0
         if all_records:
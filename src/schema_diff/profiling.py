@@ -0,0 +1,303 @@
+"""Streaming per-field data profiling with constant-memory sketches.
+
+`DataProfiler.observe` is called once per record in the same loop that infers
+the schema (see `merged_schema_from_samples`), so profiling adds no extra pass
+over the data. For every dotted path it tracks:
+
+- presence rate     – how often the key is present in its parent object
+- null rate         – how often a present value is ``None``
+- distinct count    – approximate, via HyperLogLog (~2% standard error)
+- min / max         – numeric values, or strings when a field has no numbers
+- length histogram  – power-of-two buckets of string lengths
+- top values        – approximate heavy hitters, via Space-Saving
+
+Every sketch has a fixed size, so memory grows with the number of fields, not
+the number of records. Profilers built on separate workers (or file shards)
+combine exactly with `DataProfiler.merge`.
+
+Paths use the same notation as diff reports: dotted object keys and ``[]``
+for array elements.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# Sketch sizes (fixed per field)
+HLL_PRECISION = 11  # 2048 registers, ~2.3% standard error
+TOP_K = 10
+_TOPK_CAPACITY = 4 * TOP_K  # extra counters keep the reported top-k accurate
+_MAX_TRACKED_STR = 100  # longer strings are truncated in top values / min / max
+_LENGTH_BUCKETS = 12  # 0, 1, 2-3, 4-7, ..., 1024+
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch over 64-bit hashes."""
+
+    __slots__ = ("p", "m", "registers")
+
+    def __init__(self, p: int = HLL_PRECISION) -> None:
+        self.p = p
+        self.m = 1 << p
+        self.registers = bytearray(self.m)
+
+    def add_hash(self, h: int) -> None:
+        """Record a 64-bit value hash."""
+        idx = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def count(self) -> int:
+        """Return the estimated number of distinct hashes added."""
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # small-range correction
+        return int(round(estimate))
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Fold in another sketch of the same precision (register-wise max)."""
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+
+class SpaceSaving:
+    """Space-Saving heavy-hitters summary with a fixed number of counters."""
+
+    __slots__ = ("capacity", "counts")
+
+    def __init__(self, capacity: int = _TOPK_CAPACITY) -> None:
+        self.capacity = capacity
+        self.counts: dict[Any, int] = {}
+
+    def add(self, item: Any, n: int = 1) -> None:
+        """Count `item` `n` times, evicting the smallest counter when full."""
+        counts = self.counts
+        if item in counts:
+            counts[item] += n
+        elif len(counts) < self.capacity:
+            counts[item] = n
+        else:
+            victim = min(counts, key=counts.__getitem__)
+            counts[item] = counts.pop(victim) + n
+
+    def merge(self, other: SpaceSaving) -> None:
+        """Fold in another summary, keeping the largest combined counters."""
+        merged = dict(self.counts)
+        for item, n in other.counts.items():
+            merged[item] = merged.get(item, 0) + n
+        top = sorted(merged.items(), key=lambda kv: -kv[1])[: self.capacity]
+        self.counts = dict(top)
+
+    def top(self, k: int = TOP_K) -> list[tuple[Any, int]]:
+        """Return the `k` most frequent items with their approximate counts."""
+        return sorted(self.counts.items(), key=lambda kv: (-kv[1], repr(kv[0])))[:k]
+
+
+def _value_hash(v: Any) -> int:
+    token = f"{type(v).__name__}:{v}".encode("utf-8", "surrogatepass")
+    return int.from_bytes(hashlib.blake2b(token, digest_size=8).digest(), "big")
+
+
+def _length_bucket_label(i: int) -> str:
+    if i <= 1:
+        return str(i)
+    if i == _LENGTH_BUCKETS - 1:
+        return f"{1 << (i - 1)}+"
+    return f"{1 << (i - 1)}-{(1 << i) - 1}"
+
+
+@dataclass
+class FieldProfile:
+    """Streaming statistics for one field path."""
+
+    parent: str = ""
+    present: int = 0
+    nulls: int = 0
+    num_min: Optional[float] = None
+    num_max: Optional[float] = None
+    str_min: Optional[str] = None
+    str_max: Optional[str] = None
+    length_hist: list[int] = field(default_factory=lambda: [0] * _LENGTH_BUCKETS)
+    hll: HyperLogLog = field(default_factory=HyperLogLog)
+    top: SpaceSaving = field(default_factory=SpaceSaving)
+
+    def add(self, v: Any) -> None:
+        """Record one present value of this field (``None`` counts as null)."""
+        self.present += 1
+        if v is None:
+            self.nulls += 1
+            return
+        if isinstance(v, (dict, list)):
+            return  # containers: presence only; their contents are profiled per path
+        if isinstance(v, str):
+            n = len(v)
+            self.length_hist[min(n.bit_length(), _LENGTH_BUCKETS - 1)] += 1
+            v = v[:_MAX_TRACKED_STR]
+            if self.str_min is None or v < self.str_min:
+                self.str_min = v
+            if self.str_max is None or v > self.str_max:
+                self.str_max = v
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            if self.num_min is None or v < self.num_min:
+                self.num_min = v
+            if self.num_max is None or v > self.num_max:
+                self.num_max = v
+        self.hll.add_hash(_value_hash(v))
+        self.top.add(v)
+
+    def merge(self, other: FieldProfile) -> None:
+        """Fold in the statistics of the same field from another profiler."""
+        self.present += other.present
+        self.nulls += other.nulls
+        for attr, pick in (
+            ("num_min", min),
+            ("num_max", max),
+            ("str_min", min),
+            ("str_max", max),
+        ):
+            mine, theirs = getattr(self, attr), getattr(other, attr)
+            if theirs is not None:
+                setattr(self, attr, theirs if mine is None else pick(mine, theirs))
+        self.length_hist = [a + b for a, b in zip(self.length_hist, other.length_hist)]
+        self.hll.merge(other.hll)
+        self.top.merge(other.top)
+
+    def to_dict(self, parent_count: int) -> dict[str, Any]:
+        """Summarize the field; rates are relative to `parent_count` parents."""
+        non_null = self.present - self.nulls
+        out: dict[str, Any] = {
+            "count": self.present,
+            "presence_rate": (
+                round(self.present / parent_count, 4) if parent_count else 0.0
+            ),
+            "null_rate": round(self.nulls / self.present, 4) if self.present else 0.0,
+        }
+        if self.top.counts:
+            out["distinct_approx"] = min(self.hll.count(), non_null)
+        if self.num_min is not None:
+            out["min"], out["max"] = self.num_min, self.num_max
+        elif self.str_min is not None:
+            out["min"], out["max"] = self.str_min, self.str_max
+        if any(self.length_hist):
+            out["length_histogram"] = {
+                _length_bucket_label(i): n for i, n in enumerate(self.length_hist) if n
+            }
+        if self.top.counts:
+            out["top_values"] = [
+                {"value": value, "count": count} for value, count in self.top.top()
+            ]
+        return out
+
+
+class DataProfiler:
+    """Accumulates `FieldProfile`s for every path of the observed records."""
+
+    def __init__(self) -> None:
+        self.records = 0
+        self.fields: dict[str, FieldProfile] = {}
+        # Path -> number of times an object (or array element) was seen there;
+        # the denominator for presence rates of its children
+        self.containers: dict[str, int] = {}
+        # Path -> {type label: count}, filled in by the inference pass
+        # (`merged_schema_from_samples`) from its per-path type counters
+        self.types: dict[str, dict[str, int]] = {}
+
+    def observe(self, record: Any) -> None:
+        """Profile one record (called once per record during inference)."""
+        self.records += 1
+        if isinstance(record, dict):
+            self._observe_object("", record)
+
+    def _field(self, path: str, parent: str) -> FieldProfile:
+        prof = self.fields.get(path)
+        if prof is None:
+            prof = self.fields[path] = FieldProfile(parent=parent)
+        return prof
+
+    def _observe_object(self, path: str, obj: dict[str, Any]) -> None:
+        self.containers[path] = self.containers.get(path, 0) + 1
+        for key, value in obj.items():
+            child = f"{path}.{key}" if path else key
+            self._field(child, path).add(value)
+            self._observe_nested(child, value)
+
+    def _observe_nested(self, path: str, value: Any) -> None:
+        if isinstance(value, dict):
+            self._observe_object(path, value)
+        elif isinstance(value, list):
+            elem_path = f"{path}[]"
+            for elem in value:
+                if isinstance(elem, dict):
+                    self._observe_object(elem_path, elem)
+                else:
+                    self.containers[elem_path] = self.containers.get(elem_path, 0) + 1
+                    self._field(elem_path, elem_path).add(elem)
+                    self._observe_nested(elem_path, elem)
+
+    def merge(self, other: DataProfiler) -> DataProfiler:
+        """Fold `other` (e.g. a worker's profiler) into this one; returns self.
+
+        `other` is consumed: its field profiles may be adopted, not copied.
+        """
+        self.records += other.records
+        for path, n in other.containers.items():
+            self.containers[path] = self.containers.get(path, 0) + n
+        for path, prof in other.fields.items():
+            if path in self.fields:
+                self.fields[path].merge(prof)
+            else:
+                self.fields[path] = prof
+        for path, counts in other.types.items():
+            mine = self.types.setdefault(path, {})
+            for label, n in counts.items():
+                mine[label] = mine.get(label, 0) + n
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return ``{"records": N, "fields": {path: stats}}`` sorted by path."""
+        root = self.records
+        fields = {}
+        for path, prof in sorted(self.fields.items()):
+            stats = prof.to_dict(
+                self.containers.get(prof.parent, 0) if prof.parent else root
+            )
+            if path in self.types:
+                stats["types"] = dict(sorted(self.types[path].items()))
+            fields[path] = stats
+        return {"records": self.records, "fields": fields}
+
+
+def format_profile_text(profile: dict[str, Any], colors: tuple = ()) -> str:
+    """Render a `DataProfiler.to_dict()` result as an aligned text table."""
+    BOLD, CYAN, RESET = colors or ("", "", "")
+    lines = [
+        f"{BOLD}{CYAN}📈 Field profile ({profile['records']} records){RESET}",
+        f"{'field':<40} {'present':>8} {'null':>7} {'distinct':>9}  top values",
+    ]
+    for path, stats in profile["fields"].items():
+        top = ", ".join(
+            f"{t['value']!r}×{t['count']}" for t in stats.get("top_values", [])[:3]
+        )
+        lines.append(
+            f"{path:<40} {stats['presence_rate']:>8.1%} {stats['null_rate']:>7.1%} "
+            f"{stats.get('distinct_approx', 0):>9}  {top}"
+        )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "HyperLogLog",
+    "SpaceSaving",
+    "FieldProfile",
+    "DataProfiler",
+    "format_profile_text",
+]
@@ -5,8 +5,9 @@ Entry points
 - list_protobuf_messages(path) -> list[str]
     Return fully-qualified names (FQNs) of all messages defined in a .proto file.
 
-- schema_from_protobuf_file(path, message=None)
-    Parse a .proto file and build a JSON-like *type tree* for a chosen message.
+- schema_from_protobuf_file(path, message=None, include_paths=())
+    Parse a .proto file (and, transitively, its imports) and build a JSON-like
+    *type tree* for a chosen message.
     Returns (tree, required_paths, chosen_fqn):
       - tree: Dict[str, Any] where leaves are 'int'|'float'|'bool'|'str'|'date'|'time'|'timestamp'|'object'
               and repeated fields are encoded as [elem_type].
@@ -18,15 +19,23 @@ Notes
 - Enums are represented as 'str' (their JSON mapping).
 - Maps are represented as 'object'.
 - Nested messages are inlined structurally (fields expanded).
-- Message references are resolved using lexical scope, package, and absolute FQNs.
+- Message references are resolved using lexical scope, package, and absolute FQNs,
+  across every file reachable through ``import`` (see `ProtoWorkspace`).
+- Each file is parsed at most once per process; repeated lookups and listings
+  are answered from the cached parse.
 """
 
 from __future__ import annotations
 
+import functools
+import os
 import re
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
 __all__ = [
+    "ProtoWorkspace",
     "list_protobuf_messages",
     "schema_from_protobuf_file",
     "schema_from_protobuf_file_unified",
@@ -149,57 +158,10 @@ def _resolve_ref(
 def list_protobuf_messages(path: str) -> list[str]:
     """Return fully-qualified names of all message definitions in a .proto. file.
 
-    Enums and oneofs are ignored; only messages are returned.
+    Enums and oneofs are ignored; only messages are returned. The file is
+    parsed at most once per process (see `_parse_proto_file`).
     """
-    with open(path, encoding="utf-8") as f:
-        raw = f.read()
-
-    text = _strip_comments(raw)
-    lines: list[str] = [ln.rstrip("\n") for ln in text.splitlines()]
-
-    package: str | None = None
-    stack: list[str] = []
-    out: list[str] = []
-
-    def fq_from_stack() -> str:
-        fq = ".".join(stack)
-        return f"{package}.{fq}" if package else fq
-
-    for ln in lines:
-        if not ln.strip():
-            continue
-
-        m = PACKAGE_LINE_RE.match(ln)
-        if m:
-            package = m.group(1)
-            continue
-
-        if IMPORT_LINE_RE.match(ln):
-            continue
-
-        mm = MESSAGE_OPEN_RE.match(ln)
-        if mm:
-            stack.append(mm.group(1))
-            out.append(fq_from_stack())
-            continue
-
-        me = ENUM_OPEN_RE.match(ln)
-        mo = ONEOF_OPEN_RE.match(ln)
-        if me or mo:
-            # track nesting so subsequent closes pop correctly
-            if me:
-                stack.append("(enum)")
-            elif mo:
-                stack.append(f"oneof:{mo.group(1)}")
-            continue
-
-        if BLOCK_CLOSE_RE.match(ln):
-            if stack:
-                stack.pop()
-            continue
-
-    # (enum/oneof) frames never went to `out`, this is mostly belt-and-suspenders
-    return [m for m in out if "(enum)" not in m]
+    return list(_parse_proto_file(path).msgs)
 
 
 def _build_message_tree(
@@ -208,6 +170,8 @@ def _build_message_tree(
     enums: set[str],
     package: str | None,
     children: dict[str, list[str]],
+    _known: set[str] | None = None,
+    _active: set[str] | None = None,
 ) -> dict[str, Any]:
     """Recursively inline a message definition into a JSON-like type tree.
 
@@ -215,10 +179,13 @@ def _build_message_tree(
     - enum fields   → 'str'
     - map fields    → 'object'
     - repeated(*)   → [elem_type]
+    - recursive references (a message already being inlined) → 'object'
     """
     fields = msgs.get(msg_fqn, {})
     out: dict[str, Any] = {}
-    known_msgs = set(msgs.keys())
+    if _known is None:
+        _known = set(msgs) | enums
+    active = (_active or set()) | {msg_fqn}
 
     for fname, finfo in fields.items():
         fkind = finfo["kind"]
@@ -231,12 +198,16 @@ def _build_message_tree(
         elif fkind == "message":
             raw = finfo["type"]
             scope = finfo.get("scope", msg_fqn)
-            ref_fqn = _resolve_ref(raw, scope, package, known_msgs | enums)
+            ref_fqn = _resolve_ref(raw, scope, package, _known)
             if ref_fqn:
                 if ref_fqn in enums:
                     t = "str"  # enums → strings
+                elif ref_fqn in active:
+                    t = "object"  # recursive message: cut the cycle
                 elif ref_fqn in msgs:
-                    t = _build_message_tree(ref_fqn, msgs, enums, package, children)
+                    t = _build_message_tree(
+                        ref_fqn, msgs, enums, package, children, _known, active
+                    )
                 else:
                     t = "object"  # external/unknown type
             else:
@@ -251,13 +222,16 @@ def _build_message_tree(
     # Expose nested message *definitions* as properties (when not referenced by name)
     for child_fqn in children.get(msg_fqn, []):
         child_name = child_fqn.rsplit(".", 1)[-1]
-        out[child_name] = _build_message_tree(child_fqn, msgs, enums, package, children)
+        out[child_name] = _build_message_tree(
+            child_fqn, msgs, enums, package, children, _known, active
+        )
 
     return out
 
 
 def _parse_proto_structure(
     text: str,
+    imports: list[str] | None = None,
 ) -> tuple[
     dict[str, dict[str, Any]],  # msgs: FQN -> { field_name -> info }
     set[str],  # enums: set of FQN enum names
@@ -274,6 +248,8 @@ def _parse_proto_structure(
       - top_order: top-level message FQNs in appearance order
       - package: declared package (or None)
       - children: nesting tree for messages (to expose nested defs)
+
+    If `imports` is given, imported file names are appended to it.
     """
     text = _strip_comments(text)
     lines = [ln for ln in text.splitlines() if ln.strip()]
@@ -313,7 +289,10 @@ def _parse_proto_structure(
         if m_pkg:
             package = m_pkg.group(1)
             continue
-        if IMPORT_LINE_RE.match(ln):
+        m_imp = IMPORT_LINE_RE.match(ln)
+        if m_imp:
+            if imports is not None:
+                imports.append(m_imp.group(1))
             continue
 
         # opens
@@ -418,7 +397,12 @@ def _collect_required_paths_proto(
         )
         return ref == child_fqn
 
+    active: set[str] = set()
+
     def walk(msg_fqn: str, prefix: str = ""):
+        if msg_fqn in active:
+            return  # recursive message: its required fields are already listed
+        active.add(msg_fqn)
         fields = msgs.get(msg_fqn, {})
         # (1) follow declared fields
         for fname, finfo in fields.items():
@@ -438,16 +422,170 @@ def _collect_required_paths_proto(
             child_name = child_fqn.rsplit(".", 1)[-1]
             child_prefix = f"{prefix}.{child_name}" if prefix else child_name
             walk(child_fqn, child_prefix)
+        active.discard(msg_fqn)
 
     walk(start_fqn)
     return required
 
 
+@dataclass(frozen=True)
+class _ProtoFile:
+    """Parsed structure of one .proto file (shared; treat as read-only)."""
+
+    path: str
+    package: str | None
+    imports: tuple[str, ...]
+    msgs: dict[str, dict[str, Any]]
+    enums: frozenset[str]
+    top_order: tuple[str, ...]
+    children: dict[str, list[str]]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_proto_file_cached(real_path: str, mtime_ns: int, size: int) -> _ProtoFile:
+    with open(real_path, encoding="utf-8") as f:
+        text = f.read()
+    imports: list[str] = []
+    msgs, enums, top, package, children = _parse_proto_structure(text, imports)
+    return _ProtoFile(
+        real_path,
+        package,
+        tuple(imports),
+        msgs,
+        frozenset(enums),
+        tuple(top),
+        children,
+    )
+
+
+def _parse_proto_file(path: str) -> _ProtoFile:
+    """Parse `path` once per process; re-parsed only if its size/mtime change."""
+    real_path = os.path.realpath(path)
+    st = os.stat(real_path)
+    return _parse_proto_file_cached(real_path, st.st_mtime_ns, st.st_size)
+
+
+class ProtoWorkspace:
+    """A set of .proto files linked through their ``import`` statements.
+
+    Every file is parsed once (`_parse_proto_file`) and its messages and enums
+    are merged into one symbol table keyed by FQN, which answers message
+    listings and lookups. Imports are resolved against `include_paths`, then
+    against the importing root file's directory and its ancestors (the usual
+    repository-root layout). Imports that cannot be found, such as
+    ``google/protobuf/*.proto``, are recorded in `missing_imports`; well-known
+    types are mapped by name anyway.
+    """
+
+    def __init__(self, include_paths: Sequence[str] = ()):
+        self.include_paths = [os.path.abspath(p) for p in include_paths]
+        self.files: dict[str, _ProtoFile] = {}
+        self.missing_imports: set[str] = set()
+        self.msgs: dict[str, dict[str, Any]] = {}
+        self.enums: set[str] = set()
+        self.children: dict[str, list[str]] = {}
+
+    def _find_import(self, name: str, roots: list[str]) -> str | None:
+        for base in self.include_paths + roots:
+            cand = os.path.join(base, name)
+            if os.path.isfile(cand):
+                return os.path.realpath(cand)
+        return None
+
+    def _register(self, pf: _ProtoFile) -> None:
+        for fqn, fields in pf.msgs.items():
+            self.msgs.setdefault(fqn, fields)
+        self.enums |= pf.enums
+        for parent, kids in pf.children.items():
+            self.children.setdefault(parent, []).extend(kids)
+
+    def add(self, path: str) -> _ProtoFile:
+        """Load `path` and everything it imports, transitively."""
+        root = _parse_proto_file(path)
+        if root.path in self.files:
+            return root
+        roots: list[str] = []
+        d = os.path.dirname(root.path)
+        while d not in roots:
+            roots.append(d)
+            d = os.path.dirname(d)
+
+        pending = [root]
+        while pending:
+            pf = pending.pop()
+            if pf.path in self.files:
+                continue
+            self.files[pf.path] = pf
+            self._register(pf)
+            for name in pf.imports:
+                found = self._find_import(name, roots)
+                if found is None:
+                    self.missing_imports.add(name)
+                elif found not in self.files:
+                    pending.append(_parse_proto_file(found))
+        return root
+
+    def list_messages(self, path: str) -> list[str]:
+        """Return the FQNs of the messages defined in `path` (not its imports)."""
+        return list(self.add(path).msgs)
+
+    def resolve_message(self, path: str, message: str | None = None) -> str:
+        """Resolve `message` (None, FQN or unique suffix) to an FQN.
+
+        Suffixes are matched against `path`'s own messages first, then against
+        everything it imports.
+        """
+        pf = self.add(path)
+        if not pf.top_order:
+            raise ValueError(f"No messages found in {path}")
+        if message is None:
+            return pf.top_order[0]
+        q = message.lstrip(".")
+        # exact match
+        if q in self.msgs:
+            return q
+        # unique suffix match
+        for pool in (pf.msgs, self.msgs):
+            cand = [k for k in pool if k.endswith("." + q)]
+            if len(cand) > 1:
+                raise ValueError(
+                    f"Ambiguous message suffix '{message}'. Options: {', '.join(cand)}"
+                )
+            if cand:
+                return cand[0]
+        raise ValueError(
+            f"Message '{message}' not found in {path}. "
+            f"Available: {', '.join(pf.top_order)}"
+        )
+
+    def schema(
+        self, path: str, message: str | None = None
+    ) -> tuple[dict[str, Any], set[str], str]:
+        """(tree, required_paths, chosen_fqn) for a message of `path`."""
+        chosen = self.resolve_message(path, message)
+        package = self.add(path).package
+        tree = _build_message_tree(
+            chosen,
+            self.msgs,
+            self.enums,
+            package,
+            self.children,
+            _known=set(self.msgs) | self.enums,
+        )
+        required = _collect_required_paths_proto(
+            chosen, self.msgs, package, self.children
+        )
+        return tree, required, chosen
+
+
 def schema_from_protobuf_file(
-    path: str, message: str | None = None
+    path: str,
+    message: str | None = None,
+    include_paths: Sequence[str] = (),
 ) -> tuple[dict[str, Any], set[str], str]:
-    """Parse a .proto file and produce:
+    """Parse a .proto file into the type tree of one message.
 
+    Produces:
       - tree: inlined type tree for the chosen message
       - required paths: dotted paths for required fields
       - chosen_fqn: fully-qualified name of the resolved message
@@ -455,45 +593,21 @@ def schema_from_protobuf_file(
       - None (first top-level message)
       - absolute FQN (e.g., "pkg.Outer.Inner")
       - unique suffix (e.g., "Outer.Inner")
-    """
-    with open(path, encoding="utf-8") as f:
-        text = f.read()
-
-    msgs, enums, top, package, children = _parse_proto_structure(text)
-    if not top:
-        raise ValueError(f"No messages found in {path}")
-
-    # Resolve desired message → FQN (absolute or unique suffix)
-    def pick_fqn(name_or_suffix: str | None) -> str:
-        if name_or_suffix is None:
-            return top[0]
-        q = name_or_suffix.lstrip(".")
-        # exact match
-        if q in msgs:
-            return q
-        # unique suffix match
-        cand = [k for k in msgs if k.endswith("." + q) or k == q]
-        if not cand:
-            raise ValueError(
-                f"Message '{name_or_suffix}' not found in {path}. Available: {', '.join(top)}"
-            )
-        if len(cand) > 1:
-            raise ValueError(
-                f"Ambiguous message suffix '{name_or_suffix}'. Options: {', '.join(cand)}"
-            )
-        return cand[0]
-
-    chosen_fqn = pick_fqn(message)
 
-    tree = _build_message_tree(chosen_fqn, msgs, enums, package, children)
-    required = _collect_required_paths_proto(chosen_fqn, msgs, package, children)
-
-    return tree, required, chosen_fqn
+    Imports are followed (see `ProtoWorkspace`), so fields typed with
+    messages/enums from other files are resolved; `include_paths` are
+    searched first, like protoc's ``-I``.
+    """
+    return ProtoWorkspace(include_paths).schema(path, message)
 
 
-def schema_from_protobuf_file_unified(path: str, message: str | None = None):
+def schema_from_protobuf_file_unified(
+    path: str, message: str | None = None, include_paths: Sequence[str] = ()
+):
     """Parse a Protobuf file and return unified Schema object.
 
+    `include_paths` are searched for imports first (see `ProtoWorkspace`).
+
     Returns
     -------
     Schema
@@ -501,5 +615,7 @@ def schema_from_protobuf_file_unified(path: str, message: str | None = None):
     """
     from .models import from_legacy_tree
 
-    tree, required, chosen_fqn = schema_from_protobuf_file(path, message)
+    tree, required, chosen_fqn = schema_from_protobuf_file(
+        path, message, include_paths
+    )
     return from_legacy_tree(tree, required, source_type=f"protobuf:{chosen_fqn}")
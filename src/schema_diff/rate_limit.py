@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""Shared rate limiting and adaptive concurrency for BigQuery API calls.
+
+`_retry_on_transient` retries inside each worker while the pool size stays
+fixed, so under quota pressure every worker hits 429s together and backs off
+together. `AdaptiveLimiter` gates calls instead: a token bucket caps the
+request rate, and an AIMD (additive-increase / multiplicative-decrease)
+concurrency limit shrinks the number of calls in flight on throttling
+(429/503/``rateLimitExceeded``) and grows it back one slot per window of
+successes. Pools keep their threads; threads above the current limit wait.
+
+Public helpers
+--------------
+- TokenBucket          – thread-safe token bucket
+- LimiterMetrics       – counters for calls, throttle events and waits
+- AdaptiveLimiter      – rate + AIMD concurrency gate with retrying `call`
+- get_bigquery_limiter – process-wide limiter per project
+"""
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from . import analyze_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Outcomes of one attempt, as classified for the limiter
+OK, THROTTLED, TRANSIENT, FAILED = "ok", "throttled", "transient", "failed"
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens/s, holding at most `burst`."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(rate, 1.0))
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take `tokens`, sleeping until they are available; returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+@dataclass
+class LimiterMetrics:
+    """Counters for one limiter (cumulative over the process)."""
+
+    calls: int = 0
+    successes: int = 0
+    throttles: int = 0
+    retries: int = 0
+    failures: int = 0
+    decreases: int = 0
+    min_limit: int = 0
+    peak_in_flight: int = 0
+    rate_wait_seconds: float = 0.0
+    slot_wait_seconds: float = 0.0
+
+
+def classify_bigquery_error(exc: BaseException) -> str:
+    """Classify a BigQuery exception as THROTTLED, TRANSIENT or FAILED.
+
+    429/503 and 403 ``rateLimitExceeded`` are throttling (the limit shrinks);
+    500s and deadline errors are retried without shrinking it.
+    """
+    from google.api_core import exceptions as gcp_exceptions
+
+    if isinstance(
+        exc, (gcp_exceptions.TooManyRequests, gcp_exceptions.ServiceUnavailable)
+    ):
+        return THROTTLED
+    if isinstance(exc, gcp_exceptions.Forbidden):
+        reasons = {
+            err.get("reason") for err in getattr(exc, "errors", None) or () if err
+        }
+        return THROTTLED if "rateLimitExceeded" in reasons else FAILED
+    if isinstance(
+        exc, (gcp_exceptions.InternalServerError, gcp_exceptions.DeadlineExceeded)
+    ):
+        return TRANSIENT
+    return FAILED
+
+
+class AdaptiveLimiter:
+    """Gate calls through a token bucket and an AIMD concurrency limit.
+
+    The limit starts at `max_concurrency`. Each throttled attempt multiplies
+    it by `decrease_factor` (at most once per limit generation, so one burst
+    of 429s counts as one signal); every `limit` consecutive successes add one
+    slot back. The limit never leaves
+    ``[min_concurrency, max_concurrency]``.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        *,
+        decrease_factor: float = 0.5,
+        max_attempts: int = analyze_config.RETRY_MAX_ATTEMPTS,
+        initial_delay: float = analyze_config.RETRY_INITIAL_DELAY,
+        backoff_multiplier: float = analyze_config.RETRY_BACKOFF_MULTIPLIER,
+        classify: Callable[[BaseException], str] = classify_bigquery_error,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.decrease_factor = decrease_factor
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.backoff_multiplier = backoff_multiplier
+        self.bucket = TokenBucket(rate, burst, clock, sleep) if rate else None
+        self._classify = classify
+        self._clock = clock
+        self._sleep = sleep
+        self._cond = threading.Condition()
+        self._limit = self.max_concurrency
+        self._window_successes = 0
+        self._in_flight = 0
+        self._generation = 0
+        self.metrics = LimiterMetrics(min_limit=self.max_concurrency)
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return self._limit
+
+    def _acquire(self) -> int:
+        start = self._clock()
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            self.metrics.calls += 1
+            self.metrics.peak_in_flight = max(
+                self.metrics.peak_in_flight, self._in_flight
+            )
+            self.metrics.slot_wait_seconds += self._clock() - start
+            generation = self._generation
+        if self.bucket is not None:
+            waited = self.bucket.acquire()
+            with self._cond:
+                self.metrics.rate_wait_seconds += waited
+        return generation
+
+    def _release(self, generation: int, outcome: str) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if outcome == OK:
+                self.metrics.successes += 1
+                self._window_successes += 1
+                if self._window_successes >= self._limit:
+                    self._window_successes = 0
+                    self._limit = min(self.max_concurrency, self._limit + 1)
+            elif outcome == THROTTLED:
+                self.metrics.throttles += 1
+                self._window_successes = 0
+                if generation == self._generation:
+                    self._limit = max(
+                        self.min_concurrency,
+                        int(self._limit * self.decrease_factor),
+                    )
+                    self._generation += 1
+                    self.metrics.decreases += 1
+                    self.metrics.min_limit = min(self.metrics.min_limit, self.limit)
+            self._cond.notify_all()
+
+    def call(
+        self, fn: Callable[[], T], operation_name: str = "BigQuery operation"
+    ) -> T:
+        """Run `fn` under the limiter, retrying throttled and transient errors.
+
+        Backoff sleeps happen outside the concurrency slot, so waiting calls
+        do not hold capacity. Non-retryable errors are raised immediately.
+        """
+        delay = self.initial_delay
+        for attempt in range(1, self.max_attempts + 1):
+            generation = self._acquire()
+            try:
+                result = fn()
+            except Exception as e:
+                outcome = self._classify(e)
+                self._release(generation, outcome)
+                if outcome == FAILED:
+                    with self._cond:
+                        self.metrics.failures += 1
+                    raise
+                if attempt == self.max_attempts:
+                    with self._cond:
+                        self.metrics.failures += 1
+                    logger.error(
+                        "%s failed after %d attempts: %s",
+                        operation_name,
+                        self.max_attempts,
+                        e,
+                    )
+                    raise
+                sleep_time = delay + random.uniform(0, delay * 0.25)
+                logger.warning(
+                    "%s %s (attempt %d/%d, limit %d), retrying in %.1fs: %s",
+                    operation_name,
+                    "throttled" if outcome == THROTTLED else "failed",
+                    attempt,
+                    self.max_attempts,
+                    self.limit,
+                    sleep_time,
+                    e,
+                )
+                with self._cond:
+                    self.metrics.retries += 1
+                self._sleep(sleep_time)
+                delay *= self.backoff_multiplier
+                continue
+            self._release(generation, OK)
+            return result
+        raise RuntimeError(f"{operation_name}: Exhausted retries without raising")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Metrics plus the current limit, as a plain dict."""
+        with self._cond:
+            return {**asdict(self.metrics), "limit": self.limit}
+
+
+_LIMITERS: dict[str, AdaptiveLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_bigquery_limiter(project_id: Optional[str] = None) -> AdaptiveLimiter:
+    """Return the process-wide limiter for `project_id` (quotas are per project).
+
+    Configured from analyze_config: ``PARALLEL_WORKERS`` (max concurrency),
+    ``BIGQUERY_API_QPS``/``BIGQUERY_API_BURST`` (rate) and
+    ``ADAPTIVE_MIN_WORKERS``/``ADAPTIVE_DECREASE_FACTOR`` (AIMD).
+    """
+    key = project_id or ""
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = _LIMITERS[key] = AdaptiveLimiter(
+                analyze_config.PARALLEL_WORKERS,
+                analyze_config.ADAPTIVE_MIN_WORKERS,
+                rate=analyze_config.BIGQUERY_API_QPS,
+                burst=analyze_config.BIGQUERY_API_BURST,
+                decrease_factor=analyze_config.ADAPTIVE_DECREASE_FACTOR,
+            )
+        return limiter
+
+
+__all__ = [
+    "TokenBucket",
+    "LimiterMetrics",
+    "AdaptiveLimiter",
+    "classify_bigquery_error",
+    "get_bigquery_limiter",
+]
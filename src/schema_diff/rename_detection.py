@@ -0,0 +1,281 @@
+"""Rename detection for schema diffs.
+
+`compute_path_changes` pairs fields that keep their leaf name but move; a
+field whose *name* changes (``userId`` → ``user_id``, ``cust_email`` →
+``customer_email``) still shows up as one removal plus one addition.
+
+This module pairs removed and added leaves by name similarity. Comparing every
+removed name with every added one is O(L×R), which is too slow for schemas
+with tens of thousands of fields, so candidates are generated with a
+MinHash-LSH index over character trigrams of the normalized leaf names:
+
+- each name is reduced to a small MinHash signature,
+- signatures are split into bands and bucketed, and
+- only names sharing a bucket are scored (exact trigram Jaccard).
+
+Candidates whose types are incompatible are dropped, and the remaining pairs
+are matched one-to-one, best score first. Results are plain dicts so they can
+go straight into a diff report::
+
+    {"left": "a.userId", "right": "a.user_id", "score": 1.0,
+     "left_type": "int", "right_type": "int"}
+
+Renamed leaves are not always entries of a report's ``only_in_*`` lists: when
+a whole parent is removed or added, only the parent is listed. Given those
+lists, `detect_renames` also reports the entry covering each side of a
+candidate (``left_entry``/``right_entry``; None when the leaf is under no
+entry, e.g. inside an object reported as a type mismatch).
+"""
+
+from __future__ import annotations
+
+import random
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+from .utils import PathIndex, _as_path_index
+
+DEFAULT_RENAME_THRESHOLD = 0.5
+
+# 32 permutations in 16 bands of 2 rows: pairs with Jaccard 0.5 collide in at
+# least one band with probability ~0.99, pairs below 0.2 rarely do.
+_NUM_PERM = 32
+_BANDS = 16
+_MERSENNE_PRIME = (1 << 61) - 1
+# Buckets larger than this are shared by most names (common prefixes such as
+# ``customer_``) and would make matching quadratic; they are not scored.
+_MAX_BUCKET = 64
+_rng = random.Random(0x5CEDD1FF)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(_NUM_PERM)
+]
+
+_NUMERIC = {"int", "float", "number", "integer", "numeric", "decimal"}
+_WILDCARD = {"any", "missing", "empty_array", "empty_object"}
+
+
+def _leaf_name(path: str) -> str:
+    return path.rsplit(".", 1)[-1]
+
+
+def _normalize_name(name: str) -> str:
+    """Casefold and drop separators so ``userId`` and ``user_id`` coincide.
+
+    Letters and digits of any script are kept (``名前`` stays ``名前``).
+    """
+    return "".join(ch for ch in name.casefold() if ch.isalnum())
+
+
+def _trigrams(name: str) -> frozenset[str]:
+    padded = f"^{name}$"
+    if len(padded) < 3:
+        return frozenset([padded])
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+@lru_cache(maxsize=65536)
+def _gram_hashes(gram: str) -> tuple[int, ...]:
+    """Hash one trigram under every permutation (trigram vocabularies are small)."""
+    v = zlib.crc32(gram.encode("utf-8"))
+    return tuple((a * v + b) % _MERSENNE_PRIME for a, b in _PERMUTATIONS)
+
+
+def _minhash(grams: frozenset[str]) -> tuple[int, ...]:
+    return tuple(map(min, zip(*(_gram_hashes(g) for g in grams))))
+
+
+def _type_members(t: Any) -> set[str]:
+    """Return the comparable type names of a normalized type (``missing`` dropped)."""
+    if t is None:
+        return set()
+    if isinstance(t, dict):
+        return {"object"}
+    if isinstance(t, list):
+        if not t:
+            return {"empty_array"}
+        return {f"[{m}]" for m in _type_members(t[0])} or {"[any]"}
+    s = str(t)
+    if s.startswith("union(") and s.endswith(")"):
+        parts = s[6:-1].split("|")
+    else:
+        parts = [s]
+    return {p for p in parts if p != "missing"}
+
+
+def types_compatible(left_type: Any, right_type: Any) -> bool:
+    """Return True if a field could plausibly have been renamed across these types.
+
+    Unknown types, ``any``/``missing`` and overlapping unions are compatible;
+    int and float are treated as one numeric family.
+    """
+    lt, rt = _type_members(left_type), _type_members(right_type)
+    if not lt or not rt or lt & _WILDCARD or rt & _WILDCARD or lt & rt:
+        return True
+    return bool(lt & _NUMERIC and rt & _NUMERIC)
+
+
+def match_renames(
+    removed: Mapping[str, Any],
+    added: Mapping[str, Any],
+    *,
+    threshold: float = DEFAULT_RENAME_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Pair removed and added field paths that look like renames.
+
+    Args:
+        removed: Removed path -> type (None if unknown)
+        added: Added path -> type (None if unknown)
+        threshold: Minimum trigram Jaccard similarity of the leaf names
+
+    Returns:
+        One-to-one rename candidates, best score first
+    """
+    if not removed or not added:
+        return []
+
+    def profile(paths: Mapping[str, Any]) -> dict[str, frozenset[str]]:
+        # Names without letters or digits (e.g. ``_``) carry no similarity
+        # signal and would all look identical; they are never candidates.
+        names = {p: _normalize_name(_leaf_name(p)) for p in paths}
+        return {p: _trigrams(n) for p, n in names.items() if n}
+
+    left_grams, right_grams = profile(removed), profile(added)
+
+    # Band buckets: (band, band-signature) -> added paths
+    buckets: dict[tuple[int, tuple[int, ...]], list[str]] = defaultdict(list)
+    rows = _NUM_PERM // _BANDS
+    signatures: dict[frozenset[str], tuple[int, ...]] = {}
+
+    def signature(grams: frozenset[str]) -> tuple[int, ...]:
+        if grams not in signatures:
+            signatures[grams] = _minhash(grams)
+        return signatures[grams]
+
+    for path, grams in right_grams.items():
+        sig = signature(grams)
+        for band in range(_BANDS):
+            buckets[(band, sig[band * rows : (band + 1) * rows])].append(path)
+
+    scored: list[tuple[float, bool, str, str]] = []
+    for lpath, lgrams in left_grams.items():
+        sig = signature(lgrams)
+        seen: set[str] = set()
+        for band in range(_BANDS):
+            bucket = buckets.get((band, sig[band * rows : (band + 1) * rows]), ())
+            if len(bucket) > _MAX_BUCKET:
+                continue  # hub bucket (shared prefix/suffix grams): no signal
+            for rpath in bucket:
+                if rpath in seen:
+                    continue
+                seen.add(rpath)
+                if _leaf_name(lpath) == _leaf_name(rpath):
+                    continue  # same name: a path change, not a rename
+                rgrams = right_grams[rpath]
+                score = len(lgrams & rgrams) / len(lgrams | rgrams)
+                if score < threshold:
+                    continue
+                if not types_compatible(removed[lpath], added[rpath]):
+                    continue
+                moved = lpath.rpartition(".")[0] != rpath.rpartition(".")[0]
+                scored.append((score, moved, lpath, rpath))
+
+    scored.sort(key=lambda s: (-s[0], s[1], s[2], s[3]))
+    used_left: set[str] = set()
+    used_right: set[str] = set()
+    out: list[dict[str, Any]] = []
+    for score, _moved, lpath, rpath in scored:
+        if lpath in used_left or rpath in used_right:
+            continue
+        used_left.add(lpath)
+        used_right.add(rpath)
+        out.append(
+            {
+                "left": lpath,
+                "right": rpath,
+                "score": round(score, 3),
+                "left_type": _display_type(removed[lpath]),
+                "right_type": _display_type(added[rpath]),
+            }
+        )
+    return out
+
+
+def _display_type(t: Any) -> Optional[str]:
+    if t is None:
+        return None
+    members = sorted(_type_members(t))
+    return "|".join(members) if members else "missing"
+
+
+def _covering_entry(path: str, entries: Mapping[str, str]) -> Optional[str]:
+    """Entry equal to `path` or an ancestor of it (``a`` covers ``a[].b``).
+
+    `entries` maps display-notation paths to the original entries.
+    """
+    prefix = path
+    while True:
+        if prefix in entries:
+            return entries[prefix]
+        cut = max(prefix.rfind("."), prefix.rfind("[]"))
+        if cut <= 0:
+            return None
+        prefix = prefix[:cut]
+
+
+def detect_renames(
+    left: Union[Any, PathIndex],
+    right: Union[Any, PathIndex],
+    *,
+    threshold: float = DEFAULT_RENAME_THRESHOLD,
+    only_in_left: Optional[Iterable[str]] = None,
+    only_in_right: Optional[Iterable[str]] = None,
+) -> list[dict[str, Any]]:
+    """Detect likely renamed fields between two trees (or prebuilt PathIndexes).
+
+    Only leaves that exist on one side alone are considered. Paths are
+    reported in display notation (``[]`` for array-of-object elements), like
+    the ``only_in_*`` sections of a diff report.
+
+    Args:
+        left: Left tree or PathIndex
+        right: Right tree or PathIndex
+        threshold: Minimum trigram Jaccard similarity of the leaf names
+        only_in_left: The report's ``only_in_file1`` entries; when given (with
+            `only_in_right`), each candidate gets ``left_entry``/``right_entry``
+        only_in_right: The report's ``only_in_file2`` entries
+
+    Returns:
+        One-to-one rename candidates, best score first
+    """
+    li, ri = _as_path_index(left), _as_path_index(right)
+    left_leaves, right_leaves = li.leaf_set(), ri.leaf_set()
+    removed = {
+        p.replace("[0]", "[]"): li.types.get(p)
+        for p in li.leaves
+        if p not in right_leaves
+    }
+    added = {
+        p.replace("[0]", "[]"): ri.types.get(p)
+        for p in ri.leaves
+        if p not in left_leaves
+    }
+    renames = match_renames(removed, added, threshold=threshold)
+    if only_in_left is not None and only_in_right is not None:
+        left_entries = {e.replace("[0]", "[]"): e for e in only_in_left}
+        right_entries = {e.replace("[0]", "[]"): e for e in only_in_right}
+        for rename in renames:
+            rename["left_entry"] = _covering_entry(rename["left"], left_entries)
+            rename["right_entry"] = _covering_entry(rename["right"], right_entries)
+    return renames
+
+
+__all__ = [
+    "DEFAULT_RENAME_THRESHOLD",
+    "detect_renames",
+    "match_renames",
+    "types_compatible",
+]
@@ -21,11 +21,11 @@ Key features
 
 from __future__ import annotations
 
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from .normalize import _has_any
 from .type_analysis import analyze_type_change
-from .utils import clean_deepdiff_path, fmt_dot_path
+from .utils import PathIndex, build_path_index, clean_deepdiff_path, fmt_dot_path
 
 
 def fmt_presence_type(type_repr: str, is_schema_source: bool = False) -> str:
@@ -157,7 +157,13 @@ def _root_list_value_change_fallback(diff) -> tuple[list[str], list[str]]:
 
 
 def build_report_struct(
-    diff, f1: str, f2: str, include_presence: bool
+    diff,
+    f1: str,
+    f2: str,
+    include_presence: bool,
+    *,
+    left_index: Optional[PathIndex] = None,
+    right_index: Optional[PathIndex] = None,
 ) -> dict[str, Any]:
     """Convert a DeepDiff into a stable, JSON-serializable report structure.
 
@@ -182,6 +188,10 @@ def build_report_struct(
         Labels for the two compared inputs (used in meta.direction).
     include_presence : bool
         Whether to include presence-only differences in the output.
+    left_index, right_index : PathIndex, optional
+        Prebuilt indexes of the compared trees. When given, nested fields of
+        arrays that changed between unstructured and structured are read from
+        the index instead of re-walking the subtree.
 
     Returns
     -------
@@ -292,6 +302,16 @@ def build_report_struct(
         # Extract nested fields from type changes (unstructured -> structured arrays)
         base_path = clean_deepdiff_path(p)
 
+        def nested_from_index(index, array_path):
+            """Return element field paths under `array_path` from a PathIndex."""
+            if index is None or array_path not in index.types:
+                return None
+            element_prefix = f"{array_path}[0]"
+            return [
+                f"{array_path}[]" + path[len(element_prefix) :].replace("[0]", "[]")
+                for path in index.descendants(array_path)
+            ]
+
         def extract_nested_fields(schema_tree, path_prefix=""):
             """Extract all field paths from a schema tree."""
             paths = []
@@ -317,7 +337,9 @@ def build_report_struct(
             and isinstance(new[0], dict)
         ):
             # Extract nested fields from the new structured array
-            nested_fields = extract_nested_fields(new[0], f"{base_path}[]")
+            nested_fields = nested_from_index(right_index, base_path)
+            if nested_fields is None:
+                nested_fields = extract_nested_fields(new[0], f"{base_path}[]")
             only_in_2.extend(nested_fields)
 
         # Check if this is a transition from structured to unstructured array
@@ -329,7 +351,9 @@ def build_report_struct(
             and isinstance(old[0], dict)
         ):
             # Extract nested fields from the old structured array
-            nested_fields = extract_nested_fields(old[0], f"{base_path}[]")
+            nested_fields = nested_from_index(left_index, base_path)
+            if nested_fields is None:
+                nested_fields = extract_nested_fields(old[0], f"{base_path}[]")
             only_in_1.extend(nested_fields)
 
         # Only add if there's actually a meaningful difference and not a sampling artifact
@@ -385,6 +409,7 @@ def print_report_text(
     only_common: bool = False,
     left_samples: dict | None = None,
     right_samples: dict | None = None,
+    data_presence: bool = False,
 ) -> None:
     """Pretty-print a report structure returned by `build_report_struct`.
 
@@ -400,6 +425,9 @@ def print_report_text(
         If True, prints the presence section (if present in the report).
     title_suffix : str
         Optional extra detail shown in the header (e.g., “; record #1”).
+    data_presence : bool
+        If True, data sides carry inferred required paths, so their presence
+        mismatches are shown instead of skipped.
     """
     RED, GRN, YEL, CYN, RST = colors
 
@@ -460,14 +488,23 @@ def print_report_text(
         }
         left_is_schema = left_source_type in SCHEMA_SOURCES
         right_is_schema = right_source_type in SCHEMA_SOURCES
+        if data_presence:
+            # Data sides carry inferred required paths, i.e. real nullability
+            left_is_schema = left_is_schema or left_source_type == "data"
+            right_is_schema = right_is_schema or right_source_type == "data"
 
         # Skip presence issues for data-to-schema and data-to-data comparisons
         # Data files don't have meaningful nullability constraints, so presence differences
         # are only meaningful when comparing schema-to-schema
-        is_data_to_schema = (left_source_type == "data" and right_is_schema) or (
-            right_source_type == "data" and left_is_schema
+        is_data_to_schema = not data_presence and (
+            (left_source_type == "data" and right_is_schema)
+            or (right_source_type == "data" and left_is_schema)
+        )
+        is_data_to_data = (
+            not data_presence
+            and left_source_type == "data"
+            and right_source_type == "data"
         )
-        is_data_to_data = left_source_type == "data" and right_source_type == "data"
 
         actual_presence_issues: list[Tuple[Dict[str, Any], str, str]] = []
 
@@ -552,6 +589,9 @@ def print_common_fields(
     sch1n: Any,
     sch2n: Any,
     colors: tuple[str, str, str, str, str],
+    *,
+    left_index: Optional[PathIndex] = None,
+    right_index: Optional[PathIndex] = None,
 ) -> None:
     """Print the intersection of field paths (including nested fields) when. both roots
     are objects.
@@ -564,6 +604,8 @@ def print_common_fields(
         Normalized/coerced trees. Only dict roots contribute fields.
     colors : tuple[str, str, str, str, str]
         (RED, GRN, YEL, CYN, RST) color codes; pass empty strings to disable.
+    left_index, right_index : PathIndex, optional
+        Prebuilt indexes of `sch1n`/`sch2n`; built here when not supplied.
     """
     RED, GRN, YEL, CYN, RST = colors
 
@@ -574,15 +616,14 @@ def print_common_fields(
         """
         return x if isinstance(x, dict) else {}
 
-    d1 = _as_field_dict(sch1n)
-    d2 = _as_field_dict(sch2n)
-
-    # Use flatten_paths to get all nested field paths
-    from .utils import flatten_paths
+    def _field_index(x: Any, index: Optional[PathIndex]) -> PathIndex:
+        if not isinstance(x, dict):
+            return PathIndex()
+        return index if index is not None else build_path_index(_as_field_dict(x))
 
-    paths1 = flatten_paths(d1)
-    paths2 = flatten_paths(d2)
-    common_paths = sorted(set(paths1) & set(paths2))
+    paths1 = _field_index(sch1n, left_index).leaf_set()
+    paths2 = _field_index(sch2n, right_index).leaf_set()
+    common_paths = sorted(paths1 & paths2)
 
     print(
         f"\n{YEL}-- Common fields in {left_label} ∩ {right_label} -- ({len(common_paths)}){RST}"
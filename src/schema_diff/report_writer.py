@@ -0,0 +1,84 @@
+"""Report file writers.
+
+Reports are written either as one JSON document (``json.dump(report, fh,
+indent=2)``) or as NDJSON: one JSON object per line, tagged with its
+``section``, which is convenient for downstream tools that filter or load
+entries lazily. Either way the report dict is built in memory first; NDJSON
+is an output format for consumers, not a way to bound the writer's memory.
+
+Public helpers
+--------------
+- NDJSONReportWriter – write report fields/sections as tagged NDJSON lines
+- write_report       – write a report dict as JSON or NDJSON
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from typing import Any, Optional, TextIO
+
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+
+class NDJSONReportWriter:
+    """Write a report as newline-delimited JSON, one record per entry.
+
+    Every line carries a ``section`` key. Dict entries are merged into the
+    record, string entries (e.g. ``only_in_*`` paths) become ``{"path": ...}``
+    and plain fields become ``{"value": ...}``.
+    """
+
+    def __init__(self, fh: TextIO) -> None:
+        self._fh = fh
+
+    def _line(self, record: dict[str, Any]) -> None:
+        self._fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def write_field(self, key: str, value: Any) -> None:
+        """Write a scalar or dict report field as one ``section`` record."""
+        if isinstance(value, dict):
+            self._line({"section": key, **value})
+        else:
+            self._line({"section": key, "value": value})
+
+    def write_section(self, key: str, items: Iterable[Any]) -> int:
+        """Write each entry of a list section as its own record; return the count."""
+        count = 0
+        for item in items:
+            if isinstance(item, dict):
+                self._line({"section": key, **item})
+            elif isinstance(item, str):
+                self._line({"section": key, "path": item})
+            else:
+                self._line({"section": key, "value": item})
+            count += 1
+        return count
+
+
+def write_report(
+    report: dict[str, Any], path: str, *, ndjson: Optional[bool] = None
+) -> None:
+    """Write a report to `path`.
+
+    Args:
+        report: Report dict (e.g. from ``build_report_struct``)
+        path: Output file path
+        ndjson: Force NDJSON (True) or JSON (False); by default NDJSON is used
+            for ``.ndjson``/``.jsonl`` paths
+    """
+    if ndjson is None:
+        ndjson = path.lower().endswith(NDJSON_EXTENSIONS)
+    with open(path, "w", encoding="utf-8") as fh:
+        if not ndjson:
+            json.dump(report, fh, ensure_ascii=False, indent=2)
+            return
+        writer = NDJSONReportWriter(fh)
+        for key, value in report.items():
+            if isinstance(value, list):
+                writer.write_section(key, value)
+            else:
+                writer.write_field(key, value)
+
+
+__all__ = ["NDJSONReportWriter", "write_report"]
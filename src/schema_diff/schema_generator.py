@@ -312,6 +312,7 @@ def generate_schema_from_data(
     table_name: str = "generated_table",
     required_fields: Optional[Set[str]] = None,
     validate: bool = True,
+    profiler: Optional[Any] = None,
 ) -> str:
     """Generate a schema in the specified format from data records.
 
@@ -321,12 +322,13 @@ def generate_schema_from_data(
         format: Output format ('json_schema', 'sql_ddl', 'bigquery_ddl', 'spark', 'bigquery_json', 'openapi')
         table_name: Name for the table/schema (used in SQL DDL)
         required_fields: Set of field paths that should be marked as required
+        profiler: Optional DataProfiler that profiles records during inference
 
     Returns:
         Generated schema as a string
     """
     # Generate internal schema from records
-    internal_schema = merged_schema_from_samples(records, cfg)
+    internal_schema = merged_schema_from_samples(records, cfg, profiler)
 
     # Generate the schema based on format
     if format == "json_schema":
@@ -0,0 +1,130 @@
+"""Byte-range index of CREATE TABLE statements in large SQL DDL files.
+
+Picking one table out of a multi-table dump (e.g. a ``pg_dump`` with tens of
+thousands of tables) should not re-parse every statement. This module splits
+the file into statements in a single pass and records, for every CREATE TABLE,
+the byte range it occupies. The index is cached on disk next to the other
+schema-diff caches and is reused until the file's size or mtime changes.
+
+Public helpers
+--------------
+- split_sql_statements   – one-pass statement splitter (quotes/comments aware)
+- build_sql_table_index  – table name → byte range for a file's contents
+- load_sql_table_index   – cached index for a local file (None if not indexable)
+- read_sql_range         – read one statement back as text
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, Optional
+
+from .io_utils import load_cached_file_index
+from .utils import strip_quotes_ident
+
+__all__ = [
+    "split_sql_statements",
+    "build_sql_table_index",
+    "load_sql_table_index",
+    "read_sql_range",
+]
+
+# Bump when the index layout or the splitting rules change
+_INDEX_VERSION = 1
+
+# Next byte that can change the splitter's state
+_SPLIT_TOKEN_RE = re.compile(rb"[;'\"`]|--|/\*|\$[A-Za-z_0-9]*\$")
+
+# Leading whitespace and comments before a statement's first keyword
+_LEADING_NOISE_RE = re.compile(rb"(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/)*", re.DOTALL)
+
+# Same header shapes as `sql_schema_parser.SQL_CREATE_RE_FULL`
+_CREATE_TABLE_RE = re.compile(
+    rb"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<full>[^(\s]+)\s*\(",
+    re.IGNORECASE,
+)
+
+_CLOSERS = {b"'": b"'", b'"': b'"', b"`": b"`", b"/*": b"*/", b"--": b"\n"}
+
+
+def split_sql_statements(data: bytes) -> list[tuple[int, int]]:
+    """Return ``(start, end)`` byte ranges of the statements in `data`.
+
+    Statements end at ``;`` outside string literals, quoted identifiers,
+    comments and dollar-quoted bodies (``$$ ... $$`` / ``$tag$ ... $tag$``).
+    The terminating ``;`` is included; a trailing statement without one is
+    kept as well. Whitespace-only ranges are dropped.
+    """
+    ranges: list[tuple[int, int]] = []
+    start = pos = 0
+    n = len(data)
+    while pos < n:
+        m = _SPLIT_TOKEN_RE.search(data, pos)
+        if m is None:
+            break
+        tok = m.group()
+        if tok == b";":
+            ranges.append((start, m.end()))
+            start = pos = m.end()
+            continue
+        closer = _CLOSERS.get(tok, tok)  # dollar quotes close with themselves
+        end = data.find(closer, m.end())
+        while (
+            end != -1 and tok in (b"'", b'"', b"`") and data[end + 1 : end + 2] == tok
+        ):
+            end = data.find(closer, end + 2)  # doubled quote is an escape
+        pos = n if end == -1 else end + len(closer)
+    if start < n:
+        ranges.append((start, n))
+    return [(s, e) for s, e in ranges if data[s:e].strip()]
+
+
+def build_sql_table_index(data: bytes) -> dict[str, Any]:
+    """Index the CREATE TABLE statements in `data`.
+
+    Returns:
+        ``{"tables": {full_name: [start, end]}, "names": {alias: full_name}}``
+        where aliases are the lower-cased full and bare table names, matching
+        how `schema_from_sql_schema_file` resolves ``table=``.
+    """
+    tables: dict[str, list[int]] = {}
+    names: dict[str, str] = {}
+    for start, end in split_sql_statements(data):
+        head = _LEADING_NOISE_RE.match(data, start, end)
+        m = _CREATE_TABLE_RE.match(data, head.end() if head else start, end)
+        if m is None:
+            continue
+        full_name = strip_quotes_ident(m.group("full").decode("utf-8", "replace"))
+        table_name = full_name.split(".")[-1].strip("`")
+        tables[full_name] = [start, end]
+        names[full_name.lower()] = full_name
+        names[table_name.lower()] = full_name
+    return {"tables": tables, "names": names}
+
+
+def load_sql_table_index(
+    path: str, cache_dir: Optional[Path] = None
+) -> Optional[dict[str, Any]]:
+    """Return the table index for a local, uncompressed SQL file.
+
+    The index is cached as JSON under `cache_dir` (default
+    ``~/.cache/schema-diff/sql_index``) keyed by the file's absolute path and
+    validated against its size and mtime. Returns None for paths whose byte
+    offsets are not meaningful (missing, remote or gzip-compressed files).
+    """
+    index: Optional[dict[str, Any]] = load_cached_file_index(
+        path,
+        "sql_index",
+        lambda fh: build_sql_table_index(fh.read()),
+        version=_INDEX_VERSION,
+        cache_dir=cache_dir,
+    )
+    return index
+
+
+def read_sql_range(path: str, start: int, end: int) -> str:
+    """Read bytes ``[start, end)`` of `path` as text."""
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        return fh.read(end - start).decode("utf-8-sig")
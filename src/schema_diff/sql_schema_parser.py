@@ -35,14 +35,21 @@ Enhanced Capabilities:
 
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 from .decorators import cache_expensive_operation, validate_and_time
 from .io_utils import open_text
+from .sql_ddl_index import load_sql_table_index, read_sql_range
 from .utils import strip_quotes_ident
 
-__all__ = ["schema_from_sql_schema_file", "schema_from_sql_schema_file_unified"]
+__all__ = [
+    "schema_from_sql_schema_file",
+    "schema_from_sql_schema_file_all",
+    "schema_from_sql_schema_file_unified",
+]
 
 # --- Regexes ---------------------------------------------------------------
 
@@ -521,29 +528,15 @@ def _extract_complete_type(line: str) -> str:
     return result.strip()
 
 
-# --- Main API --------------------------------------------------------------
-
-
-@cache_expensive_operation
-@validate_and_time
-def schema_from_sql_schema_file(
-    path: str, table: str | None = None
-) -> tuple[dict[str, Any], set[str]]:
-    """Parse SQL schema content from `path`.
-
-    Args:
-        path: File with SQL DDL (or loose column list).
-        table: Optional selector for a particular CREATE TABLE block. Case-insensitive.
-               Accepts fully-qualified (e.g., project.dataset.table) or simple table name.
+def _parse_sql_tables(
+    text: str,
+) -> tuple[dict[str, dict[str, Any]], dict[str, set[str]], dict[str, str]]:
+    """Parse every CREATE TABLE block (or a loose column list) in `text`.
 
     Returns:
-        (schema_tree, required_paths)
-          - schema_tree: pure type tree (no presence 'missing' injection)
-          - required_paths: set of NOT NULL column names (flat)
+        (tables, required_by_table, name_lc_to_full) keyed by full table name;
+        `name_lc_to_full` maps lower-cased full and bare names to the key.
     """
-    with open_text(path) as f:
-        text = f.read()
-
     text = _strip_sql_comments(text)
     text = _reconstruct_multiline_structs(text)
     lines = text.splitlines()
@@ -714,6 +707,78 @@ def schema_from_sql_schema_file(
     if in_block:
         _finish_block()
 
+    return tables, required_by_table, name_lc_to_full
+
+
+def _parse_sql_ranges(
+    path: str, ranges: list[tuple[int, int]]
+) -> dict[str, tuple[dict[str, Any], set[str]]]:
+    """Parse the CREATE TABLE statements at the given byte ranges of `path`."""
+    out: dict[str, tuple[dict[str, Any], set[str]]] = {}
+    for start, end in ranges:
+        tables, required_by_table, _ = _parse_sql_tables(
+            read_sql_range(path, start, end)
+        )
+        for name, tree in tables.items():
+            out[name] = (tree, required_by_table.get(name, set()))
+    return out
+
+
+def _lookup_indexed_table(
+    path: str, table: str
+) -> tuple[dict[str, Any], set[str]] | None:
+    """Parse only the CREATE TABLE statement for `table` using the file index.
+
+    Returns None when the file cannot be indexed or the indexed statement does
+    not parse to the requested table; callers then fall back to a full scan.
+    """
+    index = load_sql_table_index(path)
+    if not index:
+        return None
+    full = index["names"].get(table.strip().lower())
+    if full is None:
+        return None
+    start, end = index["tables"][full]
+    tables, required_by_table, _ = _parse_sql_tables(read_sql_range(path, start, end))
+    if full not in tables:
+        return None
+    return tables[full], required_by_table.get(full, set())
+
+
+# --- Main API --------------------------------------------------------------
+
+
+@cache_expensive_operation
+@validate_and_time
+def schema_from_sql_schema_file(
+    path: str, table: str | None = None
+) -> tuple[dict[str, Any], set[str]]:
+    """Parse SQL schema content from `path`.
+
+    With `table`, local uncompressed files are looked up through a cached
+    table → byte-range index (see `sql_ddl_index`), so only the requested
+    CREATE TABLE statement is parsed.
+
+    Args:
+        path: File with SQL DDL (or loose column list).
+        table: Optional selector for a particular CREATE TABLE block. Case-insensitive.
+               Accepts fully-qualified (e.g., project.dataset.table) or simple table name.
+
+    Returns:
+        (schema_tree, required_paths)
+          - schema_tree: pure type tree (no presence 'missing' injection)
+          - required_paths: set of NOT NULL column names (flat)
+    """
+    if table:
+        hit = _lookup_indexed_table(path, table)
+        if hit is not None:
+            return hit
+
+    with open_text(path) as f:
+        text = f.read()
+
+    tables, required_by_table, name_lc_to_full = _parse_sql_tables(text)
+
     if not tables:
         return {}, set()
 
@@ -744,3 +809,41 @@ def schema_from_sql_schema_file_unified(path: str, table: str | None = None):
 
     tree, required = schema_from_sql_schema_file(path, table)
     return from_legacy_tree(tree, required, source_type="sql")
+
+
+def schema_from_sql_schema_file_all(
+    path: str, workers: int | None = None
+) -> dict[str, tuple[dict[str, Any], set[str]]]:
+    """Parse every CREATE TABLE in `path`.
+
+    Indexed files are parsed statement by statement in a process pool
+    (`workers` processes, default: CPU count); other inputs fall back to a
+    single full scan.
+
+    Returns:
+        {full_table_name: (schema_tree, required_paths)} in file order.
+    """
+    index = load_sql_table_index(path)
+    if index is None:
+        with open_text(path) as f:
+            tables, required_by_table, _ = _parse_sql_tables(f.read())
+        return {
+            name: (tree, required_by_table.get(name, set()))
+            for name, tree in tables.items()
+        }
+
+    ranges = sorted(tuple(r) for r in index["tables"].values())
+    workers = max(1, min(workers or os.cpu_count() or 1, len(ranges)))
+    if workers == 1:
+        return _parse_sql_ranges(path, ranges)
+
+    # Contiguous chunks keep each worker's reads sequential; a few chunks per
+    # worker even out large and small statements
+    n_chunks = min(len(ranges), workers * 4)
+    size = -(-len(ranges) // n_chunks)
+    chunks = [ranges[i : i + size] for i in range(0, len(ranges), size)]
+    out: dict[str, tuple[dict[str, Any], set[str]]] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_parse_sql_ranges, [path] * len(chunks), chunks):
+            out.update(part)
+    return out
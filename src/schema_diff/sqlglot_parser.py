@@ -29,13 +29,29 @@ Usage:
         dialect="postgres"
     )
 
+    # Every table of a large dump, parsed across processes
+    tables = schemas_from_sql_ddl_sqlglot("dump.sql", dialect="postgres")
+
+Large files are split into statements (see `sql_ddl_index.split_sql_statements`)
+and parsed in a process pool. Parsed CREATE TABLE results are cached on disk
+per file, keyed by statement hash, so re-parsing a dump where a few tables
+changed only parses those statements.
+
 Requirements:
     pip install sqlglot>=25.0.0
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import Any
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .io_utils import open_text
+from .sql_ddl_index import split_sql_statements
 
 logger = logging.getLogger(__name__)
 
@@ -205,10 +221,184 @@ def _extract_schema_from_create_table(
     return schema_dict, required_fields
 
 
+# Bump when the cached per-statement results change shape
+_STATEMENT_CACHE_VERSION = 1
+
+# Below this many statements to parse, a process pool costs more than it saves
+_MIN_PARALLEL_STATEMENTS = 200
+
+
+def _require_sqlglot() -> None:
+    if not _HAS_SQLGLOT:
+        raise ImportError(
+            "SQLGlot support requires 'sqlglot'. "
+            "Install with: pip install 'schema-diff[sqlglot]'"
+        )
+
+
+def _split_statements(sql_content: str) -> list[str]:
+    """Split SQL text into statements (quotes, comments and $$ bodies aware)."""
+    data = sql_content.encode("utf-8")
+    return [data[s:e].decode("utf-8").strip() for s, e in split_sql_statements(data)]
+
+
+def _map_statements(
+    func: Callable[..., list[Any]],
+    statements: list[str],
+    workers: int | None,
+    *args: Any,
+) -> list[Any]:
+    """Apply `func(chunk, *args)` over `statements` in contiguous chunks.
+
+    Small batches (or ``workers=1``) run in-process; larger ones are spread
+    over a process pool. Results keep the order of `statements`.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(statements) < _MIN_PARALLEL_STATEMENTS:
+        return func(statements, *args)
+
+    n_chunks = min(len(statements), workers * 4)
+    size = -(-len(statements) // n_chunks)
+    chunks = [statements[i : i + size] for i in range(0, len(statements), size)]
+    out: list[Any] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(func, chunks, *([a] * len(chunks) for a in args)):
+            out.extend(part)
+    return out
+
+
+def _parse_create_tables(statements: list[str], dialect: str) -> list[Any]:
+    """Parse each statement; CREATE TABLEs become [full, name, tree, required].
+
+    Other statements map to None. Entries are JSON-serializable so they can
+    be cached on disk.
+    """
+    out: list[Any] = []
+    for text in statements:
+        entry = None
+        for stmt in sqlglot.parse(text, dialect=dialect):
+            if isinstance(stmt, exp.Create) and stmt.kind == "TABLE":
+                table = stmt.find(exp.Table)
+                parts = (table.catalog, table.db, table.name) if table else ()
+                tree, required = _extract_schema_from_create_table(stmt)
+                entry = [
+                    ".".join(p for p in parts if p),
+                    table.name if table else "",
+                    tree,
+                    sorted(required),
+                ]
+        out.append(entry)
+    return out
+
+
+def _statement_cache_path(path: str, dialect: str, cache_dir: Optional[Path]) -> Path:
+    if cache_dir is None:
+        from .decorators import _cache_manager
+
+        cache_dir = _cache_manager.cache_dir / "sqlglot"
+    token = f"{os.path.realpath(path)}\0{dialect}".encode("utf-8")
+    return cache_dir / f"{hashlib.sha1(token, usedforsecurity=False).hexdigest()}.json"
+
+
+def _parse_statements_cached(
+    path: str,
+    dialect: str,
+    workers: int | None,
+    use_cache: bool,
+    cache_dir: Optional[Path] = None,
+) -> list[Any]:
+    """Return `_parse_create_tables` entries for every statement in `path`.
+
+    Only statements whose hash is not in the file's cache are parsed. The
+    cache is rewritten with the current statements, so entries for removed
+    or edited statements do not accumulate.
+    """
+    with open_text(path) as f:
+        statements = _split_statements(f.read())
+    keys = [
+        hashlib.sha1(
+            f"{dialect}\0{text}".encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+        for text in statements
+    ]
+    version = [_STATEMENT_CACHE_VERSION, getattr(sqlglot, "__version__", "")]
+
+    cached: dict[str, Any] = {}
+    cache_path = _statement_cache_path(path, dialect, cache_dir) if use_cache else None
+    if cache_path is not None:
+        try:
+            with open(cache_path, encoding="utf-8") as fh:
+                payload = json.load(fh)
+            if payload.get("version") == version:
+                cached = payload["statements"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    todo = {k: text for k, text in zip(keys, statements) if k not in cached}
+    if todo:
+        parsed = _map_statements(
+            _parse_create_tables, list(todo.values()), workers, dialect
+        )
+        cached.update(zip(todo, parsed))
+    logger.debug(
+        "sqlglot: parsed %d of %d statements in %s", len(todo), len(keys), path
+    )
+
+    if cache_path is not None and (todo or len(cached) != len(set(keys))):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(
+                    {"version": version, "statements": {k: cached[k] for k in keys}},
+                    fh,
+                )
+            os.replace(tmp, cache_path)
+        except OSError:
+            logger.debug("sqlglot: could not write statement cache %s", cache_path)
+
+    return [cached[k] for k in keys]
+
+
+def schemas_from_sql_ddl_sqlglot(
+    path: str,
+    dialect: str = "bigquery",
+    workers: int | None = None,
+    use_cache: bool = True,
+) -> dict[str, tuple[dict[str, Any], set[str]]]:
+    """Parse every CREATE TABLE in a SQL DDL file, one entry per table.
+
+    Args:
+        path: Path to SQL DDL file
+        dialect: Source SQL dialect (bigquery, postgres, mysql, snowflake, etc.)
+        workers: Processes for parsing large files (default: CPU count)
+        use_cache: Reuse per-statement results cached for this file
+
+    Returns:
+        {full_table_name: (schema_tree, required_paths)} in file order
+
+    Raises:
+        ImportError: If sqlglot is not installed
+        ValueError: If SQL parsing fails
+    """
+    _require_sqlglot()
+    try:
+        entries = _parse_statements_cached(path, dialect, workers, use_cache)
+    except Exception as e:
+        logger.error(f"Failed to parse SQL DDL with SQLGlot: {e}")
+        raise ValueError(f"SQL parsing failed: {e}") from e
+    return {
+        full: (tree, set(required))
+        for full, _name, tree, required in filter(None, entries)
+    }
+
+
 def schema_from_sql_ddl_sqlglot(
     path: str,
     dialect: str = "bigquery",
     table_name: str | None = None,
+    workers: int | None = None,
+    use_cache: bool = True,
 ) -> tuple[dict[str, Any], set[str]]:
     """Parse SQL DDL file using SQLGlot for enhanced cross-dialect support.
 
@@ -216,6 +406,8 @@ def schema_from_sql_ddl_sqlglot(
         path: Path to SQL DDL file
         dialect: Source SQL dialect (bigquery, postgres, mysql, snowflake, etc.)
         table_name: Optional table name to extract (if file has multiple tables)
+        workers: Processes for parsing large files (default: CPU count)
+        use_cache: Reuse per-statement results cached for this file
 
     Returns:
         Tuple of (schema_tree, required_paths)
@@ -226,60 +418,104 @@ def schema_from_sql_ddl_sqlglot(
         ImportError: If sqlglot is not installed
         ValueError: If SQL parsing fails
     """
-    if not _HAS_SQLGLOT:
-        raise ImportError(
-            "SQLGlot support requires 'sqlglot'. "
-            "Install with: pip install 'schema-diff[sqlglot]'"
-        )
+    _require_sqlglot()
 
     try:
-        # Read SQL file
-        with open(path, "r", encoding="utf-8") as f:
-            sql_content = f.read()
+        entries = _parse_statements_cached(path, dialect, workers, use_cache)
+    except Exception as e:
+        logger.error(f"Failed to parse SQL DDL with SQLGlot: {e}")
+        raise ValueError(f"SQL parsing failed: {e}") from e
 
-        # Parse SQL with specified dialect
-        statements = sqlglot.parse(sql_content, dialect=dialect)
+    # Find CREATE TABLE statements
+    all_schemas = []
+    all_required = set()
 
-        # Find CREATE TABLE statements
-        all_schemas = []
-        all_required = set()
+    for _full, name, schema_dict, required in filter(None, entries):
+        if table_name and name and name != table_name:
+            continue
+        if schema_dict:  # Only add if we found columns
+            all_schemas.append(schema_dict)
+            all_required.update(required)
 
-        for stmt in statements:
-            if isinstance(stmt, exp.Create) and stmt.kind == "TABLE":
-                schema_dict, required = _extract_schema_from_create_table(
-                    stmt, table_name
-                )
-                if schema_dict:  # Only add if we found columns
-                    all_schemas.append(schema_dict)
-                    all_required.update(required)
+    # Merge all schemas if multiple tables (or return first if filtering)
+    if not all_schemas:
+        logger.warning(f"No CREATE TABLE statements found in {path}")
+        return {}, set()
+
+    if table_name or len(all_schemas) == 1:
+        return all_schemas[0], all_required
+
+    # Merge multiple tables
+    merged_schema = {}
+    for schema in all_schemas:
+        merged_schema.update(schema)
+
+    return merged_schema, all_required
 
-        # Merge all schemas if multiple tables (or return first if filtering)
-        if not all_schemas:
-            logger.warning(f"No CREATE TABLE statements found in {path}")
-            return {}, set()
 
-        if table_name or len(all_schemas) == 1:
-            return all_schemas[0], all_required
+def _translate_statements(
+    statements: list[str], from_dialect: str, to_dialect: str
+) -> list[str]:
+    """Translate each statement; comment-only statements are dropped."""
+    out = []
+    for text in statements:
+        for ast in sqlglot.parse(text, read=from_dialect):
+            if ast is not None:
+                out.append(ast.sql(dialect=to_dialect, pretty=True))
+    return out
 
-        # Merge multiple tables
-        merged_schema = {}
-        for schema in all_schemas:
-            merged_schema.update(schema)
 
-        return merged_schema, all_required
+def translate_sql_statements(
+    statements: list[str],
+    from_dialect: str,
+    to_dialect: str,
+    workers: int | None = None,
+) -> list[str]:
+    """Translate many SQL statements from one dialect to another.
 
+    Large batches are translated in a process pool.
+
+    Args:
+        statements: SQL statements (one per item)
+        from_dialect: Source dialect (e.g., "postgres")
+        to_dialect: Target dialect (e.g., "bigquery")
+        workers: Processes for large batches (default: CPU count)
+
+    Returns:
+        Translated statements, in input order
+
+    Raises:
+        ImportError: If sqlglot is not installed
+        ValueError: If any statement fails to translate
+    """
+    _require_sqlglot()
+    try:
+        return _map_statements(
+            _translate_statements, statements, workers, from_dialect, to_dialect
+        )
     except Exception as e:
-        logger.error(f"Failed to parse SQL DDL with SQLGlot: {e}")
-        raise ValueError(f"SQL parsing failed: {e}") from e
+        logger.error(f"SQL translation failed: {e}")
+        raise ValueError(
+            f"Translation from {from_dialect} to {to_dialect} failed: {e}"
+        ) from e
 
 
-def translate_sql_ddl(sql_content: str, from_dialect: str, to_dialect: str) -> str:
+def translate_sql_ddl(
+    sql_content: str,
+    from_dialect: str,
+    to_dialect: str,
+    workers: int | None = None,
+) -> str:
     """Translate SQL DDL from one dialect to another.
 
+    Multi-statement input is split and translated statement by statement
+    (see `translate_sql_statements`); statements are joined with ``;``.
+
     Args:
         sql_content: SQL DDL string
         from_dialect: Source dialect (e.g., "postgres")
         to_dialect: Target dialect (e.g., "bigquery")
+        workers: Processes for large multi-statement input (default: CPU count)
 
     Returns:
         Translated SQL DDL string
@@ -287,20 +523,23 @@ def translate_sql_ddl(sql_content: str, from_dialect: str, to_dialect: str) -> s
     Raises:
         ImportError: If sqlglot is not installed
     """
-    if not _HAS_SQLGLOT:
-        raise ImportError(
-            "SQLGlot support requires 'sqlglot'. "
-            "Install with: pip install 'schema-diff[sqlglot]'"
+    _require_sqlglot()
+
+    statements = _split_statements(sql_content)
+    if len(statements) > 1:
+        translated = translate_sql_statements(
+            statements, from_dialect, to_dialect, workers
         )
+        return ";\n\n".join(translated)
 
     try:
         # Parse with source dialect
         ast = parse_one(sql_content, read=from_dialect)
 
         # Generate SQL in target dialect
-        translated: str = ast.sql(dialect=to_dialect, pretty=True)
+        result: str = ast.sql(dialect=to_dialect, pretty=True)
 
-        return translated
+        return result
 
     except Exception as e:
         logger.error(f"SQL translation failed: {e}")
@@ -375,7 +614,9 @@ def get_supported_dialects() -> list[str]:
 
 __all__ = [
     "schema_from_sql_ddl_sqlglot",
+    "schemas_from_sql_ddl_sqlglot",
     "translate_sql_ddl",
+    "translate_sql_statements",
     "validate_sql_syntax",
     "get_supported_dialects",
 ]
@@ -7,6 +7,8 @@ Schema object format.
 """
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from .models import Schema
 
 
@@ -17,6 +19,7 @@ def load_schema_unified(
     table: str | None = None,
     model: str | None = None,
     message: str | None = None,
+    proto_include: Sequence[str] = (),
 ) -> Schema:
     """Load a schema from any supported format in unified Schema format.
 
@@ -32,6 +35,8 @@ def load_schema_unified(
         Model name for dbt schemas
     message : str, optional
         Message name for Protobuf schemas
+    proto_include : Sequence[str], optional
+        Directories searched for Protobuf imports (like protoc's ``-I``)
 
     Returns
     -------
@@ -43,7 +48,12 @@ def load_schema_unified(
         schema_type = "json_schema"
 
     return _load_unified_schema(
-        file_path, schema_type, table=table, model=model, message=message
+        file_path,
+        schema_type,
+        table=table,
+        model=model,
+        message=message,
+        proto_include=proto_include,
     )
 
 
@@ -54,6 +64,7 @@ def _load_unified_schema(
     table: str | None = None,
     model: str | None = None,
     message: str | None = None,
+    proto_include: Sequence[str] = (),
 ) -> Schema:
     """Load schema in unified format."""
     if schema_type == "jsonschema:json":
@@ -74,7 +85,9 @@ def _load_unified_schema(
     elif schema_type == "proto:sdl":
         from .protobuf_schema_parser import schema_from_protobuf_file_unified
 
-        return schema_from_protobuf_file_unified(file_path, message=message)  # type: ignore[no-any-return]
+        return schema_from_protobuf_file_unified(  # type: ignore[no-any-return]
+            file_path, message=message, include_paths=proto_include
+        )
 
     elif schema_type == "dbt:manifest":
         from .dbt_schema_parser import schema_from_dbt_manifest_unified
@@ -92,9 +105,9 @@ def _load_unified_schema(
         return schema_from_dbt_model_unified(file_path)  # type: ignore[no-any-return]
 
     elif schema_type == "bq:table":
-        from google.cloud import bigquery
-
+        from .bigquery_cache import get_cached_table
         from .bigquery_ddl import bigquery_schema_to_internal
+        from .bigquery_utils import get_bigquery_client
         from .models import from_legacy_tree
 
         # Parse BigQuery table reference
@@ -109,17 +122,12 @@ def _load_unified_schema(
         else:
             raise ValueError(f"Invalid BigQuery reference: {file_path}")
 
-        # Get project ID
-        if project_part:
-            project_id = project_part
-        else:
-            client = bigquery.Client()
-            project_id = client.project
+        # One pooled client; its default project when none is given
+        client = get_bigquery_client(project_part)
+        project_id = project_part or client.project
 
         # Get raw BigQuery schema for anti-pattern detection
-        client = bigquery.Client(project=project_id)
-        table_ref = f"{project_id}.{dataset_id}.{table_id}"
-        bq_table = client.get_table(table_ref)
+        bq_table = get_cached_table(client, project_id, dataset_id, table_id)
         raw_bq_schema = bq_table.schema
 
         # Convert to internal format (this flattens unnecessary wrappers)
@@ -15,13 +15,18 @@ Key features:
 - Clean fmt_dot_path() for consistent output formatting across all sections
 - inject_presence_for_diff() with proper array element recursion
 - Path change computation to identify field relocations between schemas
+- PathIndex: a flattened, path-keyed view of a tree built once and shared by
+  the diff, common-field and path-change stages
+- Merkle-style structural hashes for short-circuiting equal subtrees and for
+  fingerprinting schemas
 """
 
 from __future__ import annotations
 
+import hashlib
 from collections.abc import Iterable
-from copy import deepcopy
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Union
 
 __all__ = [
     # tree coercion / presence
@@ -29,6 +34,10 @@ __all__ = [
     "wrap_optional",
     "inject_presence_for_diff",
     # path analysis
+    "PathIndex",
+    "build_path_index",
+    "structural_hash",
+    "prune_equal_subtrees",
     "flatten_paths",
     "paths_by_name",
     "compute_path_changes",
@@ -114,30 +123,31 @@ def inject_presence_for_diff(tree: Any, required_paths: Iterable[str] | None) ->
     Returns
     -------
     Any
-        A deep-copied tree where non-required **leaf** fields are unioned with 'missing'.
+        A new tree where non-required **leaf** fields are unioned with 'missing'.
         Presence applies to the field holding an array, not the array's element type.
+        Only the objects on the way to a leaf are rebuilt; untouched values are
+        shared with the input rather than deep-copied, and the input is never mutated.
     """
     required: set[str] = set(required_paths or [])
-    out = deepcopy(tree)
-
-    def walk(node: Any, prefix: str) -> None:
-        if isinstance(node, dict):
-            for k, v in list(node.items()):
-                path = f"{prefix}.{k}" if prefix else k
-                if isinstance(v, dict):
-                    walk(v, path)
-                elif isinstance(v, list) and len(v) > 0 and isinstance(v[0], dict):
-                    # Handle arrays with object elements - recurse into array element
-                    array_path = f"{path}[0]"
-                    walk(v[0], array_path)
-                else:
-                    if path in required:
-                        continue  # keep pure type for required
-                    node[k] = wrap_optional(v)
-
-    if isinstance(out, dict):
-        walk(out, "")
-    return out
+
+    def walk(node: dict, prefix: str) -> dict:
+        out: dict[str, Any] = {}
+        for k, v in node.items():
+            path = f"{prefix}.{k}" if prefix else k
+            if isinstance(v, dict):
+                out[k] = walk(v, path)
+            elif isinstance(v, list) and len(v) > 0 and isinstance(v[0], dict):
+                # Handle arrays with object elements - recurse into array element
+                out[k] = [walk(v[0], f"{path}[0]"), *v[1:]]
+            elif path in required:
+                out[k] = v  # keep pure type for required
+            else:
+                out[k] = wrap_optional(v)
+        return out
+
+    if isinstance(tree, dict):
+        return walk(tree, "")
+    return tree
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -145,34 +155,194 @@ def inject_presence_for_diff(tree: Any, required_paths: Iterable[str] | None) ->
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-def flatten_paths(tree: Any, prefix: str = "") -> list[str]:
-    """Return a list of dotted paths for all *leaf* fields in the schema tree.
+@dataclass
+class PathIndex:
+    """Flattened, path-keyed view of a type tree.
 
-    We recurse into dicts (objects) and arrays (lists with dict elements). Arrays are
-    represented with [0] notation for element access.
+    Built once per schema by `build_path_index` and reused by every stage that
+    needs dotted paths (common fields, path changes, report building), so wide
+    schemas are walked a single time instead of once per stage.
+
+    Paths use the same notation as `flatten_paths`: dotted object keys and a
+    ``[0]`` segment for the element of an array of objects.
+
+    Attributes
+    ----------
+    types : dict[str, Any]
+        Path -> subtree/type for every node (objects and arrays included),
+        in depth-first order.
+    leaves : list[str]
+        Leaf paths in depth-first order (identical to `flatten_paths`).
+    parents : dict[str, str]
+        Path -> parent field path ("" for top-level fields).
+    children : dict[str, list[str]]
+        Field path ("" for the root) -> direct child paths, in order.
+    by_name : dict[str, set[str]]
+        Leaf name (final dotted segment) -> leaf paths carrying that name.
+    hashes : dict[str, str]
+        Path -> structural hash of the subtree at that path (see
+        `structural_hash`). Equal hashes mean equal subtrees.
+    root_hash : str
+        Structural hash of the whole tree; usable as a schema fingerprint.
     """
-    out: list[str] = []
-    if isinstance(tree, dict):
-        for k, v in tree.items():
+
+    types: dict[str, Any] = field(default_factory=dict)
+    leaves: list[str] = field(default_factory=list)
+    parents: dict[str, str] = field(default_factory=dict)
+    children: dict[str, list[str]] = field(default_factory=dict)
+    by_name: dict[str, set[str]] = field(default_factory=dict)
+    hashes: dict[str, str] = field(default_factory=dict)
+    root_hash: str = ""
+
+    def leaf_set(self) -> set[str]:
+        """Return the leaf paths as a set."""
+        return set(self.leaves)
+
+    def descendants(self, path: str) -> list[str]:
+        """Return all node paths below `path` in depth-first order."""
+        out: list[str] = []
+        stack = list(reversed(self.children.get(path, [])))
+        while stack:
+            p = stack.pop()
+            out.append(p)
+            stack.extend(reversed(self.children.get(p, [])))
+        return out
+
+
+def _digest(tag: str, *parts: str) -> str:
+    h = hashlib.blake2b(tag.encode("utf-8"), digest_size=16)
+    for part in parts:
+        h.update(b"\x00")
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _dict_hash(items: list[tuple[str, str]]) -> str:
+    # Key order is irrelevant to the diff, so hash keys in sorted order
+    return _digest("d", *(f"{k}={h}" for k, h in sorted(items)))
+
+
+def _list_hash(element_hashes: list[str]) -> str:
+    # Diffs ignore list order, so element hashes are combined sorted
+    return _digest("l", *sorted(element_hashes))
+
+
+def structural_hash(node: Any) -> str:
+    """Return a Merkle-style hash of a type tree.
+
+    Two trees hash equal exactly when they are equal ignoring dict key order
+    and list element order, which is how the diff compares them. Useful for
+    deduplicating and fingerprinting schemas; `build_path_index` records the
+    same hash for every subtree.
+    """
+    if isinstance(node, dict):
+        return _dict_hash([(str(k), structural_hash(v)) for k, v in node.items()])
+    if isinstance(node, list):
+        return _list_hash([structural_hash(v) for v in node])
+    if isinstance(node, str):
+        return _digest("s", node)
+    return _digest(type(node).__name__, repr(node))
+
+
+def build_path_index(tree: Any, prefix: str = "") -> PathIndex:
+    """Walk `tree` once and return its `PathIndex`.
+
+    Traversal rules match `flatten_paths`: meta-keys starting with ``__`` are
+    skipped, dicts are recursed into, arrays whose element is a dict are
+    recursed into with ``[0]`` notation, and everything else is a leaf.
+    Subtree hashes are computed bottom-up in the same walk.
+    """
+    index = PathIndex()
+
+    def add(path: str, parent: str, node: Any) -> None:
+        index.types[path] = node
+        index.parents[path] = parent
+        index.children.setdefault(parent, []).append(path)
+
+    def add_leaf(path: str) -> None:
+        index.leaves.append(path)
+        index.by_name.setdefault(path.split(".")[-1], set()).add(path)
+
+    def walk(node: Any, base: str, parent: str) -> str:
+        # `base` is the path prefix for children; `parent` the owning field path
+        items: list[tuple[str, str]] = []
+        for k, v in node.items():
             if isinstance(k, str) and k.startswith("__"):  # ignore meta-keys if any
+                items.append((k, structural_hash(v)))  # ...but keep them in the hash
                 continue
-            p = f"{prefix}.{k}" if prefix else k
+            p = f"{base}.{k}" if base else k
+            add(p, parent, v)
             if isinstance(v, dict):
-                out.extend(flatten_paths(v, p))
+                h = walk(v, p, p)
             elif isinstance(v, list) and len(v) > 0 and isinstance(v[0], dict):
                 # Handle arrays with object elements - use [0] notation
-                array_p = f"{p}[0]"
-                out.extend(flatten_paths(v[0], array_p))
+                element_hash = walk(v[0], f"{p}[0]", p)
+                h = _list_hash([element_hash, *(structural_hash(e) for e in v[1:])])
             else:
-                out.append(p)
+                add_leaf(p)
+                h = structural_hash(v)
+            index.hashes[p] = h
+            items.append((str(k), h))
+        return _dict_hash(items)
+
+    if isinstance(tree, dict):
+        index.root_hash = walk(tree, prefix, prefix)
     elif isinstance(tree, list) and len(tree) > 0 and isinstance(tree[0], dict):
         # Handle root-level arrays
-        array_p = f"{prefix}[0]" if prefix else "[0]"
-        out.extend(flatten_paths(tree[0], array_p))
+        element_hash = walk(tree[0], f"{prefix}[0]" if prefix else "[0]", prefix)
+        index.root_hash = _list_hash(
+            [element_hash, *(structural_hash(e) for e in tree[1:])]
+        )
     else:
         if prefix:
-            out.append(prefix)
-    return out
+            add_leaf(prefix)
+        index.root_hash = structural_hash(tree)
+    return index
+
+
+def prune_equal_subtrees(
+    left: Any, right: Any, left_index: PathIndex, right_index: PathIndex
+) -> tuple[Any, Any]:
+    """Drop fields whose subtrees hash equal on both sides.
+
+    Returns shallow-rebuilt copies of `left`/`right` that only keep the fields
+    that can contribute to a diff, so the differ never visits identical
+    branches. Pruning stops at arrays so list element matching is unaffected.
+    """
+
+    def prune(lnode: dict, rnode: dict, prefix: str) -> tuple[dict, dict]:
+        lout: dict[str, Any] = {}
+        rout: dict[str, Any] = {}
+        for k, lv in lnode.items():
+            if k not in rnode:
+                lout[k] = lv
+                continue
+            rv = rnode[k]
+            p = f"{prefix}.{k}" if prefix else k
+            lh = left_index.hashes.get(p)
+            if lh is not None and lh == right_index.hashes.get(p):
+                continue
+            if isinstance(lv, dict) and isinstance(rv, dict):
+                lout[k], rout[k] = prune(lv, rv, p)
+            else:
+                lout[k], rout[k] = lv, rv
+        for k, rv in rnode.items():
+            if k not in lnode:
+                rout[k] = rv
+        return lout, rout
+
+    if isinstance(left, dict) and isinstance(right, dict):
+        return prune(left, right, "")
+    return left, right
+
+
+def flatten_paths(tree: Any, prefix: str = "") -> list[str]:
+    """Return a list of dotted paths for all *leaf* fields in the schema tree.
+
+    We recurse into dicts (objects) and arrays (lists with dict elements). Arrays are
+    represented with [0] notation for element access.
+    """
+    return build_path_index(tree, prefix).leaves
 
 
 def paths_by_name(paths: list[str]) -> dict[str, set[str]]:
@@ -187,10 +357,22 @@ def paths_by_name(paths: list[str]) -> dict[str, set[str]]:
     return by_name
 
 
-def compute_path_changes(left_tree: Any, right_tree: Any) -> list[dict[str, Any]]:
+def _as_path_index(tree_or_index: Union[Any, PathIndex]) -> PathIndex:
+    """Return `tree_or_index` if it is already a PathIndex, else index the tree."""
+    if isinstance(tree_or_index, PathIndex):
+        return tree_or_index
+    return build_path_index(tree_or_index)
+
+
+def compute_path_changes(
+    left_tree: Union[Any, PathIndex], right_tree: Union[Any, PathIndex]
+) -> list[dict[str, Any]]:
     """Detect fields that share the same *name* but live in different *paths* between
     left and right schemas.
 
+    Either side may be a raw tree or a prebuilt `PathIndex`; passing indexes
+    avoids re-walking trees that were already flattened by an earlier stage.
+
     Returns a list of dicts like:
       {"name": "foo", "left": ["foo"], "right": ["bar.foo"]}
 
@@ -200,10 +382,8 @@ def compute_path_changes(left_tree: Any, right_tree: Any) -> list[dict[str, Any]
     Only shows paths that are unique to each side to reduce noise from
     common locations.
     """
-    left_paths = flatten_paths(left_tree)
-    right_paths = flatten_paths(right_tree)
-    lmap = paths_by_name(left_paths)
-    rmap = paths_by_name(right_paths)
+    lmap = _as_path_index(left_tree).by_name
+    rmap = _as_path_index(right_tree).by_name
 
     names = set(lmap) & set(rmap)
     out: list[dict[str, Any]] = []
@@ -326,10 +506,10 @@ def filter_schema_by_fields(schema: Any, fields: list[str]) -> Any:
 
     filtered: dict[str, Any] = {}
 
-    for field in fields:
+    for path in fields:
         # Handle array element paths like "experience[0].title"
-        if "[0]." in field:
-            array_field, rest = field.split("[0].", 1)
+        if "[0]." in path:
+            array_field, rest = path.split("[0].", 1)
             if (
                 array_field in schema
                 and isinstance(schema[array_field], list)
@@ -347,8 +527,8 @@ def filter_schema_by_fields(schema: Any, fields: list[str]) -> Any:
                     else:
                         filtered[array_field][0] = nested_filtered
         # Handle nested field paths like "experience.title"
-        elif "." in field:
-            root_field, rest = field.split(".", 1)
+        elif "." in path:
+            root_field, rest = path.split(".", 1)
             if root_field in schema:
                 if root_field not in filtered:
                     if isinstance(schema[root_field], list):
@@ -375,7 +555,7 @@ def filter_schema_by_fields(schema: Any, fields: list[str]) -> Any:
                         filtered[root_field] = [nested_filtered]
         else:
             # Simple field name
-            if field in schema:
-                filtered[field] = schema[field]
+            if path in schema:
+                filtered[path] = schema[path]
 
     return filtered
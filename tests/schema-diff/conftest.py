@@ -5,6 +5,17 @@ import pytest
 from schema_diff.config import Config
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    # Persistent caches (sqlglot statements, BigQuery metadata) live under
+    # the cache manager's directory; keep tests out of ~/.cache/schema-diff
+    from schema_diff.decorators import _cache_manager
+
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(_cache_manager, "cache_dir", cache_dir)
+
+
 @pytest.fixture
 def cfg_like():
     # deterministic, no color noise in output
@@ -335,6 +335,23 @@ class TestAnalyzeCommand:
 
                 assert result.returncode == 0
 
+    def test_analyze_markdown_without_suggestions(self, run_cli):
+        """Test markdown output when suggestions are not requested."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_file = Path(temp_dir) / "data.json"
+            data_file.write_text(json.dumps({"field1": "value1", "field2": 42}))
+
+            result = run_cli([
+                "analyze", str(data_file),
+                "--type", "data",
+                "--complexity",
+                "--format", "markdown",
+            ])
+
+            assert result.returncode == 0
+            assert "Schema Analysis Report" in result.stdout
+            assert "Key Recommendations" not in result.stdout
+
     def test_analyze_with_sampling_options(self, run_cli):
         """Test analysis with different sampling options."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -0,0 +1,130 @@
+"""Tests for one-vs-many and matrix batch comparison."""
+
+import json
+
+import pytest
+
+from schema_diff.batch_compare import (
+    BatchInput,
+    compare_batch,
+    load_batch_input,
+    render_batch_markdown,
+)
+from schema_diff.compare import normalize_for_diff
+
+
+def _input(label, tree, required=(), source_type="jsonschema"):
+    return BatchInput(
+        label, normalize_for_diff(tree, set(required), source_type), source_type
+    )
+
+
+@pytest.fixture
+def env_inputs():
+    base = {"id": "int", "name": "str", "meta": {"ts": "timestamp"}}
+    return [
+        _input("dev", base, {"id"}),
+        _input("staging", dict(base), {"id"}),
+        _input("prod", {**base, "name": "int", "extra": "str"}, {"id"}),
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_one_vs_many(env_inputs, workers):
+    result = compare_batch(env_inputs, workers=workers)
+
+    assert result["meta"]["mode"] == "one-vs-many"
+    assert result["meta"]["pairs"] == 2
+    # dev and staging share a fingerprint, so only one pair is actually diffed
+    assert result["meta"]["diffed"] == 1
+
+    staging, prod = result["results"]
+    assert staging["identical"] is True
+    assert prod["identical"] is False
+    assert prod["only_in_right"] == 1
+    assert prod["type_mismatches"] == 1
+    assert [m["path"] for m in prod["report"]["schema_mismatches"]] == ["name"]
+
+
+def test_matrix(env_inputs):
+    result = compare_batch(env_inputs, matrix=True, workers=1)
+
+    assert result["meta"]["pairs"] == 6
+    matrix = result["matrix"]
+    assert [row[i] for i, row in enumerate(matrix)] == [0, 0, 0]
+    assert matrix[0][1] == 0
+    assert matrix[0][2] == matrix[2][0] == 2
+
+    md = render_batch_markdown(result)
+    assert "## Drift Matrix" in md
+    assert "| `prod` | 2 | 2 | — |" in md
+
+
+def test_requires_two_inputs(env_inputs):
+    with pytest.raises(ValueError):
+        compare_batch(env_inputs[:1])
+
+
+def test_load_batch_input_data_file(tmp_path):
+    path = tmp_path / "d.json"
+    path.write_text(json.dumps({"id": 1, "tags": ["a"]}), encoding="utf-8")
+
+    inp = load_batch_input(str(path), "data:json", first_record=True)
+
+    assert inp.source_type == "data"
+    assert inp.tree == {"id": "int", "tags": ["str"]}
+    assert inp.fingerprint
+
+
+def test_cli_compare_batch(tmp_path, run_cli):
+    base = tmp_path / "base.json"
+    same = tmp_path / "same.json"
+    other = tmp_path / "other.json"
+    base.write_text(json.dumps({"id": 1, "name": "x"}), encoding="utf-8")
+    same.write_text(json.dumps({"id": 2, "name": "y"}), encoding="utf-8")
+    other.write_text(json.dumps({"id": "3"}), encoding="utf-8")
+    out = tmp_path / "batch.json"
+
+    res = run_cli([
+        "compare-batch",
+        str(base),
+        str(same),
+        str(other),
+        "--first-record",
+        "--workers",
+        "1",
+        "--json-out",
+        str(out),
+        "--no-color",
+    ])
+
+    assert res.returncode == 0
+    assert "identical" in res.stdout
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert [r["identical"] for r in payload["results"]] == [True, False]
+    assert payload["results"][1]["only_in_left"] == 1
+
+
+def test_no_color_strips_ansi_codes(tmp_path, monkeypatch, capsys):
+    import argparse
+
+    from schema_diff.cli import colors
+    from schema_diff.cli.compare_batch import (
+        add_compare_batch_subcommand,
+        cmd_compare_batch,
+    )
+
+    for name in ("BOLD", "CYAN", "GREEN", "RED", "RESET", "YELLOW"):
+        monkeypatch.setattr(colors, name, "\033[1m")
+    left = tmp_path / "left.json"
+    right = tmp_path / "right.json"
+    left.write_text(json.dumps({"id": 1}), encoding="utf-8")
+    right.write_text(json.dumps({"id": "1"}), encoding="utf-8")
+    parser = argparse.ArgumentParser()
+    add_compare_batch_subcommand(parser.add_subparsers(dest="command"))
+
+    argv = ["compare-batch", str(left), str(right), "--workers", "1"]
+    cmd_compare_batch(parser.parse_args(argv))
+    assert "\033[" in capsys.readouterr().out
+    cmd_compare_batch(parser.parse_args(argv + ["--no-color"]))
+    assert "\033[" not in capsys.readouterr().out
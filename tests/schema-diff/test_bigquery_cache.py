@@ -0,0 +1,172 @@
+"""Tests for the persistent BigQuery table-metadata cache."""
+
+import threading
+
+import pytest
+from google.api_core import exceptions as gcp_exceptions
+from google.cloud import bigquery
+from google.cloud.bigquery.schema import SchemaField
+
+from schema_diff import bigquery_cache, bigquery_utils
+from schema_diff.bigquery_cache import get_cached_table, get_cached_tables
+
+
+class _Job:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def result(self):
+        return iter(self._rows)
+
+
+class FakeClient:
+    """Serves tables by id; ``query`` answers the ``__TABLES__`` lookup."""
+
+    def __init__(self, tables, fail_query=False):
+        self.tables = tables  # table_id -> (last_modified_ms, schema)
+        self.fail_query = fail_query
+        self.queries = []
+        self.get_table_calls = []
+        self._lock = threading.Lock()
+
+    def query(self, sql, job_config=None, location=None):
+        with self._lock:
+            self.queries.append(sql)
+        if self.fail_query:
+            raise gcp_exceptions.Forbidden("Access Denied")
+        return _Job(
+            [
+                {"table_id": t, "last_modified_time": ms}
+                for t, (ms, _) in self.tables.items()
+            ]
+        )
+
+    def get_table(self, ref):
+        with self._lock:
+            self.get_table_calls.append(ref)
+        table_id = ref.rsplit(".", 1)[-1]
+        if table_id not in self.tables:
+            raise gcp_exceptions.NotFound(ref)
+        ms, schema = self.tables[table_id]
+        tbl = bigquery.Table(ref, schema=schema)
+        tbl._properties["lastModifiedTime"] = str(ms)
+        tbl.clustering_fields = ["id"]
+        return tbl
+
+    @property
+    def calls(self):
+        return len(self.queries) + len(self.get_table_calls)
+
+
+SCHEMA = [SchemaField("id", "INTEGER", mode="REQUIRED"), SchemaField("s", "STRING")]
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "bq_metadata"
+
+
+def test_warm_run_only_revalidates(cache_dir):
+    client = FakeClient({"a": (100, SCHEMA), "b": (100, SCHEMA)})
+
+    cold, errors = get_cached_tables(client, "p", "d", ["a", "b"], cache_dir=cache_dir)
+    assert not errors
+    assert len(client.queries) == 1
+    assert sorted(client.get_table_calls) == ["p.d.a", "p.d.b"]
+
+    warm_client = FakeClient(client.tables)
+    warm, _ = get_cached_tables(warm_client, "p", "d", ["a", "b"], cache_dir=cache_dir)
+    assert len(warm_client.queries) == 1 and warm_client.get_table_calls == []
+    assert warm["a"].schema == cold["a"].schema == SCHEMA
+    assert warm["a"].clustering_fields == ["id"]
+    assert warm["b"].reference.table_id == "b"
+
+
+def test_revalidation_refetches_only_modified_tables(cache_dir):
+    client = FakeClient({"a": (100, SCHEMA), "b": (100, SCHEMA)})
+    get_cached_tables(client, "p", "d", ["a", "b"], cache_dir=cache_dir)
+
+    changed = SCHEMA + [SchemaField("n", "INTEGER")]
+    client = FakeClient({"a": (200, changed), "b": (100, SCHEMA)})
+    tables, _ = get_cached_tables(client, "p", "d", ["a", "b"], cache_dir=cache_dir)
+    assert len(client.queries) == 1
+    assert client.get_table_calls == ["p.d.a"]
+    assert tables["a"].schema == changed
+
+    # Within max_age the validation is trusted; a new table forces a check
+    client = FakeClient({"a": (200, changed), "b": (100, SCHEMA), "c": (1, SCHEMA)})
+    get_cached_tables(client, "p", "d", ["a", "b"], cache_dir=cache_dir, max_age=60)
+    assert client.calls == 0
+    get_cached_tables(client, "p", "d", ["c"], cache_dir=cache_dir, max_age=60)
+    assert len(client.queries) == 1
+    assert client.get_table_calls == ["p.d.c"]
+
+
+def test_errors_and_failed_revalidation(cache_dir):
+    client = FakeClient({"a": (100, SCHEMA)})
+    with pytest.raises(gcp_exceptions.NotFound):
+        get_cached_table(client, "p", "d", "missing", cache_dir=cache_dir)
+    assert get_cached_table(client, "p", "d", "a", cache_dir=cache_dir).schema == (
+        SCHEMA
+    )
+
+    # Without a usable modified-time query every table is fetched again
+    failing = FakeClient(client.tables, fail_query=True)
+    get_cached_table(failing, "p", "d", "a", cache_dir=cache_dir)
+    assert failing.get_table_calls == ["p.d.a"]
+
+
+def test_bulk_tables_are_cached_as_partial(cache_dir, monkeypatch):
+    client = FakeClient({"a": (100, SCHEMA), "b": (100, SCHEMA)})
+    rebuilt = {t: client.get_table(f"p.d.{t}") for t in client.tables}
+    client.get_table_calls.clear()
+    monkeypatch.setattr(
+        "schema_diff.bigquery_metadata.prefetch_dataset_tables",
+        lambda client, project, dataset, table_ids: {t: rebuilt[t] for t in table_ids},
+    )
+
+    get_cached_tables(client, "p", "d", ["a", "b"], cache_dir=cache_dir)
+    assert sorted(client.get_table_calls) == ["p.d.a", "p.d.b"]
+
+    # Bulk rebuilds serve partial callers only; a full resource replaces them
+    bulk_dir = cache_dir / "bulk"
+    get_cached_tables(
+        client, "p", "d", ["a", "b"], cache_dir=bulk_dir, allow_partial=True
+    )
+    client.get_table_calls.clear()
+    get_cached_tables(
+        client, "p", "d", ["a", "b"], cache_dir=bulk_dir, allow_partial=True
+    )
+    assert client.get_table_calls == []
+    get_cached_table(client, "p", "d", "a", cache_dir=bulk_dir)
+    get_cached_table(client, "p", "d", "a", cache_dir=bulk_dir)
+    assert client.get_table_calls == ["p.d.a"]
+
+
+def test_get_live_table_schema_uses_pooled_client_and_cache(monkeypatch, tmp_path):
+    from schema_diff.bigquery_ddl import get_live_table_schema
+
+    created = []
+
+    class Client(FakeClient):
+        def __init__(self, project=None):
+            super().__init__({"t": (5, SCHEMA)})
+            self.project = project
+            created.append(self)
+
+    monkeypatch.setattr(bigquery, "Client", Client)
+    monkeypatch.setattr(bigquery_utils, "_CLIENTS", {})
+    monkeypatch.setattr(
+        bigquery_cache,
+        "_cache_path",
+        lambda cache_dir, p, d: tmp_path / f"{p}.{d}.json",
+    )
+
+    first = get_live_table_schema("p", "d", "t")
+    second = get_live_table_schema("p", "d", "t")
+
+    assert first == second
+    assert len(created) == 1
+    # Each load revalidates; only the first fetches the table
+    assert created[0].get_table_calls == ["p.d.t"]
+    assert len(created[0].queries) == 2
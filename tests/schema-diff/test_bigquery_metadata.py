@@ -0,0 +1,302 @@
+"""Tests for bulk BigQuery metadata fetching via INFORMATION_SCHEMA."""
+
+import re
+import threading
+
+import pytest
+from google.api_core import exceptions as gcp_exceptions
+from google.cloud import bigquery
+from google.cloud.bigquery.schema import PolicyTagList, SchemaField
+
+from schema_diff.bigquery_ddl import generate_dataset_ddl
+from schema_diff.bigquery_metadata import (
+    fetch_dataset_tables,
+    prefetch_dataset_tables,
+)
+
+EVENTS_SCHEMA = [
+    SchemaField("id", "INTEGER", mode="REQUIRED", description="Event id"),
+    SchemaField("ts", "TIMESTAMP", mode="REQUIRED"),
+    SchemaField(
+        "email",
+        "STRING",
+        max_length=320,
+        policy_tags=PolicyTagList(names=["projects/p/taxonomies/1/policyTags/2"]),
+    ),
+    SchemaField("amount", "NUMERIC", precision=10, scale=2),
+    SchemaField("flags", "BOOLEAN", mode="REPEATED"),
+    SchemaField(
+        "payload",
+        "RECORD",
+        fields=[
+            SchemaField("kind", "STRING", mode="REQUIRED", description="Kind"),
+            SchemaField(
+                "items",
+                "RECORD",
+                mode="REPEATED",
+                fields=[
+                    SchemaField("sku", "STRING"),
+                    SchemaField("qty", "INTEGER"),
+                ],
+            ),
+        ],
+    ),
+    SchemaField("status", "STRING", default_value_expression="'new'"),
+]
+
+EVENTS_COLUMNS = [
+    # (column, data_type, is_nullable, partitioning, clustering, default)
+    ("id", "INT64", "NO", "NO", None, "NULL"),
+    ("ts", "TIMESTAMP", "NO", "YES", None, "NULL"),
+    ("email", "STRING(320)", "YES", "NO", 1, "NULL"),
+    ("amount", "NUMERIC(10, 2)", "YES", "NO", None, "NULL"),
+    ("flags", "ARRAY<BOOL>", "NO", "NO", None, "NULL"),
+    (
+        "payload",
+        "STRUCT<kind STRING NOT NULL, items ARRAY<STRUCT<sku STRING, qty INT64>>>",
+        "YES",
+        "NO",
+        None,
+        "NULL",
+    ),
+    ("status", "STRING", "YES", "NO", 2, "'new'"),
+]
+
+EVENTS_PATHS = {
+    "id": ("Event id", []),
+    "email": (None, ["projects/p/taxonomies/1/policyTags/2"]),
+    "payload.kind": ("Kind", []),
+}
+
+EVENTS_DDL = (
+    "CREATE TABLE `p.d.events`\n(\n  id INT64 NOT NULL\n)\n"
+    "PARTITION BY TIMESTAMP_TRUNC(ts, HOUR)\n"
+    "CLUSTER BY email, status\n"
+    'OPTIONS(\n  description="Raw events"\n);'
+)
+
+
+def _column_rows(table, columns, paths):
+    rows = []
+    for pos, (name, dtype, nullable, part, clus, default) in enumerate(columns, 1):
+        base = {
+            "table_name": table,
+            "column_name": name,
+            "ordinal_position": pos,
+            "is_nullable": nullable,
+            "column_type": dtype,
+            "is_partitioning_column": part,
+            "clustering_ordinal_position": clus,
+            "column_default": default,
+        }
+        prefix = name + "."
+        field_paths = [name] + [p for p in paths if p.startswith(prefix)]
+        for fp in field_paths:
+            description, tags = paths.get(fp, (None, []))
+            rows.append(
+                {
+                    **base,
+                    "field_path": fp,
+                    "description": description,
+                    "policy_tags": tags,
+                }
+            )
+    return rows
+
+
+class _Job:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def result(self):
+        return iter(self._rows)
+
+
+class FakeClient:
+    """Serves INFORMATION_SCHEMA rows for ``query`` and Tables for ``get_table``."""
+
+    def __init__(self, tables, columns, get_tables=None, fail_query=False):
+        self.tables = tables
+        self.columns = columns
+        self.get_tables = get_tables or {}
+        self.fail_query = fail_query
+        self.queries = []
+        self.get_table_calls = []
+        self._lock = threading.Lock()
+
+    def get_dataset(self, ref):
+        return type("Dataset", (), {"location": "EU"})()
+
+    def query(self, sql, job_config=None, location=None):
+        with self._lock:
+            self.queries.append((sql, location))
+        if self.fail_query:
+            raise gcp_exceptions.Forbidden("Access Denied: INFORMATION_SCHEMA")
+        names = None
+        for param in job_config.query_parameters:
+            if param.name == "table_names":
+                names = set(param.values)
+        is_tables = "INFORMATION_SCHEMA.TABLES`" in sql
+        source = self.tables if is_tables else self.columns
+        return _Job([r for r in source if names is None or r["table_name"] in names])
+
+    def get_table(self, ref):
+        with self._lock:
+            self.get_table_calls.append(ref)
+        table_id = ref.rsplit(".", 1)[-1]
+        if table_id not in self.get_tables:
+            raise gcp_exceptions.NotFound(ref)
+        return self.get_tables[table_id]
+
+    def list_tables(self, dataset_ref):
+        names = sorted({r["table_name"] for r in self.tables})
+        return [type("Item", (), {"table_id": n})() for n in names]
+
+    def dataset(self, dataset_id, project=None):
+        return f"{project}.{dataset_id}"
+
+
+def _events_table_rows(name="events"):
+    return {
+        "table_name": name,
+        "table_type": "BASE TABLE",
+        "ddl": EVENTS_DDL.replace("events", name),
+        "options": [
+            {"option_name": "description", "option_value": '"Raw \\"events\\""'},
+            {
+                "option_name": "labels",
+                "option_value": '[STRUCT("team", "data"), STRUCT("env", "prod")]',
+            },
+            {"option_name": "require_partition_filter", "option_value": "true"},
+            {"option_name": "partition_expiration_days", "option_value": "30.0"},
+        ],
+    }
+
+
+def _events_api_table(name="events"):
+    tbl = bigquery.Table(f"p.d.{name}", schema=EVENTS_SCHEMA)
+    tbl.time_partitioning = bigquery.TimePartitioning(
+        type_="HOUR", field="ts", expiration_ms=30 * 86_400_000
+    )
+    tbl.time_partitioning._properties["requirePartitionFilter"] = True
+    tbl.clustering_fields = ["email", "status"]
+    tbl.description = 'Raw "events"'
+    tbl.labels = {"team": "data", "env": "prod"}
+    return tbl
+
+
+def _dataset(n_events=12, extra_tables=(), extra_columns=()):
+    tables, columns, api = [], [], {}
+    for k in range(n_events):
+        name = f"events_{k:02d}"
+        tables.append(_events_table_rows(name))
+        columns += _column_rows(name, EVENTS_COLUMNS, EVENTS_PATHS)
+        api[name] = _events_api_table(name)
+    return tables + list(extra_tables), columns + list(extra_columns), api
+
+
+def test_fetch_dataset_tables_rebuilds_table_metadata():
+    tables, columns, _ = _dataset(n_events=1)
+    client = FakeClient(tables, columns)
+
+    out = fetch_dataset_tables(client, "p", "d")
+
+    tbl = out["events_00"]
+    assert tbl.schema == EVENTS_SCHEMA
+    assert tbl.table_type == "TABLE"
+    assert tbl.time_partitioning.type_ == "HOUR"
+    assert tbl.time_partitioning.field == "ts"
+    assert tbl.time_partitioning.expiration_ms == 30 * 86_400_000
+    assert tbl.time_partitioning.require_partition_filter is True
+    assert tbl.clustering_fields == ["email", "status"]
+    assert tbl.description == 'Raw "events"'
+    assert tbl.labels == {"team": "data", "env": "prod"}
+    assert [loc for _, loc in client.queries] == ["EU", "EU"]
+    assert not client.get_table_calls
+
+
+def test_range_and_ingestion_time_partitioning():
+    tables = [
+        {
+            "table_name": "by_range",
+            "table_type": "BASE TABLE",
+            "ddl": "CREATE TABLE x (n INT64)\n"
+            "PARTITION BY RANGE_BUCKET(n, GENERATE_ARRAY(0, 100, 10));",
+            "options": None,
+        },
+        {
+            "table_name": "ingested",
+            "table_type": "BASE TABLE",
+            "ddl": "CREATE TABLE x (n INT64)\nPARTITION BY _PARTITIONDATE;",
+            "options": None,
+        },
+    ]
+    columns = _column_rows(
+        "by_range", [("n", "INT64", "YES", "YES", None, "NULL")], {}
+    ) + _column_rows("ingested", [("n", "INT64", "YES", "NO", None, "NULL")], {})
+
+    out = fetch_dataset_tables(FakeClient(tables, columns), "p", "d", ["by_range"])
+    assert list(out) == ["by_range"]
+    rp = out["by_range"].range_partitioning
+    assert (rp.field, rp.range_.start, rp.range_.end, rp.range_.interval) == (
+        "n",
+        0,
+        100,
+        10,
+    )
+
+    out = fetch_dataset_tables(FakeClient(tables, columns), "p", "d", ["ingested"])
+    tp = out["ingested"].time_partitioning
+    assert (tp.type_, tp.field) == ("DAY", None)
+
+
+def test_generate_dataset_ddl_bulk_matches_get_table():
+    odd = {"table_name": "odd", "table_type": "BASE TABLE", "ddl": "", "options": []}
+    odd_columns = _column_rows(
+        "odd", [("g", "MYSTERY<1>", "YES", "NO", None, None)], {}
+    )
+    tables, columns, api = _dataset(extra_tables=[odd], extra_columns=odd_columns)
+    api["odd"] = bigquery.Table("p.d.odd", schema=[SchemaField("g", "GEOGRAPHY")])
+
+    bulk_client = FakeClient(tables, columns, get_tables=api)
+    plain_client = FakeClient(tables, columns, get_tables=api, fail_query=True)
+    bulk = generate_dataset_ddl(bulk_client, "p", "d", include_constraints=False)
+    plain = generate_dataset_ddl(plain_client, "p", "d", include_constraints=False)
+
+    def strip_stamp(ddl):
+        return re.sub(r"-- End of script generated at .*", "", ddl)
+
+    assert set(bulk) == set(plain) == set(api)
+    assert {k: strip_stamp(v) for k, v in bulk.items()} == {
+        k: strip_stamp(v) for k, v in plain.items()
+    }
+    assert "PARTITION BY DATE(`ts`)" in bulk["events_00"]
+    # Only the table whose type could not be rebuilt falls back to get_table
+    assert bulk_client.get_table_calls == ["p.d.odd"]
+    assert len(plain_client.get_table_calls) == len(api)
+
+
+def test_prefetch_threshold_and_failures():
+    tables, columns, _ = _dataset(n_events=3)
+    client = FakeClient(tables, columns)
+    names = [r["table_name"] for r in tables]
+
+    assert prefetch_dataset_tables(client, "p", "d", names) == {}
+    assert client.queries == []
+    assert set(prefetch_dataset_tables(client, "p", "d", names, min_tables=2)) == set(
+        names
+    )
+
+    failing = FakeClient(tables, columns, fail_query=True)
+    assert prefetch_dataset_tables(failing, "p", "d", names, min_tables=1) == {}
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    ["STRUCT<a INT64", "ARRAY<ARRAY<INT64>>", "INT64 garbage"],
+)
+def test_unparseable_types_fall_back(dtype):
+    tables = [{"table_name": "t", "table_type": "BASE TABLE", "ddl": "", "options": []}]
+    columns = _column_rows("t", [("c", dtype, "YES", "NO", None, None)], {})
+
+    assert fetch_dataset_tables(FakeClient(tables, columns), "p", "d") == {}
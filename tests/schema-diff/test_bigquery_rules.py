@@ -0,0 +1,199 @@
+"""Tests for the single-walk anti-pattern rule engine."""
+
+import pytest
+from google.cloud.bigquery.schema import SchemaField
+
+from schema_diff import analyze_config, bigquery_rules
+from schema_diff.bigquery_ddl import detect_bigquery_antipatterns
+from schema_diff.bigquery_rules import (
+    Rule,
+    RuleContext,
+    list_rules,
+    register_rule,
+    run_rules,
+)
+from schema_diff.exceptions import ArgumentError
+
+S = SchemaField
+
+SCHEMA = [
+    S("id", "STRING"),
+    S("is_active", "INTEGER"),
+    S("password", "STRING"),
+    S("unit_price", "FLOAT"),
+    S(
+        "awards",
+        "RECORD",
+        fields=[
+            S(
+                "list",
+                "RECORD",
+                mode="REPEATED",
+                fields=[S("element", "RECORD", fields=[S("items", "STRING")])],
+            )
+        ],
+    ),
+    S(
+        "iso_codes",
+        "RECORD",
+        fields=[S("x1", "STRING"), S("usr", "STRING")],
+    ),
+]
+
+
+def _patterns(issues):
+    return {i["pattern"] for i in issues}
+
+
+def test_context_flattens_schema_once_with_shared_facts():
+    ctx = RuleContext(SCHEMA)
+
+    assert [n.path for n in ctx.nodes] == [
+        "id",
+        "is_active",
+        "password",
+        "unit_price",
+        "awards",
+        "awards.list",
+        "awards.list.element",
+        "awards.list.element.items",
+        "iso_codes",
+        "iso_codes.x1",
+        "iso_codes.usr",
+    ]
+    awards = ctx.nodes[4]
+    items = ctx.nodes[7]
+    assert awards.end == 8 and awards.subtree_depth == 3
+    assert items.parent.parent.parent is awards
+    assert (items.depth, items.parent_path) == (3, "awards.list.element")
+    assert ctx.nodes[1].canon_type == "INT64"
+    assert ctx.nodes[1].tokens == {"is", "active"}
+    assert [n.name for n in ctx.records] == ["awards", "list", "element", "iso_codes"]
+
+
+def test_detects_known_patterns_and_prunes_subtrees():
+    issues = detect_bigquery_antipatterns(SCHEMA)
+    by_pattern = {i["pattern"]: i for i in issues}
+
+    assert {
+        "unnecessary_struct_wrapper",
+        "boolean_as_integer",
+        "plaintext_secrets",
+        "float_for_money",
+        "nullable_id_fields",
+    } <= _patterns(issues)
+    # Fields below an ISO-named struct are not checked for cryptic names
+    assert "iso_codes.x1" not in by_pattern.get("cryptic_names", {}).get(
+        "affected_fields", []
+    )
+    # Nothing below the list/element wrappers is checked for pluralization
+    plural = [
+        f
+        for i in issues
+        if i["pattern"] == "plural_singular_confusion"
+        for f in i["affected_fields"]
+    ]
+    assert not [f for f in plural if f.startswith("awards.")]
+
+
+def test_per_field_rules_report_in_field_order():
+    schema = [
+        S(
+            "events",
+            "RECORD",
+            mode="REPEATED",
+            fields=[S("data", "STRING")] + [S(f"c{i}", "STRING") for i in range(5)],
+        ),
+        S("is_active", "INTEGER"),
+    ]
+    issues = detect_bigquery_antipatterns(schema)
+
+    # As the original single walk: every check of one field before the next
+    assert [(i["pattern"], i["field_name"]) for i in issues[:4]] == [
+        ("missing_array_ordering", "events"),
+        ("missing_description", "events"),
+        ("generic_field_name", "events.data"),
+        ("boolean_as_integer", "is_active"),
+    ]
+
+
+def test_rule_selection_disabling_and_timings(monkeypatch):
+    timings = {}
+    issues = detect_bigquery_antipatterns(
+        SCHEMA, rules=["secrets", "boolean_as_integer"], timings=timings
+    )
+    assert _patterns(issues) == {"plaintext_secrets", "boolean_as_integer"}
+    assert set(timings) == {"secrets", "boolean_as_integer"}
+    assert all(t >= 0 for t in timings.values())
+
+    with pytest.raises(ArgumentError, match="no_such_rule"):
+        run_rules(SCHEMA, rules=["no_such_rule"])
+
+    monkeypatch.setattr(analyze_config, "ANTIPATTERN_DISABLED_RULES", {"secrets"})
+    assert "plaintext_secrets" not in _patterns(detect_bigquery_antipatterns(SCHEMA))
+
+
+def test_registered_rule_runs_with_hooks(monkeypatch):
+    monkeypatch.setattr(bigquery_rules, "_RULES", dict(bigquery_rules._RULES))
+    seen = {"field": [], "struct": []}
+
+    @register_rule
+    class CountRecords(Rule):
+        name = "count_records"
+        field_types = frozenset({"STRING"})
+
+        def field(self, node):
+            seen["field"].append(node.path)
+
+        def struct(self, node):
+            seen["struct"].append(node.path)
+
+        def finish(self):
+            self.report({"pattern": "records", "count": len(seen["struct"])})
+
+    assert list_rules()[-1] == "count_records"
+    issues = run_rules(SCHEMA, rules=["count_records"])
+
+    assert issues == [{"pattern": "records", "count": 4}]
+    assert seen["field"] == [
+        "id",
+        "password",
+        "awards.list.element.items",
+        "iso_codes.x1",
+        "iso_codes.usr",
+    ]
+
+
+def test_analyze_cli_rule_selection_and_timings(monkeypatch, capsys):
+    import argparse
+    import json
+
+    from schema_diff import unified_loader
+    from schema_diff.cli.analyze import add_analyze_subcommand, cmd_analyze
+    from schema_diff.models import Schema
+
+    schema = Schema(source_type="bigquery", metadata={"raw_bq_schema": SCHEMA})
+    monkeypatch.setattr(unified_loader, "load_schema_unified", lambda *a, **k: schema)
+    parser = argparse.ArgumentParser()
+    add_analyze_subcommand(parser.add_subparsers(dest="command"))
+
+    def _analyze(*options):
+        args = parser.parse_args(["analyze", "p:d.t", "--type", "bigquery", *options])
+        code = cmd_analyze(args)
+        out = capsys.readouterr().out
+        return code, out
+
+    code, out = _analyze(
+        "--rules", "secrets,boolean_as_integer", "--rule-timings", "--format", "json"
+    )
+    assert code == 0
+    timings = json.loads(out[out.index("{") :])["rule_timings"]
+    assert set(timings) == {"secrets", "boolean_as_integer"}
+
+    code, out = _analyze("--disable-rules", "secrets", "--rule-timings")
+    assert code == 0
+    assert "Anti-pattern Rule Timings" in out
+    assert "boolean_as_integer" in out and " secrets " not in out
+
+    code, out = _analyze("--disable-rules", "no_such_rule")
+    assert code == 1 and "no_such_rule" in out
@@ -0,0 +1,194 @@
+"""Tests for parallel, resumable dataset/project anti-pattern scans."""
+
+import argparse
+import json
+from types import SimpleNamespace
+
+import pytest
+from google.api_core import exceptions as gcp_exceptions
+from google.cloud import bigquery
+from google.cloud.bigquery.schema import SchemaField
+
+from schema_diff import bigquery_scan
+from schema_diff.bigquery_scan import scan_bigquery
+from schema_diff.cli.analyze import add_analyze_subcommand, cmd_analyze
+
+S = SchemaField
+
+TABLES = {
+    "d": {
+        "events_20240101": [S("id", "STRING"), S("password", "STRING")],
+        "events_20240102": [S("id", "STRING")],
+        "events_20240103": [S("id", "STRING")],
+        "users": [S("id", "INTEGER"), S("is_active", "INTEGER")],
+    },
+    "e": {"orders": [S("unit_price", "FLOAT")]},
+}
+
+
+class _Job:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def result(self):
+        return iter(self._rows)
+
+
+class FakeClient:
+    """Lists datasets/tables and serves them through ``get_table``."""
+
+    def __init__(self, tables=TABLES, missing=(), forbidden=()):
+        self.tables = tables
+        self.missing = set(missing)
+        self.forbidden = set(forbidden)
+
+    def list_datasets(self, project=None):
+        return [SimpleNamespace(dataset_id=d) for d in self.tables]
+
+    def list_tables(self, dataset_ref):
+        dataset = dataset_ref.split(".")[-1]
+        if dataset in self.forbidden:
+            raise gcp_exceptions.Forbidden(dataset_ref)
+        return [SimpleNamespace(table_id=t) for t in self.tables[dataset]]
+
+    def query(self, sql, job_config=None, location=None):
+        dataset = sql.split("`")[1].split(".")[1]
+        return _Job(
+            [{"table_id": t, "last_modified_time": 1} for t in self.tables[dataset]]
+        )
+
+    def get_table(self, ref):
+        _, dataset, table_id = ref.split(".")
+        if table_id in self.missing:
+            raise gcp_exceptions.Forbidden(ref)
+        tbl = bigquery.Table(ref, schema=self.tables[dataset][table_id])
+        tbl._properties["lastModifiedTime"] = "1"
+        tbl.time_partitioning = bigquery.TimePartitioning()
+        return tbl
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _scan(tmp_path, findings, **kwargs):
+    kwargs.setdefault("client", FakeClient())
+    kwargs.setdefault("workers", 1)
+    kwargs.setdefault("cache_dir", tmp_path / "cache")
+    return scan_bigquery("p", findings, **kwargs)
+
+
+def test_scan_streams_tagged_findings_and_checkpoints(tmp_path):
+    findings = tmp_path / "out" / "findings.ndjson"
+    stats = _scan(tmp_path, findings)
+
+    assert stats["datasets"] == 2 and stats["tables"] == 5
+    assert stats["skipped"] == stats["errors"] == 0
+    records = _records(findings)
+    assert stats["findings"] == len(records)
+    by_key = {}
+    for r in records:
+        by_key.setdefault((r["dataset"], r["table"]), set()).add(r["pattern"])
+    assert "plaintext_secrets" in by_key[("d", "events_20240101")]
+    assert "boolean_as_integer" in by_key[("d", "users")]
+    assert "missing_partition_filter_requirement" in by_key[("e", "orders")]
+    assert {"sharded_tables_by_name", "inconsistent_id_types"} <= by_key[("d", None)]
+
+    checkpoint = _records(findings.with_name("findings.ndjson.checkpoint"))
+    assert {(c["dataset"], c["table"]) for c in checkpoint} == {
+        (d, t) for d in TABLES for t in [*TABLES[d], None]
+    }
+
+
+def test_resume_skips_completed_tables_and_retries_failures(tmp_path, monkeypatch):
+    expected = tmp_path / "expected.ndjson"
+    _scan(tmp_path, expected)
+
+    findings = tmp_path / "findings.ndjson"
+    failing = FakeClient(missing={"users"})
+    stats = _scan(tmp_path, findings, client=failing, cache_dir=tmp_path / "cold")
+    assert stats["errors"] == 1
+    assert any("error" in r and r["table"] == "users" for r in _records(findings))
+    # A crash mid-write leaves a partial last line behind
+    with open(findings, "a") as fh:
+        fh.write('{"project": "p", "dataset": "e", "tab')
+
+    analyzed = []
+    analyze = bigquery_scan._analyze_table
+
+    def _counting(resource, rules=None):
+        analyzed.append(resource["tableReference"]["tableId"])
+        return analyze(resource, rules)
+
+    monkeypatch.setattr(bigquery_scan, "_analyze_table", _counting)
+    stats = _scan(tmp_path, findings, resume=True)
+
+    assert analyzed == ["users"]
+    assert stats["skipped"] == 4 and stats["errors"] == 0
+    key = lambda r: json.dumps(r, sort_keys=True)  # noqa: E731
+    assert sorted(map(key, _records(findings))) == sorted(
+        map(key, _records(expected))
+    )
+
+    # Everything is checkpointed now: a further resume does no work
+    analyzed.clear()
+    assert _scan(tmp_path, findings, resume=True)["tables"] == 0
+    assert analyzed == []
+
+
+def test_unlistable_dataset_is_recorded_and_skipped(tmp_path):
+    findings = tmp_path / "findings.ndjson"
+    stats = _scan(tmp_path, findings, client=FakeClient(forbidden={"d"}))
+
+    assert stats["datasets"] == 1 and stats["tables"] == 1
+    assert stats["errors"] == 1
+    errors = [r for r in _records(findings) if "error" in r]
+    assert [(r["dataset"], r["table"]) for r in errors] == [("d", None)]
+    assert "Forbidden" in errors[0]["error"]
+    checkpoint = _records(findings.with_name("findings.ndjson.checkpoint"))
+    assert {c["dataset"] for c in checkpoint} == {"e"}
+
+    # The dataset is retried on resume
+    stats = _scan(tmp_path, findings, resume=True)
+    assert stats["tables"] == 4 and stats["skipped"] == 1 and stats["errors"] == 0
+
+
+def test_process_pool_matches_in_process_scan(tmp_path):
+    inline = tmp_path / "inline.ndjson"
+    pooled = tmp_path / "pooled.ndjson"
+    _scan(tmp_path, inline, dataset_ids=["d"])
+    stats = _scan(tmp_path, pooled, dataset_ids=["d"], workers=2)
+
+    assert stats["tables"] == 4
+    key = lambda r: json.dumps(r, sort_keys=True)  # noqa: E731
+    assert sorted(map(key, _records(pooled))) == sorted(map(key, _records(inline)))
+
+
+def test_analyze_dataset_option_runs_scan(tmp_path, monkeypatch, capsys):
+    parser = argparse.ArgumentParser()
+    add_analyze_subcommand(parser.add_subparsers(dest="command"))
+    calls = []
+
+    def _fake_scan(project, findings, **kwargs):
+        calls.append((project, findings, kwargs))
+        return {"datasets": 1, "tables": 3, "skipped": 0, "errors": 0, "findings": 7}
+
+    monkeypatch.setattr(bigquery_scan, "scan_bigquery", _fake_scan)
+    monkeypatch.chdir(tmp_path)
+
+    args = parser.parse_args(["analyze", "--dataset", "p:d", "--workers", "4"])
+    assert cmd_analyze(args) == 0
+    project, findings, kwargs = calls[0]
+    assert project == "p"
+    assert findings.name == "antipatterns_p_d.ndjson"
+    assert kwargs == {
+        "dataset_ids": ["d"],
+        "workers": 4,
+        "resume": False,
+        "rules": None,
+    }
+    assert "7 findings" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["analyze", "--dataset", "p:d", "--project", "p"])
+    assert cmd_analyze(parser.parse_args(["analyze"])) == 1
@@ -1,5 +1,12 @@
-from schema_diff.utils import inject_presence_for_diff
-from schema_diff.normalize import walk_normalize
+from unittest.mock import patch
+
+from schema_diff.utils import (
+    build_path_index,
+    inject_presence_for_diff,
+    prune_equal_subtrees,
+    structural_hash,
+)
+from schema_diff.normalize import walk_normalize, walk_normalize_with_presence
 from schema_diff.compare import compare_trees
 import json
 import sys
@@ -27,6 +34,32 @@ def test_inject_presence_scalars_and_arrays():
     assert "missing" in n["meta"]["note"]
 
 
+def test_fused_presence_normalize_matches_two_pass():
+    ref = {
+        "id": "int",
+        "note": "empty_string",
+        "tags": ["str"],
+        "blob": [],
+        "items": [{"sku": "str", "qty": "union(int|float)", "dims": {"w": "int"}}],
+        "meta": {"active": "bool"},
+    }
+    required = {"id", "items[0].sku", "meta.active"}
+    snapshot = json.dumps(ref, sort_keys=True)
+
+    fused = walk_normalize_with_presence(ref, required)
+
+    assert fused == walk_normalize(inject_presence_for_diff(ref, required))
+    assert fused["items"] == [
+        {
+            "sku": "str",
+            "qty": "union(float|int|missing)",
+            "dims": {"w": "union(int|missing)"},
+        }
+    ]
+    # neither pass mutates its input
+    assert json.dumps(ref, sort_keys=True) == snapshot
+
+
 def test_compare_trees_plain_types_match(cfg_like):
     left = {"id": "int", "name": "str"}
     right = {"id": "int", "name": "str"}
@@ -34,6 +67,44 @@ def test_compare_trees_plain_types_match(cfg_like):
     compare_trees("L", "R", left, set(), right, set(), cfg=cfg_like)
 
 
+def test_structural_hash_ignores_key_and_element_order():
+    a = {"id": "int", "items": [{"x": "str", "y": "int"}]}
+    b = {"items": [{"y": "int", "x": "str"}], "id": "int"}
+
+    assert structural_hash(a) == structural_hash(b)
+    assert structural_hash(a) != structural_hash({**a, "id": "str"})
+    assert structural_hash({"n": 1}) != structural_hash({"n": "1"})
+    assert build_path_index(a).root_hash == structural_hash(a)
+    assert build_path_index(a).hashes["items"] == structural_hash(a["items"])
+
+
+def test_compare_trees_equal_roots_skip_deepdiff(cfg_like):
+    left = {"id": "int", "meta": {"a": "str", "b": ["int"]}}
+    right = {"meta": {"b": ["int"], "a": "str"}, "id": "int"}
+
+    with patch("schema_diff.compare.DeepDiff", side_effect=AssertionError):
+        report = compare_trees("L", "R", left, set(), right, set(), cfg=cfg_like)
+
+    assert report["note"] == "No differences"
+
+
+def test_prune_equal_subtrees_keeps_only_differing_branches(cfg_like):
+    shared = {f"f{i}": "str" for i in range(50)}
+    left = {"same": shared, "nested": {"keep": "int", "same": shared}, "gone": "int"}
+    right = {"same": shared, "nested": {"keep": "str", "same": shared}, "new": "int"}
+
+    pl, pr = prune_equal_subtrees(
+        left, right, build_path_index(left), build_path_index(right)
+    )
+    assert pl == {"nested": {"keep": "int"}, "gone": "int"}
+    assert pr == {"nested": {"keep": "str"}, "new": "int"}
+
+    report = compare_trees("L", "R", left, set(), right, set(), cfg=cfg_like)
+    assert report["only_in_file1"] == ["gone"]
+    assert report["only_in_file2"] == ["new"]
+    assert [m["path"] for m in report["schema_mismatches"]] == ["nested.keep"]
+
+
 def test_presence_only_diff_jsonschema_vs_sql(tmp_path, run_cli):
     js = tmp_path / "schema.json"
     js.write_text(
@@ -107,3 +107,86 @@ def test_dbt_manifest_array_angle(tmp_path):
 
     tree, req = schema_from_dbt_manifest(str(p), model="y")
     assert tree["tags"] in (["str"], "array")
+
+
+def _big_manifest(n_models=400):
+    """Manifest well past the 64 KiB read chunk and the 128 KiB sniff peek."""
+    nodes = {}
+    for i in range(n_models):
+        nodes[f"model.proj.m{i}"] = {
+            "resource_type": "model",
+            "name": f"m{i}",
+            "alias": f"alias_{i}",
+            "description": "x" * 300,
+            "columns": {
+                "id": {"data_type": "BIGINT", "tests": ["not_null"]},
+                f"c{i}": {"data_type": "TEXT"},
+            },
+        }
+        nodes[f"test.proj.not_null_m{i}_id"] = {
+            "resource_type": "test",
+            "name": "m0",
+            "columns": {"bogus": {"data_type": "INT"}},
+        }
+    return {"nodes": nodes, "metadata": {"dbt_version": "1.7.0"}}
+
+
+def _reference(manifest, name):
+    (node,) = [
+        n for n in manifest["nodes"].values()
+        if n["resource_type"] == "model" and name in (n["name"], n["alias"])
+    ]
+    return set(node["columns"])
+
+
+@pytest.fixture
+def dbt_cache(tmp_path, monkeypatch):
+    from schema_diff.decorators import _cache_manager
+
+    monkeypatch.setattr(_cache_manager, "cache_dir", tmp_path / "cache")
+    return tmp_path / "cache" / "dbt_index"
+
+
+def test_dbt_manifest_streamed_gzip(write_file, dbt_cache):
+    manifest = _big_manifest()
+    path = write_file("manifest.json.gz", json.dumps(manifest), gz=True)
+
+    for name in ("m0", "alias_217", "model.proj.m399"):
+        tree, required = schema_from_dbt_manifest(path, model=name)
+        assert set(tree) == _reference(manifest, name.split(".")[-1])
+        assert required == {"id"}
+    # No model: first node id in sort order
+    assert set(schema_from_dbt_manifest(path)[0]) == {"id", "c0"}
+    assert not dbt_cache.exists()  # gzip offsets are not indexable
+    with pytest.raises(ValueError, match="No dbt model"):
+        schema_from_dbt_manifest(path, model="missing")
+
+
+def test_dbt_manifest_index_lookup(write_file, dbt_cache, monkeypatch):
+    from schema_diff import dbt_schema_parser
+
+    manifest = _big_manifest()
+    path = write_file("manifest.json", json.dumps(manifest, indent=2))
+
+    tree, required = schema_from_dbt_manifest(path, model="m123")
+    assert tree == {"id": "int", "c123": "str"} and required == {"id"}
+    assert len(list(dbt_cache.glob("*.json"))) == 1
+
+    # Repeated lookups seek through the cached index without streaming
+    def _no_stream(*a, **k):
+        raise AssertionError("manifest was streamed")
+
+    monkeypatch.setattr(dbt_schema_parser, "iter_manifest_models", _no_stream)
+    assert set(schema_from_dbt_manifest(path, model="alias_399")[0]) == {"id", "c399"}
+    with pytest.raises(ValueError, match="No dbt model"):
+        schema_from_dbt_manifest(path, model="not_null_m0_id")
+
+
+def test_sniff_truncated_manifest_peek(write_file):
+    from schema_diff.loader import KIND_DBT_MANIFEST, _sniff_json_kind
+
+    manifest = _big_manifest()
+    manifest = {"metadata": manifest.pop("metadata"), **manifest}
+    path = write_file("manifest.json", json.dumps(manifest))
+
+    assert _sniff_json_kind(path) == KIND_DBT_MANIFEST
@@ -0,0 +1,207 @@
+"""Tests for whole-manifest dbt vs BigQuery reconciliation."""
+
+import json
+import sys
+import threading
+
+import pytest
+from google.api_core import exceptions as gcp_exceptions
+from google.cloud.bigquery.schema import SchemaField
+
+from schema_diff.dbt_reconcile import (
+    load_manifest_models,
+    reconcile_dbt_manifest,
+    render_reconcile_markdown,
+)
+
+
+class FakeTable:
+    def __init__(self, schema):
+        self.schema = schema
+
+
+class FakeClient:
+    """Stands in for bigquery.Client: serves schemas from a dict."""
+
+    def __init__(self, tables, fail=()):
+        self.tables = tables
+        self.fail = set(fail)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_table(self, ref):
+        with self._lock:
+            self.calls.append(ref)
+        table_id = ref.rsplit(".", 1)[-1]
+        if table_id in self.fail:
+            raise gcp_exceptions.Forbidden("Access Denied")
+        if table_id not in self.tables:
+            raise gcp_exceptions.NotFound(f"Not found: Table {ref}")
+        return FakeTable(self.tables[table_id])
+
+
+def _model(name, columns, schema="analytics", materialized="table", alias=None):
+    return {
+        "resource_type": "model",
+        "name": name,
+        "alias": alias or name,
+        "schema": schema,
+        "config": {"materialized": materialized},
+        "columns": columns,
+    }
+
+
+@pytest.fixture
+def manifest(write_file):
+    nodes = {
+        "model.shop.orders": _model(
+            "orders",
+            {
+                "id": {"data_type": "INT64", "tests": ["not_null"]},
+                "amount": {"data_type": "NUMERIC"},
+                "note": {},  # no data_type: existence only
+                "customer.id": {"data_type": "INT64"},
+            },
+        ),
+        "model.shop.customers": _model(
+            "customers",
+            {"id": {"data_type": "INT64"}, "email": {"data_type": "STRING"}},
+            alias="dim_customers",
+        ),
+        "model.shop.gone": _model("gone", {"id": {"data_type": "INT64"}}),
+        "model.shop.secret": _model("secret", {"id": {"data_type": "INT64"}}),
+        "model.shop.stg": _model("stg", {"id": {}}, materialized="ephemeral"),
+        "model.shop.other": _model("other", {"id": {}}, schema="staging"),
+        "model.shop.undoc": _model("undoc", {}),
+        "test.shop.not_null_orders_id": {"resource_type": "test", "name": "t"},
+    }
+    return write_file("manifest.json", json.dumps({"nodes": nodes}))
+
+
+@pytest.fixture
+def client():
+    return FakeClient(
+        {
+            "orders": [
+                SchemaField("id", "INTEGER", mode="REQUIRED"),
+                SchemaField("amount", "NUMERIC"),
+                SchemaField("note", "STRING"),
+                SchemaField("customer", "RECORD", fields=[SchemaField("id", "INT64")]),
+            ],
+            "dim_customers": [
+                SchemaField("id", "INTEGER"),
+                SchemaField("email", "INTEGER"),
+                SchemaField("created_at", "TIMESTAMP"),
+            ],
+        },
+        fail={"secret"},
+    )
+
+
+def test_load_manifest_models_filters(manifest):
+    models = load_manifest_models(manifest, dataset="analytics")
+
+    assert [m.name for m in models] == [
+        "orders",
+        "customers",
+        "gone",
+        "secret",
+        "undoc",
+    ]
+    assert models[1].table == "dim_customers"
+    assert [m.name for m in load_manifest_models(manifest, models=["OTHER"])] == [
+        "other"
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_reconcile_statuses(manifest, client, workers):
+    result = reconcile_dbt_manifest(
+        manifest, "proj", "analytics", client=client, workers=workers
+    )
+
+    by_model = {r["model"].split(".")[-1]: r for r in result["results"]}
+    assert {k: r["status"] for k, r in by_model.items()} == {
+        "orders": "match",
+        "customers": "drift",
+        "gone": "missing_table",
+        "secret": "error",
+        "undoc": "undocumented",
+    }
+    customers = by_model["customers"]
+    assert customers["table"] == "proj.analytics.dim_customers"
+    assert (customers["only_in_right"], customers["type_mismatches"]) == (1, 1)
+    assert "Access Denied" in by_model["secret"]["error"]
+
+    # One bulk fetch per distinct table, no fetch for undocumented models
+    assert sorted(client.calls) == [
+        "proj.analytics.dim_customers",
+        "proj.analytics.gone",
+        "proj.analytics.orders",
+        "proj.analytics.secret",
+    ]
+    assert result["summary"] == {
+        "match": 1,
+        "drift": 1,
+        "missing_table": 1,
+        "undocumented": 1,
+        "error": 1,
+    }
+    assert result["meta"]["diffed"] == 1
+
+    md = render_reconcile_markdown(result)
+    assert "| `model.shop.customers` | `proj.analytics.dim_customers` | drift |" in md
+
+
+def test_cli_dbt_reconcile(manifest, client, tmp_path, monkeypatch, capsys):
+    from schema_diff import bigquery_utils
+    from schema_diff.cli import main
+
+    monkeypatch.setattr(bigquery_utils, "get_bigquery_client", lambda project: client)
+    out = tmp_path / "reconcile.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "schema-diff",
+            "dbt-reconcile",
+            manifest,
+            "proj:analytics",
+            "--model",
+            "orders",
+            "--model",
+            "dim_customers",
+            "--workers",
+            "1",
+            "--json-out",
+            str(out),
+        ],
+    )
+
+    assert main() == 0
+    result = json.loads(out.read_text(encoding="utf-8"))
+    assert [r["status"] for r in result["results"]] == ["match", "drift"]
+    assert "1 match, 1 drift" in capsys.readouterr().out
+
+
+def test_cli_dbt_reconcile_no_color(manifest, client, monkeypatch, capsys):
+    import argparse
+
+    from schema_diff import bigquery_utils
+    from schema_diff.cli import colors
+    from schema_diff.cli.dbt_reconcile import (
+        add_dbt_reconcile_subcommand,
+        cmd_dbt_reconcile,
+    )
+
+    monkeypatch.setattr(bigquery_utils, "get_bigquery_client", lambda project: client)
+    for name in ("BOLD", "CYAN", "GREEN", "RED", "RESET", "YELLOW"):
+        monkeypatch.setattr(colors, name, "\033[1m")
+    parser = argparse.ArgumentParser()
+    add_dbt_reconcile_subcommand(parser.add_subparsers(dest="command"))
+
+    argv = ["dbt-reconcile", manifest, "proj:analytics", "--workers", "1"]
+    cmd_dbt_reconcile(parser.parse_args(argv))
+    assert "\033[" in capsys.readouterr().out
+    cmd_dbt_reconcile(parser.parse_args(argv + ["--no-color"]))
+    assert "\033[" not in capsys.readouterr().out
@@ -4,7 +4,12 @@ Tests for enhanced functionality: array normalization, path changes, live BigQue
 
 from unittest.mock import Mock, patch
 
-from schema_diff.utils import compute_path_changes, fmt_dot_path
+from schema_diff.utils import (
+    build_path_index,
+    compute_path_changes,
+    flatten_paths,
+    fmt_dot_path,
+)
 from schema_diff.bigquery_ddl import _normalize_bigquery_arrays
 from schema_diff.report import print_path_changes
 from schema_diff.loader import load_left_or_right, KIND_BIGQUERY
@@ -129,6 +134,41 @@ class TestPathChanges:
         # At minimum, should return a list
         assert len(changes) >= 0
 
+    def test_path_index_matches_flatten_paths(self):
+        """PathIndex leaves, parents and name index agree with the tree."""
+        tree = {
+            "id": "int",
+            "experience": [{"title": "str", "company": {"id": "int"}}],
+            "tags": ["str"],
+        }
+
+        index = build_path_index(tree)
+
+        assert index.leaves == flatten_paths(tree)
+        assert index.parents["experience[0].company.id"] == "experience[0].company"
+        assert index.parents["experience[0].title"] == "experience"
+        assert index.by_name["id"] == {"id", "experience[0].company.id"}
+        assert index.descendants("experience") == [
+            "experience[0].title",
+            "experience[0].company",
+            "experience[0].company.id",
+        ]
+
+    def test_compute_path_changes_accepts_indexes(self):
+        """Prebuilt indexes give the same result as raw trees."""
+        left_tree = {"name": "str", "meta": {"id": "int"}}
+        right_tree = {"profile": {"name": "str"}, "meta": {"id": "int"}}
+
+        from_trees = compute_path_changes(left_tree, right_tree)
+        from_indexes = compute_path_changes(
+            build_path_index(left_tree), build_path_index(right_tree)
+        )
+
+        assert from_trees == from_indexes
+        assert from_trees == [
+            {"name": "name", "shared": [], "left": ["name"], "right": ["profile.name"]}
+        ]
+
     def test_fmt_dot_path_array_notation(self):
         """Test path formatting with clean array notation."""
         # Test legacy [0] notation cleanup
@@ -75,3 +75,113 @@ def test_nested_required(tmp_path):
     n = walk_normalize(tree)
     assert n["user"]["id"] == "int"
     assert "user.id" in required and "user.name" not in required
+
+
+def test_refs_resolved_and_shared(tmp_path):
+    sch = {
+        "type": "object",
+        "required": ["billing"],
+        "properties": {
+            "billing": {"$ref": "#/$defs/address"},
+            "shipping": {"$ref": "#/definitions/address"},
+            "tags": {"type": "array", "items": {"$ref": "#/$defs/tag"}},
+            "remote": {"$ref": "https://example.com/other.json"},
+        },
+        "$defs": {
+            "address": {
+                "type": "object",
+                "required": ["zip"],
+                "properties": {
+                    "zip": {"type": "string"},
+                    "geo": {"$ref": "#/$defs/address/properties/zip"},
+                },
+            },
+            "tag": {"type": "string"},
+        },
+        "definitions": {"address": {"$ref": "#/$defs/address"}},
+    }
+    p = tmp_path / "schema.json"
+    p.write_text(json.dumps(sch), encoding="utf-8")
+
+    tree, required = schema_from_json_schema_file(str(p))
+
+    assert tree["billing"] == {"zip": "str", "geo": "str"}
+    assert tree["shipping"] is tree["billing"]  # converted once, shared
+    assert tree["tags"] == ["str"]
+    assert tree["remote"] == "any"
+    assert required == {"billing", "billing.zip", "shipping.zip"}
+
+
+def test_recursive_refs_are_cut(tmp_path):
+    sch = {
+        "$ref": "#/$defs/node",
+        "$defs": {
+            "node": {
+                "type": "object",
+                "required": ["id"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "children": {"type": "array", "items": {"$ref": "#/$defs/node"}},
+                    "parent": {"$ref": "#"},
+                },
+            }
+        },
+    }
+    p = tmp_path / "schema.json"
+    p.write_text(json.dumps(sch), encoding="utf-8")
+
+    tree, required = schema_from_json_schema_file(str(p))
+
+    assert tree == {"id": "int", "children": ["object"], "parent": "object"}
+    assert required == {"id"}
+
+
+def test_mutually_recursive_refs_independent_of_order(tmp_path):
+    defs = {
+        "a": {
+            "type": "object",
+            "required": ["b", "name"],
+            "properties": {"name": {"type": "string"}, "b": {"$ref": "#/$defs/b"}},
+        },
+        "b": {
+            "type": "object",
+            "required": ["a"],
+            "properties": {"a": {"$ref": "#/$defs/a"}, "n": {"type": "integer"}},
+        },
+    }
+    props = {"x": {"$ref": "#/$defs/a"}, "y": {"$ref": "#/$defs/b"}}
+    results = []
+    for order in (["x", "y"], ["y", "x"]):
+        sch = {
+            "type": "object",
+            "properties": {k: props[k] for k in order},
+            "$defs": defs,
+        }
+        p = tmp_path / "schema.json"
+        p.write_text(json.dumps(sch), encoding="utf-8")
+        results.append(schema_from_json_schema_file(str(p)))
+
+    (tree, required), (tree_rev, required_rev) = results
+    assert tree == tree_rev
+    assert required == required_rev
+    assert tree == {"x": {"name": "str", "b": "object"}, "y": {"a": "object", "n": "int"}}
+    assert required == {"x.b", "x.name", "y.a"}
+
+
+def test_shared_definitions_not_reexpanded(tmp_path):
+    # Each level references the previous one twice: 2**60 expansions without memo
+    defs = {"d0": {"type": "object", "properties": {"v": {"type": "integer"}}}}
+    for i in range(1, 61):
+        ref = {"$ref": f"#/$defs/d{i - 1}"}
+        defs[f"d{i}"] = {"type": "object", "properties": {"l": ref, "r": ref}}
+    p = tmp_path / "schema.json"
+    p.write_text(json.dumps({"$ref": "#/$defs/d60", "$defs": defs}), encoding="utf-8")
+
+    tree, required = schema_from_json_schema_file(str(p))
+
+    assert tree["l"] is tree["r"]
+    node = tree
+    for _ in range(60):
+        node = node["l"]
+    assert node == {"v": "int"}
+    assert required == set()
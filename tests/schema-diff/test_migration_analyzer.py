@@ -0,0 +1,66 @@
+"""Tests for migration analysis rendered from structured diff reports."""
+
+from schema_diff.compare import diff_normalized_trees, normalize_for_diff
+from schema_diff.migration_analyzer import (
+    analyze_migration_impact,
+    generate_migration_report,
+)
+
+
+def _report():
+    left = normalize_for_diff(
+        {"a": "int", "b": "str", "c": {"x": "int"}, "m": "str"}, {"b"}, "sql"
+    )
+    right = normalize_for_diff(
+        {"a": "str", "b": "str", "x": "int", "n": "int"}, set(), "sql"
+    )
+    report = diff_normalized_trees("old.sql", "new.sql", left, right)
+    report["common_fields"] = ["b"]
+    return report
+
+
+def test_markdown_rendered_from_structured_report():
+    analysis = analyze_migration_impact(
+        _report(), "old.sql", "new.sql", full_diff_output="console text"
+    )
+    md = generate_migration_report(analysis)
+
+    assert "Comparing **`old.sql`** → **`new.sql`**" in md
+    assert "#### ✅ Common Fields (1)" in md
+    assert "#### ⬅️ Only in Source (2)" in md
+    assert "  - `m`" in md
+    assert "- **`a`**: `int → str`" in md
+    assert "- **`b`**: `required → nullable`" in md
+    assert "#### 🔀 Path Changes (1)" in md
+    assert "#### 1. **`x`**" in md
+    assert "  • `c.x`" in md
+    assert md.count("<details>") == md.count("</details>")
+    assert "console text" not in md
+
+
+def test_full_diff_section_only_when_requested():
+    md = generate_migration_report(analyze_migration_impact(_report(), "a", "b"))
+
+    assert "Full Schema-Diff Output" not in md
+    assert "- ⚠️ **2 fields removed**" in md
+
+
+def test_markdown_for_identical_schemas():
+    report = {"meta": {"direction": "a -> b"}, "note": "No differences"}
+    md = generate_migration_report(
+        analyze_migration_impact(report, "a", "b", full_diff_output="-")
+    )
+
+    assert "No differences found." in md
+    assert "Fully Compatible" in md
+
+
+def test_full_diff_output_without_report_is_verbatim():
+    analysis = analyze_migration_impact(
+        {}, "a", "b", full_diff_output="\x1b[31mx\x1b[0m"
+    )
+    analysis.diff_report = None
+
+    md = generate_migration_report(analysis)
+
+    assert "```\nx\n```" in md
@@ -0,0 +1,102 @@
+"""Tests for the compiled field-name catalog matchers."""
+
+import random
+
+from schema_diff import analyze_config, name_matcher
+from schema_diff.bigquery_ddl import _classify_pii_by_name
+from schema_diff.name_matcher import (
+    AffixMatcher,
+    KeywordMatcher,
+    TokenMatcher,
+    keyword_matcher,
+    suffix_matcher,
+    token_matcher,
+    tokenize_name,
+)
+
+
+def _random_names(alphabet, count=2000, seed=7):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        for _ in range(count)
+    ]
+
+
+def test_keyword_and_affix_matchers_agree_with_naive_loops():
+    # Overlapping keywords exercise the Aho-Corasick failure links
+    keywords = ["he", "she", "his", "hers", "_id", "id_", "s", "ssn", "sh"]
+    names = _random_names("hesird_n")
+    kw = KeywordMatcher(keywords)
+    prefixes = AffixMatcher(keywords)
+    suffixes = AffixMatcher(keywords, suffix=True)
+
+    for name in names:
+        assert kw.find(name) == tuple(k for k in keywords if k in name)
+        assert kw.search(name) == any(k in name for k in keywords)
+        assert prefixes.match(name) == name.startswith(tuple(keywords))
+        assert suffixes.match(name) == name.endswith(tuple(keywords))
+
+    assert KeywordMatcher([""]).search("anything")
+    assert not KeywordMatcher([]).search("anything")
+    assert AffixMatcher([""], suffix=True).match("x")
+
+
+def test_token_matcher_matches_per_indicator_loop():
+    categories = {
+        "contact": ["email", "phone_number", "email_address"],
+        "financial": ["credit_card", "iban", "card"],
+        "empty": ["__"],
+    }
+    matcher = TokenMatcher(categories)
+
+    assert matcher.classify("userEmailAddress") == {
+        "contact": ["email", "email_address"],
+        "empty": ["__"],
+    }
+    assert matcher.classify("card_credit_no") == {
+        "financial": ["credit_card", "card"],
+        "empty": ["__"],
+    }
+    # Results are copies; callers may mutate them freely
+    matcher.classify("iban").clear()
+    assert matcher.classify("iban")["financial"] == ["iban"]
+
+    for name in ["", "x", "PhoneNumber2", "iban_email", "credit-card"]:
+        tokens = set(tokenize_name(name))
+        expected = {}
+        for cat, indicators in categories.items():
+            hits = [i for i in indicators if set(tokenize_name(i)) <= tokens]
+            if hits:
+                expected[cat] = hits
+        assert matcher.classify(name) == expected
+
+
+def test_compiled_once_per_catalog_and_recompiled_on_rebind(monkeypatch):
+    catalog = analyze_config.SENSITIVE_SECRET_SUFFIXES
+    assert suffix_matcher(catalog) is suffix_matcher(catalog)
+    assert keyword_matcher(catalog) is not keyword_matcher(catalog, delimited=True)
+
+    monkeypatch.setattr(
+        analyze_config, "PII_INDICATORS", {"custom": {"favourite_colour"}}
+    )
+    assert token_matcher(analyze_config.PII_INDICATORS) is token_matcher(
+        analyze_config.PII_INDICATORS
+    )
+    assert _classify_pii_by_name("FavouriteColour") == {
+        "custom": ["favourite_colour"]
+    }
+    assert _classify_pii_by_name("email") == {}
+
+
+def test_delimited_keywords_and_bounded_memo(monkeypatch):
+    matcher = keyword_matcher(["count"], delimited=True)
+    assert matcher.search("row_count") and matcher.search("count_rows")
+    assert not matcher.search("count") and not matcher.search("counter")
+
+    monkeypatch.setattr(name_matcher, "MEMO_LIMIT", 3)
+    kw = KeywordMatcher(["a"])
+    for name in ["a", "b", "ab", "ba", "c"]:
+        kw.find(name)
+    assert len(kw._memo) <= 3
+    assert kw.find("ba") == ("a",)
@@ -0,0 +1,92 @@
+"""Tests for streaming per-field data profiling."""
+
+import json
+import random
+
+from schema_diff.config import Config
+from schema_diff.json_data_file_parser import merged_schema_from_samples
+from schema_diff.profiling import DataProfiler, HyperLogLog, SpaceSaving
+
+
+def _records(n, seed=3):
+    rnd = random.Random(seed)
+    out = []
+    for i in range(n):
+        rec = {"id": i, "country": rnd.choice(["US", "US", "US", "DE", "FR"])}
+        if i % 4:
+            rec["email"] = None if i % 10 == 1 else f"user{i}@example.com"
+        rec["tags"] = ["a", "bb"][: i % 3]
+        rec["address"] = {"zip": str(10000 + i % 50)}
+        out.append(rec)
+    return out
+
+
+def test_hyperloglog_within_error_bound():
+    hll = HyperLogLog()
+    for i in range(50_000):
+        hll.add_hash(hash(("x", i)) & (2**64 - 1))
+    assert abs(hll.count() - 50_000) / 50_000 < 0.08
+
+
+def test_space_saving_finds_heavy_hitters():
+    ss = SpaceSaving()
+    stream = ["hot"] * 500 + ["warm"] * 200 + [f"cold{i}" for i in range(2000)]
+    random.Random(1).shuffle(stream)
+    for item in stream:
+        ss.add(item)
+    assert [item for item, _ in ss.top(2)] == ["hot", "warm"]
+
+
+def test_profile_collected_during_inference():
+    recs = _records(400)
+    profiler = DataProfiler()
+
+    schema = merged_schema_from_samples(recs, Config(), profiler)
+    fields = profiler.to_dict()["fields"]
+
+    assert schema["id"] == "int"
+    assert fields["id"]["presence_rate"] == 1.0
+    assert fields["id"]["min"] == 0 and fields["id"]["max"] == 399
+    assert abs(fields["id"]["distinct_approx"] - 400) <= 20
+    assert fields["email"]["presence_rate"] == 0.75
+    assert fields["email"]["null_rate"] == round(40 / 300, 4)
+    assert fields["email"]["length_histogram"]
+    assert fields["country"]["top_values"][0]["value"] == "US"
+    assert fields["address.zip"]["distinct_approx"] == 50
+    assert fields["tags[]"]["count"] == sum(i % 3 for i in range(400))
+    # Exact type distributions come from the inference pass itself
+    assert fields["email"]["types"] == {"missing": 140, "str": 260}
+
+
+def test_merged_profiles_match_single_pass():
+    recs = _records(300)
+    whole = DataProfiler()
+    for r in recs:
+        whole.observe(r)
+
+    left, right = DataProfiler(), DataProfiler()
+    for r in recs[:120]:
+        left.observe(r)
+    for r in recs[120:]:
+        right.observe(r)
+
+    merged = left.merge(right).to_dict()
+    expected = whole.to_dict()
+    # Space-Saving counts are exact only while a field fits in its counters
+    assert merged["fields"]["country"] == expected["fields"]["country"]
+    for stats in (*merged["fields"].values(), *expected["fields"].values()):
+        stats.pop("top_values", None)
+    assert merged == expected
+
+
+def test_analyze_profile_data_flag(run_cli, write_file):
+    path = write_file("rows.ndjson", "\n".join(json.dumps(r) for r in _records(20)))
+
+    result = run_cli(
+        ["analyze", str(path), "--type", "data", "--profile-data", "--format", "json"]
+    )
+
+    assert result.returncode == 0
+    payload = json.loads(result.stdout[result.stdout.index("{") :])
+    assert payload["profile"]["records"] == 20
+    assert "address.zip" in payload["profile"]["fields"]
@@ -1,4 +1,6 @@
+from schema_diff import protobuf_schema_parser
 from schema_diff.protobuf_schema_parser import (
+    ProtoWorkspace,
     list_protobuf_messages,
     schema_from_protobuf_file,
 )
@@ -218,3 +220,124 @@ def test_top_level_other_message(tmp_path: Path):
 
 
 # Note: dbt manifest array angle test is covered in test_dbt_parsers.py
+
+def _proto_tree(root: Path) -> Path:
+    """protos/{common/types.proto, common/status.proto, svc/order.proto}."""
+    files = {
+        "common/types.proto": """
+            syntax = "proto3";
+            package acme.common;
+            import "common/status.proto";
+            message Money {
+              string currency = 1;
+              int64 units = 2;
+            }
+            message Audit {
+              Status status = 1;
+              Audit parent = 2;
+            }
+        """,
+        "common/status.proto": """
+            syntax = "proto3";
+            package acme.common;
+            enum Status {
+              UNKNOWN = 0;
+              ACTIVE = 1;
+            }
+        """,
+        "svc/order.proto": """
+            syntax = "proto3";
+            package acme.svc;
+            import "common/types.proto";
+            import "google/protobuf/timestamp.proto";
+            message Order {
+              acme.common.Money total = 1;
+              repeated common.Money lines = 2;
+              acme.common.Audit audit = 3;
+              google.protobuf.Timestamp at = 4;
+            }
+        """,
+    }
+    for rel, text in files.items():
+        f = root / "protos" / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text(textwrap.dedent(text), encoding="utf-8")
+    return root / "protos"
+
+
+def test_workspace_resolves_imports_across_files(tmp_path: Path):
+    protos = _proto_tree(tmp_path)
+    ws = ProtoWorkspace([str(protos)])
+
+    tree, _, chosen = ws.schema(str(protos / "svc" / "order.proto"))
+
+    assert chosen == "acme.svc.Order"
+    assert tree["total"] == {"currency": "str", "units": "int"}
+    assert tree["lines"] == [{"currency": "str", "units": "int"}]
+    # Imported enum → str; recursive message cut at the cycle
+    assert tree["audit"] == {"status": "str", "parent": "object"}
+    assert tree["at"] == "timestamp"
+    assert len(ws.files) == 3
+    assert ws.missing_imports == {"google/protobuf/timestamp.proto"}
+    # Imported messages can be selected by suffix from the importing file
+    assert ws.resolve_message(str(protos / "svc" / "order.proto"), "Money") == (
+        "acme.common.Money"
+    )
+    assert ws.list_messages(str(protos / "svc" / "order.proto")) == ["acme.svc.Order"]
+
+
+def test_imports_found_from_ancestor_directories(tmp_path: Path):
+    protos = _proto_tree(tmp_path)
+
+    # No include path: imports resolve against the file's parent directories
+    tree, _, _ = schema_from_protobuf_file(str(protos / "svc" / "order.proto"))
+    assert tree["total"] == {"currency": "str", "units": "int"}
+
+
+def test_each_file_parsed_once(tmp_path: Path, monkeypatch):
+    protos = _proto_tree(tmp_path)
+    protobuf_schema_parser._parse_proto_file_cached.cache_clear()
+    calls = []
+    real = protobuf_schema_parser._parse_proto_structure
+
+    def counting(text, imports=None):
+        calls.append(text)
+        return real(text, imports)
+
+    monkeypatch.setattr(protobuf_schema_parser, "_parse_proto_structure", counting)
+    order = str(protos / "svc" / "order.proto")
+
+    assert list_protobuf_messages(order) == ["acme.svc.Order"]
+    schema_from_protobuf_file(order)
+    schema_from_protobuf_file(order, message="Money")
+    ProtoWorkspace().schema(str(protos / "common" / "types.proto"))
+
+    assert len(calls) == 3
+
+
+
+def test_proto_include_paths_reach_loaders_and_cli(tmp_path: Path, run_cli):
+    from schema_diff.loader import KIND_PROTOBUF, load_left_or_right
+    from schema_diff.unified_loader import load_schema_unified
+
+    vendor = _proto_tree(tmp_path / "vendor")
+    app = tmp_path / "app"
+    app.mkdir()
+    (vendor / "svc" / "order.proto").rename(app / "order.proto")
+    order = str(app / "order.proto")
+    money = {"currency": "str", "units": "int"}
+
+    # Not an ancestor of the importing file: only found through the include
+    load = dict(kind=KIND_PROTOBUF, cfg=None, samples=0)
+    tree, _, _ = load_left_or_right(order, **load)
+    assert tree["total"] != money
+    tree, _, _ = load_left_or_right(order, **load, proto_include=[str(vendor)])
+    assert tree["total"] == money
+
+    schema = load_schema_unified(order, "proto:sdl", proto_include=[str(vendor)])
+    assert {"total.currency", "total.units"} <= {f.path for f in schema.fields}
+
+    result = run_cli(
+        ["compare", order, order, "--proto-include", str(vendor), "--no-color"]
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,194 @@
+"""Tests for the shared BigQuery rate limiter and AIMD concurrency control."""
+
+import threading
+import time
+
+import pytest
+from google.api_core import exceptions as gcp_exceptions
+
+from schema_diff.rate_limit import (
+    FAILED,
+    THROTTLED,
+    TRANSIENT,
+    AdaptiveLimiter,
+    TokenBucket,
+    classify_bigquery_error,
+    get_bigquery_limiter,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(**kwargs):
+    clock = FakeClock()
+    kwargs.setdefault("initial_delay", 0.5)
+    limiter = AdaptiveLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+    return limiter, clock
+
+
+def test_token_bucket_paces_after_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1)
+    assert waits[3] == pytest.approx(0.1)
+    assert clock.now == pytest.approx(0.2)
+
+
+def test_classify_bigquery_error():
+    rate_limited = gcp_exceptions.Forbidden(
+        "Exceeded rate limits", errors=[{"reason": "rateLimitExceeded"}]
+    )
+    assert classify_bigquery_error(gcp_exceptions.TooManyRequests("x")) == THROTTLED
+    assert classify_bigquery_error(gcp_exceptions.ServiceUnavailable("x")) == THROTTLED
+    assert classify_bigquery_error(rate_limited) == THROTTLED
+    assert classify_bigquery_error(gcp_exceptions.InternalServerError("x")) == (
+        TRANSIENT
+    )
+    assert classify_bigquery_error(gcp_exceptions.Forbidden("Access Denied")) == FAILED
+    assert classify_bigquery_error(gcp_exceptions.NotFound("x")) == FAILED
+
+
+def test_throttling_halves_limit_once_per_generation_and_recovers():
+    limiter, _ = _limiter(max_concurrency=8, max_attempts=5)
+
+    # Two calls admitted in the same generation both get throttled: one decrease
+    g1, g2 = limiter._acquire(), limiter._acquire()
+    limiter._release(g1, THROTTLED)
+    limiter._release(g2, THROTTLED)
+    assert limiter.limit == 4
+    assert limiter.snapshot()["decreases"] == 1
+
+    # A later throttle (new generation) halves again
+    limiter._release(limiter._acquire(), THROTTLED)
+    assert limiter.limit == 2
+
+    # Additive increase: one slot per window of `limit` successes
+    for _ in range(2 + 3 + 4 + 5 + 6 + 7 - 1):
+        limiter.call(lambda: "ok")
+    assert limiter.limit == 7
+    limiter.call(lambda: "ok")
+    assert limiter.limit == 8
+    limiter.call(lambda: "ok")
+    assert limiter.limit == 8
+
+    metrics = limiter.snapshot()
+    assert metrics["throttles"] == 3
+    assert metrics["min_limit"] == 2
+    assert metrics["limit"] == 8
+
+
+def test_call_retries_throttled_then_succeeds():
+    limiter, clock = _limiter(max_concurrency=4, max_attempts=3, backoff_multiplier=2)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise gcp_exceptions.TooManyRequests("quota")
+        return "done"
+
+    assert limiter.call(flaky) == "done"
+    assert len(clock.sleeps) == 2
+    assert 0.5 <= clock.sleeps[0] <= 0.625 and 1.0 <= clock.sleeps[1] <= 1.25
+    metrics = limiter.snapshot()
+    assert (metrics["retries"], metrics["throttles"], metrics["successes"]) == (2, 2, 1)
+    # 4 -> 2 -> 1, then one success fills the one-slot window
+    assert limiter.limit == 2
+
+
+def test_call_raises_non_retryable_and_exhausted_errors():
+    limiter, clock = _limiter(max_concurrency=2, max_attempts=2)
+
+    with pytest.raises(gcp_exceptions.NotFound):
+        limiter.call(lambda: (_ for _ in ()).throw(gcp_exceptions.NotFound("gone")))
+    assert clock.sleeps == []
+
+    with pytest.raises(gcp_exceptions.InternalServerError):
+        limiter.call(
+            lambda: (_ for _ in ()).throw(gcp_exceptions.InternalServerError("boom"))
+        )
+    metrics = limiter.snapshot()
+    assert (metrics["failures"], metrics["retries"], metrics["throttles"]) == (2, 1, 0)
+    # 500s are retried but do not shrink the limit
+    assert limiter.limit == 2
+
+
+def test_reduced_limit_caps_calls_in_flight():
+    limiter = AdaptiveLimiter(max_concurrency=6)
+    limiter._release(limiter._acquire(), THROTTLED)
+    limiter._release(limiter._acquire(), THROTTLED)
+    assert limiter.limit == 1
+
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def work():
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.01)
+        with lock:
+            state["now"] -= 1
+
+    # Success after success grows the limit back, but never past the window
+    threads = [threading.Thread(target=limiter.call, args=(work,)) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert state["peak"] <= 3
+    assert limiter.snapshot()["peak_in_flight"] == state["peak"]
+
+
+def test_get_bigquery_limiter_is_shared_per_project():
+    assert get_bigquery_limiter("proj-a") is get_bigquery_limiter("proj-a")
+    assert get_bigquery_limiter("proj-a") is not get_bigquery_limiter("proj-b")
+
+
+def test_generate_dataset_ddl_retries_throttled_get_table(monkeypatch):
+    from unittest.mock import Mock
+
+    from google.cloud import bigquery
+    from google.cloud.bigquery.schema import SchemaField
+
+    from schema_diff import rate_limit
+    from schema_diff.bigquery_ddl import generate_dataset_ddl
+
+    limiter, clock = _limiter(max_concurrency=4)
+    monkeypatch.setitem(rate_limit._LIMITERS, "p", limiter)
+    seen = set()
+    lock = threading.Lock()
+
+    def get_table(ref):
+        with lock:
+            first = ref not in seen
+            seen.add(ref)
+        if first:
+            raise gcp_exceptions.TooManyRequests("Quota exceeded")
+        return bigquery.Table(ref, schema=[SchemaField("id", "INTEGER")])
+
+    client = Mock()
+    client.list_tables.return_value = [Mock(table_id=t) for t in ("a", "b", "c")]
+    client.get_table.side_effect = get_table
+
+    ddls = generate_dataset_ddl(client, "p", "d", include_constraints=False)
+
+    assert all("CREATE OR REPLACE TABLE" in ddl for ddl in ddls.values())
+    metrics = limiter.snapshot()
+    assert metrics["throttles"] == 3 and metrics["successes"] == 3
+    assert metrics["decreases"] >= 1 and len(clock.sleeps) == 3
@@ -0,0 +1,133 @@
+"""Tests for MinHash-LSH rename detection and its use in migration analysis."""
+
+from schema_diff.compare import diff_normalized_trees, normalize_for_diff
+from schema_diff.migration_analyzer import (
+    analyze_migration_impact,
+    generate_migration_report,
+)
+from schema_diff.rename_detection import detect_renames, match_renames, types_compatible
+
+
+def test_match_renames_pairs_similar_names():
+    renames = match_renames(
+        {"a.userId": "int", "zip": "str", "amount": "int", "legacy": "str"},
+        {"a.user_id": "union(int|missing)", "zipcode": "int", "amount_usd": "float"},
+    )
+
+    pairs = [(r["left"], r["right"]) for r in renames]
+    assert pairs == [("a.userId", "a.user_id"), ("amount", "amount_usd")]
+    assert renames[0]["score"] == 1.0
+    assert renames[0]["right_type"] == "int"
+
+
+def test_match_renames_is_one_to_one():
+    renames = match_renames(
+        dict.fromkeys(["customer_name", "customer_names"]),
+        dict.fromkeys(["customer_nme"]),
+    )
+    assert [(r["left"], r["right"]) for r in renames] == [
+        ("customer_name", "customer_nme")
+    ]
+
+
+def test_match_renames_non_ascii_names():
+    renames = match_renames(
+        {"名前": "str", "Straße": "str", "_": "str"},
+        {"氏名": "str", "strasse_name": "str", "__": "str"},
+    )
+    assert [(r["left"], r["right"]) for r in renames] == [("Straße", "strasse_name")]
+
+
+def test_types_compatible():
+    assert types_compatible("union(int|missing)", "int")
+    assert types_compatible("int", "float")
+    assert types_compatible(None, "str")
+    assert not types_compatible("str", "int")
+    assert not types_compatible(["str"], "str")
+
+
+def test_detect_renames_skips_moves_and_uses_display_paths():
+    left = {"items": [{"sku_code": "str"}], "email": "str"}
+    right = {"items": [{"skuCode": "str"}], "contact": {"email": "str"}}
+
+    renames = detect_renames(left, right)
+
+    assert [(r["left"], r["right"]) for r in renames] == [
+        ("items[].sku_code", "items[].skuCode")
+    ]
+
+
+def test_detect_renames_reports_covering_only_in_entries():
+    from schema_diff.compare import diff_normalized_trees, normalize_for_diff
+
+    left = {"a": {"userId": "int", "emailAddr": "str"}, "k": {"cityName": "str"}}
+    right = {"b": {"user_id": "int", "email_addr": "str"}, "k": {"city_name": "str"}}
+    report = diff_normalized_trees(
+        "L", "R", normalize_for_diff(left, set()), normalize_for_diff(right, set())
+    )
+
+    assert report["only_in_file1"] == ["a"] and report["only_in_file2"] == ["b"]
+    entries = {
+        r["left"]: (r["left_entry"], r["right_entry"])
+        for r in report["rename_candidates"]
+    }
+    # Leaves of the removed/added parents are covered by the parent entries
+    assert entries["a.userId"] == entries["a.emailAddr"] == ("a", "b")
+    # ``k`` itself is reported as a mismatch, so its leaf is under no entry
+    assert [m["path"] for m in report["schema_mismatches"]] == ["k"]
+    assert entries["k.cityName"] == (None, None)
+    # Without the only_in lists no entries are reported
+    assert "left_entry" not in detect_renames(left, right)[0]
+
+
+def test_detect_renames_scales_to_wide_schemas():
+    left = {f"field_{i:05d}_value": "int" for i in range(5000)}
+    right = {f"field_{i:05d}_val": "int" for i in range(5000)}
+
+    renames = detect_renames(left, right)
+
+    # Shared prefixes/suffixes land in hub buckets that are skipped, so
+    # recall is near-complete rather than exact; every match must be right
+    assert len(renames) >= 4950
+    assert all(r["left"][:11] == r["right"][:11] for r in renames)
+
+
+def test_migration_analysis_reports_renames():
+    left = normalize_for_diff({"userId": "int", "status": "str"}, set())
+    right = normalize_for_diff({"user_id": "int", "status": "str"}, set())
+    report = diff_normalized_trees("old", "new", left, right)
+
+    analysis = analyze_migration_impact(report, "old", "new")
+
+    assert [r["right"] for r in analysis.renames] == ["user_id"]
+    assert not any("removed" in b for b in analysis.breaking_changes)
+    assert any("likely renamed" in w for w in analysis.warnings)
+    md = generate_migration_report(analysis)
+    assert "fields removed" not in md and "new fields" not in md
+    assert "**1 fields likely renamed**" in md
+
+
+def test_migration_analysis_counts_renamed_leaves_under_moved_parent():
+    left = normalize_for_diff({"a": {"userId": "int", "emailAddr": "str"}}, set())
+    right = normalize_for_diff({"b": {"user_id": "int", "email_addr": "str"}}, set())
+    report = diff_normalized_trees("old", "new", left, right)
+
+    analysis = analyze_migration_impact(report, "old", "new")
+
+    assert len(analysis.renames) == 2
+    assert analysis.removed_fields == ["a"] and analysis.added_fields == ["b"]
+    md = generate_migration_report(analysis)
+    assert "**1 fields removed**" in md and "**2 fields likely renamed**" in md
+    text = generate_migration_report(analysis, format="text")
+    assert "Fields removed: 1\nFields added: 1\n" in text
+
+
+def test_migration_analysis_matches_names_without_candidates():
+    report = {"only_in_file1": ["order_total"], "only_in_file2": ["orderTotal"]}
+
+    analysis = analyze_migration_impact(report, "old", "new")
+
+    assert [(r["left"], r["right"]) for r in analysis.renames] == [
+        ("order_total", "orderTotal")
+    ]
+    assert analysis.breaking_changes == []
@@ -25,6 +25,32 @@ def test_report_presence_vs_schema():
     assert "only_in_2" in r["only_in_file1"]
 
 
+def test_report_nested_fields_from_path_index():
+    from schema_diff.utils import build_path_index
+
+    left = {"items": "array"}
+    right = {"items": [{"sku": "str", "dims": {"w": "int"}, "tags": [{"k": "str"}]}]}
+    diff = {
+        "type_changes": {
+            "root['items']": {"old_value": left["items"], "new_value": right["items"]}
+        }
+    }
+
+    plain = build_report_struct(diff, "f1", "f2", include_presence=False)
+    indexed = build_report_struct(
+        diff,
+        "f1",
+        "f2",
+        include_presence=False,
+        left_index=build_path_index(left),
+        right_index=build_path_index(right),
+    )
+
+    assert indexed == plain
+    assert "items[].dims.w" in indexed["only_in_file2"]
+    assert "items[].tags[].k" in indexed["only_in_file2"]
+
+
 def _extract_common_keys(stdout: str) -> set[str]:
     keys, in_block = set(), False
     for ln in stdout.splitlines():
@@ -0,0 +1,88 @@
+"""Tests for the JSON/NDJSON report writers."""
+
+import datetime
+import json
+
+import pytest
+
+from schema_diff.compare import compare_trees
+from schema_diff.migration_analyzer import (
+    MigrationAnalysis,
+    generate_migration_report,
+    write_migration_report,
+)
+from schema_diff.report_writer import write_report
+
+
+@pytest.fixture
+def sample_report():
+    return {
+        "meta": {"direction": "a -> b", "mode": ""},
+        "only_in_file1": ["x", "nested.ü"],
+        "only_in_file2": [],
+        "schema_mismatches": [
+            {"path": "id", "left": "int", "right": "str", "nested": {"k": [1, 2]}}
+        ],
+        "note": None,
+    }
+
+
+def test_json_writer_matches_json_dump(tmp_path, sample_report):
+    out = tmp_path / "r.json"
+    write_report(sample_report, str(out))
+
+    expected = json.dumps(sample_report, ensure_ascii=False, indent=2)
+    assert out.read_text(encoding="utf-8") == expected
+
+
+def test_ndjson_by_extension(tmp_path, sample_report):
+    out = tmp_path / "r.ndjson"
+    write_report(sample_report, str(out))
+
+    records = [
+        json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()
+    ]
+    assert records[0] == {"section": "meta", "direction": "a -> b", "mode": ""}
+    assert {"section": "only_in_file1", "path": "nested.ü"} in records
+    assert records[3]["section"] == "schema_mismatches"
+    assert records[3]["path"] == "id"
+    assert records[-1] == {"section": "note", "value": None}
+
+
+def test_compare_trees_json_out_includes_path_changes(tmp_path, cfg_like, capsys):
+    out = tmp_path / "diff.json"
+    report = compare_trees(
+        "L",
+        "R",
+        {"id": "int", "user": {"email": "str"}},
+        set(),
+        {"id": "str", "email": "str"},
+        set(),
+        cfg=cfg_like,
+        json_out=str(out),
+    )
+
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert payload == report
+    assert [c["name"] for c in payload["path_changes"]] == ["email"]
+
+
+def test_write_migration_report_matches_generated(tmp_path):
+    analysis = MigrationAnalysis(
+        source_label="old",
+        target_label="new",
+        timestamp=datetime.datetime(2024, 1, 1),
+        common_fields=3,
+        only_in_source=1,
+        only_in_target=2,
+        type_mismatches=0,
+        presence_changes=0,
+        path_changes=1,
+        breaking_changes=["Potentially critical field removed: id"],
+        warnings=[],
+        recommendations=["Check mappings"],
+        commands_used=["schema-diff compare a b"],
+    )
+    out = write_migration_report(analysis, tmp_path / "reports" / "m.md")
+
+    assert out.read_text(encoding="utf-8") == generate_migration_report(analysis)
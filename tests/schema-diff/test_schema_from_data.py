@@ -1,4 +1,8 @@
-from schema_diff.json_data_file_parser import to_schema, merged_schema_from_samples
+from schema_diff.json_data_file_parser import (
+    merge_schema,
+    merged_schema_from_samples,
+    to_schema,
+)
 from schema_diff.config import Config
 
 CFG = Config(infer_datetimes=False, color_enabled=False, show_presence=True)
@@ -25,3 +29,193 @@ def test_merged_schema_basic():
     sch = merged_schema_from_samples(recs, CFG)
     assert isinstance(sch, dict)
     assert "a" in sch and "b" in sch
+
+
+def test_datetime_classification_matches_patterns():
+    from schema_diff.infer import (
+        ISO_DATE_RE,
+        ISO_TIME_RE,
+        ISO_TS_RE,
+        classify_datetime_str,
+    )
+
+    def by_regex(v):
+        s = v.strip()
+        if ISO_TS_RE.match(s):
+            return "timestamp"
+        if ISO_DATE_RE.match(s):
+            return "date"
+        if ISO_TIME_RE.match(s):
+            return "time"
+        return "str"
+
+    values = [
+        "2024-01-01",
+        " 2024-01-01\n",
+        "2024-01-01T10:00",
+        "2024-01-01 10:00:00.123456789+05:30",
+        "2024-01-01T10:00:00Z",
+        "2024-01-01X10:00",
+        "12:30",
+        "12:30:45.123456789",
+        "12:30:45.1234567890",
+        "1:30",
+        "ACTIVE",
+        "2024-1-01",
+        "   ",
+        "١٢٣٤-٠١-٠١",
+    ]
+    for v in values:
+        assert classify_datetime_str(v) == by_regex(v), v
+
+
+def test_tname_many_matches_tname():
+    from schema_diff.infer import tname, tname_many
+
+    cfg = Config(infer_datetimes=True, color_enabled=False)
+    values = ["2024-01-01", "ok", "ok", "", 1, 2.5, True, None, [], {"a": 1}, "10:00"]
+
+    assert tname_many(values, cfg) == [tname(v, cfg) for v in values]
+    assert tname_many(["2024-01-01"], CFG) == ["str"]
+
+
+def test_to_schema_types_sampled_array_elements():
+    cfg = Config(color_enabled=False, array_sample_size=8)
+
+    assert to_schema([1, 2, None], cfg) == ["union(int|missing)"]
+    assert to_schema([{"a": 1}, {"a": 2, "b": "x"}], cfg) == [
+        {"a": "int", "b": "union(missing|str)"}
+    ]
+    # Late outliers are reached through the strided tail
+    assert to_schema(list(range(1000)) + ["x"], cfg) == ["union(int|str)"]
+    # Budget 1 keeps the first-element-only behaviour
+    assert to_schema([1, "x"], Config(array_sample_size=1)) == ["int"]
+
+
+def test_sample_indices_is_bounded():
+    from schema_diff.json_data_file_parser import sample_indices
+
+    assert list(sample_indices(5, 16)) == [0, 1, 2, 3, 4]
+    idx = sample_indices(10_000, 16)
+    assert len(idx) == 16
+    assert idx[:8] == list(range(8)) and idx[-1] == 9_999
+    assert idx == sorted(set(idx))
+
+
+def _presence_records():
+    recs = []
+    for i in range(20):
+        rec = {"id": i, "items": [{"sku": "a", "qty": i if i % 2 else None}]}
+        if i != 7:
+            rec["email"] = "x@y.z"
+        if i % 2:
+            rec["address"] = {"zip": "123", "city": None if i == 3 else "c"}
+        recs.append(rec)
+    return recs
+
+
+def test_type_counter_infers_required_paths():
+    from schema_diff.json_data_file_parser import TypeCounter
+
+    counter = TypeCounter(CFG).observe_many(_presence_records())
+
+    # Nested paths are relative to their parent object, as in JSON Schema
+    assert counter.required_paths() == {"id", "items", "items[0].sku", "address.zip"}
+    assert counter.required_paths(0.9) == {
+        "id",
+        "email",
+        "items",
+        "items[0].sku",
+        "address.zip",
+        "address.city",
+    }
+
+
+def test_required_paths_merge_across_shards():
+    from schema_diff.json_data_file_parser import TypeCounter
+
+    recs = _presence_records()
+    whole = TypeCounter(CFG).observe_many(recs)
+    left = TypeCounter(CFG).observe_many(recs[:5])
+    left.merge(TypeCounter(CFG).observe_many(recs[5:]))
+
+    for threshold in (1.0, 0.9, 0.5):
+        assert left.required_paths(threshold) == whole.required_paths(threshold)
+
+
+def test_merged_schema_with_required_marks_threshold_paths():
+    from schema_diff.json_data_file_parser import merged_schema_with_required
+
+    tree, required = merged_schema_with_required(_presence_records(), CFG)
+    assert required == set()
+    assert tree["email"] == "union(missing|str)"
+
+    cfg = Config(color_enabled=False, required_threshold=0.9)
+    tree, required = merged_schema_with_required(_presence_records(), cfg)
+    assert "email" in required
+    assert tree["email"] == "str"
+    assert tree["items"] == [{"qty": "union(int|missing)", "sku": "str"}]
+
+
+def test_data_parser_returns_inferred_required_paths(write_file):
+    from schema_diff.parser_factory import DataParser
+
+    path = write_file(
+        "rows.ndjson", '{"id": 1, "name": "a"}\n{"id": 2}\n{"id": 3, "name": null}\n'
+    )
+
+    assert DataParser().parse(path, CFG, all_records=True).required_paths == set()
+    cfg = Config(color_enabled=False, required_threshold=1.0)
+    assert DataParser().parse(path, cfg, all_records=True).required_paths == {"id"}
+
+
+def test_compare_infer_required_reports_presence(run_cli, write_file):
+    left = write_file("left.ndjson", '{"id": 1}\n{"id": 2}\n')
+    right = write_file("right.ndjson", '{"id": 1}\n{"other": 2}\n')
+
+    result = run_cli(
+        ["compare", left, right, "--all-records", "--no-color", "--infer-required"]
+    )
+
+    assert result.returncode == 0
+    assert "id: required → nullable" in result.stdout
+
+
+def _legacy_fold(recs, cfg):
+    sch = None
+    for r in recs:
+        s = to_schema(r, cfg)
+        sch = s if sch is None else merge_schema(sch, s)
+    return sch
+
+
+def test_type_counter_matches_pairwise_merge():
+    from schema_diff.json_data_file_parser import TypeCounter
+
+    recs = [
+        {"id": 1, "tags": ["a", 2], "user": {"name": "x", "age": 3}, "v": None},
+        {"id": "2", "tags": [], "user": {"name": "y"}, "items": [{"q": 1}, {}]},
+        {"id": 3, "user": "n/a", "items": [{"q": 2.5, "s": ""}]},
+        {"tags": ["b"], "v": 1.5, "nested": [[1], [None]]},
+    ]
+    for prefix in range(len(recs) + 1):
+        got = TypeCounter(CFG).observe_many(recs[:prefix]).materialize()
+        want = _legacy_fold(recs[:prefix], CFG) if prefix else "missing"
+        assert got == want
+
+
+def test_type_counter_distribution_and_merge():
+    from schema_diff.json_data_file_parser import TypeCounter
+
+    recs = [{"a": 1, "b": {"c": "x"}}, {"a": "s"}, {"a": None, "b": {"c": ""}}]
+    whole = TypeCounter(CFG).observe_many(recs)
+    dist = whole.distribution()
+
+    assert dist["a"] == {"int": 1, "str": 1, "missing": 1}
+    assert dist["b"] == {"object": 2, "missing": 1}
+    assert dist["b.c"] == {"str": 1, "empty_string": 1}
+
+    shard = TypeCounter(CFG).observe_many(recs[:1])
+    shard.merge(TypeCounter(CFG).observe_many(recs[1:]))
+    assert shard.distribution() == dist
+    assert shard.materialize() == whole.materialize()
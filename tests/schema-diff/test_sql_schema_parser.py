@@ -170,3 +170,123 @@ def test_sql_not_null_before_default_is_captured(tmp_path):
 
     tree, required = schema_from_sql_schema_file(str(p), table="t")
     assert "name" in required
+
+
+MULTI_TABLE_DDL = """-- dump header; not a statement
+CREATE TABLE public.users (
+  id BIGINT NOT NULL,
+  email TEXT DEFAULT 'a;b',
+  tags TEXT[]
+);
+/* CREATE TABLE commented_out (x INT); */
+CREATE FUNCTION touch() RETURNS trigger AS $fn$ BEGIN; END; $fn$ LANGUAGE plpgsql;
+CREATE TABLE IF NOT EXISTS `proj.ds.events` (
+  event_id INT64 NOT NULL,
+  payload STRUCT<kind STRING, ids ARRAY<INT64>>
+);
+INSERT INTO public.users VALUES (1, 'it''s; fine', '{}');
+CREATE TABLE "Orders" (
+  order_id INTEGER NOT NULL,
+  total NUMERIC(10,2)
+);
+"""
+
+
+def test_split_sql_statements_respects_quotes_and_comments():
+    from schema_diff.sql_ddl_index import split_sql_statements
+
+    data = MULTI_TABLE_DDL.encode()
+    stmts = [data[s:e].decode().strip() for s, e in split_sql_statements(data)]
+
+    assert len(stmts) == 5
+    assert stmts[0].endswith("tags TEXT[]\n);")
+    assert stmts[1].startswith("/* CREATE TABLE commented_out")
+    assert stmts[1].endswith("AS $fn$ BEGIN; END; $fn$ LANGUAGE plpgsql;")
+    assert stmts[3] == "INSERT INTO public.users VALUES (1, 'it''s; fine', '{}');"
+
+
+def test_sql_table_index_lookup_matches_full_parse(tmp_path):
+    from schema_diff.sql_ddl_index import load_sql_table_index
+    from schema_diff.sql_schema_parser import _lookup_indexed_table, _parse_sql_tables
+
+    p = tmp_path / "dump.sql"
+    p.write_text(MULTI_TABLE_DDL, encoding="utf-8")
+
+    index = load_sql_table_index(str(p), cache_dir=tmp_path / "idx")
+    assert set(index["tables"]) == {"public.users", "proj.ds.events", "Orders"}
+    assert index["names"]["events"] == "proj.ds.events"
+
+    tables, required, _ = _parse_sql_tables(MULTI_TABLE_DDL)
+    for name in ("users", "PUBLIC.USERS", "events", "orders"):
+        full = index["names"][name.lower()]
+        assert _lookup_indexed_table(str(p), name) == (tables[full], required[full])
+        assert schema_from_sql_schema_file(str(p), table=name) == (
+            tables[full],
+            required[full],
+        )
+
+
+def test_sql_table_index_cache_is_invalidated_on_rewrite(tmp_path):
+    import os
+
+    from schema_diff.sql_ddl_index import load_sql_table_index
+
+    p = tmp_path / "dump.sql"
+    p.write_text("CREATE TABLE a (\n  x INT\n);\n", encoding="utf-8")
+    cache_dir = tmp_path / "idx"
+
+    first = load_sql_table_index(str(p), cache_dir=cache_dir)
+    assert list(first["tables"]) == ["a"]
+    assert len(list(cache_dir.iterdir())) == 1
+
+    p.write_text(
+        "CREATE TABLE b (\n  y INT\n);\nCREATE TABLE a (\n  x INT\n);\n",
+        encoding="utf-8",
+    )
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert list(load_sql_table_index(str(p), cache_dir=cache_dir)["tables"]) == [
+        "b",
+        "a",
+    ]
+    # The parser's result cache is keyed on the file's size/mtime as well
+    assert schema_from_sql_schema_file(str(p), table="b") == ({"y": "int"}, set())
+
+
+def test_sql_table_index_skips_gzip(write_file):
+    from schema_diff.sql_ddl_index import load_sql_table_index
+
+    path = write_file("dump.sql.gz", "CREATE TABLE a (x INT);\n", gz=True)
+    assert load_sql_table_index(path) is None
+
+
+def test_schema_from_sql_all_tables_parallel_matches_lookup(tmp_path):
+    from schema_diff.sql_schema_parser import schema_from_sql_schema_file_all
+
+    p = tmp_path / "dump.sql"
+    p.write_text(MULTI_TABLE_DDL, encoding="utf-8")
+
+    serial = schema_from_sql_schema_file_all(str(p), workers=1)
+    parallel = schema_from_sql_schema_file_all(str(p), workers=2)
+
+    assert list(serial) == ["public.users", "proj.ds.events", "Orders"]
+    assert parallel == serial
+    assert serial["proj.ds.events"] == (
+        {"event_id": "int", "payload": {"kind": "str", "ids": ["int"]}},
+        {"event_id"},
+    )
+    for name, result in serial.items():
+        assert schema_from_sql_schema_file(str(p), table=name) == result
+
+
+def test_compare_batch_all_tables(run_cli, write_file):
+    contract = write_file(
+        "contract.sql", "CREATE TABLE c (\n  order_id INTEGER NOT NULL\n);\n"
+    )
+    dump = write_file("dump.sql", MULTI_TABLE_DDL)
+
+    result = run_cli(["compare-batch", contract, dump, "--all-tables", "--no-color"])
+
+    assert result.returncode == 0, result.stderr
+    assert "4 inputs" in result.stdout
+    assert f"{dump}:proj.ds.events" in result.stdout
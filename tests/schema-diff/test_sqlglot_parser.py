@@ -0,0 +1,101 @@
+import pytest
+
+pytest.importorskip("sqlglot")
+
+from schema_diff import sqlglot_parser  # noqa: E402
+from schema_diff.sqlglot_parser import (  # noqa: E402
+    schema_from_sql_ddl_sqlglot,
+    schemas_from_sql_ddl_sqlglot,
+    translate_sql_ddl,
+    translate_sql_statements,
+)
+
+
+def _dump(n_tables, changed=()):
+    parts = []
+    for i in range(n_tables):
+        extra = ",\n  note TEXT" if i in changed else ""
+        parts.append(
+            f"CREATE TABLE public.t{i} (\n  id BIGINT NOT NULL,\n  v TEXT{extra}\n);\n"
+        )
+        if i % 3 == 0:
+            parts.append(f"COMMENT ON TABLE public.t{i} IS 'table; {i}';\n")
+    return "".join(parts)
+
+
+@pytest.fixture
+def count_parsed(monkeypatch):
+    """Count statements handed to the in-process sqlglot parse step."""
+    calls = []
+    real = sqlglot_parser._parse_create_tables
+
+    def _counting(statements, dialect):
+        calls.append(len(statements))
+        return real(statements, dialect)
+
+    monkeypatch.setattr(sqlglot_parser, "_parse_create_tables", _counting)
+    monkeypatch.setattr(sqlglot_parser, "_MIN_PARALLEL_STATEMENTS", 10**9)
+    return calls
+
+
+def test_schemas_from_sql_ddl_sqlglot_per_table(write_file):
+    from schema_diff.decorators import _cache_manager
+
+    path = write_file("dump.sql", _dump(4))
+
+    tables = schemas_from_sql_ddl_sqlglot(path, dialect="postgres", use_cache=False)
+
+    assert list(tables) == ["public.t0", "public.t1", "public.t2", "public.t3"]
+    assert tables["public.t2"] == ({"id": "int", "v": "str"}, {"id"})
+    assert schema_from_sql_ddl_sqlglot(
+        path, "postgres", table_name="t1", use_cache=False
+    ) == ({"id": "int", "v": "str"}, {"id"})
+    assert not (_cache_manager.cache_dir / "sqlglot").exists()
+
+
+def test_statement_cache_reparses_only_changed_statements(tmp_path, count_parsed):
+    p = tmp_path / "dump.sql"
+    p.write_text(_dump(50), encoding="utf-8")
+
+    first = schemas_from_sql_ddl_sqlglot(str(p), dialect="postgres")
+    assert count_parsed == [67]  # 50 CREATE TABLE + 17 COMMENT statements
+
+    p.write_text(_dump(50, changed={4, 20, 33}), encoding="utf-8")
+    second = schemas_from_sql_ddl_sqlglot(str(p), dialect="postgres")
+
+    assert count_parsed == [67, 3]
+    assert second["public.t20"][0] == {"id": "int", "v": "str", "note": "str"}
+    changed = {"public.t4", "public.t20", "public.t33"}
+    assert {k: v for k, v in second.items() if k not in changed} == {
+        k: v for k, v in first.items() if k not in changed
+    }
+
+    schemas_from_sql_ddl_sqlglot(str(p), dialect="postgres")
+    assert count_parsed == [67, 3]
+
+
+def test_parallel_parse_matches_serial(write_file, monkeypatch):
+    path = write_file("dump.sql", _dump(30))
+    monkeypatch.setattr(sqlglot_parser, "_MIN_PARALLEL_STATEMENTS", 1)
+
+    parallel = schemas_from_sql_ddl_sqlglot(
+        path, dialect="postgres", workers=2, use_cache=False
+    )
+    serial = schemas_from_sql_ddl_sqlglot(
+        path, dialect="postgres", workers=1, use_cache=False
+    )
+    assert list(parallel) == list(serial)
+    assert parallel == serial
+
+
+def test_translate_sql_ddl_multiple_statements():
+    sql = "CREATE TABLE a (id INT64);\n-- second\nCREATE TABLE b (s STRING);\n"
+
+    out = translate_sql_ddl(sql, "bigquery", "postgres")
+
+    assert out.count("CREATE TABLE") == 2
+    assert "BIGINT" in out and "TEXT" in out
+    single = "CREATE TABLE a (id INT64)"
+    assert translate_sql_ddl(single, "bigquery", "postgres") == (
+        translate_sql_statements([single], "bigquery", "postgres")[0]
+    )